@@ -0,0 +1,136 @@
+"""Micro-benchmarks for hot paths that are hard to profile against a live cluster."""
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+from rich.console import Console
+
+__DEFAULT_POD_COUNT = 50_000
+__REPEATS = 3
+
+
+def __pod(index: int) -> dict[str, Any]:
+    """Build a representative raw Pod as the API server serializes it."""
+    name = f"web-{index // 100}-{index:06d}"
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": f"team-{index % 40}",
+            "uid": f"00000000-0000-0000-0000-{index:012d}",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": {"app": "web", "pod-template-hash": "5d9f8c7b6", "tier": "frontend"},
+            "annotations": {"kubectl.kubernetes.io/restartedAt": "2024-01-01T00:00:00Z"},
+            "ownerReferences": [
+                {"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "web", "uid": "rs-1"}
+            ],
+        },
+        "spec": {
+            "nodeName": f"node-{index % 200}",
+            "containers": [
+                {
+                    "name": "app",
+                    "image": "nginx:1.25",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "resources": {
+                        "requests": {"cpu": "100m", "memory": "128Mi"},
+                        "limits": {"cpu": "500m", "memory": "256Mi"},
+                    },
+                },
+                {"name": "sidecar", "image": "envoy:1.30"},
+            ],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}",
+            "conditions": [
+                {"type": "Ready", "status": "True", "lastTransitionTime": "2024-01-01T00:00:05Z"}
+            ],
+            "containerStatuses": [
+                {
+                    "name": container,
+                    "image": image,
+                    "imageID": "",
+                    "ready": True,
+                    "restartCount": index % 3,
+                    "state": {"running": {"startedAt": "2024-01-01T00:00:05Z"}},
+                }
+                for container, image in (("app", "nginx:1.25"), ("sidecar", "envoy:1.30"))
+            ],
+        },
+    }
+
+
+def __pages(count: int, chunk_size: int) -> list[bytes]:
+    """Serialize ``count`` pods into PodList pages linked by continue tokens."""
+    pages = []
+    for start in range(0, count, chunk_size):
+        end = min(start + chunk_size, count)
+        token = str(end) if end < count else None
+        body = {
+            "apiVersion": "v1",
+            "kind": "PodList",
+            "metadata": {"continue": token} if token else {},
+            "items": [__pod(i) for i in range(start, end)],
+        }
+        pages.append(json.dumps(body).encode())
+    return pages
+
+
+def __stub_client(pages: list[bytes], chunk_size: int, *, fast: bool) -> SimpleNamespace:
+    """Build a client whose pod LIST serves ``pages`` like the SDK would."""
+    from kubernetes.client import ApiClient
+
+    api_client = ApiClient()
+
+    def list_namespaced_pod(**kwargs: Any) -> Any:
+        data = pages[int(kwargs.get("_continue") or 0) // chunk_size]
+        if kwargs.get("_preload_content") is False:
+            return SimpleNamespace(data=data, release_conn=lambda: None)
+        # What the SDK does with a preloaded response
+        return api_client._ApiClient__deserialize(json.loads(data), "V1PodList")
+
+    return SimpleNamespace(
+        core_v1=SimpleNamespace(list_namespaced_pod=list_namespaced_pod),
+        default_namespace="default",
+        fast_list_enabled=fast,
+        informer=lambda resource: None,
+    )
+
+
+def __best_of(func: Callable[[], object]) -> float:
+    """Return the fastest wall-clock time of several runs."""
+    timings = []
+    for _ in range(__REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def k8s_list() -> None:
+    """Compare SDK and fast-list conversion of a large pod LIST.
+
+    Usage: bench-k8s-list [POD_COUNT]
+    """
+    from system_operations_manager.services.kubernetes.base import DEFAULT_LIST_CHUNK_SIZE
+    from system_operations_manager.services.kubernetes.workload_manager import WorkloadManager
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else __DEFAULT_POD_COUNT
+    chunk_size = DEFAULT_LIST_CHUNK_SIZE
+    pages = __pages(count, chunk_size)
+
+    results = {}
+    for label, fast in (("sdk objects", False), ("fast list", True)):
+        manager = WorkloadManager(__stub_client(pages, chunk_size, fast=fast))  # type: ignore[arg-type]
+        assert len(manager.list_pods()) == count
+        results[label] = __best_of(manager.list_pods)
+
+    console = Console()
+    console.print(f"list_pods, {count} pods in pages of {chunk_size} (best of {__REPEATS}):")
+    for label, seconds in results.items():
+        console.print(f"  {label:<12} {seconds:8.3f}s")
+    console.print(f"  speedup      {results['sdk objects'] / results['fast list']:7.1f}x")
@@ -1,6 +1,9 @@
 """Kong Gateway integration - HTTP client and API models."""
 
-from system_operations_manager.integrations.kong.client import KongAdminClient
+from system_operations_manager.integrations.kong.client import (
+    AsyncKongAdminClient,
+    KongAdminClient,
+)
 from system_operations_manager.integrations.kong.config import (
     KongAuthConfig,
     KongConnectionConfig,
@@ -15,6 +18,7 @@ from system_operations_manager.integrations.kong.exceptions import (
 )
 
 __all__ = [
+    "AsyncKongAdminClient",
     "KongAPIError",
     "KongAdminClient",
     "KongAuthConfig",
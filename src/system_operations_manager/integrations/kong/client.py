@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 from typing import TYPE_CHECKING, Any, cast
 
 import httpx
@@ -31,51 +33,55 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
-class KongAdminClient:
-    """HTTP client for Kong Admin API.
+def _http2_available() -> bool:
+    """Check whether the optional h2 package required for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
 
-    This client provides methods to interact with the Kong Admin API,
-    supporting various authentication methods and automatic retry logic.
 
-    Example:
-        ```python
-        from system_operations_manager.integrations.kong import KongAdminClient
-        from system_operations_manager.integrations.kong.config import (
-            KongConnectionConfig,
-            KongAuthConfig,
-        )
-
-        connection = KongConnectionConfig(base_url="http://localhost:8001")
-        auth = KongAuthConfig(type="api_key", api_key="my-api-key")
-
-        with KongAdminClient(connection, auth) as client:
-            status = client.get("status")
-            print(status)
-        ```
-    """
+class _BaseKongAdminClient:
+    """Configuration and response handling shared by the sync and async clients."""
 
     def __init__(
         self,
         connection_config: KongConnectionConfig,
         auth_config: KongAuthConfig | None = None,
     ) -> None:
-        """Initialize Kong Admin API client.
+        """Initialize shared client state.
 
         Args:
-            connection_config: Connection settings (URL, timeout, SSL, retries).
+            connection_config: Connection settings (URL, timeout, SSL, retries, pool).
             auth_config: Authentication settings (type, credentials).
         """
         self.connection_config = connection_config
         self.auth_config = auth_config
         self._retries = connection_config.retries
+        self._client_kwargs = self._build_client_kwargs()
+
+    def _build_client_kwargs(self) -> dict[str, Any]:
+        """Build httpx client arguments from connection and auth configuration."""
+        connection_config = self.connection_config
+        auth_config = self.auth_config
 
-        # Build client configuration
         client_kwargs: dict[str, Any] = {
             "base_url": connection_config.base_url,
             "timeout": httpx.Timeout(connection_config.timeout),
             "verify": connection_config.verify_ssl,
+            "limits": httpx.Limits(
+                max_connections=connection_config.max_connections,
+                max_keepalive_connections=connection_config.max_keepalive_connections,
+                keepalive_expiry=connection_config.keepalive_expiry,
+            ),
         }
 
+        if connection_config.http2:
+            if _http2_available():
+                client_kwargs["http2"] = True
+            else:
+                logger.warning(
+                    "HTTP/2 requested but h2 is not installed, falling back to HTTP/1.1",
+                    hint="Install with: pip install 'httpx[http2]'",
+                )
+
         # Configure authentication
         headers: dict[str, str] = {}
         if auth_config:
@@ -91,13 +97,7 @@ class KongAdminClient:
         if headers:
             client_kwargs["headers"] = headers
 
-        self._client = httpx.Client(**client_kwargs)
-
-        logger.info(
-            "Kong Admin API client initialized",
-            base_url=connection_config.base_url,
-            auth_type=auth_config.type if auth_config else "none",
-        )
+        return client_kwargs
 
     def _make_retry_decorator(self) -> Any:
         """Create a retry decorator based on configuration."""
@@ -108,6 +108,34 @@ class KongAdminClient:
             reraise=True,
         )
 
+    @staticmethod
+    def _connection_error(
+        error: httpx.ConnectError | httpx.TimeoutException,
+        url: str,
+    ) -> KongConnectionError:
+        """Translate an httpx connect or timeout error into KongConnectionError.
+
+        Args:
+            error: Transport error raised by httpx.
+            url: Endpoint that was called.
+
+        Returns:
+            KongConnectionError wrapping the original error.
+        """
+        if isinstance(error, httpx.TimeoutException):
+            logger.error("Kong request timeout", endpoint=url, error=str(error))
+            return KongConnectionError(
+                message=f"Kong request timed out: {error}",
+                endpoint=url,
+                original_error=error,
+            )
+        logger.error("Kong connection error", endpoint=url, error=str(error))
+        return KongConnectionError(
+            message=f"Failed to connect to Kong: {error}",
+            endpoint=url,
+            original_error=error,
+        )
+
     def _handle_response(self, response: httpx.Response, endpoint: str) -> dict[str, Any]:
         """Handle HTTP response and raise appropriate exceptions.
 
@@ -184,6 +212,51 @@ class KongAdminClient:
             endpoint=endpoint,
         )
 
+
+class KongAdminClient(_BaseKongAdminClient):
+    """HTTP client for Kong Admin API.
+
+    This client provides methods to interact with the Kong Admin API,
+    supporting various authentication methods and automatic retry logic.
+
+    Example:
+        ```python
+        from system_operations_manager.integrations.kong import KongAdminClient
+        from system_operations_manager.integrations.kong.config import (
+            KongConnectionConfig,
+            KongAuthConfig,
+        )
+
+        connection = KongConnectionConfig(base_url="http://localhost:8001")
+        auth = KongAuthConfig(type="api_key", api_key="my-api-key")
+
+        with KongAdminClient(connection, auth) as client:
+            status = client.get("status")
+            print(status)
+        ```
+    """
+
+    def __init__(
+        self,
+        connection_config: KongConnectionConfig,
+        auth_config: KongAuthConfig | None = None,
+    ) -> None:
+        """Initialize Kong Admin API client.
+
+        Args:
+            connection_config: Connection settings (URL, timeout, SSL, retries, pool).
+            auth_config: Authentication settings (type, credentials).
+        """
+        super().__init__(connection_config, auth_config)
+        self._client = httpx.Client(**self._client_kwargs)
+        self._retrying_request = self._make_retry_decorator()(self._request)
+
+        logger.info(
+            "Kong Admin API client initialized",
+            base_url=connection_config.base_url,
+            auth_type=auth_config.type if auth_config else "none",
+        )
+
     def _request(
         self,
         method: str,
@@ -212,20 +285,8 @@ class KongAdminClient:
             response = self._client.request(method, url, **kwargs)
             log.debug("Kong API response", status=response.status_code)
             return self._handle_response(response, url)
-        except httpx.ConnectError as e:
-            log.error("Kong connection error", error=str(e))
-            raise KongConnectionError(
-                message=f"Failed to connect to Kong: {e}",
-                endpoint=url,
-                original_error=e,
-            ) from e
-        except httpx.TimeoutException as e:
-            log.error("Kong request timeout", error=str(e))
-            raise KongConnectionError(
-                message=f"Kong request timed out: {e}",
-                endpoint=url,
-                original_error=e,
-            ) from e
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            raise self._connection_error(e, url) from e
 
     def get(self, endpoint: str, **kwargs: Any) -> dict[str, Any]:
         """GET request to Kong Admin API.
@@ -237,8 +298,7 @@ class KongAdminClient:
         Returns:
             Parsed JSON response body.
         """
-        retry_decorator = self._make_retry_decorator()
-        result = retry_decorator(self._request)("GET", endpoint, **kwargs)
+        result = self._retrying_request("GET", endpoint, **kwargs)
         return cast(dict[str, Any], result)
 
     def post(
@@ -257,8 +317,7 @@ class KongAdminClient:
         Returns:
             Parsed JSON response body (created resource).
         """
-        retry_decorator = self._make_retry_decorator()
-        result = retry_decorator(self._request)("POST", endpoint, json=json, **kwargs)
+        result = self._retrying_request("POST", endpoint, json=json, **kwargs)
         return cast(dict[str, Any], result)
 
     def put(
@@ -277,8 +336,7 @@ class KongAdminClient:
         Returns:
             Parsed JSON response body (updated resource).
         """
-        retry_decorator = self._make_retry_decorator()
-        result = retry_decorator(self._request)("PUT", endpoint, json=json, **kwargs)
+        result = self._retrying_request("PUT", endpoint, json=json, **kwargs)
         return cast(dict[str, Any], result)
 
     def patch(
@@ -297,8 +355,7 @@ class KongAdminClient:
         Returns:
             Parsed JSON response body (updated resource).
         """
-        retry_decorator = self._make_retry_decorator()
-        result = retry_decorator(self._request)("PATCH", endpoint, json=json, **kwargs)
+        result = self._retrying_request("PATCH", endpoint, json=json, **kwargs)
         return cast(dict[str, Any], result)
 
     def delete(self, endpoint: str, **kwargs: Any) -> None:
@@ -308,8 +365,7 @@ class KongAdminClient:
             endpoint: API endpoint.
             **kwargs: Additional request parameters.
         """
-        retry_decorator = self._make_retry_decorator()
-        retry_decorator(self._request)("DELETE", endpoint, **kwargs)
+        self._retrying_request("DELETE", endpoint, **kwargs)
 
     def close(self) -> None:
         """Close the HTTP client and release resources."""
@@ -353,3 +409,207 @@ class KongAdminClient:
             return True
         except KongAPIError:
             return False
+
+
+class AsyncKongAdminClient(_BaseKongAdminClient):
+    """Asynchronous HTTP client for Kong Admin API.
+
+    Mirrors KongAdminClient's API and exception translation on top of
+    ``httpx.AsyncClient``, so bulk operations can issue many Admin API
+    calls concurrently. Connection pool size, keepalive and HTTP/2 come
+    from KongConnectionConfig; ``max_in_flight`` caps the number of
+    concurrent requests so large batches cannot overload Kong.
+
+    Example:
+        ```python
+        import asyncio
+
+        from system_operations_manager.integrations.kong import AsyncKongAdminClient
+        from system_operations_manager.integrations.kong.config import KongConnectionConfig
+
+        async def fetch(names: list[str]) -> list[dict]:
+            connection = KongConnectionConfig(http2=True, max_in_flight=20)
+            async with AsyncKongAdminClient(connection) as client:
+                return await asyncio.gather(*(client.get(f"services/{n}") for n in names))
+        ```
+    """
+
+    def __init__(
+        self,
+        connection_config: KongConnectionConfig,
+        auth_config: KongAuthConfig | None = None,
+    ) -> None:
+        """Initialize async Kong Admin API client.
+
+        Args:
+            connection_config: Connection settings (URL, timeout, SSL, retries, pool).
+            auth_config: Authentication settings (type, credentials).
+        """
+        super().__init__(connection_config, auth_config)
+        self._client = httpx.AsyncClient(**self._client_kwargs)
+        self._semaphore = asyncio.Semaphore(connection_config.max_in_flight)
+        self._retrying_request = self._make_retry_decorator()(self._request)
+
+        logger.info(
+            "Async Kong Admin API client initialized",
+            base_url=connection_config.base_url,
+            auth_type=auth_config.type if auth_config else "none",
+            max_in_flight=connection_config.max_in_flight,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Make an HTTP request to Kong Admin API.
+
+        The in-flight slot is held only for the request itself, so retry
+        backoff does not block other callers.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE).
+            endpoint: API endpoint (will be prefixed with base URL).
+            **kwargs: Additional arguments to pass to httpx.
+
+        Returns:
+            Parsed JSON response body.
+
+        Raises:
+            KongConnectionError: If connection to Kong fails.
+            KongAPIError: If Kong returns an error response.
+        """
+        url = f"/{endpoint.lstrip('/')}"
+        log = logger.bind(method=method, endpoint=url)
+
+        try:
+            async with self._semaphore:
+                log.debug("Kong API request")
+                response = await self._client.request(method, url, **kwargs)
+            log.debug("Kong API response", status=response.status_code)
+            return self._handle_response(response, url)
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            raise self._connection_error(e, url) from e
+
+    async def get(self, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+        """GET request to Kong Admin API.
+
+        Args:
+            endpoint: API endpoint (e.g., "services", "routes/my-route").
+            **kwargs: Additional query parameters.
+
+        Returns:
+            Parsed JSON response body.
+        """
+        result = await self._retrying_request("GET", endpoint, **kwargs)
+        return cast(dict[str, Any], result)
+
+    async def post(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """POST request to Kong Admin API.
+
+        Args:
+            endpoint: API endpoint.
+            json: Request body as dictionary.
+            **kwargs: Additional request parameters.
+
+        Returns:
+            Parsed JSON response body (created resource).
+        """
+        result = await self._retrying_request("POST", endpoint, json=json, **kwargs)
+        return cast(dict[str, Any], result)
+
+    async def put(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """PUT request to Kong Admin API.
+
+        Args:
+            endpoint: API endpoint.
+            json: Request body as dictionary.
+            **kwargs: Additional request parameters.
+
+        Returns:
+            Parsed JSON response body (updated resource).
+        """
+        result = await self._retrying_request("PUT", endpoint, json=json, **kwargs)
+        return cast(dict[str, Any], result)
+
+    async def patch(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """PATCH request to Kong Admin API.
+
+        Args:
+            endpoint: API endpoint.
+            json: Request body as dictionary (partial update).
+            **kwargs: Additional request parameters.
+
+        Returns:
+            Parsed JSON response body (updated resource).
+        """
+        result = await self._retrying_request("PATCH", endpoint, json=json, **kwargs)
+        return cast(dict[str, Any], result)
+
+    async def delete(self, endpoint: str, **kwargs: Any) -> None:
+        """DELETE request to Kong Admin API.
+
+        Args:
+            endpoint: API endpoint.
+            **kwargs: Additional request parameters.
+        """
+        await self._retrying_request("DELETE", endpoint, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and release resources."""
+        await self._client.aclose()
+        logger.debug("Async Kong client closed")
+
+    async def __aenter__(self) -> AsyncKongAdminClient:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
+    # Convenience methods for common operations
+
+    async def get_status(self) -> dict[str, Any]:
+        """Get Kong node status.
+
+        Returns:
+            Kong status information including database connectivity.
+        """
+        return await self.get("status")
+
+    async def get_info(self) -> dict[str, Any]:
+        """Get Kong node information.
+
+        Returns:
+            Kong node details including version, hostname, plugins.
+        """
+        return await self.get("")
+
+    async def check_connection(self) -> bool:
+        """Check if connection to Kong Admin API is working.
+
+        Returns:
+            True if connection is successful, False otherwise.
+        """
+        try:
+            await self.get_status()
+            return True
+        except KongAPIError:
+            return False
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import os
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from system_operations_manager.utils.pagination import MAX_PAGE_SIZE, validate_page_size
+
 if TYPE_CHECKING:
     from system_operations_manager.integrations.observability.config import (
         ObservabilityStackConfig,
@@ -22,6 +25,11 @@ class KongConnectionConfig(BaseModel):
     timeout: int = 30
     verify_ssl: bool = True
     retries: int = 3
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    max_in_flight: int = 50
 
     @field_validator("base_url")
     @classmethod
@@ -47,6 +55,22 @@ class KongConnectionConfig(BaseModel):
             raise ValueError("retries must be non-negative")
         return v
 
+    @field_validator("max_connections", "max_keepalive_connections", "max_in_flight")
+    @classmethod
+    def validate_pool_size(cls, v: int) -> int:
+        """Validate connection pool and concurrency limits are at least 1."""
+        if v < 1:
+            raise ValueError("connection limits must be at least 1")
+        return v
+
+    @field_validator("keepalive_expiry")
+    @classmethod
+    def validate_keepalive_expiry(cls, v: float) -> float:
+        """Validate keepalive expiry is non-negative."""
+        if v < 0:
+            raise ValueError("keepalive_expiry must be non-negative")
+        return v
+
 
 class KongAuthConfig(BaseModel):
     """Kong Admin API authentication configuration."""
@@ -78,6 +102,77 @@ class KongEnterpriseConfig(BaseModel):
     enabled: bool = False
 
 
+class KongSyncConfig(BaseModel):
+    """Gateway/Konnect query and sync push concurrency configuration."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_concurrency: int = 8
+    gateway_timeout: float | None = None
+    konnect_timeout: float | None = None
+    push_concurrency: int = 8
+    konnect_requests_per_second: float = 20.0
+    page_size: int | None = MAX_PAGE_SIZE
+    audit_rotate_days: int | None = 30
+    audit_retention_days: int | None = None
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def validate_max_concurrency(cls, v: int) -> int:
+        """Validate max_concurrency is at least 1."""
+        if v < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        return v
+
+    @field_validator("push_concurrency")
+    @classmethod
+    def validate_push_concurrency(cls, v: int) -> int:
+        """Validate push_concurrency is at least 1."""
+        if v < 1:
+            raise ValueError("push_concurrency must be at least 1")
+        return v
+
+    @field_validator("konnect_requests_per_second")
+    @classmethod
+    def validate_requests_per_second(cls, v: float) -> float:
+        """Validate the Konnect request rate is positive."""
+        if v <= 0:
+            raise ValueError("konnect_requests_per_second must be positive")
+        return v
+
+    @field_validator("page_size")
+    @classmethod
+    def validate_page_size(cls, v: int | None) -> int | None:
+        """Validate page_size is within the API's limits."""
+        return validate_page_size(v)
+
+    @property
+    def audit_max_age(self) -> timedelta | None:
+        """Age at which the sync audit log is rotated."""
+        return timedelta(days=self.audit_rotate_days) if self.audit_rotate_days else None
+
+    @property
+    def audit_retention(self) -> timedelta | None:
+        """Age beyond which rotated sync audit segments are removed (None keeps all)."""
+        return timedelta(days=self.audit_retention_days) if self.audit_retention_days else None
+
+    @field_validator("audit_rotate_days", "audit_retention_days")
+    @classmethod
+    def validate_audit_days(cls, v: int | None) -> int | None:
+        """Validate audit log rotation/retention periods are positive."""
+        if v is not None and v < 1:
+            raise ValueError("audit rotation and retention must be at least 1 day")
+        return v
+
+    @field_validator("gateway_timeout", "konnect_timeout")
+    @classmethod
+    def validate_source_timeout(cls, v: float | None) -> float | None:
+        """Validate source timeouts are positive."""
+        if v is not None and v <= 0:
+            raise ValueError("timeout must be positive")
+        return v
+
+
 class KongPluginConfig(BaseModel):
     """Complete Kong plugin configuration."""
 
@@ -88,6 +183,7 @@ class KongPluginConfig(BaseModel):
     output_format: Literal["table", "json", "yaml"] = "table"
     default_workspace: str = "default"
     enterprise: KongEnterpriseConfig = KongEnterpriseConfig()
+    sync: KongSyncConfig = KongSyncConfig()
     observability: ObservabilityStackConfig | None = None
 
     @field_validator("output_format")
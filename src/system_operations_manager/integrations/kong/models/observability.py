@@ -6,7 +6,7 @@ node statistics, and observability plugin configurations.
 
 from __future__ import annotations
 
-from typing import Any, ClassVar, Literal
+from typing import Any, ClassVar, Literal, get_args
 
 from pydantic import ConfigDict, Field
 
@@ -14,6 +14,7 @@ from system_operations_manager.integrations.kong.models.base import KongEntityBa
 
 # Prometheus metric types
 MetricType = Literal["counter", "gauge", "histogram", "summary", "untyped"]
+METRIC_TYPES: frozenset[str] = frozenset(get_args(MetricType))
 
 # Health status values
 HealthStatus = Literal["HEALTHY", "UNHEALTHY", "DNS_ERROR", "HEALTHCHECKS_OFF"]
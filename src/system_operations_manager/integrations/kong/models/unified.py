@@ -3,14 +3,20 @@
 This module provides models for representing Kong entities that may exist
 in multiple sources (Gateway data plane and Konnect control plane), with
 support for drift detection between sources.
+
+Merging is on the hot path of every sync and unified listing, so drift
+compares field values in place instead of dumping both entities, the
+merged list is not revalidated row by row, and the per-source counters are
+tallied in a single pass.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from system_operations_manager.integrations.kong.models.base import KongEntityBase
 
@@ -23,6 +29,13 @@ class EntitySource(StrEnum):
     BOTH = "both"
 
 
+# Metadata that differs by source and is never compared for drift
+DRIFT_EXCLUDED_FIELDS = frozenset({"id", "created_at", "updated_at"})
+
+# Counters kept by UnifiedEntityList
+_COUNTERS = ("gateway_only", "konnect_only", "in_both", "drift", "synced")
+
+
 class UnifiedEntity[T: KongEntityBase](BaseModel):
     """Wrapper for entities from multiple sources with drift detection.
 
@@ -88,10 +101,28 @@ class UnifiedEntityList[T: KongEntityBase](BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    # Cached counters and the (list id, length) they were tallied for
+    _counts: dict[str, int] | None = PrivateAttr(default=None)
+    _counted: tuple[int, int] = PrivateAttr(default=(0, -1))
+
     def __len__(self) -> int:
         """Return the number of entities."""
         return len(self.entities)
 
+    def _tally(self) -> dict[str, int]:
+        """Count entities by sync state in one pass.
+
+        The result is cached until the entities list is replaced or
+        changes length.
+        """
+        key = (id(self.entities), len(self.entities))
+        if self._counts is None or self._counted != key:
+            counts = dict.fromkeys(_COUNTERS, 0)
+            for e in self.entities:
+                _count(counts, e.source, e.has_drift)
+            self._counts, self._counted = counts, key
+        return self._counts
+
     @property
     def gateway_only(self) -> list[UnifiedEntity[T]]:
         """Get entities that exist only in Gateway."""
@@ -120,27 +151,27 @@ class UnifiedEntityList[T: KongEntityBase](BaseModel):
     @property
     def gateway_only_count(self) -> int:
         """Count of entities only in Gateway."""
-        return len(self.gateway_only)
+        return self._tally()["gateway_only"]
 
     @property
     def konnect_only_count(self) -> int:
         """Count of entities only in Konnect."""
-        return len(self.konnect_only)
+        return self._tally()["konnect_only"]
 
     @property
     def in_both_count(self) -> int:
         """Count of entities in both sources."""
-        return len(self.in_both)
+        return self._tally()["in_both"]
 
     @property
     def drift_count(self) -> int:
         """Count of entities with drift."""
-        return len(self.with_drift)
+        return self._tally()["drift"]
 
     @property
     def synced_count(self) -> int:
         """Count of fully synced entities."""
-        return len(self.synced)
+        return self._tally()["synced"]
 
     def filter_by_source(self, source: EntitySource | str) -> UnifiedEntityList[T]:
         """Filter entities by source.
@@ -194,21 +225,22 @@ def detect_drift(
     if gateway_entity is None or konnect_entity is None:
         return False, []
 
-    # Default fields to exclude from comparison (metadata that differs by source)
-    exclude_fields = {"id", "created_at", "updated_at"}
-
-    # Get fields to compare
-    gateway_data = gateway_entity.model_dump(exclude_none=True)
-    konnect_data = konnect_entity.model_dump(exclude_none=True)
+    if type(gateway_entity) is type(konnect_entity):
+        # Same model: compare the validated field values directly. Nested
+        # models compare by value, which matches comparing their dumps.
+        gateway_data: dict[str, Any] = gateway_entity.__dict__
+        konnect_data: dict[str, Any] = konnect_entity.__dict__
+    else:
+        gateway_data = gateway_entity.model_dump(exclude_none=True)
+        konnect_data = konnect_entity.model_dump(exclude_none=True)
 
     if compare_fields is None:
         # Compare all common fields except excluded ones
-        all_fields = set(gateway_data.keys()) | set(konnect_data.keys())
-        compare_fields = list(all_fields - exclude_fields)
+        compare_fields = [*gateway_data, *(f for f in konnect_data if f not in gateway_data)]
 
     drift_fields = []
     for field in compare_fields:
-        if field in exclude_fields:
+        if field in DRIFT_EXCLUDED_FIELDS:
             continue
 
         gateway_val = gateway_data.get(field)
@@ -224,49 +256,68 @@ def detect_drift(
     return len(drift_fields) > 0, drift_fields
 
 
+def _count(counts: dict[str, int], source: EntitySource, has_drift: bool) -> None:
+    """Add one entity to a UnifiedEntityList counter dict."""
+    if source == EntitySource.GATEWAY:
+        counts["gateway_only"] += 1
+    elif source == EntitySource.KONNECT:
+        counts["konnect_only"] += 1
+    elif source == EntitySource.BOTH:
+        counts["in_both"] += 1
+        if not has_drift:
+            counts["synced"] += 1
+    if has_drift:
+        counts["drift"] += 1
+
+
 def merge_entities[T: KongEntityBase](
     gateway_entities: list[T],
     konnect_entities: list[T],
     key_field: str = "name",
     compare_fields: list[str] | None = None,
+    *,
+    key: Callable[[T], str | None] | None = None,
 ) -> UnifiedEntityList[T]:
     """Merge entities from Gateway and Konnect into a unified list.
 
     Matches entities by a key field (typically 'name') and detects drift
-    between matching entities.
+    between matching entities. Entities without a key are dropped.
 
     Args:
         gateway_entities: Entities from Gateway.
         konnect_entities: Entities from Konnect.
         key_field: Field to use for matching entities (default: 'name').
         compare_fields: Fields to compare for drift detection.
+        key: Function deriving the match key from an entity, used instead
+            of key_field when given.
 
     Returns:
-        UnifiedEntityList with merged entities and drift information.
+        UnifiedEntityList with merged entities, sorted by key, and its
+        counters already tallied.
     """
-    unified: list[UnifiedEntity[Any]] = []
+
+    def key_of(entity: T) -> str | None:
+        return key(entity) if key else getattr(entity, key_field, None)
 
     # Index entities by key
     gateway_by_key: dict[str, T] = {}
     for entity in gateway_entities:
-        key = getattr(entity, key_field, None)
-        if key:
-            gateway_by_key[key] = entity
+        if k := key_of(entity):
+            gateway_by_key[k] = entity
 
     konnect_by_key: dict[str, T] = {}
     for entity in konnect_entities:
-        key = getattr(entity, key_field, None)
-        if key:
-            konnect_by_key[key] = entity
+        if k := key_of(entity):
+            konnect_by_key[k] = entity
 
-    # Process all keys
-    all_keys = set(gateway_by_key.keys()) | set(konnect_by_key.keys())
+    unified: list[UnifiedEntity[Any]] = []
+    counts = dict.fromkeys(_COUNTERS, 0)
 
-    for key in sorted(all_keys):
-        gateway_entity = gateway_by_key.get(key)
-        konnect_entity = konnect_by_key.get(key)
+    for k in sorted(gateway_by_key.keys() | konnect_by_key.keys()):
+        gateway_entity = gateway_by_key.get(k)
+        konnect_entity = konnect_by_key.get(k)
 
-        if gateway_entity and konnect_entity:
+        if gateway_entity is not None and konnect_entity is not None:
             # Entity exists in both
             has_drift, drift_fields = detect_drift(gateway_entity, konnect_entity, compare_fields)
             unified.append(
@@ -281,7 +332,8 @@ def merge_entities[T: KongEntityBase](
                     konnect_entity=konnect_entity,
                 )
             )
-        elif gateway_entity:
+            _count(counts, EntitySource.BOTH, has_drift)
+        elif gateway_entity is not None:
             # Only in Gateway
             unified.append(
                 UnifiedEntity(
@@ -291,7 +343,8 @@ def merge_entities[T: KongEntityBase](
                     gateway_entity=gateway_entity,
                 )
             )
-        elif konnect_entity:
+            _count(counts, EntitySource.GATEWAY, False)
+        elif konnect_entity is not None:
             # Only in Konnect
             unified.append(
                 UnifiedEntity(
@@ -301,5 +354,9 @@ def merge_entities[T: KongEntityBase](
                     konnect_entity=konnect_entity,
                 )
             )
+            _count(counts, EntitySource.KONNECT, False)
 
-    return UnifiedEntityList(entities=unified)
+    # The rows were validated as they were built; skip revalidating the list
+    result: UnifiedEntityList[T] = UnifiedEntityList.model_construct(entities=unified)
+    result._counts, result._counted = counts, (id(unified), len(unified))
+    return result
@@ -1,5 +1,6 @@
 """Kong Konnect API integration."""
 
+from system_operations_manager.integrations.konnect.cache import ControlPlaneCache
 from system_operations_manager.integrations.konnect.client import KonnectClient
 from system_operations_manager.integrations.konnect.config import (
     KonnectConfig,
@@ -11,9 +12,13 @@ from system_operations_manager.integrations.konnect.exceptions import (
     KonnectConfigError,
     KonnectConnectionError,
     KonnectNotFoundError,
+    KonnectRateLimitError,
+    KonnectTimeoutError,
 )
+from system_operations_manager.integrations.konnect.rate_limit import KonnectRateLimiter
 
 __all__ = [
+    "ControlPlaneCache",
     "KonnectAPIError",
     "KonnectAuthError",
     "KonnectClient",
@@ -21,5 +26,8 @@ __all__ = [
     "KonnectConfigError",
     "KonnectConnectionError",
     "KonnectNotFoundError",
+    "KonnectRateLimitError",
+    "KonnectRateLimiter",
     "KonnectRegion",
+    "KonnectTimeoutError",
 ]
@@ -0,0 +1,217 @@
+"""On-disk cache for Konnect control plane name resolution."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from system_operations_manager.integrations.konnect.exceptions import KonnectNotFoundError
+
+if TYPE_CHECKING:
+    from system_operations_manager.integrations.konnect.client import KonnectClient
+    from system_operations_manager.integrations.konnect.config import KonnectConfig
+
+logger = structlog.get_logger()
+
+
+class ControlPlaneCache:
+    """TTL cache mapping control plane names to IDs.
+
+    Resolving a control plane by name requires listing every control plane
+    in the organization. The cache persists name→ID resolutions in
+    ``~/.cache/ops/konnect_control_planes.json`` so subsequent CLI
+    invocations can skip that lookup entirely.
+
+    Entries are keyed by region, a fingerprint of the API token and the
+    requested name, so switching tokens or regions never returns another
+    organization's IDs. Cache I/O errors are logged and otherwise ignored.
+
+    Example:
+        ```python
+        cache = ControlPlaneCache()
+        cp_id = cache.resolve(client, config, "production")
+
+        # Same, and re-resolve on the first 404 if the cached ID went stale
+        cp_id = cache.bind(client, config, "production")
+        ```
+    """
+
+    DEFAULT_TTL_SECONDS = 3600
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Cache file path (defaults to get_cache_path()).
+            ttl_seconds: Seconds before a cached resolution expires.
+        """
+        self._path = path or self.get_cache_path()
+        self._ttl_seconds = ttl_seconds
+
+    @classmethod
+    def get_cache_path(cls) -> Path:
+        """Get the cache file path.
+
+        Returns:
+            Path to the cache file (~/.cache/ops/konnect_control_planes.json).
+        """
+        cache_dir = Path.home() / ".cache" / "ops"
+        return cache_dir / "konnect_control_planes.json"
+
+    @staticmethod
+    def _key(config: KonnectConfig, name_or_id: str) -> str:
+        """Build the cache key for a control plane lookup."""
+        token_fingerprint = hashlib.sha256(
+            str(config.token.get_secret_value()).encode()
+        ).hexdigest()[:16]
+        return f"{config.region.value}:{token_fingerprint}:{name_or_id}"
+
+    def _load(self) -> dict[str, Any]:
+        """Load cache entries from disk."""
+        try:
+            with self._path.open() as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable control plane cache", error=str(e))
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, entries: dict[str, Any]) -> None:
+        """Atomically write cache entries to disk with owner-only permissions."""
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix=".cp-cache-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                Path(tmp_name).chmod(0o600)
+                Path(tmp_name).replace(self._path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug("Failed to write control plane cache", error=str(e))
+
+    def get(self, config: KonnectConfig, name_or_id: str) -> str | None:
+        """Get a cached control plane ID.
+
+        Args:
+            config: Konnect configuration (region and token scope the entry).
+            name_or_id: Control plane name or ID as configured.
+
+        Returns:
+            Cached control plane ID, or None if missing or expired.
+        """
+        entry = self._load().get(self._key(config, name_or_id))
+        if not isinstance(entry, dict):
+            return None
+        if time.time() - float(entry.get("resolved_at", 0)) > self._ttl_seconds:
+            return None
+        cp_id = entry.get("id")
+        return cp_id if isinstance(cp_id, str) else None
+
+    def set(self, config: KonnectConfig, name_or_id: str, control_plane_id: str) -> None:
+        """Store a control plane resolution, pruning expired entries.
+
+        Args:
+            config: Konnect configuration (region and token scope the entry).
+            name_or_id: Control plane name or ID as configured.
+            control_plane_id: Resolved control plane ID.
+        """
+        now = time.time()
+        entries = {
+            key: entry
+            for key, entry in self._load().items()
+            if isinstance(entry, dict)
+            and now - float(entry.get("resolved_at", 0)) <= self._ttl_seconds
+        }
+        entries[self._key(config, name_or_id)] = {"id": control_plane_id, "resolved_at": now}
+        self._save(entries)
+
+    def invalidate(self, config: KonnectConfig, name_or_id: str) -> None:
+        """Remove a cached resolution.
+
+        Args:
+            config: Konnect configuration (region and token scope the entry).
+            name_or_id: Control plane name or ID as configured.
+        """
+        entries = self._load()
+        if entries.pop(self._key(config, name_or_id), None) is not None:
+            self._save(entries)
+
+    def resolve(self, client: KonnectClient, config: KonnectConfig, name_or_id: str) -> str:
+        """Resolve a control plane ID, consulting the cache first.
+
+        Args:
+            client: Konnect client used on a cache miss.
+            config: Konnect configuration (region and token scope the entry).
+            name_or_id: Control plane name or ID.
+
+        Returns:
+            Control plane ID.
+
+        Raises:
+            KonnectNotFoundError: If the control plane does not exist.
+        """
+        cached = self.get(config, name_or_id)
+        if cached:
+            logger.debug("Control plane resolved from cache", control_plane=name_or_id)
+            return cached
+
+        control_plane_id = client.find_control_plane(name_or_id).id
+        self.set(config, name_or_id, control_plane_id)
+        return control_plane_id
+
+    def bind(self, client: KonnectClient, config: KonnectConfig, name_or_id: str) -> str:
+        """Resolve a control plane ID and let the client heal it if it goes stale.
+
+        The ID is returned straight from the cache when possible, with no
+        request to confirm it. The client is given a resolver instead: when
+        a control-plane-scoped request returns 404 with an ID that came from
+        the cache, the entry is invalidated and the name resolved again, so
+        a control plane deleted and recreated under the same name is picked
+        up on the first real request that needs it.
+
+        Args:
+            client: Konnect client that will use the ID.
+            config: Konnect configuration (region and token scope the entry).
+            name_or_id: Control plane name or ID.
+
+        Returns:
+            Control plane ID.
+
+        Raises:
+            KonnectNotFoundError: If the control plane does not exist.
+        """
+        cached = self.get(config, name_or_id)
+        control_plane_id = self.resolve(client, config, name_or_id)
+
+        def re_resolve(stale_id: str) -> str | None:
+            if cached is None or stale_id != cached:
+                return None  # Resolved from the API just now; a 404 is about the entity
+            logger.debug(
+                "Cached control plane ID not found, re-resolving",
+                control_plane=name_or_id,
+                stale_id=stale_id,
+            )
+            self.invalidate(config, name_or_id)
+            try:
+                return self.resolve(client, config, name_or_id)
+            except KonnectNotFoundError:
+                return None
+
+        client.set_control_plane_resolver(re_resolve)
+        return control_plane_id
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import random
 import re
+import threading
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 import httpx
 import structlog
 from tenacity import (
+    RetryCallState,
     retry,
-    retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from system_operations_manager.integrations.konnect.exceptions import (
@@ -19,12 +22,19 @@ from system_operations_manager.integrations.konnect.exceptions import (
     KonnectAuthError,
     KonnectConnectionError,
     KonnectNotFoundError,
+    KonnectRateLimitError,
+    KonnectTimeoutError,
 )
 from system_operations_manager.integrations.konnect.models import (
     ControlPlane,
     ControlPlaneListResponse,
     DataPlaneCertificate,
 )
+from system_operations_manager.integrations.konnect.rate_limit import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    KonnectRateLimiter,
+    parse_retry_after,
+)
 
 if TYPE_CHECKING:
     from system_operations_manager.integrations.konnect.config import KonnectConfig
@@ -44,6 +54,68 @@ from system_operations_manager.integrations.kong.models.upstream import Target,
 
 logger = structlog.get_logger()
 
+# Attempts per request, including the first
+MAX_REQUEST_ATTEMPTS = 5
+
+# Server errors Konnect returns while overloaded or restarting
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Methods safe to repeat after a server error or a read/write timeout; a POST
+# may already have been committed, so it is only retried when it never left
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "PATCH", "DELETE"})
+
+# Pause after a 429 that carries no Retry-After header
+DEFAULT_RATE_LIMIT_PAUSE = 1.0
+
+_jittered_backoff = wait_random_exponential(multiplier=0.5, max=10)
+
+# Endpoints scoped to one control plane; group 1 is the control plane ID
+_CONTROL_PLANE_SCOPED = re.compile(r"^/v2/control-planes/([^/]+)/")
+
+
+def _is_retryable(error: BaseException, method: str) -> bool:
+    """Check if a failed request is worth retrying.
+
+    Args:
+        error: The error the request raised.
+        method: HTTP method of the request.
+
+    Returns:
+        True for connection errors and 429s, and for timeouts and retryable
+        5xx responses to idempotent methods.
+    """
+    if isinstance(error, KonnectTimeoutError):
+        return method.upper() in IDEMPOTENT_METHODS
+    if isinstance(error, KonnectConnectionError | KonnectRateLimitError):
+        return True
+    return (
+        isinstance(error, KonnectAPIError)
+        and error.status_code in RETRYABLE_STATUS_CODES
+        and method.upper() in IDEMPOTENT_METHODS
+    )
+
+
+def _should_retry(retry_state: RetryCallState) -> bool:
+    """Tenacity retry predicate for KonnectClient._request."""
+    if retry_state.outcome is None or not retry_state.outcome.failed:
+        return False
+    error = retry_state.outcome.exception()
+    # _request(self, method, endpoint, ...)
+    method = retry_state.kwargs.get("method") or retry_state.args[1]
+    return error is not None and _is_retryable(error, str(method))
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Back off with full jitter before retrying a request.
+
+    A 429 has already paused the client's rate limiter for Retry-After, so
+    it only adds a little jitter to keep callers from retrying in lockstep.
+    """
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, KonnectRateLimitError):
+        return random.uniform(0, 1)
+    return _jittered_backoff(retry_state)
+
 
 class KonnectClient:
     """HTTP client for Kong Konnect API.
@@ -51,6 +123,15 @@ class KonnectClient:
     This client provides methods to interact with the Konnect API for
     managing control planes and data plane certificates.
 
+    The client is safe to share between threads. Every request goes through
+    one KonnectRateLimiter, and 429s and connection failures are retried
+    with jittered backoff, as are 5xx responses to idempotent methods.
+
+    With a control plane resolver set (see set_control_plane_resolver), a
+    404 from a control-plane-scoped endpoint asks the resolver whether the
+    control plane ID is stale. If it returns a new ID, the request is
+    retried once with it and later requests for the old ID use the new one.
+
     Example:
         ```python
         from system_operations_manager.integrations.konnect import (
@@ -66,13 +147,27 @@ class KonnectClient:
         ```
     """
 
-    def __init__(self, config: KonnectConfig) -> None:
+    def __init__(
+        self,
+        config: KonnectConfig,
+        *,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> None:
         """Initialize Konnect client.
 
         Args:
             config: Konnect configuration with token and region.
+            requests_per_second: Highest request rate the client sends at;
+                lowered automatically to the quota Konnect reports.
         """
         self.config = config
+        self.rate_limiter = KonnectRateLimiter(requests_per_second)
+        self._control_plane_resolver: Callable[[str], str | None] | None = None
+        # Stale control plane IDs mapped to their replacements, and IDs the
+        # resolver already confirmed, so each ID is re-resolved at most once
+        self._control_plane_aliases: dict[str, str] = {}
+        self._confirmed_control_planes: set[str] = set()
+        self._control_plane_lock = threading.Lock()
         self._client = httpx.Client(
             base_url=config.api_url,
             timeout=httpx.Timeout(30.0),
@@ -116,19 +211,100 @@ class KonnectClient:
         )
         return bool(uuid_pattern.match(value))
 
+    def set_control_plane_resolver(self, resolver: Callable[[str], str | None]) -> None:
+        """Set the callback that re-resolves a control plane ID after a 404.
+
+        Args:
+            resolver: Receives the control plane ID whose request returned
+                404 and returns its current ID, or None if it cannot tell.
+        """
+        self._control_plane_resolver = resolver
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Make an HTTP request to Konnect API, healing stale control plane IDs.
+
+        Args:
+            method: HTTP method.
+            endpoint: API endpoint.
+            **kwargs: Additional arguments for httpx.
+
+        Returns:
+            Response JSON data.
+
+        Raises:
+            KonnectConnectionError: On connection failure.
+            KonnectTimeoutError: If a sent request gets no answer in time.
+            KonnectAuthError: On authentication failure.
+            KonnectNotFoundError: On 404 response.
+            KonnectRateLimitError: On 429 response.
+            KonnectAPIError: On other API errors.
+        """
+        match = _CONTROL_PLANE_SCOPED.match(endpoint)
+        if match is None:
+            return self._send(method, endpoint, **kwargs)
+
+        control_plane_id = match.group(1)
+        current_id = self._control_plane_aliases.get(control_plane_id, control_plane_id)
+        try:
+            return self._send(method, self._rebind(endpoint, current_id), **kwargs)
+        except KonnectNotFoundError:
+            fresh_id = self._refresh_control_plane(current_id)
+            if fresh_id is None:
+                raise
+            with self._control_plane_lock:
+                self._control_plane_aliases[control_plane_id] = fresh_id
+        return self._send(method, self._rebind(endpoint, fresh_id), **kwargs)
+
+    @staticmethod
+    def _rebind(endpoint: str, control_plane_id: str) -> str:
+        """Point a control-plane-scoped endpoint at another control plane ID."""
+        prefix = "/v2/control-planes/"
+        rest = endpoint[len(prefix) :].partition("/")[2]
+        return f"{prefix}{control_plane_id}/{rest}"
+
+    def _refresh_control_plane(self, control_plane_id: str) -> str | None:
+        """Ask the resolver for a new ID once per control plane ID.
+
+        Returns:
+            The replacement ID, or None if there is no resolver, the ID was
+            already confirmed, or the resolver returned the same ID.
+        """
+        if self._control_plane_resolver is None:
+            return None
+        with self._control_plane_lock:
+            if control_plane_id in self._confirmed_control_planes:
+                return None
+            self._confirmed_control_planes.add(control_plane_id)
+        fresh_id = self._control_plane_resolver(control_plane_id)
+        if not fresh_id or fresh_id == control_plane_id:
+            return None
+        with self._control_plane_lock:
+            self._confirmed_control_planes.add(fresh_id)
+        logger.info(
+            "Control plane ID was stale, retrying with re-resolved ID",
+            stale_id=control_plane_id,
+            control_plane_id=fresh_id,
+        )
+        return fresh_id
+
     @retry(
-        retry=retry_if_exception_type(KonnectConnectionError),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=_should_retry,
+        stop=stop_after_attempt(MAX_REQUEST_ATTEMPTS),
+        wait=_retry_wait,
         reraise=True,
     )
-    def _request(
+    def _send(
         self,
         method: str,
         endpoint: str,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Make an HTTP request to Konnect API.
+        """Send one HTTP request to Konnect API, retrying transient failures.
 
         Args:
             method: HTTP method.
@@ -140,10 +316,13 @@ class KonnectClient:
 
         Raises:
             KonnectConnectionError: On connection failure.
+            KonnectTimeoutError: If a sent request gets no answer in time.
             KonnectAuthError: On authentication failure.
             KonnectNotFoundError: On 404 response.
+            KonnectRateLimitError: On 429 response.
             KonnectAPIError: On other API errors.
         """
+        self.rate_limiter.acquire()
         try:
             response = self._client.request(method, endpoint, **kwargs)
         except httpx.ConnectError as e:
@@ -156,18 +335,41 @@ class KonnectClient:
                 f"Failed to connect to Konnect API: {e}",
                 details=str(e),
             ) from e
+        except (httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            logger.error(
+                "Konnect timeout before sending",
+                endpoint=endpoint,
+                error=str(e),
+            )
+            raise KonnectConnectionError(
+                "Request to Konnect API timed out before it was sent",
+                details=str(e),
+            ) from e
         except httpx.TimeoutException as e:
             logger.error(
                 "Konnect timeout",
                 endpoint=endpoint,
                 error=str(e),
             )
-            raise KonnectConnectionError(
+            raise KonnectTimeoutError(
                 "Request to Konnect API timed out",
                 details=str(e),
             ) from e
 
+        self.rate_limiter.update(response.headers)
+
         # Handle errors
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.rate_limiter.pause(
+                DEFAULT_RATE_LIMIT_PAUSE if retry_after is None else retry_after
+            )
+            logger.warning("Konnect rate limit hit", endpoint=endpoint, retry_after=retry_after)
+            raise KonnectRateLimitError(
+                "Konnect API rate limit exceeded",
+                retry_after=retry_after,
+                details=response.text,
+            )
         if response.status_code == 401:
             raise KonnectAuthError(
                 "Invalid Konnect API token",
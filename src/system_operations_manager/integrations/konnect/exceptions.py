@@ -22,6 +22,10 @@ class KonnectConnectionError(KonnectError):
     """Raised when connection to Konnect API fails."""
 
 
+class KonnectTimeoutError(KonnectConnectionError):
+    """Raised when Konnect API does not answer a request that was sent."""
+
+
 class KonnectAuthError(KonnectError):
     """Raised when authentication fails."""
 
@@ -52,3 +56,23 @@ class KonnectNotFoundError(KonnectAPIError):
 
 class KonnectConfigError(KonnectError):
     """Raised when configuration is invalid or missing."""
+
+
+class KonnectRateLimitError(KonnectAPIError):
+    """Raised when Konnect rejects a request with 429 Too Many Requests."""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: float | None = None,
+        details: str | None = None,
+    ) -> None:
+        """Initialize exception.
+
+        Args:
+            message: Error message.
+            retry_after: Seconds Konnect asked to wait, if it said.
+            details: Additional details.
+        """
+        super().__init__(message, status_code=429, details=details)
+        self.retry_after = retry_after
@@ -0,0 +1,200 @@
+"""Client-side rate limiting for the Konnect API.
+
+Konnect enforces per-token request quotas and answers 429 once they run
+out. Sync push issues thousands of writes from several threads, so every
+request made through a KonnectClient first takes a token from a shared
+KonnectRateLimiter.
+
+The limiter is a token bucket whose refill rate starts at the configured
+ceiling and follows the quota Konnect reports: when a response says how
+many requests remain in the current window, the rate drops to spread them
+evenly over the rest of it, and climbs back to the ceiling once the window
+resets. A 429 pauses the whole bucket for ``Retry-After`` seconds, so
+concurrent callers back off together instead of each burning a retry.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Requests per second allowed before Konnect reports its own quota
+DEFAULT_REQUESTS_PER_SECOND = 20.0
+
+# Rate never drops below this, so a nearly spent quota still makes progress
+MIN_REQUESTS_PER_SECOND = 0.5
+
+# Kong rate-limiting window suffixes and their length in seconds
+_KONG_WINDOWS = {"second": 1, "minute": 60, "hour": 3600}
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date.
+        now: Current epoch time, for HTTP dates. Defaults to time.time().
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except TypeError, ValueError:
+        return None
+    return max(retry_at - (time.time() if now is None else now), 0.0)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    """Read a numeric header, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def remaining_quota(headers: Mapping[str, str]) -> tuple[float, float] | None:
+    """Read the remaining request quota from rate-limit response headers.
+
+    Understands the IETF ``RateLimit-Remaining``/``RateLimit-Reset`` pair
+    and Kong's ``X-RateLimit-Remaining-<window>`` headers; with several
+    Kong windows, the one allowing the lowest rate wins.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        Tuple of (remaining requests, seconds until the window resets), or
+        None if the response carries no quota information.
+    """
+    remaining = _header_float(headers, "RateLimit-Remaining")
+    reset = _header_float(headers, "RateLimit-Reset")
+    if remaining is not None and reset is not None:
+        return remaining, max(reset, 1.0)
+
+    quota: tuple[float, float] | None = None
+    for window, seconds in _KONG_WINDOWS.items():
+        left = _header_float(headers, f"X-RateLimit-Remaining-{window.capitalize()}")
+        if left is None:
+            continue
+        if quota is None or left / seconds < quota[0] / quota[1]:
+            quota = (left, float(seconds))
+    return quota
+
+
+class KonnectRateLimiter:
+    """Thread-safe token bucket that adapts to Konnect's reported quota.
+
+    Example:
+        >>> limiter = KonnectRateLimiter(requests_per_second=10)
+        >>> limiter.acquire()  # blocks until a request may be sent
+        >>> limiter.update(response.headers)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_second: Ceiling rate. The bucket holds one second's
+                worth of tokens at the current rate, which bounds bursts.
+            clock: Monotonic clock, injectable for tests.
+            sleep: Sleep function, injectable for tests.
+
+        Raises:
+            ValueError: If requests_per_second is not positive.
+        """
+        if requests_per_second <= 0:
+            raise ValueError(f"requests_per_second must be positive, got {requests_per_second}")
+        self._ceiling = requests_per_second
+        self._rate = requests_per_second
+        self._tokens = max(requests_per_second, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in requests per second."""
+        with self._lock:
+            return self._rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then take a token."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    delay = (1 - self._tokens) / self._rate
+            self._sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Adjust the refill rate to the quota a response reports.
+
+        Args:
+            headers: Response headers.
+        """
+        quota = remaining_quota(headers)
+        if quota is None:
+            return
+        remaining, reset = quota
+        with self._lock:
+            self._refill(self._clock())
+            if remaining <= 0:
+                self._pause(reset)
+            rate = min(self._ceiling, max(remaining / reset, MIN_REQUESTS_PER_SECOND))
+            if rate != self._rate:
+                logger.debug("Konnect request rate adjusted", rate=round(rate, 2))
+                self._rate = rate
+                self._tokens = min(self._tokens, max(rate, 1.0))
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the given time, e.g. after a 429.
+
+        Args:
+            seconds: Seconds to pause for.
+        """
+        with self._lock:
+            self._pause(seconds)
+
+    def _pause(self, seconds: float) -> None:
+        """Extend the pause window and empty the bucket (lock held)."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        self._tokens = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill (lock held)."""
+        if now > self._updated:
+            elapsed = now - max(self._updated, self._paused_until)
+            if elapsed > 0:
+                capacity = max(self._rate, 1.0)
+                self._tokens = min(capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
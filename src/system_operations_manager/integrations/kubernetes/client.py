@@ -7,6 +7,8 @@ error translation.
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -17,6 +19,10 @@ from tenacity import (
     wait_exponential,
 )
 
+from system_operations_manager.integrations.kubernetes.discovery import (
+    DEFAULT_DISCOVERY_TTL,
+    new_dynamic_client,
+)
 from system_operations_manager.integrations.kubernetes.exceptions import (
     KubernetesAuthError,
     KubernetesConflictError,
@@ -25,9 +31,14 @@ from system_operations_manager.integrations.kubernetes.exceptions import (
     KubernetesNotFoundError,
     KubernetesValidationError,
 )
+from system_operations_manager.integrations.kubernetes.informer import (
+    INFORMER_RESOURCES,
+    Informer,
+)
 
 if TYPE_CHECKING:
     from kubernetes.client import (
+        ApiClient,
         AppsV1Api,
         BatchV1Api,
         CoreV1Api,
@@ -50,10 +61,13 @@ class KubernetesClient:
 
     Wraps the official kubernetes Python client with:
     - Multi-cluster context management via kubeconfig
-    - Lazy API group initialization
+    - Lazy API group initialization over one shared ApiClient
+    - Dynamic client backed by a persistent discovery cache
     - Automatic retry with tenacity for transient errors
     - Consistent error translation to custom exceptions
     - Context manager support
+    - Pooled per-cluster clients that do not touch global configuration
+    - Optional watch-backed informers that serve repeated list calls
 
     Example:
         ```python
@@ -69,7 +83,7 @@ class KubernetesClient:
         ```
     """
 
-    def __init__(self, plugin_config: KubernetesPluginConfig) -> None:
+    def __init__(self, plugin_config: KubernetesPluginConfig, *, isolated: bool = False) -> None:
         """Initialize Kubernetes client from plugin config.
 
         Loads kubeconfig and sets the active context. If no clusters are
@@ -78,10 +92,29 @@ class KubernetesClient:
 
         Args:
             plugin_config: Complete plugin configuration.
+            isolated: If True, build a private ApiClient for the active
+                context instead of loading it into the global kubernetes
+                configuration. Isolated clients can be used side by side
+                from different threads.
         """
         self._config = plugin_config
         self._retries = plugin_config.defaults.retry_attempts
         self._current_context: str | None = None
+        self._isolated = isolated
+        self._api_client: ApiClient | None = None
+        self._dynamic_client: Any = None
+        self._dynamic_created = 0.0
+        self._api_lock = threading.Lock()
+
+        # Informers by resource name; None while informers are disabled
+        self._informers: dict[str, Informer] | None = None
+        self._informer_lock = threading.Lock()
+        # Resources whose cluster-wide LIST/WATCH RBAC denies on this context
+        self._informers_denied: set[str] = set()
+
+        # Per-cluster isolated clients, created on first use
+        self._cluster_clients: dict[str, KubernetesClient] = {}
+        self._cluster_lock = threading.Lock()
 
         # Lazy-loaded API group instances
         self._core_v1: CoreV1Api | None = None
@@ -116,10 +149,7 @@ class KubernetesClient:
                 cluster_cfg = self._config.clusters[self._config.active_cluster]
                 kubeconfig_path = cluster_cfg.kubeconfig
 
-            config.load_kube_config(
-                config_file=kubeconfig_path,
-                context=active_context,
-            )
+            self._load_kube_config(kubeconfig_path, active_context)
             self._current_context = active_context
             logger.debug(
                 "loaded_kubeconfig",
@@ -128,7 +158,14 @@ class KubernetesClient:
             )
         except ConfigException:
             try:
-                config.load_incluster_config()
+                if self._isolated:
+                    from kubernetes.client import ApiClient, Configuration
+
+                    configuration = Configuration()
+                    config.load_incluster_config(client_configuration=configuration)
+                    self._api_client = ApiClient(configuration)
+                else:
+                    config.load_incluster_config()
                 self._current_context = "in-cluster"
                 logger.debug("loaded_incluster_config")
             except ConfigException as e:
@@ -141,8 +178,36 @@ class KubernetesClient:
         # Reset cached API instances on config change
         self._invalidate_api_cache()
 
+    def _load_kube_config(self, config_file: str | None, context: str | None) -> None:
+        """Load a kubeconfig context, privately if this client is isolated.
+
+        Raises:
+            ConfigException: If the kubeconfig or context cannot be loaded.
+        """
+        from kubernetes import config
+
+        if not self._isolated:
+            config.load_kube_config(config_file=config_file, context=context)
+            return
+
+        api_client = config.new_client_from_config(config_file=config_file, context=context)
+        if self._api_client is not None:
+            self._api_client.close()
+        self._api_client = api_client
+
     def _invalidate_api_cache(self) -> None:
-        """Clear cached API group instances."""
+        """Clear cached API group instances and the dynamic client.
+
+        The shared ApiClient of a non-isolated client is dropped too, since
+        it was built from the previous global configuration. Running
+        informers are stopped; they restart against the new context on
+        their next use.
+        """
+        self._stop_informers()
+        self._dynamic_client = None
+        if not self._isolated and self._api_client is not None:
+            self._api_client.close()
+            self._api_client = None
         self._core_v1 = None
         self._apps_v1 = None
         self._batch_v1 = None
@@ -156,13 +221,45 @@ class KubernetesClient:
     # Lazy API Group Accessors
     # =========================================================================
 
+    @property
+    def api_client(self) -> ApiClient:
+        """Get the ApiClient shared by every API group of this client.
+
+        Isolated clients return their private ApiClient. The default client
+        builds one from the global configuration on first use and keeps it
+        (and its connection pool) until the context changes.
+        """
+        if self._api_client is None:
+            from kubernetes.client import ApiClient
+
+            with self._api_lock:
+                if self._api_client is None:
+                    self._api_client = ApiClient()
+        return self._api_client
+
+    @property
+    def dynamic_client(self) -> Any:
+        """Get a DynamicClient backed by the cluster's discovery cache.
+
+        The client is created once and reused, so API discovery runs at most
+        once per process (and not at all while the on-disk cache is fresh).
+        It is rebuilt when older than the discovery TTL.
+        """
+        api_client = self.api_client
+        with self._api_lock:
+            age = time.monotonic() - self._dynamic_created
+            if self._dynamic_client is None or age > DEFAULT_DISCOVERY_TTL.total_seconds():
+                self._dynamic_client = new_dynamic_client(api_client)
+                self._dynamic_created = time.monotonic()
+            return self._dynamic_client
+
     @property
     def core_v1(self) -> CoreV1Api:
         """Get CoreV1Api instance (pods, services, namespaces, secrets, configmaps, etc.)."""
         if self._core_v1 is None:
             from kubernetes.client import CoreV1Api
 
-            self._core_v1 = CoreV1Api()
+            self._core_v1 = CoreV1Api(self.api_client)
         return self._core_v1
 
     @property
@@ -171,7 +268,7 @@ class KubernetesClient:
         if self._apps_v1 is None:
             from kubernetes.client import AppsV1Api
 
-            self._apps_v1 = AppsV1Api()
+            self._apps_v1 = AppsV1Api(self.api_client)
         return self._apps_v1
 
     @property
@@ -180,7 +277,7 @@ class KubernetesClient:
         if self._batch_v1 is None:
             from kubernetes.client import BatchV1Api
 
-            self._batch_v1 = BatchV1Api()
+            self._batch_v1 = BatchV1Api(self.api_client)
         return self._batch_v1
 
     @property
@@ -189,7 +286,7 @@ class KubernetesClient:
         if self._custom_objects is None:
             from kubernetes.client import CustomObjectsApi
 
-            self._custom_objects = CustomObjectsApi()
+            self._custom_objects = CustomObjectsApi(self.api_client)
         return self._custom_objects
 
     @property
@@ -198,7 +295,7 @@ class KubernetesClient:
         if self._networking_v1 is None:
             from kubernetes.client import NetworkingV1Api
 
-            self._networking_v1 = NetworkingV1Api()
+            self._networking_v1 = NetworkingV1Api(self.api_client)
         return self._networking_v1
 
     @property
@@ -207,7 +304,7 @@ class KubernetesClient:
         if self._rbac_v1 is None:
             from kubernetes.client import RbacAuthorizationV1Api
 
-            self._rbac_v1 = RbacAuthorizationV1Api()
+            self._rbac_v1 = RbacAuthorizationV1Api(self.api_client)
         return self._rbac_v1
 
     @property
@@ -216,7 +313,7 @@ class KubernetesClient:
         if self._storage_v1 is None:
             from kubernetes.client import StorageV1Api
 
-            self._storage_v1 = StorageV1Api()
+            self._storage_v1 = StorageV1Api(self.api_client)
         return self._storage_v1
 
     @property
@@ -225,7 +322,7 @@ class KubernetesClient:
         if self._version_api is None:
             from kubernetes.client import VersionApi
 
-            self._version_api = VersionApi()
+            self._version_api = VersionApi(self.api_client)
         return self._version_api
 
     # =========================================================================
@@ -242,7 +339,6 @@ class KubernetesClient:
         Raises:
             KubernetesConnectionError: If the context cannot be loaded.
         """
-        from kubernetes import config
         from kubernetes.config import ConfigException
 
         # Check if it's a named cluster in our config
@@ -253,10 +349,7 @@ class KubernetesClient:
             kubeconfig_path = cluster_cfg.kubeconfig
 
         try:
-            config.load_kube_config(
-                config_file=kubeconfig_path,
-                context=context_name,
-            )
+            self._load_kube_config(kubeconfig_path, context_name)
             self._current_context = context_name
             self._invalidate_api_cache()
             logger.info("switched_context", context=context_name)
@@ -266,6 +359,45 @@ class KubernetesClient:
                 original_error=e,
             ) from e
 
+    def for_cluster(self, cluster_name: str) -> KubernetesClient:
+        """Get an isolated client for a named cluster from the plugin config.
+
+        Clients are created on first use and pooled, so repeated calls reuse
+        the same connection pool. Unlike switch_context(), this never changes
+        the global kubernetes configuration or this client's context, and the
+        returned clients are safe to use concurrently with each other.
+
+        Args:
+            cluster_name: A named cluster from the plugin config.
+
+        Returns:
+            Client bound to the cluster's kubeconfig, context, namespace and
+            timeout.
+
+        Raises:
+            KubernetesConnectionError: If the cluster is unknown or its
+                context cannot be loaded.
+        """
+        with self._cluster_lock:
+            cached = self._cluster_clients.get(cluster_name)
+            if cached is not None:
+                return cached
+
+        if cluster_name not in self._config.clusters:
+            raise KubernetesConnectionError(
+                message=f"Cluster '{cluster_name}' is not configured",
+            )
+
+        # Build outside the lock so slow kubeconfig loads do not serialize
+        cluster_config = self._config.model_copy(update={"active_cluster": cluster_name})
+        client = KubernetesClient(cluster_config, isolated=True)
+
+        with self._cluster_lock:
+            existing = self._cluster_clients.setdefault(cluster_name, client)
+        if existing is not client:
+            client.close()
+        return existing
+
     def get_current_context(self) -> str:
         """Get the current active context name.
 
@@ -420,6 +552,82 @@ class KubernetesClient:
                 original_error=e,
             ) from e
 
+    # =========================================================================
+    # Informers
+    # =========================================================================
+
+    def enable_informers(self) -> None:
+        """Serve supported list calls from watch-backed informers.
+
+        Each resource type is listed once on first use and then kept up to
+        date by a WATCH, so managers answer repeated list calls without
+        re-listing the cluster. Meant for long-running callers such as the
+        TUI; one-shot commands are better served by a plain LIST.
+        """
+        with self._informer_lock:
+            if self._informers is None:
+                self._informers = {}
+
+    def disable_informers(self) -> None:
+        """Stop all informers and return to plain list calls."""
+        self._stop_informers()
+        with self._informer_lock:
+            self._informers = None
+
+    @property
+    def informers_enabled(self) -> bool:
+        """Check whether list calls are served from informers."""
+        return self._informers is not None
+
+    def informer(self, resource: str) -> Informer | None:
+        """Get the running informer for a resource type, starting it if needed.
+
+        Args:
+            resource: Resource name from ``INFORMER_RESOURCES`` (e.g. "pods").
+
+        Returns:
+            The synced informer, or None if informers are disabled, the
+            resource type is not supported, or the informer could not start
+            (e.g. the user may only list namespaced resources). The caller
+            then falls back to a plain LIST. A 401/403 is remembered until
+            the context changes, so the cluster-wide LIST is not retried on
+            every refresh.
+        """
+        from kubernetes.client import ApiException
+
+        if resource not in INFORMER_RESOURCES:
+            return None
+        with self._informer_lock:
+            if self._informers is None or resource in self._informers_denied:
+                return None
+            informer = self._informers.get(resource)
+            if informer is None:
+                group, method = INFORMER_RESOURCES[resource]
+                informer = Informer(getattr(getattr(self, group), method), resource=resource)
+                try:
+                    informer.start()
+                except ApiException as e:
+                    if e.status in (401, 403):
+                        self._informers_denied.add(resource)
+                    logger.info("informer_unavailable", resource=resource, status=e.status)
+                    return None
+                except Exception as e:
+                    logger.info("informer_unavailable", resource=resource, error=str(e))
+                    return None
+                self._informers[resource] = informer
+            return informer
+
+    def _stop_informers(self) -> None:
+        """Stop running informers, keeping informers enabled if they were."""
+        with self._informer_lock:
+            self._informers_denied.clear()
+            if not self._informers:
+                return
+            informers = list(self._informers.values())
+            self._informers.clear()
+        for informer in informers:
+            informer.stop()
+
     # =========================================================================
     # Properties
     # =========================================================================
@@ -434,13 +642,27 @@ class KubernetesClient:
         """Get the configured timeout."""
         return self._config.get_active_timeout()
 
+    @property
+    def fast_list_enabled(self) -> bool:
+        """Check whether list calls decode raw JSON instead of SDK objects."""
+        return self._config.defaults.fast_list
+
     # =========================================================================
     # Lifecycle
     # =========================================================================
 
     def close(self) -> None:
         """Close the client and release resources."""
+        with self._cluster_lock:
+            cluster_clients = list(self._cluster_clients.values())
+            self._cluster_clients.clear()
+        for client in cluster_clients:
+            client.close()
+
         self._invalidate_api_cache()
+        if self._api_client is not None:
+            self._api_client.close()
+            self._api_client = None
         logger.debug("Kubernetes client closed")
 
     def __enter__(self) -> KubernetesClient:
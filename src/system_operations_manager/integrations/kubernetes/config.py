@@ -63,6 +63,7 @@ class KubernetesDefaultsConfig(BaseModel):
     timeout: int = 300
     retry_attempts: int = 3
     dry_run_strategy: Literal["none", "client", "server"] = "none"
+    fast_list: bool = False
 
     @field_validator("timeout")
     @classmethod
@@ -115,6 +116,7 @@ class KubernetesPluginConfig(BaseModel):
             OPS_K8S_TIMEOUT: Default timeout in seconds
             OPS_K8S_OUTPUT: Output format (table, json, yaml)
             OPS_K8S_DRY_RUN: Dry run strategy (none, client, server)
+            OPS_K8S_FAST_LIST: Decode list responses without the SDK (true/false)
         """
         config_dict = base_config.copy() if base_config else {}
 
@@ -157,6 +159,10 @@ class KubernetesPluginConfig(BaseModel):
         if dry_run := os.environ.get("OPS_K8S_DRY_RUN"):
             config_dict["defaults"]["dry_run_strategy"] = dry_run
 
+        # Fast list decoding override
+        if fast_list := os.environ.get("OPS_K8S_FAST_LIST"):
+            config_dict["defaults"]["fast_list"] = fast_list.lower() in ("1", "true", "yes")
+
         # Extract internal override keys before validation
         kubeconfig_override = config_dict.pop("_kubeconfig_override", None)
         namespace_override = config_dict.pop("_namespace_override", None)
@@ -0,0 +1,82 @@
+"""Persistent API discovery cache for dynamic clients.
+
+Creating a ``kubernetes.dynamic.DynamicClient`` runs API discovery, which
+costs a request per API group the first time a kind is looked up. The
+library can persist discovery results to a JSON file, but by default it
+writes one file per API host to the temp directory and never expires it.
+
+This module keeps one cache file per cluster (keyed by API server URL)
+under the user's cache directory and discards it once it is older than a
+TTL. The library still re-runs discovery on its own when a kind is missing
+from the cache, so newly installed CRDs are picked up before the TTL runs
+out.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from kubernetes.client import ApiClient
+
+logger = structlog.get_logger()
+
+# Default cache location following XDG spec
+DEFAULT_DISCOVERY_CACHE_DIR = Path.home() / ".cache" / "ops" / "k8s_discovery"
+
+# Matches kubectl's disk discovery cache lifetime
+DEFAULT_DISCOVERY_TTL = timedelta(hours=6)
+
+
+def discovery_cache_path(host: str, directory: Path = DEFAULT_DISCOVERY_CACHE_DIR) -> Path:
+    """Get the discovery cache file for an API server.
+
+    Args:
+        host: API server URL (``ApiClient.configuration.host``).
+        directory: Cache directory.
+
+    Returns:
+        Path of the cluster's cache file.
+    """
+    digest = hashlib.sha256(host.encode()).hexdigest()[:16]
+    return directory / f"{digest}.json"
+
+
+def new_dynamic_client(
+    api_client: ApiClient,
+    *,
+    directory: Path = DEFAULT_DISCOVERY_CACHE_DIR,
+    ttl: timedelta = DEFAULT_DISCOVERY_TTL,
+) -> Any:
+    """Create a DynamicClient backed by the cluster's on-disk discovery cache.
+
+    An expired cache file is removed first, so discovery runs again from
+    scratch and rewrites it.
+
+    Args:
+        api_client: ApiClient of the cluster to talk to.
+        directory: Cache directory.
+        ttl: Maximum age of a cache file before it is discarded.
+
+    Returns:
+        A ``kubernetes.dynamic.DynamicClient``.
+    """
+    from kubernetes.dynamic import DynamicClient
+
+    path = discovery_cache_path(api_client.configuration.host, directory)
+    try:
+        age = time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        age = None
+    if age is not None and age > ttl.total_seconds():
+        path.unlink(missing_ok=True)
+        logger.debug("discovery_cache_expired", path=str(path), age=round(age))
+
+    directory.mkdir(parents=True, exist_ok=True)
+    return DynamicClient(api_client, cache_file=str(path))
@@ -0,0 +1,349 @@
+"""Watch-backed informer cache for Kubernetes list calls.
+
+An informer runs one cluster-wide LIST of a resource type, then keeps a
+WATCH open from the returned resourceVersion and applies every event to an
+in-memory store. List calls are answered from the store, so a client that
+refreshes the same view repeatedly (the TUI, long-running commands) pays
+for the changes on the cluster rather than a full LIST per refresh.
+
+The store is indexed by namespace, by label and by owner UID. Watches ask
+for bookmarks, and the informer resumes from the latest bookmarked
+resourceVersion when a watch times out. If that version has expired
+(410 Gone) it re-lists and starts over. While watches keep failing (RBAC
+denials, network errors) the store is marked unhealthy and list calls fall
+back to a LIST until a watch delivers events again.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Resources an informer can serve: name -> (client API group, cluster-wide list method).
+# Secrets are deliberately absent so the client never mirrors every Secret in memory.
+INFORMER_RESOURCES: dict[str, tuple[str, str]] = {
+    "pods": ("core_v1", "list_pod_for_all_namespaces"),
+    "services": ("core_v1", "list_service_for_all_namespaces"),
+    "config_maps": ("core_v1", "list_config_map_for_all_namespaces"),
+    "events": ("core_v1", "list_event_for_all_namespaces"),
+    "namespaces": ("core_v1", "list_namespace"),
+    "nodes": ("core_v1", "list_node"),
+    "deployments": ("apps_v1", "list_deployment_for_all_namespaces"),
+    "stateful_sets": ("apps_v1", "list_stateful_set_for_all_namespaces"),
+    "daemon_sets": ("apps_v1", "list_daemon_set_for_all_namespaces"),
+    "replica_sets": ("apps_v1", "list_replica_set_for_all_namespaces"),
+    "ingresses": ("networking_v1", "list_ingress_for_all_namespaces"),
+    "network_policies": ("networking_v1", "list_network_policy_for_all_namespaces"),
+}
+
+# Server-side timeout of one watch request; the watch is then resumed
+WATCH_TIMEOUT_SECONDS = 300
+
+# Client read timeout, above the interval between bookmarks and the watch timeout
+WATCH_READ_TIMEOUT_SECONDS = WATCH_TIMEOUT_SECONDS + 30
+
+# Delay before retrying a failed watch, doubled per failure up to the maximum
+WATCH_RETRY_SECONDS = 1.0
+WATCH_RETRY_MAX_SECONDS = 30.0
+
+# Consecutive watch failures after which the store is no longer served
+WATCH_UNHEALTHY_FAILURES = 3
+
+type ObjectKey = tuple[str, str]
+type Requirement = tuple[str, str | None]
+
+
+def parse_label_selector(selector: str) -> list[Requirement] | None:
+    """Parse an equality-based label selector.
+
+    Supports ``key=value``, ``key==value`` and bare ``key`` (label exists)
+    requirements joined by commas.
+
+    Args:
+        selector: Label selector string, e.g. ``'app=web,tier'``.
+
+    Returns:
+        (key, value) requirements, with value None for existence checks, or
+        None if the selector uses other operators (``!=``, ``in``,
+        ``notin``, ``!key``) that the store cannot answer from its index.
+    """
+    requirements: list[Requirement] = []
+    for part in selector.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "!" in part or " " in part or "(" in part:
+            return None
+        key, sep, value = part.partition("=")
+        if sep:
+            value = value.removeprefix("=")
+            if "=" in value:
+                return None
+            requirements.append((key.strip(), value.strip()))
+        else:
+            requirements.append((key, None))
+    return requirements
+
+
+class Informer:
+    """One resource type's LIST+WATCH mirror.
+
+    Example:
+        >>> informer = Informer(client.core_v1.list_pod_for_all_namespaces, resource="pods")
+        >>> informer.start()
+        >>> informer.list_objects("default", label_selector="app=web")
+        >>> informer.stop()
+    """
+
+    def __init__(self, list_func: Callable[..., Any], *, resource: str) -> None:
+        """Initialize the informer.
+
+        Args:
+            list_func: Cluster-wide list method of the resource (e.g.
+                ``CoreV1Api.list_pod_for_all_namespaces``), used for both the
+                LIST and the WATCH.
+            resource: Resource name for logging.
+        """
+        self._list_func = list_func
+        self._resource = resource
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._watch: Any = None
+        self._resource_version: str | None = None
+        self._watch_failures = 0
+        self._log = logger.bind(informer=resource)
+
+        self._objects: dict[ObjectKey, Any] = {}
+        self._by_namespace: dict[str, set[ObjectKey]] = {}
+        self._by_label: dict[Requirement, set[ObjectKey]] = {}
+        self._by_owner: dict[str, set[ObjectKey]] = {}
+
+    @property
+    def resource(self) -> str:
+        """Get the resource name."""
+        return self._resource
+
+    @property
+    def resource_version(self) -> str | None:
+        """Get the resourceVersion the store is synced to."""
+        return self._resource_version
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the watch is keeping the store current.
+
+        False once WATCH_UNHEALTHY_FAILURES watches in a row have failed
+        without delivering an event; True again after the next event.
+        """
+        return self._watch_failures < WATCH_UNHEALTHY_FAILURES
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """List the resource and start watching for changes.
+
+        The initial LIST runs in the calling thread, so API errors surface
+        to the caller and the store is complete once this returns.
+        """
+        self._relist()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"informer-{self._resource}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching. The store keeps its last contents."""
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _relist(self) -> None:
+        """Replace the store with a fresh LIST."""
+        result = self._list_func()
+        objects: dict[ObjectKey, Any] = {}
+        for obj in result.items:
+            objects[_key(obj)] = obj
+        with self._lock:
+            self._objects = {}
+            self._by_namespace = {}
+            self._by_label = {}
+            self._by_owner = {}
+            for key, obj in objects.items():
+                self._index(key, obj)
+            self._resource_version = result.metadata.resource_version
+        self._log.debug(
+            "informer_listed", objects=len(objects), resource_version=self._resource_version
+        )
+
+    def _run(self) -> None:
+        """Watch loop: apply events, resume after timeouts, re-list on 410."""
+        from kubernetes import watch
+        from kubernetes.client import ApiException
+
+        retry = WATCH_RETRY_SECONDS
+        while not self._stopped.is_set():
+            self._watch = watch.Watch()
+            try:
+                for event in self._watch.stream(
+                    self._list_func,
+                    resource_version=self._resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                    _request_timeout=WATCH_READ_TIMEOUT_SECONDS,
+                ):
+                    if self._stopped.is_set():
+                        break
+                    self.apply_event(event)
+                    self._watch_failures = 0
+                retry = WATCH_RETRY_SECONDS
+            except ApiException as e:
+                if e.status == 410:
+                    self._log.debug("informer_expired", resource_version=self._resource_version)
+                    try:
+                        self._relist()
+                        self._watch_failures = 0
+                        continue
+                    except Exception as relist_error:
+                        self._log.warning("informer_relist_failed", error=str(relist_error))
+                else:
+                    self._log.warning("informer_watch_failed", error=str(e.reason))
+                self._record_failure()
+                self._stopped.wait(retry)
+                retry = min(retry * 2, WATCH_RETRY_MAX_SECONDS)
+            except Exception as e:
+                self._log.warning("informer_watch_failed", error=str(e))
+                self._record_failure()
+                self._stopped.wait(retry)
+                retry = min(retry * 2, WATCH_RETRY_MAX_SECONDS)
+
+    def _record_failure(self) -> None:
+        """Count a failed watch, logging when the store stops being served."""
+        self._watch_failures += 1
+        if self._watch_failures == WATCH_UNHEALTHY_FAILURES:
+            self._log.warning("informer_unhealthy", failures=self._watch_failures)
+
+    # -------------------------------------------------------------------------
+    # Store maintenance
+    # -------------------------------------------------------------------------
+
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """Apply one watch event to the store.
+
+        Args:
+            event: Event from ``kubernetes.watch.Watch.stream`` with
+                ``type``, ``object`` and ``raw_object`` keys.
+        """
+        event_type = event.get("type")
+        if event_type == "BOOKMARK":
+            metadata = (event.get("raw_object") or {}).get("metadata") or {}
+            if version := metadata.get("resourceVersion"):
+                self._resource_version = version
+            return
+
+        obj = event.get("object")
+        if event_type not in ("ADDED", "MODIFIED", "DELETED") or obj is None:
+            return
+        key = _key(obj)
+        with self._lock:
+            self._unindex(key)
+            if event_type != "DELETED":
+                self._index(key, obj)
+            self._resource_version = obj.metadata.resource_version or self._resource_version
+
+    def _index(self, key: ObjectKey, obj: Any) -> None:
+        self._objects[key] = obj
+        self._by_namespace.setdefault(key[0], set()).add(key)
+        for label in (obj.metadata.labels or {}).items():
+            self._by_label.setdefault(label, set()).add(key)
+            self._by_label.setdefault((label[0], None), set()).add(key)
+        for owner in obj.metadata.owner_references or []:
+            self._by_owner.setdefault(owner.uid, set()).add(key)
+
+    def _unindex(self, key: ObjectKey) -> None:
+        obj = self._objects.pop(key, None)
+        if obj is None:
+            return
+        _discard(self._by_namespace, key[0], key)
+        for label in (obj.metadata.labels or {}).items():
+            _discard(self._by_label, label, key)
+            _discard(self._by_label, (label[0], None), key)
+        for owner in obj.metadata.owner_references or []:
+            _discard(self._by_owner, owner.uid, key)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def list_objects(
+        self, namespace: str | None = None, *, label_selector: str | None = None
+    ) -> list[Any] | None:
+        """List objects from the store.
+
+        Args:
+            namespace: Only objects in this namespace (None for all).
+            label_selector: Equality-based label selector.
+
+        Returns:
+            Matching objects sorted by namespace and name (the order a LIST
+            returns), or None if the caller has to LIST instead: the
+            selector is not equality-based, or the watch is unhealthy and
+            the store may be stale.
+        """
+        if not self.healthy:
+            return None
+        requirements = parse_label_selector(label_selector) if label_selector else []
+        if requirements is None:
+            return None
+
+        with self._lock:
+            candidates: list[set[ObjectKey]] = [
+                self._by_label.get(requirement, set()) for requirement in requirements
+            ]
+            if namespace is not None:
+                candidates.append(self._by_namespace.get(namespace, set()))
+            keys: Iterable[ObjectKey]
+            if candidates:
+                candidates.sort(key=len)
+                keys = candidates[0].intersection(*candidates[1:])
+            else:
+                keys = self._objects
+            return [self._objects[key] for key in sorted(keys)]
+
+    def owned_by(self, uid: str) -> list[Any]:
+        """List objects whose owner references include ``uid``.
+
+        Args:
+            uid: Owner UID (e.g. a ReplicaSet's ``metadata.uid``).
+
+        Returns:
+            Owned objects sorted by namespace and name.
+        """
+        with self._lock:
+            return [self._objects[key] for key in sorted(self._by_owner.get(uid, ()))]
+
+    def __len__(self) -> int:
+        """Get the number of objects in the store."""
+        return len(self._objects)
+
+
+def _key(obj: Any) -> ObjectKey:
+    """Get an object's (namespace, name) store key ("" for cluster-scoped)."""
+    return (obj.metadata.namespace or "", obj.metadata.name)
+
+
+def _discard[K](index: dict[K, set[ObjectKey]], bucket: K, key: ObjectKey) -> None:
+    """Remove a key from an index bucket, dropping the bucket once empty."""
+    keys = index.get(bucket)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[bucket]
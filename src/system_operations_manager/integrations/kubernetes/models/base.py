@@ -68,6 +68,16 @@ class OwnerReference(BaseModel):
             uid=getattr(obj, "uid", None),
         )
 
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> OwnerReference:
+        """Create from a raw JSON owner reference, skipping validation."""
+        return cls.model_construct(
+            api_version=obj.get("apiVersion"),
+            kind=obj.get("kind"),
+            name=obj.get("name"),
+            uid=obj.get("uid"),
+        )
+
 
 def _safe_get(obj: Any, *attrs: str, default: Any = None) -> Any:
     """Safely traverse nested attributes on kubernetes SDK objects."""
@@ -100,3 +110,27 @@ def _get_annotations(obj: Any) -> dict[str, str] | None:
     """Extract annotations dict, returning None if empty."""
     annotations = _safe_get(obj, "metadata", "annotations")
     return dict(annotations) if annotations else None
+
+
+def _json_timestamp(value: str | None) -> str | None:
+    """Normalize an API timestamp string to the form ``_get_timestamp`` produces.
+
+    The API serializes UTC as ``Z`` while the SDK's datetimes render it as
+    ``+00:00``; normalizing keeps both conversion paths byte-identical.
+    """
+    if value and value.endswith("Z"):
+        return value[:-1] + "+00:00"
+    return value
+
+
+def _json_metadata(obj: dict[str, Any]) -> dict[str, Any]:
+    """Extract the ``K8sEntityBase`` fields from a raw JSON API object."""
+    metadata: dict[str, Any] = obj.get("metadata") or {}
+    return {
+        "name": metadata.get("name") or "",
+        "namespace": metadata.get("namespace"),
+        "uid": metadata.get("uid"),
+        "creation_timestamp": _json_timestamp(metadata.get("creationTimestamp")),
+        "labels": metadata.get("labels") or None,
+        "annotations": metadata.get("annotations") or None,
+    }
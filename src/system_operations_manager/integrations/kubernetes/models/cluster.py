@@ -11,6 +11,8 @@ from system_operations_manager.integrations.kubernetes.models.base import (
     _get_annotations,
     _get_labels,
     _get_timestamp,
+    _json_metadata,
+    _json_timestamp,
     _safe_get,
 )
 
@@ -140,3 +142,24 @@ class EventSummary(K8sEntityBase):
             involved_object_kind=_safe_get(involved, "kind"),
             involved_object_name=_safe_get(involved, "name"),
         )
+
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> EventSummary:
+        """Create from a raw JSON core/v1 Event, skipping validation."""
+        metadata = _json_metadata(obj)
+        involved: dict[str, Any] = obj.get("involvedObject") or {}
+        return cls.model_construct(
+            name=metadata["name"],
+            namespace=metadata["namespace"],
+            uid=metadata["uid"],
+            creation_timestamp=metadata["creation_timestamp"],
+            type=obj.get("type") or "Normal",
+            reason=obj.get("reason"),
+            message=obj.get("message"),
+            source_component=(obj.get("source") or {}).get("component"),
+            first_timestamp=_json_timestamp(obj.get("firstTimestamp")),
+            last_timestamp=_json_timestamp(obj.get("lastTimestamp")),
+            count=obj.get("count") or 1,
+            involved_object_kind=involved.get("kind"),
+            involved_object_name=involved.get("name"),
+        )
@@ -44,6 +44,9 @@ class ClusterDeployResult(BaseModel):
     results: list[dict[str, Any]] = Field(
         default_factory=list, description="Per-resource apply results"
     )
+    timed_out: bool = Field(
+        default=False, description="Whether the deploy timed out with its outcome unknown"
+    )
     error: str | None = Field(default=None, description="Error message if deploy failed")
 
 
@@ -58,6 +61,7 @@ class MultiClusterDeployResult(BaseModel):
     total_clusters: int = Field(default=0, description="Total clusters targeted")
     successful: int = Field(default=0, description="Clusters where all resources succeeded")
     failed: int = Field(default=0, description="Clusters where one or more resources failed")
+    unknown: int = Field(default=0, description="Clusters that timed out with the outcome unknown")
 
 
 class ClusterSyncResult(BaseModel):
@@ -68,6 +72,9 @@ class ClusterSyncResult(BaseModel):
     cluster: str = Field(description="Target cluster name")
     success: bool = Field(description="Whether the sync was successful")
     action: str = Field(default="", description="Action taken (created, configured, skipped)")
+    timed_out: bool = Field(
+        default=False, description="Whether the sync timed out with its outcome unknown"
+    )
     error: str | None = Field(default=None, description="Error message if sync failed")
 
 
@@ -86,3 +93,4 @@ class MultiClusterSyncResult(BaseModel):
     total_targets: int = Field(default=0, description="Total target clusters")
     successful: int = Field(default=0, description="Successful syncs")
     failed: int = Field(default=0, description="Failed syncs")
+    unknown: int = Field(default=0, description="Syncs that timed out with the outcome unknown")
@@ -102,6 +102,20 @@ class WorkloadResourceAnalysis(K8sEntityBase):
         return f"{self.total_usage.memory_display}/{req_mi:.0f}Mi"
 
 
+class UsagePercentiles(BaseModel):
+    """Percentiles of sampled per-pod usage over a time window."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    samples: int = Field(default=0, description="Number of pod samples in the window")
+    cpu_p50_millicores: int = Field(default=0, description="Median CPU usage per pod")
+    cpu_p95_millicores: int = Field(default=0, description="95th percentile CPU usage per pod")
+    cpu_max_millicores: int = Field(default=0, description="Peak CPU usage per pod")
+    memory_p50_bytes: int = Field(default=0, description="Median memory usage per pod")
+    memory_p95_bytes: int = Field(default=0, description="95th percentile memory usage per pod")
+    memory_max_bytes: int = Field(default=0, description="Peak memory usage per pod")
+
+
 class RightsizingRecommendation(K8sEntityBase):
     """Right-sizing recommendation for a single workload."""
 
@@ -122,6 +136,9 @@ class RightsizingRecommendation(K8sEntityBase):
     memory_savings_bytes: int = Field(
         default=0, description="Memory savings in bytes (positive = saving)"
     )
+    usage_percentiles: UsagePercentiles | None = Field(
+        default=None, description="Sampled usage the recommendation is based on, if any"
+    )
 
 
 # =============================================================================
@@ -12,6 +12,7 @@ from system_operations_manager.integrations.kubernetes.models.base import (
     _get_annotations,
     _get_labels,
     _get_timestamp,
+    _json_metadata,
     _safe_get,
 )
 
@@ -48,6 +49,26 @@ class ContainerStatus(K8sEntityBase):
             state=state,
         )
 
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> ContainerStatus:
+        """Create from a raw JSON container status, skipping validation."""
+        state = "unknown"
+        if obj_state := obj.get("state"):
+            if obj_state.get("running"):
+                state = "running"
+            elif waiting := obj_state.get("waiting"):
+                state = str(waiting.get("reason") or "Waiting")
+            elif terminated := obj_state.get("terminated"):
+                state = str(terminated.get("reason") or "Terminated")
+
+        return cls.model_construct(
+            name=obj.get("name") or "",
+            image=obj.get("image"),
+            ready=obj.get("ready") or False,
+            restart_count=obj.get("restartCount") or 0,
+            state=state,
+        )
+
 
 class PodSummary(K8sEntityBase):
     """Pod display model."""
@@ -92,6 +113,28 @@ class PodSummary(K8sEntityBase):
             containers=containers,
         )
 
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> PodSummary:
+        """Create from a raw JSON Pod, skipping validation.
+
+        Used by the fast list path, which decodes LIST responses itself
+        instead of letting the SDK deserialize them into V1Pod objects.
+        """
+        spec: dict[str, Any] = obj.get("spec") or {}
+        status: dict[str, Any] = obj.get("status") or {}
+        containers = [ContainerStatus.from_json(cs) for cs in status.get("containerStatuses") or []]
+
+        return cls.model_construct(
+            **_json_metadata(obj),
+            phase=status.get("phase") or "Unknown",
+            node_name=spec.get("nodeName"),
+            pod_ip=status.get("podIP"),
+            restarts=sum(c.restart_count for c in containers),
+            ready_count=sum(1 for c in containers if c.ready),
+            total_count=len(spec.get("containers") or []),
+            containers=containers,
+        )
+
 
 class DeploymentSummary(K8sEntityBase):
     """Deployment display model."""
@@ -121,6 +164,20 @@ class DeploymentSummary(K8sEntityBase):
             strategy=_safe_get(obj, "spec", "strategy", "type"),
         )
 
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> DeploymentSummary:
+        """Create from a raw JSON Deployment, skipping validation."""
+        spec: dict[str, Any] = obj.get("spec") or {}
+        status: dict[str, Any] = obj.get("status") or {}
+        return cls.model_construct(
+            **_json_metadata(obj),
+            replicas=spec.get("replicas") or 0,
+            ready_replicas=status.get("readyReplicas") or 0,
+            available_replicas=status.get("availableReplicas") or 0,
+            updated_replicas=status.get("updatedReplicas") or 0,
+            strategy=(spec.get("strategy") or {}).get("type"),
+        )
+
 
 class StatefulSetSummary(K8sEntityBase):
     """StatefulSet display model."""
@@ -146,6 +203,18 @@ class StatefulSetSummary(K8sEntityBase):
             service_name=_safe_get(obj, "spec", "service_name"),
         )
 
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> StatefulSetSummary:
+        """Create from a raw JSON StatefulSet, skipping validation."""
+        spec: dict[str, Any] = obj.get("spec") or {}
+        status: dict[str, Any] = obj.get("status") or {}
+        return cls.model_construct(
+            **_json_metadata(obj),
+            replicas=spec.get("replicas") or 0,
+            ready_replicas=status.get("readyReplicas") or 0,
+            service_name=spec.get("serviceName"),
+        )
+
 
 class DaemonSetSummary(K8sEntityBase):
     """DaemonSet display model."""
@@ -176,6 +245,19 @@ class DaemonSetSummary(K8sEntityBase):
             node_selector=dict(node_selector) if node_selector else None,
         )
 
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> DaemonSetSummary:
+        """Create from a raw JSON DaemonSet, skipping validation."""
+        template_spec = ((obj.get("spec") or {}).get("template") or {}).get("spec") or {}
+        status: dict[str, Any] = obj.get("status") or {}
+        return cls.model_construct(
+            **_json_metadata(obj),
+            desired_number_scheduled=status.get("desiredNumberScheduled") or 0,
+            current_number_scheduled=status.get("currentNumberScheduled") or 0,
+            number_ready=status.get("numberReady") or 0,
+            node_selector=template_spec.get("nodeSelector") or None,
+        )
+
 
 class ReplicaSetSummary(K8sEntityBase):
     """ReplicaSet display model."""
@@ -203,3 +285,14 @@ class ReplicaSetSummary(K8sEntityBase):
             ready_replicas=_safe_get(obj, "status", "ready_replicas", default=0) or 0,
             owner_references=[OwnerReference.from_k8s_object(ref) for ref in owner_refs],
         )
+
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> ReplicaSetSummary:
+        """Create from a raw JSON ReplicaSet, skipping validation."""
+        owner_refs = (obj.get("metadata") or {}).get("ownerReferences") or []
+        return cls.model_construct(
+            **_json_metadata(obj),
+            replicas=(obj.get("spec") or {}).get("replicas") or 0,
+            ready_replicas=(obj.get("status") or {}).get("readyReplicas") or 0,
+            owner_references=[OwnerReference.from_json(ref) for ref in owner_refs],
+        )
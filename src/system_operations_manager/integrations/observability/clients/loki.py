@@ -5,6 +5,7 @@ Provides methods to query Kong logs from Loki.
 
 from __future__ import annotations
 
+import math
 from datetime import datetime, timedelta
 from typing import Any, Literal, cast
 
@@ -134,17 +135,26 @@ class LokiClient(BaseObservabilityClient):
                         }
                     )
         elif result_type == "matrix":
+            # Every series of a range query is sampled at the same steps, so
+            # each step's datetime is built once and shared across series
+            stamps: dict[float, datetime] = {}
             for series in results:
                 labels = series.get("metric", {})
-                for value in series.get("values", []):
-                    timestamp, val = value
-                    entries.append(
-                        {
-                            "timestamp": datetime.fromtimestamp(float(timestamp)),
-                            "labels": labels,
-                            "value": float(val),
-                        }
-                    )
+                for timestamp, val in series.get("values", []):
+                    stamp = stamps.get(timestamp)
+                    if stamp is None:
+                        stamp = stamps[timestamp] = datetime.fromtimestamp(float(timestamp))
+                    entries.append({"timestamp": stamp, "labels": labels, "value": float(val)})
+        elif result_type == "vector":
+            for sample in results:
+                timestamp, val = sample.get("value", (0, "0"))
+                entries.append(
+                    {
+                        "timestamp": datetime.fromtimestamp(float(timestamp)),
+                        "labels": sample.get("metric", {}),
+                        "value": float(val),
+                    }
+                )
 
         return entries
 
@@ -240,6 +250,40 @@ class LokiClient(BaseObservabilityClient):
         data = self.get("/loki/api/v1/query_range", params=params)
         return self._parse_query_response(data)
 
+    def _count_over_time(
+        self,
+        selector: str,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        *,
+        by: str | None = None,
+        pipeline: str = "",
+    ) -> list[dict[str, Any]]:
+        """Count log lines over a time range with a LogQL metric query.
+
+        Runs ``sum [by (label)] (count_over_time(...))`` as one instant query
+        evaluated at end_time, so Loki aggregates the lines server-side.
+
+        Args:
+            selector: Stream selector.
+            start_time: Start of time range (default: one hour before end).
+            end_time: End of time range (default: now).
+            by: Label to group counts by.
+            pipeline: Log pipeline stages applied before counting.
+
+        Returns:
+            Vector samples, one per group.
+        """
+        if end_time is None:
+            end_time = datetime.now()
+        if start_time is None:
+            start_time = end_time - timedelta(hours=1)
+
+        seconds = max(math.ceil((end_time - start_time).total_seconds()), 1)
+        grouping = f" by ({by})" if by else ""
+        query = f"sum{grouping} (count_over_time({selector}{pipeline} [{seconds}s]))"
+        return self.query(query, time=end_time)
+
     def get_labels(self) -> list[str]:
         """Get all label names.
 
@@ -412,6 +456,87 @@ class LokiClient(BaseObservabilityClient):
 
         return self.query_range(query, start=start_time, end=end_time, step=interval)
 
+    def count_kong_logs(
+        self,
+        service: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> int:
+        """Count Kong log lines in a time range.
+
+        Args:
+            service: Filter by service name.
+            start_time: Start of time range.
+            end_time: End of time range.
+
+        Returns:
+            Number of log lines.
+        """
+        labels = ['job="kong"']
+        if service:
+            labels.append(f'service="{service}"')
+
+        selector = "{" + ",".join(labels) + "}"
+        samples = self._count_over_time(selector, start_time, end_time)
+        return sum(int(sample["value"]) for sample in samples)
+
+    def get_kong_status_distribution(
+        self,
+        service: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> dict[int, int]:
+        """Count Kong log lines per HTTP response status.
+
+        Args:
+            service: Filter by service name.
+            start_time: Start of time range.
+            end_time: End of time range.
+
+        Returns:
+            Dict mapping status code to count.
+        """
+        labels = ['job="kong"']
+        if service:
+            labels.append(f'service="{service}"')
+
+        selector = "{" + ",".join(labels) + "}"
+        samples = self._count_over_time(
+            selector,
+            start_time,
+            end_time,
+            by="response_status",
+            pipeline=' | json | __error__=""',
+        )
+
+        distribution: dict[int, int] = {}
+        for sample in samples:
+            status = sample["labels"].get("response_status", "")
+            if status.isdigit():
+                distribution[int(status)] = distribution.get(int(status), 0) + int(sample["value"])
+        return distribution
+
+    def get_kong_service_distribution(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> dict[str, int]:
+        """Count Kong log lines per service.
+
+        Args:
+            start_time: Start of time range.
+            end_time: End of time range.
+
+        Returns:
+            Dict mapping service name to count.
+        """
+        samples = self._count_over_time('{job="kong"}', start_time, end_time, by="service")
+        return {
+            sample["labels"]["service"]: int(sample["value"])
+            for sample in samples
+            if sample["labels"].get("service")
+        }
+
     def get_kong_services(self) -> list[str]:
         """Get list of Kong services with logs.
 
@@ -55,6 +55,28 @@ def register_apply_command(
                 help="Show what would be changed without applying",
             ),
         ] = False,
+        bulk: Annotated[
+            bool,
+            typer.Option(
+                "--bulk",
+                help="Replace the full config via /config in one request (DB mode)",
+            ),
+        ] = False,
+        concurrency: Annotated[
+            int | None,
+            typer.Option(
+                "--concurrency",
+                min=1,
+                help="Maximum concurrent Admin API requests (default 8)",
+            ),
+        ] = None,
+        fail_fast: Annotated[
+            bool,
+            typer.Option(
+                "--fail-fast",
+                help="Stop after the first failed operation instead of continuing",
+            ),
+        ] = False,
     ) -> None:
         """Apply declarative config to Kong.
 
@@ -69,10 +91,19 @@ def register_apply_command(
 
         Deletions are performed in reverse order.
 
+        Independent operations run concurrently, so an entity only waits for
+        the parents it references. By default a failure skips only the
+        operations that depend on it; --fail-fast stops after the first failure.
+
+        In DB-less mode, or with --bulk, the whole file is posted to Kong's
+        /config endpoint in a single request instead.
+
         Examples:
             ops kong config apply kong.yaml
             ops kong config apply kong.yaml --dry-run
             ops kong config apply kong.yaml --no-confirm
+            ops kong config apply kong.yaml --bulk
+            ops kong config apply kong.yaml --concurrency 16 --fail-fast
         """
         # Check file exists
         if not file.exists():
@@ -180,8 +211,14 @@ def register_apply_command(
                     console.print(f"\n[red]Failed to sync configuration: {e}[/red]")
                     raise typer.Exit(1) from None
             else:
-                # Database mode: use individual entity endpoints
-                operations = manager.apply_config(config, dry_run=False)
+                # Database mode: individual entity endpoints, or /config with --bulk
+                operations = manager.apply_config(
+                    config,
+                    dry_run=False,
+                    bulk=bulk,
+                    max_workers=concurrency,
+                    on_error="fail-fast" if fail_fast else "continue",
+                )
 
                 # Report results
                 successful = [o for o in operations if o.result == "success"]
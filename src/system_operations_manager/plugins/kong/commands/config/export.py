@@ -62,6 +62,23 @@ def register_export_command(
                 help="Output format: yaml or json (auto-detected from file extension if not specified)",
             ),
         ] = "",
+        page_size: Annotated[
+            int | None,
+            typer.Option(
+                "--page-size",
+                min=1,
+                max=1000,
+                help="Entities fetched per Admin API page (1-1000, default 1000)",
+            ),
+        ] = None,
+        concurrency: Annotated[
+            int | None,
+            typer.Option(
+                "--concurrency",
+                min=1,
+                help="Maximum concurrent Admin API requests (default 8)",
+            ),
+        ] = None,
     ) -> None:
         """Export current Kong state to a declarative config file.
 
@@ -74,6 +91,7 @@ def register_export_command(
             ops kong config export kong.json --format json
             ops kong config export services.yaml --only services --only routes
             ops kong config export full.yaml --include-credentials
+            ops kong config export full.yaml --include-credentials --concurrency 16
         """
         # Validate --only options
         valid_types = {"services", "routes", "upstreams", "consumers", "plugins"}
@@ -96,6 +114,8 @@ def register_export_command(
             config = manager.export_state(
                 only=only,
                 include_credentials=include_credentials,
+                page_size=page_size,
+                max_workers=concurrency,
             )
 
             # Prepare output data
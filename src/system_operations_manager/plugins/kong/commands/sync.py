@@ -10,8 +10,10 @@ Kong Gateway (data plane) and Konnect (control plane):
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import UTC, datetime
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 import typer
@@ -35,6 +37,7 @@ from system_operations_manager.services.kong.sync_audit import (
     SyncSummary,
     parse_since,
 )
+from system_operations_manager.services.kong.unified_query import SyncSession
 
 if TYPE_CHECKING:
     from system_operations_manager.services.kong.certificate_manager import (
@@ -78,11 +81,14 @@ if TYPE_CHECKING:
         KonnectVaultManager,
     )
 
+# Konnect writes in flight during sync push
+DEFAULT_PUSH_CONCURRENCY = 8
+
 
 def _display_sync_status_table(
     summary: dict[str, dict[str, int]],
     entity_types: list[str],
-    unified_service: UnifiedQueryService,
+    unified_service: UnifiedQueryService | SyncSession,
 ) -> None:
     """Display sync status as a formatted table."""
     from system_operations_manager.cli.output import Table
@@ -219,7 +225,7 @@ def _display_sync_status_table(
 
 
 def _launch_conflict_resolution_tui(
-    unified_service: UnifiedQueryService,
+    unified_service: UnifiedQueryService | SyncSession,
     entity_types: list[str],
     direction: Literal["push", "pull"],
     dry_run: bool = False,
@@ -227,7 +233,7 @@ def _launch_conflict_resolution_tui(
     """Launch the TUI for interactive conflict resolution.
 
     Args:
-        unified_service: Service for querying unified entities.
+        unified_service: Sync session (or service) to read unified entities from.
         entity_types: List of entity types to check for conflicts.
         direction: Sync direction ('push' or 'pull').
         dry_run: Whether this is a dry-run.
@@ -323,13 +329,16 @@ def _record_skipped_resolutions(
 
 
 def _build_service_id_map(
-    unified_service: UnifiedQueryService,
+    unified_service: UnifiedQueryService | SyncSession,
 ) -> dict[str, str]:
     """Build a mapping from gateway service IDs/names to Konnect service IDs.
 
     This is needed because routes reference services by ID, and gateway IDs
     differ from Konnect IDs for the same logical service.
 
+    Args:
+        unified_service: Sync session (or service) to read services from.
+
     Returns:
         Dict mapping gateway service ID -> Konnect service ID,
         plus gateway service name -> Konnect service ID.
@@ -393,21 +402,53 @@ def _remap_route_service_ref(
     return entity
 
 
+def _run_writes[T](
+    writes: list[Callable[[], T]],
+    max_workers: int,
+) -> Iterator[T | Exception]:
+    """Run write calls concurrently, yielding their outcomes in order.
+
+    Results are yielded in submission order so callers report and audit
+    them from the calling thread; only the API calls run in the pool.
+
+    Args:
+        writes: Zero-argument calls, e.g. ``partial(manager.create, entity)``.
+        max_workers: Maximum calls in flight.
+
+    Yields:
+        Each call's result, or the exception it raised.
+    """
+    if not writes:
+        return
+    workers = max(1, min(max_workers, len(writes)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="konnect-push") as pool:
+        futures = [pool.submit(write) for write in writes]
+        for future in futures:
+            try:
+                yield future.result()
+            except Exception as e:
+                yield e
+
+
 def _push_entity_type(
     entity_type: str,
-    unified_service: UnifiedQueryService,
+    unified_service: UnifiedQueryService | SyncSession,
     konnect_managers: dict[str, Any],
     dry_run: bool,
     audit_service: SyncAuditService | None = None,
     sync_id: str | None = None,
     resolved_entities: set[str] | None = None,
     resolution_actions: dict[str, str] | None = None,
+    max_workers: int = 1,
 ) -> tuple[int, int, int]:
     """Push entities of a specific type to Konnect.
 
+    Creates, then updates, are sent with up to max_workers requests in
+    flight; output and audit entries follow the entity order.
+
     Args:
         entity_type: Type of entity (services, routes, etc.)
-        unified_service: UnifiedQueryService instance
+        unified_service: Sync session (or UnifiedQueryService) to read entities from
         konnect_managers: Dict mapping entity type to Konnect manager
         dry_run: If True, show what would be pushed without changes
         audit_service: Optional audit service for logging operations
@@ -418,11 +459,13 @@ def _push_entity_type(
         resolution_actions: Optional dict mapping "entity_type:entity_name" to
             resolution action string ('keep_source', 'keep_target', 'skip')
             for audit logging in interactive mode.
+        max_workers: Maximum concurrent Konnect writes.
 
     Returns:
         Tuple of (created_count, updated_count, error_count)
     """
     from system_operations_manager.integrations.kong.models.unified import (
+        UnifiedEntity,
         UnifiedEntityList,
     )
 
@@ -466,6 +509,7 @@ def _push_entity_type(
         service_id_map = _build_service_id_map(unified_service)
 
     # Create entities that only exist in Gateway
+    creates: list[tuple[UnifiedEntity[Any], Any]] = []
     for unified in entities.gateway_only:
         entity = unified.gateway_entity
         if entity is None:
@@ -496,53 +540,57 @@ def _push_entity_type(
                     )
                 )
         else:
-            try:
-                result = manager.create(entity)
-                console.print(f"  [green]Created:[/green] {unified.identifier}")
-                created += 1
-                # Record audit entry
-                if audit_service and sync_id:
-                    audit_service.record(
-                        SyncAuditEntry(
-                            sync_id=sync_id,
-                            timestamp=datetime.now(UTC).isoformat(),
-                            operation="push",
-                            dry_run=False,
-                            entity_type=entity_type,
-                            entity_id=unified.gateway_id,
-                            entity_name=unified.identifier,
-                            action="create",
-                            source="gateway",
-                            target="konnect",
-                            status="success",
-                            after_state=result.model_dump()
-                            if hasattr(result, "model_dump")
-                            else None,
-                        )
+            creates.append((unified, entity))
+
+    create_outcomes = _run_writes(
+        [partial(manager.create, entity) for _, entity in creates], max_workers
+    )
+    for (unified, _), result in zip(creates, create_outcomes, strict=True):
+        if not isinstance(result, Exception):
+            console.print(f"  [green]Created:[/green] {unified.identifier}")
+            created += 1
+            # Record audit entry
+            if audit_service and sync_id:
+                audit_service.record(
+                    SyncAuditEntry(
+                        sync_id=sync_id,
+                        timestamp=datetime.now(UTC).isoformat(),
+                        operation="push",
+                        dry_run=False,
+                        entity_type=entity_type,
+                        entity_id=unified.gateway_id,
+                        entity_name=unified.identifier,
+                        action="create",
+                        source="gateway",
+                        target="konnect",
+                        status="success",
+                        after_state=result.model_dump() if hasattr(result, "model_dump") else None,
                     )
-            except Exception as e:
-                console.print(f"  [red]Failed to create:[/red] {unified.identifier} - {e}")
-                errors += 1
-                # Record error in audit
-                if audit_service and sync_id:
-                    audit_service.record(
-                        SyncAuditEntry(
-                            sync_id=sync_id,
-                            timestamp=datetime.now(UTC).isoformat(),
-                            operation="push",
-                            dry_run=False,
-                            entity_type=entity_type,
-                            entity_id=unified.gateway_id,
-                            entity_name=unified.identifier,
-                            action="create",
-                            source="gateway",
-                            target="konnect",
-                            status="failed",
-                            error=str(e),
-                        )
+                )
+        else:
+            console.print(f"  [red]Failed to create:[/red] {unified.identifier} - {result}")
+            errors += 1
+            # Record error in audit
+            if audit_service and sync_id:
+                audit_service.record(
+                    SyncAuditEntry(
+                        sync_id=sync_id,
+                        timestamp=datetime.now(UTC).isoformat(),
+                        operation="push",
+                        dry_run=False,
+                        entity_type=entity_type,
+                        entity_id=unified.gateway_id,
+                        entity_name=unified.identifier,
+                        action="create",
+                        source="gateway",
+                        target="konnect",
+                        status="failed",
+                        error=str(result),
                     )
+                )
 
     # Update entities with drift
+    updates: list[tuple[UnifiedEntity[Any], str, Any, list[str], str | None]] = []
     for unified in entities.with_drift:
         entity = unified.gateway_entity
         konnect_id = unified.konnect_id
@@ -592,66 +640,71 @@ def _push_entity_type(
                     )
                 )
         else:
-            try:
-                result = manager.update(konnect_id, entity)
-                console.print(f"  [green]Updated:[/green] {unified.identifier}")
-                updated += 1
-                # Record audit entry
-                if audit_service and sync_id:
-                    audit_service.record(
-                        SyncAuditEntry(
-                            sync_id=sync_id,
-                            timestamp=datetime.now(UTC).isoformat(),
-                            operation="push",
-                            dry_run=False,
-                            entity_type=entity_type,
-                            entity_id=unified.gateway_id,
-                            entity_name=unified.identifier,
-                            action="update",
-                            source="gateway",
-                            target="konnect",
-                            status="success",
-                            drift_fields=drift_fields if drift_fields else None,
-                            resolution_action=resolution_action,
-                            before_state=unified.konnect_entity.model_dump()
-                            if unified.konnect_entity
-                            and hasattr(unified.konnect_entity, "model_dump")
-                            else None,
-                            after_state=result.model_dump()
-                            if hasattr(result, "model_dump")
-                            else None,
-                        )
+            updates.append((unified, konnect_id, entity, drift_fields, resolution_action))
+
+    update_outcomes = _run_writes(
+        [partial(manager.update, konnect_id, entity) for _, konnect_id, entity, _, _ in updates],
+        max_workers,
+    )
+    for (unified, _, _, drift_fields, resolution_action), result in zip(
+        updates, update_outcomes, strict=True
+    ):
+        if not isinstance(result, Exception):
+            console.print(f"  [green]Updated:[/green] {unified.identifier}")
+            updated += 1
+            # Record audit entry
+            if audit_service and sync_id:
+                audit_service.record(
+                    SyncAuditEntry(
+                        sync_id=sync_id,
+                        timestamp=datetime.now(UTC).isoformat(),
+                        operation="push",
+                        dry_run=False,
+                        entity_type=entity_type,
+                        entity_id=unified.gateway_id,
+                        entity_name=unified.identifier,
+                        action="update",
+                        source="gateway",
+                        target="konnect",
+                        status="success",
+                        drift_fields=drift_fields if drift_fields else None,
+                        resolution_action=resolution_action,
+                        before_state=unified.konnect_entity.model_dump()
+                        if unified.konnect_entity and hasattr(unified.konnect_entity, "model_dump")
+                        else None,
+                        after_state=result.model_dump() if hasattr(result, "model_dump") else None,
                     )
-            except Exception as e:
-                console.print(f"  [red]Failed to update:[/red] {unified.identifier} - {e}")
-                errors += 1
-                # Record error in audit
-                if audit_service and sync_id:
-                    audit_service.record(
-                        SyncAuditEntry(
-                            sync_id=sync_id,
-                            timestamp=datetime.now(UTC).isoformat(),
-                            operation="push",
-                            dry_run=False,
-                            entity_type=entity_type,
-                            entity_id=unified.gateway_id,
-                            entity_name=unified.identifier,
-                            action="update",
-                            source="gateway",
-                            target="konnect",
-                            status="failed",
-                            error=str(e),
-                            drift_fields=drift_fields if drift_fields else None,
-                            resolution_action=resolution_action,
-                        )
+                )
+        else:
+            console.print(f"  [red]Failed to update:[/red] {unified.identifier} - {result}")
+            errors += 1
+            # Record error in audit
+            if audit_service and sync_id:
+                audit_service.record(
+                    SyncAuditEntry(
+                        sync_id=sync_id,
+                        timestamp=datetime.now(UTC).isoformat(),
+                        operation="push",
+                        dry_run=False,
+                        entity_type=entity_type,
+                        entity_id=unified.gateway_id,
+                        entity_name=unified.identifier,
+                        action="update",
+                        source="gateway",
+                        target="konnect",
+                        status="failed",
+                        error=str(result),
+                        drift_fields=drift_fields if drift_fields else None,
+                        resolution_action=resolution_action,
                     )
+                )
 
     return created, updated, errors
 
 
 def _pull_entity_type(
     entity_type: str,
-    unified_service: UnifiedQueryService,
+    unified_service: UnifiedQueryService | SyncSession,
     gateway_managers: dict[str, Any],
     dry_run: bool,
     with_drift: bool = False,
@@ -664,7 +717,7 @@ def _pull_entity_type(
 
     Args:
         entity_type: Type of entity (services, routes, etc.)
-        unified_service: UnifiedQueryService instance
+        unified_service: Sync session (or UnifiedQueryService) to read entities from
         gateway_managers: Dict mapping entity type to Gateway manager
         dry_run: If True, show what would be pulled without changes
         with_drift: If True, also update entities with drift (Gateway to match Konnect)
@@ -897,23 +950,29 @@ def _pull_entity_type(
 
 
 def _push_targets_for_upstreams(
-    unified_service: UnifiedQueryService,
+    unified_service: UnifiedQueryService | SyncSession,
     upstreams: list[str],
     konnect_upstream_manager: Any,
     dry_run: bool,
+    max_workers: int = 1,
 ) -> tuple[int, int, int]:
     """Push targets for the given upstreams from Gateway to Konnect.
 
+    Targets of all upstreams are created together, with up to max_workers
+    requests in flight.
+
     Args:
-        unified_service: UnifiedQueryService instance.
+        unified_service: Sync session (or UnifiedQueryService) to read targets from.
         upstreams: List of upstream names to sync targets for.
         konnect_upstream_manager: Konnect UpstreamManager instance.
         dry_run: If True, show what would be pushed without changes.
+        max_workers: Maximum concurrent Konnect writes.
 
     Returns:
         Tuple of (created_count, updated_count, error_count).
     """
     created, updated, errors = 0, 0, 0
+    creates: list[tuple[str, Any]] = []
 
     for upstream_name in upstreams:
         try:
@@ -934,23 +993,27 @@ def _push_targets_for_upstreams(
                 )
                 created += 1
             else:
-                try:
-                    konnect_upstream_manager.add_target(upstream_name, target)
-                    console.print(
-                        f"  [green]Created target:[/green] {target.target} -> {upstream_name}"
-                    )
-                    created += 1
-                except Exception as e:
-                    console.print(f"  [red]Failed to create target:[/red] {target.target} - {e}")
-                    errors += 1
+                creates.append((upstream_name, target))
 
         # Note: Target updates are not supported (targets are immutable, recreate to change)
 
+    outcomes = _run_writes(
+        [partial(konnect_upstream_manager.add_target, name, target) for name, target in creates],
+        max_workers,
+    )
+    for (upstream_name, target), result in zip(creates, outcomes, strict=True):
+        if not isinstance(result, Exception):
+            console.print(f"  [green]Created target:[/green] {target.target} -> {upstream_name}")
+            created += 1
+        else:
+            console.print(f"  [red]Failed to create target:[/red] {target.target} - {result}")
+            errors += 1
+
     return created, updated, errors
 
 
 def _pull_targets_for_upstreams(
-    unified_service: UnifiedQueryService,
+    unified_service: UnifiedQueryService | SyncSession,
     upstreams: list[str],
     gateway_upstream_manager: Any,
     dry_run: bool,
@@ -958,7 +1021,7 @@ def _pull_targets_for_upstreams(
     """Pull targets for the given upstreams from Konnect to Gateway.
 
     Args:
-        unified_service: UnifiedQueryService instance.
+        unified_service: Sync session (or UnifiedQueryService) to read targets from.
         upstreams: List of upstream names to sync targets for.
         gateway_upstream_manager: Gateway UpstreamManager instance.
         dry_run: If True, show what would be pulled without changes.
@@ -1032,6 +1095,9 @@ def register_sync_commands(
     get_gateway_key_set_manager: Callable[[], KeySetManager] | None = None,
     get_gateway_key_manager: Callable[[], KeyManager] | None = None,
     get_gateway_vault_manager: Callable[[], VaultManager] | None = None,
+    push_concurrency: int = DEFAULT_PUSH_CONCURRENCY,
+    audit_max_age: timedelta | None = None,
+    audit_retention: timedelta | None = None,
 ) -> None:
     """Register sync commands with the Kong app.
 
@@ -1060,6 +1126,11 @@ def register_sync_commands(
         get_gateway_key_set_manager: Factory for Gateway key set manager (for pull).
         get_gateway_key_manager: Factory for Gateway key manager (for pull).
         get_gateway_vault_manager: Factory for Gateway vault manager (for pull).
+        push_concurrency: Default number of concurrent Konnect writes in push.
+        audit_max_age: Rotate the sync audit log once its oldest entry is
+            this old (None rotates by size only).
+        audit_retention: Remove rotated audit segments older than this
+            whenever the log rotates (None keeps them forever).
     """
     sync_app = typer.Typer(
         name="sync",
@@ -1144,11 +1215,12 @@ def register_sync_commands(
                 "vaults",
             ]
 
-        # Get sync summary
-        summary = unified_service.get_sync_summary(entity_types)
+        # Fetch every entity type once; the drift details reuse the snapshot
+        session = SyncSession(unified_service)
+        summary = session.get_sync_summary(entity_types)
 
         if output == OutputFormat.TABLE:
-            _display_sync_status_table(summary, entity_types, unified_service)
+            _display_sync_status_table(summary, entity_types, session)
         else:
             formatter.format_dict(summary, title="Sync Status")
 
@@ -1184,6 +1256,14 @@ def register_sync_commands(
                 help="Skip entities with drift (only sync new entities)",
             ),
         ] = False,
+        concurrency: Annotated[
+            int | None,
+            typer.Option(
+                "--concurrency",
+                min=1,
+                help="Maximum concurrent Konnect writes (default: sync.push_concurrency, 8)",
+            ),
+        ] = None,
         force: ForceOption = False,
         interactive: InteractiveOption = False,
     ) -> None:
@@ -1193,6 +1273,10 @@ def register_sync_commands(
         - Only in Gateway (creates in Konnect)
         - In both with drift (updates Konnect to match Gateway, unless --skip-conflicts)
 
+        Entity types are pushed one after another (services before routes,
+        upstreams before targets); writes within a type run concurrently and
+        are paced to Konnect's rate limits.
+
         Examples:
             ops kong sync push                     # Push all entity types
             ops kong sync push --type services     # Push only services
@@ -1200,7 +1284,9 @@ def register_sync_commands(
             ops kong sync push --force             # Skip confirmation
             ops kong sync push --interactive       # Resolve conflicts interactively
             ops kong sync push --skip-conflicts    # Only sync new entities (CI/CD friendly)
+            ops kong sync push --concurrency 16    # More Konnect writes in flight
         """
+        max_workers = concurrency or push_concurrency
         unified_service = get_unified_query_service()
 
         if unified_service is None:
@@ -1275,8 +1361,10 @@ def register_sync_commands(
             )
             raise typer.Exit(1)
 
-        # Get preview of changes
-        summary = unified_service.get_sync_summary(entity_types_to_push)
+        # Snapshot both planes once; the preview, conflict resolution, push and
+        # target sync below all read from it
+        session = SyncSession(unified_service)
+        summary = session.get_sync_summary(entity_types_to_push)
         total_to_create = sum(s["gateway_only"] for s in summary.values())
         drift_count = sum(s["drift"] for s in summary.values())
         total_to_update = 0 if skip_conflicts else drift_count
@@ -1306,7 +1394,7 @@ def register_sync_commands(
 
         if interactive and total_to_update > 0:
             resolutions = _launch_conflict_resolution_tui(
-                unified_service, entity_types_to_push, "push", dry_run
+                session, entity_types_to_push, "push", dry_run
             )
             if not resolutions:
                 console.print("[yellow]No resolutions made. Cancelled.[/yellow]")
@@ -1344,68 +1432,76 @@ def register_sync_commands(
                 raise typer.Exit(0)
 
         # Initialize audit service
-        audit_service = SyncAuditService()
+        audit_service = SyncAuditService(max_age=audit_max_age, retention=audit_retention)
         sync_id = audit_service.start_sync("push", dry_run)
 
-        # Record skipped resolutions from interactive mode
-        if interactive and resolutions:
-            _record_skipped_resolutions(resolutions, "push", audit_service, sync_id, dry_run)
-
-        # Push each entity type
-        total_created = 0
-        total_updated = 0
-        total_errors = 0
-
-        for etype in entity_types_to_push:
-            stats = summary.get(etype, {})
-            to_create = stats.get("gateway_only", 0)
-            to_update = 0 if skip_conflicts else stats.get("drift", 0)
-
-            if to_create == 0 and to_update == 0:
-                continue
-
-            console.print(f"\n[cyan]{etype.capitalize()}:[/cyan]")
-
-            # Determine resolved_entities based on mode:
-            # - interactive: use the user-resolved entities
-            # - skip_conflicts: use empty set to skip all drift
-            # - normal: None to process all
-            if interactive:
-                resolved = resolved_entities
-            elif skip_conflicts:
-                resolved = set()  # Empty set = skip all drifted entities
-            else:
-                resolved = None
-
-            created, updated, errors = _push_entity_type(
-                etype,
-                unified_service,
-                konnect_managers,
-                dry_run,
-                audit_service=audit_service,
-                sync_id=sync_id,
-                resolved_entities=resolved,
-                resolution_actions=resolution_actions if interactive else None,
-            )
-            total_created += created
-            total_updated += updated
-            total_errors += errors
-
-        # Push targets for upstreams if requested
-        if include_targets and "upstreams" in entity_types_to_push:
-            konnect_upstream_mgr = konnect_managers.get("upstreams")
-            if konnect_upstream_mgr:
-                # Get all upstream names
-                upstreams = unified_service.list_upstreams()
-                upstream_names = [u.identifier for u in upstreams.entities]
-                if upstream_names:
-                    console.print("\n[cyan]Targets:[/cyan]")
-                    created, updated, errors = _push_targets_for_upstreams(
-                        unified_service, upstream_names, konnect_upstream_mgr, dry_run
-                    )
-                    total_created += created
-                    total_updated += updated
-                    total_errors += errors
+        # Buffer audit entries for the run; flushed in batches and on exit
+        with audit_service.batch():
+            # Record skipped resolutions from interactive mode
+            if interactive and resolutions:
+                _record_skipped_resolutions(resolutions, "push", audit_service, sync_id, dry_run)
+
+            # Push each entity type
+            total_created = 0
+            total_updated = 0
+            total_errors = 0
+
+            for etype in entity_types_to_push:
+                stats = summary.get(etype, {})
+                to_create = stats.get("gateway_only", 0)
+                to_update = 0 if skip_conflicts else stats.get("drift", 0)
+
+                if to_create == 0 and to_update == 0:
+                    continue
+
+                console.print(f"\n[cyan]{etype.capitalize()}:[/cyan]")
+
+                # Determine resolved_entities based on mode:
+                # - interactive: use the user-resolved entities
+                # - skip_conflicts: use empty set to skip all drift
+                # - normal: None to process all
+                if interactive:
+                    resolved = resolved_entities
+                elif skip_conflicts:
+                    resolved = set()  # Empty set = skip all drifted entities
+                else:
+                    resolved = None
+
+                created, updated, errors = _push_entity_type(
+                    etype,
+                    session,
+                    konnect_managers,
+                    dry_run,
+                    audit_service=audit_service,
+                    sync_id=sync_id,
+                    resolved_entities=resolved,
+                    resolution_actions=resolution_actions if interactive else None,
+                    max_workers=max_workers,
+                )
+                total_created += created
+                total_updated += updated
+                total_errors += errors
+
+                # Routes are remapped to the Konnect IDs of their services, so
+                # services created just now must be visible to the routes push
+                if etype == "services" and created and not dry_run:
+                    session.refresh(["services"])
+
+            # Push targets for upstreams if requested
+            if include_targets and "upstreams" in entity_types_to_push:
+                konnect_upstream_mgr = konnect_managers.get("upstreams")
+                if konnect_upstream_mgr:
+                    # Get all upstream names
+                    upstreams = session.list_upstreams()
+                    upstream_names = [u.identifier for u in upstreams.entities]
+                    if upstream_names:
+                        console.print("\n[cyan]Targets:[/cyan]")
+                        created, updated, errors = _push_targets_for_upstreams(
+                            session, upstream_names, konnect_upstream_mgr, dry_run, max_workers
+                        )
+                        total_created += created
+                        total_updated += updated
+                        total_errors += errors
 
         # Summary
         console.print("\n[bold]Summary:[/bold]")
@@ -1567,8 +1663,10 @@ def register_sync_commands(
             )
             raise typer.Exit(1)
 
-        # Get preview of changes
-        summary = unified_service.get_sync_summary(entity_types_to_pull)
+        # Snapshot both planes once; the preview, conflict resolution, pull and
+        # target sync below all read from it
+        session = SyncSession(unified_service)
+        summary = session.get_sync_summary(entity_types_to_pull)
         total_to_create = sum(s["konnect_only"] for s in summary.values())
         drift_count = sum(s["drift"] for s in summary.values())
         # Interactive mode implies with_drift for conflict resolution
@@ -1605,7 +1703,7 @@ def register_sync_commands(
 
         if interactive and drift_count > 0:
             resolutions = _launch_conflict_resolution_tui(
-                unified_service, entity_types_to_pull, "pull", dry_run
+                session, entity_types_to_pull, "pull", dry_run
             )
             if not resolutions:
                 console.print("[yellow]No resolutions made. Cancelled.[/yellow]")
@@ -1645,57 +1743,59 @@ def register_sync_commands(
                 raise typer.Exit(0)
 
         # Initialize audit service
-        audit_service = SyncAuditService()
+        audit_service = SyncAuditService(max_age=audit_max_age, retention=audit_retention)
         sync_id = audit_service.start_sync("pull", dry_run)
 
-        # Record skipped resolutions from interactive mode
-        if interactive and resolutions:
-            _record_skipped_resolutions(resolutions, "pull", audit_service, sync_id, dry_run)
-
-        # Pull each entity type
-        total_created = 0
-        total_updated = 0
-        total_errors = 0
-
-        for etype in entity_types_to_pull:
-            stats = summary.get(etype, {})
-            to_create = stats.get("konnect_only", 0)
-            to_update = stats.get("drift", 0) if effective_with_drift else 0
-
-            if to_create == 0 and to_update == 0:
-                continue
-
-            console.print(f"\n[cyan]{etype.capitalize()}:[/cyan]")
-            created, updated, errors = _pull_entity_type(
-                etype,
-                unified_service,
-                gateway_managers,
-                dry_run,
-                effective_with_drift,
-                audit_service=audit_service,
-                sync_id=sync_id,
-                resolved_entities=resolved_entities if interactive else None,
-                resolution_actions=resolution_actions if interactive else None,
-            )
-            total_created += created
-            total_updated += updated
-            total_errors += errors
-
-        # Pull targets for upstreams if requested
-        if include_targets and "upstreams" in entity_types_to_pull:
-            gateway_upstream_mgr = gateway_managers.get("upstreams")
-            if gateway_upstream_mgr:
-                # Get all upstream names
-                upstreams = unified_service.list_upstreams()
-                upstream_names = [u.identifier for u in upstreams.entities]
-                if upstream_names:
-                    console.print("\n[cyan]Targets:[/cyan]")
-                    created, updated, errors = _pull_targets_for_upstreams(
-                        unified_service, upstream_names, gateway_upstream_mgr, dry_run
-                    )
-                    total_created += created
-                    total_updated += updated
-                    total_errors += errors
+        # Buffer audit entries for the run; flushed in batches and on exit
+        with audit_service.batch():
+            # Record skipped resolutions from interactive mode
+            if interactive and resolutions:
+                _record_skipped_resolutions(resolutions, "pull", audit_service, sync_id, dry_run)
+
+            # Pull each entity type
+            total_created = 0
+            total_updated = 0
+            total_errors = 0
+
+            for etype in entity_types_to_pull:
+                stats = summary.get(etype, {})
+                to_create = stats.get("konnect_only", 0)
+                to_update = stats.get("drift", 0) if effective_with_drift else 0
+
+                if to_create == 0 and to_update == 0:
+                    continue
+
+                console.print(f"\n[cyan]{etype.capitalize()}:[/cyan]")
+                created, updated, errors = _pull_entity_type(
+                    etype,
+                    session,
+                    gateway_managers,
+                    dry_run,
+                    effective_with_drift,
+                    audit_service=audit_service,
+                    sync_id=sync_id,
+                    resolved_entities=resolved_entities if interactive else None,
+                    resolution_actions=resolution_actions if interactive else None,
+                )
+                total_created += created
+                total_updated += updated
+                total_errors += errors
+
+            # Pull targets for upstreams if requested
+            if include_targets and "upstreams" in entity_types_to_pull:
+                gateway_upstream_mgr = gateway_managers.get("upstreams")
+                if gateway_upstream_mgr:
+                    # Get all upstream names
+                    upstreams = session.list_upstreams()
+                    upstream_names = [u.identifier for u in upstreams.entities]
+                    if upstream_names:
+                        console.print("\n[cyan]Targets:[/cyan]")
+                        created, updated, errors = _pull_targets_for_upstreams(
+                            session, upstream_names, gateway_upstream_mgr, dry_run
+                        )
+                        total_created += created
+                        total_updated += updated
+                        total_errors += errors
 
         # Summary
         console.print("\n[bold]Summary:[/bold]")
@@ -1774,7 +1874,7 @@ def register_sync_commands(
             SyncAuditService,
         )
 
-        audit_service = SyncAuditService()
+        audit_service = SyncAuditService(max_age=audit_max_age, retention=audit_retention)
 
         # Parse since parameter
         since_dt = None
@@ -2018,7 +2118,7 @@ def register_sync_commands(
 
         from system_operations_manager.services.kong.sync_rollback import RollbackService
 
-        audit_service = SyncAuditService()
+        audit_service = SyncAuditService(max_age=audit_max_age, retention=audit_retention)
 
         # Build managers dicts
         gateway_managers: dict[str, Any] = {}
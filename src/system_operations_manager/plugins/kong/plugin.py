@@ -18,7 +18,7 @@ from rich.console import Console
 from system_operations_manager.cli.output import Table
 from system_operations_manager.core.plugins.base import Plugin, hookimpl
 from system_operations_manager.integrations.kong.client import KongAdminClient
-from system_operations_manager.integrations.kong.config import KongPluginConfig
+from system_operations_manager.integrations.kong.config import KongPluginConfig, KongSyncConfig
 from system_operations_manager.integrations.kong.exceptions import KongAPIError
 from system_operations_manager.plugins.kong.commands.base import (
     OutputOption,
@@ -48,6 +48,9 @@ class KongPlugin(Plugin):
         super().__init__()
         self._client: KongAdminClient | None = None
         self._plugin_config: KongPluginConfig | None = None
+        # Konnect session (client + control plane ID), resolved at most once
+        self._konnect_session: tuple[KonnectClient, str] | None = None
+        self._konnect_session_resolved = False
 
     def on_initialize(self) -> None:
         """Initialize Kong plugin with configuration.
@@ -223,10 +226,28 @@ class KongPlugin(Plugin):
         def get_registry_manager() -> RegistryManager:
             return RegistryManager()
 
+        sync_config = self._plugin_config.sync if self._plugin_config else KongSyncConfig()
+
         # Konnect manager factory functions (return None if not configured)
         def _get_konnect_client_and_cp_id() -> tuple[KonnectClient, str] | tuple[None, None]:
-            """Get Konnect client and default control plane ID if configured."""
+            """Get the shared Konnect client and default control plane ID if configured.
+
+            The session is resolved once per plugin instance so every Konnect
+            manager shares one HTTP client, and the control plane name lookup
+            is served from the on-disk ControlPlaneCache when possible; a
+            cached ID that no longer exists is re-resolved by name on the
+            first request that returns 404.
+            """
+            if not self._konnect_session_resolved:
+                self._konnect_session = _create_konnect_session()
+                self._konnect_session_resolved = True
+            if self._konnect_session is None:
+                return None, None
+            return self._konnect_session
+
+        def _create_konnect_session() -> tuple[KonnectClient, str] | None:
             from system_operations_manager.integrations.konnect import (
+                ControlPlaneCache,
                 KonnectClient,
                 KonnectConfig,
             )
@@ -235,23 +256,27 @@ class KongPlugin(Plugin):
             )
 
             if not KonnectConfig.exists():
-                return None, None
+                return None
 
             try:
                 config = KonnectConfig.load()
             except KonnectConfigError:
-                return None, None
+                return None
 
             if not config.default_control_plane:
-                return None, None
+                return None
 
+            client = None
             try:
-                client = KonnectClient(config)
-                # Find control plane ID from name
-                cp = client.find_control_plane(config.default_control_plane)
-                return client, cp.id
+                client = KonnectClient(
+                    config, requests_per_second=sync_config.konnect_requests_per_second
+                )
+                cp_id = ControlPlaneCache().bind(client, config, config.default_control_plane)
+                return client, cp_id
             except Exception:
-                return None, None
+                if client is not None:
+                    client.close()
+                return None
 
         def get_konnect_service_manager() -> KonnectServiceManager | None:
             client, cp_id = _get_konnect_client_and_cp_id()
@@ -305,6 +330,10 @@ class KongPlugin(Plugin):
                 konnect_consumer_manager=get_konnect_consumer_manager(),
                 konnect_plugin_manager=get_konnect_plugin_manager(),
                 konnect_upstream_manager=get_konnect_upstream_manager(),
+                max_workers=sync_config.max_concurrency,
+                gateway_timeout=sync_config.gateway_timeout,
+                konnect_timeout=sync_config.konnect_timeout,
+                page_size=sync_config.page_size,
             )
 
         # Register all command groups
@@ -414,6 +443,9 @@ class KongPlugin(Plugin):
             get_gateway_consumer_manager=get_consumer_manager,
             get_gateway_plugin_manager=get_plugin_manager,
             get_gateway_upstream_manager=get_upstream_manager,
+            push_concurrency=sync_config.push_concurrency,
+            audit_max_age=sync_config.audit_max_age,
+            audit_retention=sync_config.audit_retention,
         )
 
     def _register_status_commands(self, app: typer.Typer) -> None:
@@ -560,6 +592,10 @@ class KongPlugin(Plugin):
         if self._client:
             self._client.close()
             self._client = None
+        if self._konnect_session:
+            self._konnect_session[0].close()
+        self._konnect_session = None
+        self._konnect_session_resolved = False
         super().cleanup()
         logger.debug("Kong plugin cleaned up")
 
@@ -150,14 +150,14 @@ def register_cluster_commands(
         """
         try:
             manager = get_manager()
-            resources = manager.list_events(
+            pages = manager.iter_events(
                 namespace=namespace,
                 all_namespaces=all_namespaces,
                 field_selector=field_selector,
                 involved_object=involved_object,
             )
             formatter = get_formatter(output, console)
-            formatter.format_list(resources, EVENT_COLUMNS, title="Events")
+            formatter.format_pages(pages, EVENT_COLUMNS, title="Events")
         except KubernetesError as e:
             handle_k8s_error(e)
 
@@ -6,7 +6,7 @@ files and directories.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
@@ -23,7 +23,11 @@ from system_operations_manager.plugins.kubernetes.commands.base import (
     handle_k8s_error,
 )
 from system_operations_manager.plugins.kubernetes.formatters import OutputFormat, get_formatter
-from system_operations_manager.services.kubernetes.manifest_manager import DiffResult
+from system_operations_manager.services.kubernetes.manifest_manager import (
+    DEFAULT_APPLY_CONCURRENCY,
+    ApplyResult,
+    DiffResult,
+)
 
 if TYPE_CHECKING:
     from system_operations_manager.services.kubernetes.manifest_manager import ManifestManager
@@ -40,6 +44,23 @@ ServerDryRunOption = Annotated[
     ),
 ]
 
+ServerSideOption = Annotated[
+    bool,
+    typer.Option(
+        "--server-side/--no-server-side",
+        help="Apply with server-side apply in one request (default) instead of create-then-patch",
+    ),
+]
+
+ApplyConcurrencyOption = Annotated[
+    int,
+    typer.Option(
+        "--concurrency",
+        min=1,
+        help="Maximum resources applied at once within each kind tier",
+    ),
+]
+
 ManifestPathArgument = Annotated[
     Path,
     typer.Argument(
@@ -105,19 +126,30 @@ def register_manifest_commands(
         dry_run: DryRunOption = False,
         server_dry_run: ServerDryRunOption = False,
         force: ForceOption = False,
+        server_side: ServerSideOption = True,
+        concurrency: ApplyConcurrencyOption = DEFAULT_APPLY_CONCURRENCY,
         output: OutputOption = OutputFormat.TABLE,
     ) -> None:
         """Apply manifests from a file or directory to the cluster.
 
         Validates manifests before applying. Use ``--dry-run`` for a
         client-side dry run (no API calls) or ``--server-dry-run`` for
-        server-side validation without persisting.
+        server-side validation without persisting. ``--force`` also takes
+        over fields owned by other field managers.
+
+        Resources are applied in kind tiers (Namespaces and CRDs, then RBAC,
+        ConfigMaps and Secrets, then workloads, then admission webhooks),
+        with up to ``--concurrency`` requests in flight within a tier. Table
+        output prints each resource as soon as it is applied; JSON and YAML
+        output list every result in manifest order once all are done.
 
         Examples:
             ops k8s manifests apply deployment.yaml
             ops k8s manifests apply ./manifests/ -n production
             ops k8s manifests apply app.yaml --dry-run
             ops k8s manifests apply app.yaml --server-dry-run
+            ops k8s manifests apply app.yaml --no-server-side
+            ops k8s manifests apply ./rendered/ --concurrency 32
         """
         try:
             manager = get_manager()
@@ -137,21 +169,30 @@ def register_manifest_commands(
                         console.print(f"  {v.resource}: {err}")
                 raise typer.Exit(1)
 
-            results = manager.apply_manifests(
-                manifests,
-                namespace,
-                dry_run=dry_run,
-                server_dry_run=server_dry_run,
-                force=force,
-            )
-
-            formatter = get_formatter(output, console)
-            result_dicts = [asdict(r) for r in results]
-
             if output == OutputFormat.TABLE:
-                _print_apply_table(result_dicts)
+                results = _print_apply_results(
+                    manager.iter_apply_manifests(
+                        manifests,
+                        namespace,
+                        dry_run=dry_run,
+                        server_dry_run=server_dry_run,
+                        force=force,
+                        server_side=server_side,
+                        max_concurrency=concurrency,
+                    )
+                )
             else:
-                formatter.format_dict(
+                results = manager.apply_manifests(
+                    manifests,
+                    namespace,
+                    dry_run=dry_run,
+                    server_dry_run=server_dry_run,
+                    force=force,
+                    server_side=server_side,
+                    max_concurrency=concurrency,
+                )
+                result_dicts = [asdict(r) for r in results]
+                get_formatter(output, console).format_dict(
                     {"results": result_dicts, "total": len(result_dicts)},
                     title="Apply Results",
                 )
@@ -271,28 +312,30 @@ def register_manifest_commands(
     # Table helpers
     # -----------------------------------------------------------------
 
-    def _print_apply_table(results: list[dict[str, object]]) -> None:
-        """Print apply results as a Rich table."""
-        from system_operations_manager.cli.output import Table
-
-        table = Table(title="Apply Results")
-        table.add_column("Resource", style="cyan")
-        table.add_column("Namespace", style="white")
-        table.add_column("Action", style="green")
-        table.add_column("Status", style="white")
-        table.add_column("Message", style="dim")
+    def _print_apply_results(results: Iterable[ApplyResult]) -> list[ApplyResult]:
+        """Print apply results one line each as they arrive.
 
+        Returns:
+            The printed results, in the order they arrived.
+        """
+        printed: list[ApplyResult] = []
         for r in results:
-            status = "[green]OK[/green]" if r["success"] else "[red]FAILED[/red]"
-            table.add_row(
-                str(r["resource"]),
-                str(r["namespace"]),
-                str(r["action"]),
-                status,
-                str(r.get("message", "")),
+            status = "[green]OK[/green]    " if r.success else "[red]FAILED[/red]"
+            namespace_suffix = f" [white]({r.namespace})[/white]" if r.namespace else ""
+            message = f" [dim]{r.message}[/dim]" if r.message else ""
+            console.print(
+                f"{status} [cyan]{r.resource}[/cyan]{namespace_suffix} "
+                f"[green]{r.action}[/green]{message}",
+                highlight=False,
             )
-        console.print(table)
-        console.print(f"\n[dim]Total: {len(results)} resource(s)[/dim]")
+            printed.append(r)
+
+        failed = sum(1 for r in printed if not r.success)
+        summary = f"Total: {len(printed)} resource(s)"
+        if failed:
+            summary += f", {failed} failed"
+        console.print(f"\n[dim]{summary}[/dim]")
+        return printed
 
     def _print_validation_table(results: list[dict[str, object]]) -> None:
         """Print validation results as a Rich table."""
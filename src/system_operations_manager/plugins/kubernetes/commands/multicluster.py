@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
@@ -65,6 +65,24 @@ SYNC_COLUMNS = [
 
 ClustersOption = str | None
 
+ConcurrencyOption = Annotated[
+    int | None,
+    typer.Option(
+        "--concurrency",
+        min=1,
+        help="Maximum clusters processed at once (default: all)",
+    ),
+]
+
+ClusterTimeoutOption = Annotated[
+    float | None,
+    typer.Option(
+        "--timeout",
+        min=0.1,
+        help="Per-cluster timeout in seconds (default: each cluster's configured timeout)",
+    ),
+]
+
 
 def _parse_clusters(clusters_str: str | None) -> list[str] | None:
     """Parse a comma-separated cluster list into a list of names."""
@@ -102,19 +120,27 @@ def register_multicluster_commands(
             "-c",
             help="Comma-separated cluster names (default: all configured)",
         ),
+        concurrency: ConcurrencyOption = None,
+        timeout: ClusterTimeoutOption = None,
         output: OutputOption = OutputFormat.TABLE,
     ) -> None:
         """Show connectivity and version status for multiple clusters.
 
+        Clusters are checked concurrently; a cluster that does not answer
+        within its timeout is reported as disconnected.
+
         Examples:
             ops k8s multicluster status
             ops k8s multicluster status --clusters staging,production
+            ops k8s multicluster status --timeout 5
             ops k8s multicluster status --output json
         """
         try:
             manager = get_manager()
             cluster_list = _parse_clusters(clusters)
-            result = manager.multi_cluster_status(cluster_list)
+            result = manager.multi_cluster_status(
+                cluster_list, max_concurrency=concurrency, timeout=timeout
+            )
 
             formatter = get_formatter(output, console)
             formatter.format_list(
@@ -148,17 +174,31 @@ def register_multicluster_commands(
         ),
         namespace: NamespaceOption = None,
         dry_run: DryRunOption = False,
+        concurrency: ConcurrencyOption = None,
+        wave_size: int | None = typer.Option(
+            None,
+            "--wave-size",
+            min=1,
+            help="Roll out to this many clusters per wave, in the order given",
+        ),
+        halt_on_failure: bool = typer.Option(
+            False,
+            "--halt-on-failure",
+            help="Skip the remaining waves once a wave has a failed cluster",
+        ),
+        timeout: ClusterTimeoutOption = None,
         output: OutputOption = OutputFormat.TABLE,
     ) -> None:
         """Deploy manifests to multiple clusters.
 
         Reads a YAML manifest from a file, directory, or stdin and applies
-        it to the specified (or all configured) clusters.
+        it to the specified (or all configured) clusters concurrently.
 
         Examples:
             ops k8s multicluster deploy --file app.yaml
             ops k8s multicluster deploy --file app.yaml --clusters staging,production
             ops k8s multicluster deploy --file manifests/ --namespace app --dry-run
+            ops k8s multicluster deploy --file app.yaml --wave-size 5 --halt-on-failure
             cat app.yaml | ops k8s multicluster deploy --file -
         """
         try:
@@ -188,6 +228,10 @@ def register_multicluster_commands(
                 clusters=cluster_list,
                 namespace=namespace,
                 dry_run=dry_run,
+                max_concurrency=concurrency,
+                wave_size=wave_size,
+                halt_on_failure=halt_on_failure,
+                timeout=timeout,
             )
 
             if dry_run:
@@ -200,7 +244,7 @@ def register_multicluster_commands(
                 title=f"Multi-Cluster Deploy ({result.successful}/{result.total_clusters} succeeded)",
             )
 
-            if result.failed > 0:
+            if result.failed or result.unknown:
                 raise typer.Exit(1)
 
         except ValueError as e:
@@ -240,6 +284,8 @@ def register_multicluster_commands(
         ),
         namespace: NamespaceOption = None,
         dry_run: DryRunOption = False,
+        concurrency: ConcurrencyOption = None,
+        timeout: ClusterTimeoutOption = None,
         output: OutputOption = OutputFormat.TABLE,
     ) -> None:
         """Sync a resource from one cluster to others.
@@ -276,6 +322,8 @@ def register_multicluster_commands(
                 resource_name=name,
                 namespace=namespace,
                 dry_run=dry_run,
+                max_concurrency=concurrency,
+                timeout=timeout,
             )
 
             if dry_run:
@@ -291,7 +339,7 @@ def register_multicluster_commands(
                 ),
             )
 
-            if result.failed > 0:
+            if result.failed or result.unknown:
                 raise typer.Exit(1)
 
         except ValueError as e:
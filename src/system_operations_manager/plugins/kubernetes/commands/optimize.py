@@ -7,7 +7,10 @@ optimization opportunities.
 
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
 import typer
@@ -23,9 +26,15 @@ from system_operations_manager.plugins.kubernetes.commands.base import (
 )
 from system_operations_manager.plugins.kubernetes.formatters import OutputFormat, get_formatter
 from system_operations_manager.services.kubernetes.optimization_manager import (
+    DEFAULT_HISTORY_WINDOW,
     DEFAULT_STALE_JOB_HOURS,
     UNDERUTILIZED_CPU_THRESHOLD,
 )
+from system_operations_manager.services.kubernetes.usage_history import (
+    DEFAULT_CAPACITY,
+    DEFAULT_USAGE_HISTORY_DIR,
+    UsageHistory,
+)
 
 if TYPE_CHECKING:
     from system_operations_manager.services.kubernetes.optimization_manager import (
@@ -95,6 +104,73 @@ WorkloadTypeOption = Annotated[
     ),
 ]
 
+HistoryOption = Annotated[
+    bool,
+    typer.Option(
+        "--history",
+        help="Use p95 usage from sampled history (see 'optimize sample') instead of a snapshot",
+    ),
+]
+
+WindowOption = Annotated[
+    float,
+    typer.Option(
+        "--window",
+        help="Hours of sampled history to use with --history",
+    ),
+]
+
+HistoryDirOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--history-dir",
+        help=f"Usage history directory (default: {DEFAULT_USAGE_HISTORY_DIR})",
+    ),
+]
+
+IntervalOption = Annotated[
+    float,
+    typer.Option(
+        "--interval",
+        help="Seconds between samples",
+    ),
+]
+
+CountOption = Annotated[
+    int,
+    typer.Option(
+        "--count",
+        "-c",
+        help="Number of samples to take (0 = until interrupted)",
+    ),
+]
+
+CapacityOption = Annotated[
+    int,
+    typer.Option(
+        "--capacity",
+        help="Samples kept per pod; older samples are overwritten",
+    ),
+]
+
+RetentionOption = Annotated[
+    float,
+    typer.Option(
+        "--retention",
+        help="Hours after which history of pods that are gone is deleted",
+    ),
+]
+
+DEFAULT_SAMPLE_INTERVAL = 30.0
+DEFAULT_RETENTION_HOURS = 168.0
+
+
+def _history(history: bool, history_dir: Path | None) -> UsageHistory | None:
+    """Open the usage history if requested."""
+    if not history and history_dir is None:
+        return None
+    return UsageHistory(history_dir or DEFAULT_USAGE_HISTORY_DIR)
+
 
 # =============================================================================
 # Command Registration
@@ -127,18 +203,24 @@ def register_optimization_commands(
         all_namespaces: AllNamespacesOption = False,
         label_selector: LabelSelectorOption = None,
         threshold: ThresholdOption = UNDERUTILIZED_CPU_THRESHOLD,
+        history: HistoryOption = False,
+        window: WindowOption = DEFAULT_HISTORY_WINDOW.total_seconds() / 3600,
+        history_dir: HistoryDirOption = None,
         output: OutputOption = OutputFormat.TABLE,
     ) -> None:
         """Analyze resource usage vs requests for workloads.
 
         Compares actual CPU/memory consumption (from metrics-server)
         against resource requests for Deployments, StatefulSets, and DaemonSets.
+        With --history, usage is the p95 of samples recorded by
+        'optimize sample' over the --window.
 
         Examples:
             ops k8s optimize analyze
             ops k8s optimize analyze -A
             ops k8s optimize analyze -n production --threshold 0.3
             ops k8s optimize analyze -l app=nginx -o json
+            ops k8s optimize analyze -A --history --window 72
         """
         try:
             manager = get_manager()
@@ -147,6 +229,8 @@ def register_optimization_commands(
                 all_namespaces=all_namespaces,
                 label_selector=label_selector,
                 threshold=threshold,
+                history=_history(history, history_dir),
+                window=timedelta(hours=window),
             )
 
             if not analyses:
@@ -167,17 +251,22 @@ def register_optimization_commands(
         name: Annotated[str, typer.Argument(help="Workload name")],
         namespace: NamespaceOption = None,
         workload_type: WorkloadTypeOption = "Deployment",
+        history: HistoryOption = False,
+        window: WindowOption = DEFAULT_HISTORY_WINDOW.total_seconds() / 3600,
+        history_dir: HistoryDirOption = None,
         output: OutputOption = OutputFormat.TABLE,
     ) -> None:
         """Get right-sizing recommendations for a workload.
 
         Suggests adjusted resource requests and limits based on actual
-        usage from metrics-server, with a safety buffer.
+        usage from metrics-server, with a safety buffer. With --history,
+        requests follow p95 sampled usage and limits cover the observed peak.
 
         Examples:
             ops k8s optimize recommend my-deployment
             ops k8s optimize recommend my-sts -n production --type StatefulSet
             ops k8s optimize recommend my-deploy -o yaml
+            ops k8s optimize recommend my-deploy --history --window 168
         """
         try:
             manager = get_manager()
@@ -185,6 +274,8 @@ def register_optimization_commands(
                 name=name,
                 namespace=namespace,
                 workload_type=workload_type,
+                history=_history(history, history_dir),
+                window=timedelta(hours=window),
             )
 
             formatter = get_formatter(output, console)
@@ -192,6 +283,56 @@ def register_optimization_commands(
         except KubernetesError as e:
             handle_k8s_error(e)
 
+    # -------------------------------------------------------------------------
+    # sample
+    # -------------------------------------------------------------------------
+
+    @optimize_app.command("sample")
+    def sample(
+        namespace: NamespaceOption = None,
+        all_namespaces: AllNamespacesOption = False,
+        interval: IntervalOption = DEFAULT_SAMPLE_INTERVAL,
+        count: CountOption = 0,
+        capacity: CapacityOption = DEFAULT_CAPACITY,
+        retention: RetentionOption = DEFAULT_RETENTION_HOURS,
+        history_dir: HistoryDirOption = None,
+    ) -> None:
+        """Record pod usage from metrics-server into the usage history.
+
+        Polls metrics-server every --interval seconds and appends each pod's
+        usage to a fixed-size ring buffer, filed under its owning workload.
+        'analyze --history' and 'recommend --history' then use percentiles
+        of these samples instead of a single snapshot.
+
+        Examples:
+            ops k8s optimize sample -A
+            ops k8s optimize sample -n production --interval 60
+            ops k8s optimize sample --count 1
+        """
+        store = UsageHistory(history_dir or DEFAULT_USAGE_HISTORY_DIR, capacity=capacity)
+        prune_every = max(1, int(3600 / interval)) if interval > 0 else 1
+        console.print(f"[dim]Recording usage to {store.directory} (Ctrl+C to stop)[/dim]")
+        try:
+            manager = get_manager()
+            taken = 0
+            next_at = time.monotonic()
+            while not count or taken < count:
+                if taken % prune_every == 0:
+                    store.prune(datetime.now(UTC) - timedelta(hours=retention))
+                recorded = manager.sample_usage(
+                    store, namespace=namespace, all_namespaces=all_namespaces
+                )
+                taken += 1
+                console.print(f"Sample {taken}: recorded {recorded} pods")
+                if count and taken >= count:
+                    break
+                next_at += interval
+                time.sleep(max(0.0, next_at - time.monotonic()))
+        except KeyboardInterrupt:
+            console.print("\n[dim]Stopped sampling.[/dim]")
+        except KubernetesError as e:
+            handle_k8s_error(e)
+
     # -------------------------------------------------------------------------
     # unused
     # -------------------------------------------------------------------------
@@ -8,15 +8,16 @@ from __future__ import annotations
 
 import contextlib
 import re
+import selectors
 import socket
 import sys
-import threading
-import time
-from collections.abc import Callable
+import zlib
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 from rich.console import Console
+from rich.text import Text
 
 from system_operations_manager.integrations.kubernetes.exceptions import KubernetesError
 from system_operations_manager.plugins.kubernetes.commands.base import (
@@ -24,8 +25,10 @@ from system_operations_manager.plugins.kubernetes.commands.base import (
     console,
     handle_k8s_error,
 )
+from system_operations_manager.services.kubernetes.streaming_manager import WORKLOAD_KINDS
 
 if TYPE_CHECKING:
+    from system_operations_manager.services.kubernetes.log_multiplexer import LogLine
     from system_operations_manager.services.kubernetes.streaming_manager import StreamingManager
 
 # Duration regex: matches "1h", "30m", "5s", "1h30m", "2h15m30s", etc.
@@ -98,6 +101,53 @@ def _parse_target(target: str) -> tuple[str, str]:
     return target_type, target_name
 
 
+def _parse_logs_target(target: str) -> tuple[str, str]:
+    """Parse a logs target string.
+
+    Supports "pod/name", plain "name" (assumes pod), or a workload such as
+    "deploy/name", "statefulset/name" or "job/name".
+
+    Args:
+        target: Target string.
+
+    Returns:
+        Tuple of (kind, name) where kind is "pod" or a workload alias.
+
+    Raises:
+        typer.BadParameter: If the kind is not a pod or workload kind.
+    """
+    kind, sep, name = target.partition("/")
+    if not sep:
+        return "pod", target
+    kind = kind.lower()
+    if kind not in ("pod", "po", *WORKLOAD_KINDS) or not name:
+        raise typer.BadParameter(
+            f"Invalid target '{target}'. Use '<pod-name>', 'pod/<name>' or "
+            "'<kind>/<name>' for a deployment, statefulset, daemonset, replicaset or job."
+        )
+    return ("pod" if kind == "po" else kind), name
+
+
+# Prefix colours for multiplexed logs, picked per pod so each keeps its colour
+_LOG_PREFIX_STYLES = ("cyan", "magenta", "green", "yellow", "blue", "bright_red")
+
+
+def _print_log_lines(lines: Iterable[LogLine], *, timestamps: bool) -> None:
+    """Print multiplexed log lines with a coloured ``pod/container`` prefix.
+
+    Args:
+        lines: Lines from StreamingManager.stream_selector_logs.
+        timestamps: Include the kubelet timestamp after the prefix.
+    """
+    for line in lines:
+        style = _LOG_PREFIX_STYLES[zlib.crc32(line.pod.encode()) % len(_LOG_PREFIX_STYLES)]
+        text = Text(f"{line.pod}/{line.container} ", style=style)
+        if timestamps and line.timestamp:
+            text.append(f"{line.timestamp} ", style="dim")
+        text.append(line.message)
+        console.print(text, soft_wrap=True, highlight=False)
+
+
 def _parse_port_mappings(mappings: list[str]) -> list[tuple[int, int]]:
     """Parse port mapping strings.
 
@@ -125,6 +175,261 @@ def _parse_port_mappings(mappings: list[str]) -> list[tuple[int, int]]:
     return ports
 
 
+# Bytes read per recv call; one buffer is reused for every connection
+_BRIDGE_CHUNK_SIZE = 256 * 1024
+
+# Pending bytes per direction before reading from the sender pauses
+_BRIDGE_HIGH_WATER = 4 * 1024 * 1024
+
+
+class _Pipe:
+    """One direction of a bridged connection with its pending output."""
+
+    __slots__ = ("dst", "eof", "pending", "src")
+
+    def __init__(self, src: Any, dst: Any) -> None:
+        self.src = src
+        self.dst = dst
+        self.pending = bytearray()
+        self.eof = False
+
+
+class _BridgedConnection:
+    """A local client connection bridged to a port-forward stream."""
+
+    __slots__ = ("client", "remote_port", "stream", "to_client", "to_pod")
+
+    def __init__(self, client: socket.socket, stream: Any, remote_port: int) -> None:
+        self.client = client
+        self.stream = stream
+        self.remote_port = remote_port
+        self.to_pod = _Pipe(client, stream)
+        self.to_client = _Pipe(stream, client)
+
+
+class _PortForwardBridge:
+    """Multiplex every forwarded connection over one selector loop.
+
+    Sockets are non-blocking and only touched when the selector reports
+    them ready, so there is no polling or sleeping. Each read uses a large
+    shared buffer and is written straight through to the peer; bytes the
+    peer cannot take yet are queued, and reading from the sender pauses
+    once ``high_water`` bytes are queued (backpressure).
+
+    The Kubernetes port-forward carries a single stream per remote port, so
+    only one local connection per port is bridged at a time; additional
+    concurrent connections are refused instead of interleaving their bytes.
+
+    When the client half-closes, the client-to-pod direction ends but the
+    pod's reply is still relayed until the pod side finishes. The stream
+    itself is not shut down, since it is shared by later connections. A
+    half-closed connection gives way to the next client connecting to the
+    same port. Bytes left unread on the stream when a connection is torn
+    down are discarded, so they never reach the next client.
+    """
+
+    def __init__(
+        self,
+        pf: Any,
+        *,
+        chunk_size: int = _BRIDGE_CHUNK_SIZE,
+        high_water: int = _BRIDGE_HIGH_WATER,
+    ) -> None:
+        """Initialize the bridge.
+
+        Args:
+            pf: Port-forward object from kubernetes.stream.portforward.
+            chunk_size: Bytes read per recv call.
+            high_water: Pending bytes per direction before reads pause.
+        """
+        self._pf = pf
+        self._chunk = memoryview(bytearray(chunk_size))
+        self._high_water = high_water
+        self._selector = selectors.DefaultSelector()
+        self._servers: list[socket.socket] = []
+        self._active: dict[int, _BridgedConnection] = {}
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+        self._running = False
+
+    def listen(self, address: str, local_port: int, remote_port: int) -> None:
+        """Start accepting local connections for one port mapping.
+
+        Args:
+            address: Local address to bind to.
+            local_port: Local port to listen on.
+            remote_port: Pod port to forward to.
+        """
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._servers.append(server)
+        server.bind((address, local_port))
+        server.listen(socket.SOMAXCONN)
+        server.setblocking(False)
+        self._selector.register(server, selectors.EVENT_READ, remote_port)
+
+    def serve_forever(self) -> None:
+        """Run the event loop until stop() is called."""
+        self._running = True
+        while self._running:
+            for key, events in self._selector.select():
+                if key.fileobj is self._wakeup_r:
+                    self._running = False
+                elif isinstance(key.data, int):
+                    self._accept(key.fileobj, key.data)  # type: ignore[arg-type]
+                else:
+                    self._service(key.fileobj, key.data, events)
+
+    def stop(self) -> None:
+        """Ask the event loop to exit; safe to call from another thread."""
+        with contextlib.suppress(OSError):
+            self._wakeup_w.send(b"\0")
+
+    def close(self) -> None:
+        """Close listeners and local client connections."""
+        for conn in list(self._active.values()):
+            self._close(conn)
+        for server in self._servers:
+            with contextlib.suppress(KeyError, ValueError):
+                self._selector.unregister(server)
+            with contextlib.suppress(OSError):
+                server.close()
+        self._selector.close()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+
+    def _accept(self, server: socket.socket, remote_port: int) -> None:
+        """Accept a pending local connection and bridge it."""
+        try:
+            client, _ = server.accept()
+        except BlockingIOError, InterruptedError:
+            return
+
+        active = self._active.get(remote_port)
+        if active is not None and active.to_pod.eof:
+            # The previous client has finished sending; let the new one in
+            self._close(active)
+        elif active is not None:
+            console.print(
+                f"[yellow][port-forward] Refusing connection: port {remote_port} "
+                "already has an active connection[/yellow]"
+            )
+            client.close()
+            return
+
+        try:
+            stream = self._pf.socket(remote_port)
+            client.setblocking(False)
+            stream.setblocking(False)
+            with contextlib.suppress(OSError):
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except Exception as exc:
+            console.log(f"[port-forward] Error opening stream to port {remote_port}: {exc}")
+            client.close()
+            return
+
+        conn = _BridgedConnection(client, stream, remote_port)
+        self._active[remote_port] = conn
+        self._selector.register(client, selectors.EVENT_READ, conn)
+        self._selector.register(stream, selectors.EVENT_READ, conn)
+
+    def _service(self, sock: Any, conn: _BridgedConnection, events: int) -> None:
+        """Move data for a ready socket and update its interest set."""
+        if self._active.get(conn.remote_port) is not conn:
+            return  # Closed earlier in this round of events
+        try:
+            if events & selectors.EVENT_WRITE:
+                # Flush whatever is queued for this socket
+                pipe = conn.to_client if sock is conn.client else conn.to_pod
+                self._flush(pipe)
+            if events & selectors.EVENT_READ:
+                pipe = conn.to_pod if sock is conn.client else conn.to_client
+                self._read(pipe)
+        except OSError as exc:
+            console.log(f"[port-forward] Error in TCP bridge: {exc}")
+            self._close(conn)
+            return
+
+        # Client EOF only ends the client-to-pod direction; the bridge ends
+        # once the pod side finishes and its data is delivered
+        if conn.to_client.eof and not conn.to_client.pending:
+            self._close(conn)
+            return
+        self._update_interest(conn)
+
+    def _read(self, pipe: _Pipe) -> None:
+        """Read one chunk from the pipe's source and forward it."""
+        try:
+            n = pipe.src.recv_into(self._chunk)
+        except BlockingIOError, InterruptedError:
+            return
+        if n == 0:
+            pipe.eof = True
+            return
+
+        data = self._chunk[:n]
+        if not pipe.pending:
+            try:
+                sent = pipe.dst.send(data)
+            except BlockingIOError, InterruptedError:
+                sent = 0
+            data = data[sent:]
+        if data:
+            pipe.pending += data
+
+    @staticmethod
+    def _flush(pipe: _Pipe) -> None:
+        """Write as much pending data to the pipe's destination as it accepts."""
+        if not pipe.pending:
+            return
+        try:
+            sent = pipe.dst.send(pipe.pending)
+        except BlockingIOError, InterruptedError:
+            return
+        del pipe.pending[:sent]
+
+    def _update_interest(self, conn: _BridgedConnection) -> None:
+        """Register read/write interest based on EOF and queued bytes."""
+        for sock, outgoing, incoming in (
+            (conn.client, conn.to_pod, conn.to_client),
+            (conn.stream, conn.to_client, conn.to_pod),
+        ):
+            events = 0
+            if not outgoing.eof and len(outgoing.pending) < self._high_water:
+                events |= selectors.EVENT_READ
+            if incoming.pending:
+                events |= selectors.EVENT_WRITE
+            registered = sock in self._selector.get_map()
+            if events and registered:
+                self._selector.modify(sock, events, conn)
+            elif events:
+                self._selector.register(sock, events, conn)
+            elif registered:
+                # Sender finished or peer backed up, and nothing queued for us
+                self._selector.unregister(sock)
+
+    def _close(self, conn: _BridgedConnection) -> None:
+        """Tear down a bridged connection, keeping the shared stream open."""
+        for sock in (conn.client, conn.stream):
+            with contextlib.suppress(KeyError, ValueError):
+                self._selector.unregister(sock)
+        with contextlib.suppress(OSError):
+            conn.client.close()
+        conn.to_client.pending.clear()
+        self._discard_stream(conn.stream)
+        self._active.pop(conn.remote_port, None)
+
+    def _discard_stream(self, stream: Any) -> None:
+        """Drop bytes already readable on a stream so the next client starts clean."""
+        while True:
+            try:
+                if not stream.recv_into(self._chunk):
+                    return
+            except OSError:
+                return  # Nothing left to read (or the stream is gone)
+
+
 def _run_port_forward(
     pf: Any,
     ports: list[tuple[int, int]],
@@ -132,112 +437,26 @@ def _run_port_forward(
 ) -> None:
     """Run local TCP listeners that forward to the Kubernetes pod.
 
+    All listeners and forwarded connections are served by one event loop
+    on the calling thread until Ctrl+C.
+
     Args:
         pf: Port-forward object from kubernetes.stream.portforward.
         ports: List of (local_port, remote_port) tuples.
         address: Local address to bind to.
     """
-    servers: list[socket.socket] = []
-
+    bridge = _PortForwardBridge(pf)
     try:
         for local_port, remote_port in ports:
-            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server.bind((address, local_port))
-            server.listen(5)
-            servers.append(server)
+            bridge.listen(address, local_port, remote_port)
             console.print(f"Forwarding from {address}:{local_port} -> {remote_port}")
 
-            accept_thread = threading.Thread(
-                target=_accept_connections,
-                args=(server, pf, remote_port),
-                daemon=True,
-            )
-            accept_thread.start()
-
         console.print("[dim]Press Ctrl+C to stop port forwarding.[/dim]")
-        while True:
-            time.sleep(1)
+        bridge.serve_forever()
     except KeyboardInterrupt:
         console.print("\n[dim]Stopping port forwarding...[/dim]")
     finally:
-        for server in servers:
-            with contextlib.suppress(OSError):
-                server.close()
-
-
-def _accept_connections(
-    server: socket.socket,
-    pf: Any,
-    remote_port: int,
-) -> None:
-    """Accept local TCP connections and bridge to the port-forward.
-
-    Args:
-        server: Local TCP server socket.
-        pf: Port-forward object.
-        remote_port: Remote port to forward to.
-    """
-    while True:
-        try:
-            client_sock, _ = server.accept()
-        except OSError:
-            break
-
-        bridge_thread = threading.Thread(
-            target=_bridge_connection,
-            args=(client_sock, pf, remote_port),
-            daemon=True,
-        )
-        bridge_thread.start()
-
-
-def _bridge_connection(
-    client_sock: socket.socket,
-    pf: Any,
-    remote_port: int,
-) -> None:
-    """Bridge a local TCP connection to the Kubernetes port-forward.
-
-    Args:
-        client_sock: Local client socket.
-        pf: Port-forward object.
-        remote_port: Remote port to forward to.
-    """
-    try:
-        pf_socket = pf.socket(remote_port)
-        client_sock.setblocking(False)
-        pf_socket.setblocking(False)
-
-        while True:
-            # Read from local client, write to pod
-            try:
-                data = client_sock.recv(4096)
-                if not data:
-                    break
-                pf_socket.sendall(data)
-            except BlockingIOError:
-                # Expected for non-blocking sockets when no data is available yet.
-                # Non-blocking socket: no data available right now, try again on next loop
-                pass
-
-            # Read from pod, write to local client
-            try:
-                data = pf_socket.recv(4096)
-                if not data:
-                    break
-                client_sock.sendall(data)
-                # Expected for non-blocking sockets when no data is available yet.
-            except BlockingIOError:
-                # Non-blocking socket: no data available right now, try again on next loop
-                pass
-
-            time.sleep(0.01)
-    except Exception as exc:
-        console.log(f"[port-forward] Error in TCP bridge: {exc}")
-    finally:
-        with contextlib.suppress(OSError):
-            client_sock.close()
+        bridge.close()
 
 
 def register_streaming_commands(
@@ -259,8 +478,17 @@ def register_streaming_commands(
 
     @app.command("logs")
     def logs_command(
-        pod: Annotated[str, typer.Argument(help="Pod name")],
+        pod: Annotated[
+            str | None,
+            typer.Argument(
+                help="Pod name, or a workload such as deploy/<name>, sts/<name> or job/<name>"
+            ),
+        ] = None,
         namespace: NamespaceOption = None,
+        selector: Annotated[
+            str | None,
+            typer.Option("--selector", "-l", help="Tail every pod matching this label selector"),
+        ] = None,
         container: Annotated[
             str | None,
             typer.Option("--container", "-c", help="Container name"),
@@ -288,17 +516,51 @@ def register_streaming_commands(
     ) -> None:
         """Get or stream pod logs.
 
+        With a label selector or a workload, every matching pod is tailed
+        at once and lines are interleaved by timestamp with a
+        ``pod/container`` prefix. Pods that appear while following are
+        picked up automatically.
+
         Examples:
             ops k8s logs my-pod
             ops k8s logs my-pod --follow
             ops k8s logs my-pod --tail 100 -c sidecar
             ops k8s logs my-pod --since 1h --timestamps
+            ops k8s logs deploy/web --follow
+            ops k8s logs -l app=web -f --tail 10
         """
+        kind, name = _parse_logs_target(pod) if pod else ("pod", "")
+        if selector and pod:
+            raise typer.BadParameter("Pass either a pod/workload or --selector, not both.")
+        if not selector and not name:
+            raise typer.BadParameter("Pass a pod, a workload, or --selector.")
+
         try:
             manager = get_manager()
             since_seconds = _parse_duration(since) if since else None
+
+            if selector or kind != "pod":
+                if previous:
+                    raise typer.BadParameter("--previous only applies to a single pod.")
+                label_selector = selector or manager.resolve_workload_selector(
+                    kind, name, namespace
+                )
+                lines = manager.stream_selector_logs(
+                    label_selector,
+                    namespace,
+                    container=container,
+                    follow=follow,
+                    tail_lines=tail,
+                    since_seconds=since_seconds,
+                )
+                try:
+                    _print_log_lines(lines, timestamps=timestamps)
+                except KeyboardInterrupt:
+                    console.print("\n[dim]Log streaming stopped.[/dim]")
+                return
+
             result = manager.stream_logs(
-                pod,
+                name,
                 namespace,
                 container=container,
                 follow=follow,
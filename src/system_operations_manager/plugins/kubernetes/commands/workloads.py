@@ -142,14 +142,14 @@ def register_workload_commands(
         """
         try:
             manager = get_manager()
-            pods = manager.list_pods(
+            pages = manager.iter_pods(
                 namespace=namespace,
                 all_namespaces=all_namespaces,
                 label_selector=label_selector,
                 field_selector=field_selector,
             )
             formatter = get_formatter(output, console)
-            formatter.format_list(pods, POD_COLUMNS, title="Pods")
+            formatter.format_pages(pages, POD_COLUMNS, title="Pods")
         except KubernetesError as e:
             handle_k8s_error(e)
 
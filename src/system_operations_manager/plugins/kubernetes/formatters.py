@@ -7,8 +7,9 @@ allowing commands to output data in table, JSON, or YAML formats.
 from __future__ import annotations
 
 import json
+import textwrap
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from enum import StrEnum
 from typing import Any
 
@@ -45,6 +46,15 @@ class K8sFormatter(ABC):
     ) -> None:
         """Format and display a list of resources."""
 
+    @abstractmethod
+    def format_pages(
+        self,
+        pages: Iterable[Sequence[Any]],
+        columns: list[tuple[str, str]],
+        title: str = "",
+    ) -> None:
+        """Format and display resources as they arrive, one page at a time."""
+
     @abstractmethod
     def format_dict(self, data: dict[str, Any], title: str = "") -> None:
         """Format and display a dictionary."""
@@ -84,6 +94,35 @@ class TableFormatter(K8sFormatter):
         """Format resources as a multi-column table."""
         table = Table(title=title, show_header=True)
 
+        self._add_rows(table, resources, columns)
+
+        self.console.print(table)
+        self.console.print(f"\n[dim]Total: {len(resources)} resources[/dim]")
+
+    def format_pages(
+        self,
+        pages: Iterable[Sequence[Any]],
+        columns: list[tuple[str, str]],
+        title: str = "",
+    ) -> None:
+        """Format each page as its own table, printed as soon as it arrives."""
+        total = 0
+        for index, page in enumerate(pages):
+            if not page and index:
+                continue
+            table = Table(title=title if index == 0 else None, show_header=True)
+            self._add_rows(table, page, columns)
+            self.console.print(table)
+            total += len(page)
+
+        self.console.print(f"\n[dim]Total: {total} resources[/dim]")
+
+    def _add_rows(
+        self,
+        table: Table,
+        resources: Iterable[Any],
+        columns: list[tuple[str, str]],
+    ) -> None:
         for _field_name, header in columns:
             style = "cyan" if header.lower() in ("name", "namespace") else None
             table.add_column(header, style=style)
@@ -96,9 +135,6 @@ class TableFormatter(K8sFormatter):
                 row.append(self._format_cell_value(value))
             table.add_row(*row)
 
-        self.console.print(table)
-        self.console.print(f"\n[dim]Total: {len(resources)} resources[/dim]")
-
     def format_dict(self, data: dict[str, Any], title: str = "") -> None:
         """Format dictionary as a two-column table."""
         table = Table(title=title, show_header=True)
@@ -179,6 +215,31 @@ class JsonFormatter(K8sFormatter):
         output = {"data": data, "total": len(data)}
         self.console.print(json.dumps(output, indent=2, default=str))
 
+    def format_pages(
+        self,
+        pages: Iterable[Sequence[Any]],
+        columns: list[tuple[str, str]],
+        title: str = "",
+    ) -> None:
+        """Write the same document as format_list, one item at a time."""
+        total = 0
+        pending: str | None = None
+        for page in pages:
+            for r in page:
+                data = r.model_dump(exclude_none=True) if hasattr(r, "model_dump") else r
+                if pending is None:
+                    self.console.print('{\n  "data": [')
+                else:
+                    self.console.print(f"{pending},")
+                pending = textwrap.indent(json.dumps(data, indent=2, default=str), "    ")
+                total += 1
+
+        if pending is None:
+            self.console.print('{\n  "data": [],')
+        else:
+            self.console.print(f"{pending}\n  ],")
+        self.console.print(f'  "total": {total}\n}}')
+
     def format_dict(self, data: dict[str, Any], title: str = "") -> None:
         self.console.print(json.dumps(data, indent=2, default=str))
 
@@ -203,6 +264,26 @@ class YamlFormatter(K8sFormatter):
         ]
         self.console.print(yaml.dump(data, default_flow_style=False, sort_keys=False))
 
+    def format_pages(
+        self,
+        pages: Iterable[Sequence[Any]],
+        columns: list[tuple[str, str]],
+        title: str = "",
+    ) -> None:
+        """Write each page as a run of sequence items of one YAML list."""
+        empty = True
+        for page in pages:
+            if not page:
+                continue
+            data = [
+                r.model_dump(exclude_none=True) if hasattr(r, "model_dump") else r for r in page
+            ]
+            self.console.print(yaml.dump(data, default_flow_style=False, sort_keys=False), end="")
+            empty = False
+
+        if empty:
+            self.console.print(yaml.dump([], default_flow_style=False))
+
     def format_dict(self, data: dict[str, Any], title: str = "") -> None:
         self.console.print(yaml.dump(data, default_flow_style=False, sort_keys=False))
 
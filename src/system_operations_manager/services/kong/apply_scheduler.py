@@ -0,0 +1,279 @@
+"""Dependency-aware parallel scheduler for declarative config apply.
+
+This module groups apply operations into waves. Every operation in a wave
+depends only on operations in earlier waves, so each wave can run
+concurrently and total apply time scales with dependency depth instead of
+entity count.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import structlog
+
+from system_operations_manager.integrations.kong.models.config import (
+    ApplyOperation,
+    ConfigDiff,
+)
+
+logger = structlog.get_logger()
+
+type ErrorPolicy = Literal["continue", "fail-fast"]
+type RefResolver = Callable[[Any, bool], str | None]
+
+ERROR_POLICIES: tuple[ErrorPolicy, ...] = ("continue", "fail-fast")
+
+# Parent references each entity type may carry:
+# field -> (referenced entity type, prefer_username when resolving)
+PARENT_REFS: dict[str, dict[str, tuple[str, bool]]] = {
+    "routes": {"service": ("services", False)},
+    "plugins": {
+        "service": ("services", False),
+        "route": ("routes", False),
+        "consumer": ("consumers", True),
+    },
+}
+
+
+@dataclass
+class ApplyNode:
+    """A single scheduled apply operation.
+
+    Attributes:
+        diff: The diff to apply.
+        deps: Indexes of nodes that must succeed before this one runs.
+        wave: Zero-based wave the node runs in.
+    """
+
+    diff: ConfigDiff
+    deps: list[int] = field(default_factory=list)
+    wave: int = 0
+
+
+class ApplyScheduler:
+    """Run apply operations concurrently in dependency-ordered waves.
+
+    Creates and updates run first. A route waits for the service it
+    references, and a plugin waits for its service, route and consumer, but
+    only when that parent is itself part of the diff. Deletes run afterwards
+    in the reverse direction: a service is deleted only once the routes and
+    plugins that reference it are gone.
+
+    With ``on_error="continue"`` operations whose dependencies failed are
+    reported as failed without being attempted, while unrelated operations
+    proceed. With ``"fail-fast"`` the current wave finishes and every
+    remaining operation is reported as not applied.
+
+    Example:
+        >>> scheduler = ApplyScheduler(run, resolve_ref=resolve, max_workers=8)
+        >>> operations = scheduler.run(ordered_diffs)
+    """
+
+    def __init__(
+        self,
+        run_operation: Callable[[ConfigDiff], ApplyOperation],
+        *,
+        resolve_ref: RefResolver,
+        max_workers: int = 1,
+        on_error: ErrorPolicy = "continue",
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            run_operation: Applies one diff and returns its result. Must not raise.
+            resolve_ref: Resolves a parent reference to a name or ID.
+            max_workers: Maximum operations run concurrently within a wave.
+            on_error: Failure policy ("continue" or "fail-fast").
+
+        Raises:
+            ValueError: If max_workers or on_error is invalid.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if on_error not in ERROR_POLICIES:
+            raise ValueError(f"on_error must be one of: {', '.join(ERROR_POLICIES)}")
+
+        self._run_operation = run_operation
+        self._resolve_ref = resolve_ref
+        self._max_workers = max_workers
+        self._on_error = on_error
+        self._log = logger.bind(service="apply_scheduler")
+
+    # -------------------------------------------------------------------------
+    # Planning
+    # -------------------------------------------------------------------------
+
+    def plan(self, diffs: list[ConfigDiff]) -> list[list[ConfigDiff]]:
+        """Group diffs into dependency waves.
+
+        Args:
+            diffs: Diffs in dependency order (see run()).
+
+        Returns:
+            Waves of diffs; each diff only depends on diffs in earlier waves.
+        """
+        nodes = self._build_nodes(diffs)
+        return [[nodes[i].diff for i in wave] for wave in self._waves(nodes)]
+
+    def _build_nodes(self, diffs: list[ConfigDiff]) -> list[ApplyNode]:
+        """Build nodes with dependency edges and wave numbers."""
+        nodes = [ApplyNode(diff=d) for d in diffs]
+        upserts = [i for i, n in enumerate(nodes) if n.diff.operation != "delete"]
+        deletes = [i for i, n in enumerate(nodes) if n.diff.operation == "delete"]
+
+        self._link_upserts(nodes, upserts)
+        upsert_depth = max((nodes[i].wave + 1 for i in upserts), default=0)
+        self._link_deletes(nodes, deletes, first_wave=upsert_depth)
+        return nodes
+
+    @staticmethod
+    def _waves(nodes: list[ApplyNode]) -> list[list[int]]:
+        """Group node indexes by wave, preserving input order within a wave."""
+        waves: list[list[int]] = [[] for _ in range(max((n.wave + 1 for n in nodes), default=0))]
+        for i, node in enumerate(nodes):
+            waves[node.wave].append(i)
+        return [wave for wave in waves if wave]
+
+    @staticmethod
+    def _identifiers(entity: dict[str, Any] | None, fallback: str) -> set[str]:
+        """Collect every identifier an entity may be referenced by."""
+        idents = {fallback}
+        if entity:
+            idents.update(str(entity[key]) for key in ("id", "name", "username") if entity.get(key))
+        return idents
+
+    def _parent_refs(
+        self, diff: ConfigDiff, entity: dict[str, Any] | None
+    ) -> list[tuple[str, str]]:
+        """Resolve the (entity type, identifier) pairs an entity references."""
+        refs: list[tuple[str, str]] = []
+        if not entity:
+            return refs
+        for ref_field, (parent_type, prefer_username) in PARENT_REFS.get(
+            diff.entity_type, {}
+        ).items():
+            ident = self._resolve_ref(entity.get(ref_field), prefer_username)
+            if ident:
+                refs.append((parent_type, ident))
+        return refs
+
+    def _link_upserts(self, nodes: list[ApplyNode], indexes: list[int]) -> None:
+        """Make creates/updates wait for parents being created or updated."""
+        index: dict[tuple[str, str], int] = {}
+        for i in indexes:
+            diff = nodes[i].diff
+            for ident in self._identifiers(diff.desired, diff.id_or_name):
+                index.setdefault((diff.entity_type, ident), i)
+
+        for i in indexes:
+            node = nodes[i]
+            for ref in self._parent_refs(node.diff, node.diff.desired):
+                parent = index.get(ref)
+                if parent is not None and parent != i:
+                    node.deps.append(parent)
+            node.wave = max((nodes[d].wave + 1 for d in node.deps), default=0)
+
+    def _link_deletes(self, nodes: list[ApplyNode], indexes: list[int], *, first_wave: int) -> None:
+        """Make parent deletes wait for deletes of the children referencing them."""
+        index: dict[tuple[str, str], int] = {}
+        for i in indexes:
+            diff = nodes[i].diff
+            for ident in self._identifiers(diff.current, diff.id_or_name):
+                index.setdefault((diff.entity_type, ident), i)
+
+        for i in indexes:
+            node = nodes[i]
+            for ref in self._parent_refs(node.diff, node.diff.current):
+                parent = index.get(ref)
+                if parent is not None and parent != i:
+                    nodes[parent].deps.append(i)
+
+        # Children precede parents in delete order, so one pass settles waves
+        for i in indexes:
+            node = nodes[i]
+            node.wave = max((nodes[d].wave + 1 for d in node.deps), default=first_wave)
+
+    # -------------------------------------------------------------------------
+    # Execution
+    # -------------------------------------------------------------------------
+
+    def run(self, diffs: list[ConfigDiff]) -> list[ApplyOperation]:
+        """Apply diffs wave by wave.
+
+        Args:
+            diffs: Diffs in dependency order: creates/updates with parents
+                before children, then deletes with children before parents,
+                as produced by ConfigManager._ordered_diffs.
+
+        Returns:
+            One ApplyOperation per diff, in the order the diffs were given.
+        """
+        nodes = self._build_nodes(diffs)
+        waves = self._waves(nodes)
+        results: list[ApplyOperation | None] = [None] * len(nodes)
+        failed: set[int] = set()
+
+        self._log.info(
+            "apply_scheduled",
+            operations=len(nodes),
+            waves=len(waves),
+            max_workers=self._max_workers,
+            on_error=self._on_error,
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="kong-apply"
+        ) as pool:
+            for wave_number, wave in enumerate(waves):
+                if failed and self._on_error == "fail-fast":
+                    for i in wave:
+                        results[i] = self._not_applied(nodes[i], "aborted after an earlier failure")
+                    continue
+
+                runnable: list[int] = []
+                for i in wave:
+                    if blocked := [d for d in nodes[i].deps if d in failed]:
+                        parent = nodes[blocked[0]].diff
+                        results[i] = self._not_applied(
+                            nodes[i],
+                            f"dependency {parent.entity_type}/{parent.id_or_name} failed",
+                        )
+                        failed.add(i)
+                    else:
+                        runnable.append(i)
+
+                if self._max_workers == 1 or len(runnable) <= 1:
+                    outcomes = [self._run_operation(nodes[i].diff) for i in runnable]
+                else:
+                    outcomes = list(
+                        pool.map(lambda i: self._run_operation(nodes[i].diff), runnable)
+                    )
+
+                for i, outcome in zip(runnable, outcomes, strict=True):
+                    results[i] = outcome
+                    if outcome.result == "failed":
+                        failed.add(i)
+
+                self._log.debug(
+                    "apply_wave_complete",
+                    wave=wave_number,
+                    operations=len(wave),
+                    failed=len(failed.intersection(wave)),
+                )
+
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    def _not_applied(node: ApplyNode, reason: str) -> ApplyOperation:
+        """Report an operation that was skipped because of another failure."""
+        return ApplyOperation(
+            operation=node.diff.operation,
+            entity_type=node.diff.entity_type,
+            id_or_name=node.diff.id_or_name,
+            result="failed",
+            error=f"Not applied: {reason}",
+        )
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import builtins
 from abc import ABC
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -18,6 +19,11 @@ if TYPE_CHECKING:
 
 from system_operations_manager.integrations.kong.exceptions import KongNotFoundError
 from system_operations_manager.integrations.kong.models.base import KongEntityBase
+from system_operations_manager.utils.pagination import (
+    iter_items,
+    iter_pages,
+    validate_page_size,
+)
 
 logger = structlog.get_logger()
 
@@ -216,26 +222,92 @@ class BaseEntityManager[T: KongEntityBase](ABC):
         except KongNotFoundError:
             return False
 
-    def count(self, *, tags: builtins.list[str] | None = None) -> int:
+    def iter_pages(
+        self,
+        *,
+        tags: builtins.list[str] | None = None,
+        page_size: int | None = None,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[builtins.list[T]]:
+        """Stream entities one page at a time.
+
+        Follows pagination offsets until the collection is exhausted. With
+        prefetch enabled the next page is requested while the caller
+        processes the current one.
+
+        Args:
+            tags: Filter by tags (AND logic - entities must have all tags).
+            page_size: Entities per page (1-1000, Kong default: 100).
+            prefetch: Fetch the next page in the background.
+            **filters: Additional entity-specific query parameters.
+
+        Yields:
+            Lists of entity models, one per page.
+
+        Raises:
+            ValueError: If page_size is outside 1-1000.
+
+        Example:
+            >>> for page in manager.iter_pages(page_size=1000):
+            ...     process(page)
+        """
+        limit = validate_page_size(page_size)
+        return iter_pages(
+            lambda offset: self.list(tags=tags, limit=limit, offset=offset, **filters),
+            prefetch=prefetch,
+        )
+
+    def iter_all(
+        self,
+        *,
+        tags: builtins.list[str] | None = None,
+        page_size: int | None = None,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[T]:
+        """Stream every entity across all pages.
+
+        Args:
+            tags: Filter by tags (AND logic - entities must have all tags).
+            page_size: Entities per page (1-1000, Kong default: 100).
+            prefetch: Fetch the next page in the background.
+            **filters: Additional entity-specific query parameters.
+
+        Yields:
+            Entity models in server order.
+
+        Raises:
+            ValueError: If page_size is outside 1-1000.
+
+        Example:
+            >>> names = [service.name for service in manager.iter_all(tags=["prod"])]
+        """
+        limit = validate_page_size(page_size)
+        return iter_items(
+            lambda offset: self.list(tags=tags, limit=limit, offset=offset, **filters),
+            prefetch=prefetch,
+        )
+
+    def count(
+        self,
+        *,
+        tags: builtins.list[str] | None = None,
+        page_size: int | None = None,
+    ) -> int:
         """Count entities matching the filter criteria.
 
         Note: Kong doesn't provide a native count endpoint, so this
-        fetches all entities. For large datasets, consider using
-        list() with pagination instead.
+        pages through all entities. Only one page is held in memory
+        at a time.
 
         Args:
             tags: Filter by tags before counting.
+            page_size: Entities per page (1-1000, Kong default: 100).
 
         Returns:
             Total count of matching entities.
         """
-        count = 0
-        offset: str | None = None
-
-        while True:
-            entities, offset = self.list(tags=tags, offset=offset)
-            count += len(entities)
-            if not offset:
-                break
-
-        return count
+        return sum(
+            len(page) for page in self.iter_pages(tags=tags, page_size=page_size, prefetch=False)
+        )
@@ -6,7 +6,10 @@ diff, and apply operations for Kong's declarative configuration format.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal
 
 import structlog
 
@@ -21,9 +24,21 @@ from system_operations_manager.integrations.kong.models.config import (
     ConfigValidationResult,
     DeclarativeConfig,
 )
+from system_operations_manager.services.kong.apply_scheduler import (
+    ApplyScheduler,
+    ErrorPolicy,
+)
+from system_operations_manager.utils.fingerprint import fingerprint
+from system_operations_manager.utils.pagination import MAX_PAGE_SIZE
 
 logger = structlog.get_logger()
 
+# Kong accepts page sizes between 1 and 1000 (default 100)
+DEFAULT_PAGE_SIZE = MAX_PAGE_SIZE
+
+# Default number of concurrent Admin API requests issued during export
+DEFAULT_MAX_WORKERS = 8
+
 
 class ConfigManager:
     """Manager for Kong declarative configuration operations.
@@ -59,6 +74,39 @@ class ConfigManager:
         "services",
     ]
 
+    # Server-assigned fields excluded from diffs and fingerprints
+    DIFF_IGNORED_FIELDS = frozenset({"id", "created_at", "updated_at"})
+
+    # Bundled plugin names, keyed by scope even when entity_type is not given
+    PLUGIN_NAMES = frozenset(
+        {
+            "key-auth",
+            "basic-auth",
+            "jwt",
+            "oauth2",
+            "acl",
+            "rate-limiting",
+            "request-size-limiting",
+            "request-transformer",
+            "response-transformer",
+            "cors",
+            "ip-restriction",
+            "bot-detection",
+            "aws-lambda",
+            "http-log",
+            "file-log",
+            "tcp-log",
+            "udp-log",
+            "syslog",
+            "prometheus",
+            "datadog",
+            "zipkin",
+            "opentelemetry",
+            "proxy-cache",
+            "response-ratelimiting",
+        }
+    )
+
     # Nested entity mappings - fields that contain child entities
     # These are valid in declarative config but need special handling for REST API
     NESTED_ENTITIES = {
@@ -84,15 +132,47 @@ class ConfigManager:
         },
     }
 
-    def __init__(self, client: KongAdminClient) -> None:
+    # Credential endpoints fetched per consumer when exporting credentials
+    CREDENTIAL_TYPES = ["key-auth", "basic-auth", "jwt", "oauth2", "acls"]
+
+    def __init__(
+        self,
+        client: KongAdminClient,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
         """Initialize the config manager.
 
         Args:
             client: Kong Admin API client instance.
+            page_size: Number of entities requested per page when exporting
+                (1-1000).
+            max_workers: Maximum number of concurrent Admin API requests used
+                when exporting. A value of 1 fetches everything sequentially.
+
+        Raises:
+            ValueError: If page_size or max_workers is out of range.
         """
         self._client = client
+        self._page_size = self._validate_page_size(page_size)
+        self._max_workers = self._validate_max_workers(max_workers)
         self._log = logger.bind(service="config_manager")
 
+    @staticmethod
+    def _validate_page_size(page_size: int) -> int:
+        """Validate a page size against Kong's accepted range."""
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        return page_size
+
+    @staticmethod
+    def _validate_max_workers(max_workers: int) -> int:
+        """Validate the worker pool size."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        return max_workers
+
     # =========================================================================
     # Config Flattening (for DB mode)
     # =========================================================================
@@ -218,40 +298,69 @@ class ConfigManager:
         *,
         only: list[str] | None = None,
         include_credentials: bool = False,
+        page_size: int | None = None,
+        max_workers: int | None = None,
     ) -> DeclarativeConfig:
         """Export current Kong state to declarative config.
 
         Fetches all entities from Kong and assembles them into a
-        declarative configuration format.
+        declarative configuration format. Every page of each collection is
+        followed. Entity types are fetched concurrently, then per-parent
+        children (upstream targets, consumer credentials) are fetched as one
+        batch, both on a single pool of max_workers threads.
 
         Args:
             only: Filter to specific entity types (e.g., ['services', 'routes']).
             include_credentials: Whether to include consumer credentials.
+            page_size: Override the page size for this export (1-1000).
+            max_workers: Override the worker pool size for this export.
 
         Returns:
             DeclarativeConfig with current state.
+
+        Raises:
+            ValueError: If page_size or max_workers is out of range.
         """
+        page_size = self._validate_page_size(page_size or self._page_size)
+        max_workers = self._validate_max_workers(max_workers or self._max_workers)
+
         self._log.info(
             "exporting_kong_state",
             only=only,
             include_credentials=include_credentials,
+            page_size=page_size,
+            max_workers=max_workers,
         )
 
         config = DeclarativeConfig()
 
-        entity_types = only if only else self.ENTITY_ORDER
+        exporters: dict[str, Callable[[], list[dict[str, Any]]]] = {
+            "services": lambda: self._export_services(page_size=page_size),
+            "upstreams": lambda: self._fetch_all("upstreams", page_size=page_size),
+            "routes": lambda: self._export_routes(page_size=page_size),
+            "consumers": lambda: self._fetch_all("consumers", page_size=page_size),
+            "plugins": lambda: self._export_plugins(page_size=page_size),
+        }
 
-        for entity_type in entity_types:
-            if entity_type == "services":
-                config.services = self._export_services()
-            elif entity_type == "routes":
-                config.routes = self._export_routes()
-            elif entity_type == "upstreams":
-                config.upstreams = self._export_upstreams()
-            elif entity_type == "consumers":
-                config.consumers = self._export_consumers(include_credentials)
-            elif entity_type == "plugins":
-                config.plugins = self._export_plugins()
+        entity_types = [t for t in (only if only else self.ENTITY_ORDER) if t in exporters]
+        with self._export_pool(max_workers) as pool:
+            results = dict(
+                zip(
+                    entity_types,
+                    pool.map(lambda entity_type: exporters[entity_type](), entity_types),
+                    strict=True,
+                )
+            )
+            # Children are fetched only after every collection is in, so no
+            # pool task ever waits on another and the pool never grows
+            upstreams = results.get("upstreams", [])
+            consumers = results.get("consumers", []) if include_credentials else []
+            self._embed_children(pool, upstreams, consumers, page_size=page_size)
+
+        for entity_type, entities in results.items():
+            if entity_type in ("upstreams", "consumers"):
+                entities = self._clean_entities(entities)
+            setattr(config, entity_type, entities)
 
         self._log.info(
             "export_complete",
@@ -264,74 +373,138 @@ class ConfigManager:
 
         return config
 
-    def _export_services(self) -> list[dict[str, Any]]:
+    def _fetch_all(self, endpoint: str, *, page_size: int | None = None) -> list[dict[str, Any]]:
+        """Fetch every page of a collection endpoint.
+
+        Args:
+            endpoint: Collection endpoint (e.g., "services", "upstreams/x/targets").
+            page_size: Entities per page; defaults to the manager's page size.
+
+        Returns:
+            All raw entity dictionaries across every page.
+        """
+        params: dict[str, Any] = {"size": page_size or self._page_size}
+        entities: list[dict[str, Any]] = []
+
+        while True:
+            response = self._client.get(endpoint, params=params)
+            entities.extend(response.get("data", []))
+            next_offset = response.get("offset")
+            if not next_offset:
+                break
+            params = {**params, "offset": next_offset}
+
+        return entities
+
+    def _export_pool(self, max_workers: int | None = None) -> ThreadPoolExecutor:
+        """Create the bounded worker pool used by an export.
+
+        Args:
+            max_workers: Pool size; defaults to the manager's max_workers.
+
+        Returns:
+            Thread pool executor (use as a context manager).
+        """
+        return ThreadPoolExecutor(
+            max_workers=max_workers or self._max_workers, thread_name_prefix="kong-export"
+        )
+
+    def _embed_children(
+        self,
+        pool: Executor,
+        upstreams: list[dict[str, Any]],
+        consumers: list[dict[str, Any]],
+        *,
+        page_size: int | None = None,
+    ) -> None:
+        """Fetch upstream targets and consumer credentials and embed them.
+
+        Every (upstream) and (consumer, credential type) fetch is submitted
+        to ``pool`` as one flat batch, so the number of requests in flight
+        never exceeds the pool size. Results are embedded on the calling
+        thread in input order.
+
+        Args:
+            pool: Executor running the child fetches.
+            upstreams: Raw upstreams to embed ``targets`` into.
+            consumers: Raw consumers to embed credentials into.
+            page_size: Entities per page.
+        """
+        target_parents: list[tuple[dict[str, Any], str]] = [
+            (upstream, name)
+            for upstream in upstreams
+            if (name := upstream.get("name") or upstream.get("id"))
+        ]
+        credential_parents: list[tuple[dict[str, Any], str, str]] = [
+            (consumer, consumer_id, cred_type)
+            for consumer in consumers
+            if (consumer_id := consumer.get("id") or consumer.get("username"))
+            for cred_type in self.CREDENTIAL_TYPES
+        ]
+
+        jobs: list[Callable[[], list[dict[str, Any]]]] = [
+            partial(self._fetch_targets, name, page_size=page_size) for _, name in target_parents
+        ]
+        jobs += [
+            partial(self._fetch_credentials, consumer_id, cred_type, page_size=page_size)
+            for _, consumer_id, cred_type in credential_parents
+        ]
+        results = list(pool.map(lambda job: job(), jobs))
+
+        target_results = results[: len(target_parents)]
+        credential_results = results[len(target_parents) :]
+        for (upstream, _), targets in zip(target_parents, target_results, strict=True):
+            if targets:
+                upstream["targets"] = targets
+        for (consumer, _, cred_type), creds in zip(
+            credential_parents, credential_results, strict=True
+        ):
+            if creds:
+                # Store with underscored key for declarative format
+                consumer[cred_type.replace("-", "_")] = creds
+
+    def _fetch_targets(
+        self, upstream: str, *, page_size: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch an upstream's targets, logging and skipping failures."""
+        try:
+            return self._clean_entities(
+                self._fetch_all(f"upstreams/{upstream}/targets", page_size=page_size)
+            )
+        except Exception as e:
+            self._log.warning(
+                "failed_to_export_targets",
+                upstream=upstream,
+                error=str(e),
+            )
+            return []
+
+    def _fetch_credentials(
+        self, consumer_id: str, cred_type: str, *, page_size: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch one credential type of a consumer, skipping failures."""
+        try:
+            return self._clean_entities(
+                self._fetch_all(f"consumers/{consumer_id}/{cred_type}", page_size=page_size)
+            )
+        except Exception:
+            # Credential type not enabled or no credentials
+            return []
+
+    def _export_services(self, *, page_size: int | None = None) -> list[dict[str, Any]]:
         """Export all services."""
         self._log.debug("exporting_services")
-        response = self._client.get("services")
-        return self._clean_entities(response.get("data", []))
+        return self._clean_entities(self._fetch_all("services", page_size=page_size))
 
-    def _export_routes(self) -> list[dict[str, Any]]:
+    def _export_routes(self, *, page_size: int | None = None) -> list[dict[str, Any]]:
         """Export all routes."""
         self._log.debug("exporting_routes")
-        response = self._client.get("routes")
-        return self._clean_entities(response.get("data", []))
-
-    def _export_upstreams(self) -> list[dict[str, Any]]:
-        """Export all upstreams with embedded targets."""
-        self._log.debug("exporting_upstreams")
-        response = self._client.get("upstreams")
-        upstreams = response.get("data", [])
-
-        # For each upstream, fetch and embed targets
-        for upstream in upstreams:
-            name = upstream.get("name") or upstream.get("id")
-            if name:
-                try:
-                    targets_response = self._client.get(f"upstreams/{name}/targets")
-                    targets = self._clean_entities(targets_response.get("data", []))
-                    if targets:
-                        upstream["targets"] = targets
-                except Exception as e:
-                    self._log.warning(
-                        "failed_to_export_targets",
-                        upstream=name,
-                        error=str(e),
-                    )
+        return self._clean_entities(self._fetch_all("routes", page_size=page_size))
 
-        return self._clean_entities(upstreams)
-
-    def _export_consumers(self, include_credentials: bool) -> list[dict[str, Any]]:
-        """Export all consumers, optionally with credentials."""
-        self._log.debug("exporting_consumers", include_credentials=include_credentials)
-        response = self._client.get("consumers")
-        consumers = response.get("data", [])
-
-        if include_credentials:
-            credential_types = ["key-auth", "basic-auth", "jwt", "oauth2", "acls"]
-            for consumer in consumers:
-                consumer_id = consumer.get("id") or consumer.get("username")
-                if not consumer_id:
-                    continue
-
-                for cred_type in credential_types:
-                    try:
-                        creds_response = self._client.get(f"consumers/{consumer_id}/{cred_type}")
-                        creds = creds_response.get("data", [])
-                        if creds:
-                            # Store with underscored key for declarative format
-                            key = cred_type.replace("-", "_")
-                            consumer[key] = self._clean_entities(creds)
-                    except Exception:
-                        # Credential type not enabled or no credentials
-                        pass
-
-        return self._clean_entities(consumers)
-
-    def _export_plugins(self) -> list[dict[str, Any]]:
+    def _export_plugins(self, *, page_size: int | None = None) -> list[dict[str, Any]]:
         """Export all plugins."""
         self._log.debug("exporting_plugins")
-        response = self._client.get("plugins")
-        return self._clean_entities(response.get("data", []))
+        return self._clean_entities(self._fetch_all("plugins", page_size=page_size))
 
     def _clean_entities(self, entities: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Remove server-assigned fields from entities.
@@ -491,7 +664,12 @@ class ConfigManager:
     # Diff Methods
     # =========================================================================
 
-    def diff_config(self, desired: DeclarativeConfig) -> ConfigDiffSummary:
+    def diff_config(
+        self,
+        desired: DeclarativeConfig,
+        *,
+        dbless: bool | None = None,
+    ) -> ConfigDiffSummary:
         """Calculate diff between current state and desired config.
 
         Compares entity by entity to determine what operations are needed.
@@ -499,14 +677,18 @@ class ConfigManager:
 
         Args:
             desired: The desired configuration state.
+            dbless: Whether Kong runs in DB-less mode; detected when None.
 
         Returns:
             ConfigDiffSummary with all required changes.
         """
         self._log.info("diffing_config")
 
+        if dbless is None:
+            dbless = self.is_dbless_mode()
+
         # Flatten nested entities for DB mode comparison
-        if not self.is_dbless_mode():
+        if not dbless:
             desired = self._flatten_config(desired)
 
         current = self.export_state()
@@ -564,6 +746,7 @@ class ConfigManager:
         # Index by name or ID (pass entity_type for proper plugin keying)
         current_map = {self._entity_key(e, entity_type): e for e in current}
         desired_map = {self._entity_key(e, entity_type): e for e in desired}
+        ignore = self.DIFF_IGNORED_FIELDS
 
         # Find creates and updates
         for key, desired_entity in desired_map.items():
@@ -577,14 +760,21 @@ class ConfigManager:
                     )
                 )
             else:
-                changes = self._diff_entity(current_map[key], desired_entity)
+                current_entity = current_map[key]
+                # Unchanged entities are skipped with one C-level comparison of
+                # their content; only mismatches get a field-level diff
+                if self._diff_content(current_entity, ignore) == self._diff_content(
+                    desired_entity, ignore
+                ):
+                    continue
+                changes = self._diff_entity(current_entity, desired_entity)
                 if changes:
                     diffs.append(
                         ConfigDiff(
                             entity_type=entity_type,
                             operation="update",
                             id_or_name=key,
-                            current=current_map[key],
+                            current=current_entity,
                             desired=desired_entity,
                             changes=changes,
                         )
@@ -604,12 +794,23 @@ class ConfigManager:
 
         return diffs
 
+    @staticmethod
+    def _diff_content(entity: dict[str, Any], ignore: frozenset[str]) -> dict[str, Any]:
+        """Project an entity onto the fields compared by _diff_entity.
+
+        Ignored fields and None values are dropped, matching _diff_entity's
+        treatment of an absent field and an explicit null as equal.
+        """
+        return {k: v for k, v in entity.items() if v is not None and k not in ignore}
+
     def _entity_key(self, entity: dict[str, Any], entity_type: str = "") -> str:
         """Get unique key for an entity.
 
         For most entities, uses name, username, or ID.
         For plugins, includes the scope (service/route/consumer) to ensure uniqueness
         since multiple plugins with the same name can exist on different parents.
+        Entities without any identifier are keyed by their content fingerprint,
+        which is stable across runs.
 
         Args:
             entity: Entity dictionary.
@@ -619,32 +820,7 @@ class ConfigManager:
             String key for indexing.
         """
         # For plugins, create compound key with scope
-        if entity_type == "plugins" or entity.get("name") in (
-            "key-auth",
-            "basic-auth",
-            "jwt",
-            "oauth2",
-            "acl",
-            "rate-limiting",
-            "request-size-limiting",
-            "request-transformer",
-            "response-transformer",
-            "cors",
-            "ip-restriction",
-            "bot-detection",
-            "aws-lambda",
-            "http-log",
-            "file-log",
-            "tcp-log",
-            "udp-log",
-            "syslog",
-            "prometheus",
-            "datadog",
-            "zipkin",
-            "opentelemetry",
-            "proxy-cache",
-            "response-ratelimiting",
-        ):
+        if entity_type == "plugins" or entity.get("name") in self.PLUGIN_NAMES:
             plugin_name = entity.get("name", "")
             scope_parts = []
 
@@ -680,7 +856,7 @@ class ConfigManager:
             entity.get("name")
             or entity.get("username")
             or entity.get("id")
-            or str(hash(frozenset(entity.items())))
+            or f"fingerprint:{fingerprint(entity, ignore=self.DIFF_IGNORED_FIELDS)}"
         )
 
     def _diff_entity(
@@ -698,11 +874,9 @@ class ConfigManager:
             Dictionary of changed fields with (old, new) values, or None if identical.
         """
         changes: dict[str, tuple[Any, Any]] = {}
-        ignore_keys = {"id", "created_at", "updated_at"}
-
         all_keys = set(current.keys()) | set(desired.keys())
 
-        for key in all_keys - ignore_keys:
+        for key in all_keys - self.DIFF_IGNORED_FIELDS:
             curr_val = current.get(key)
             desired_val = desired.get(key)
             if curr_val != desired_val:
@@ -719,6 +893,9 @@ class ConfigManager:
         config: DeclarativeConfig,
         *,
         dry_run: bool = False,
+        bulk: bool | None = None,
+        max_workers: int | None = None,
+        on_error: ErrorPolicy = "continue",
     ) -> list[ApplyOperation]:
         """Apply declarative config to Kong.
 
@@ -728,52 +905,58 @@ class ConfigManager:
         3. Consumers (no dependencies)
         4. Plugins (depend on services, routes, consumers)
 
-        Deletes are performed in reverse dependency order.
+        Deletes are performed in reverse dependency order. Operations are
+        grouped into waves by ApplyScheduler and each wave runs
+        concurrently, so an entity only waits for the parents it actually
+        references.
+
+        In bulk mode the whole document is posted to Kong's ``/config``
+        endpoint in a single request instead, replacing the current state.
+        The returned operations are still computed from the local diff; if
+        the request fails, every operation is reported as failed with
+        Kong's error.
 
         Args:
             config: The desired configuration.
             dry_run: If True, only calculate changes without applying.
+            bulk: Post the full document to /config. Defaults to True in
+                DB-less mode and False otherwise. Forcing it on a
+                database-backed node only works on Kong versions whose
+                /config endpoint accepts writes in that mode.
+            max_workers: Override the worker pool size for this apply.
+            on_error: "continue" skips only operations depending on a
+                failure; "fail-fast" stops after the first failing wave.
 
         Returns:
-            List of operations performed.
+            List of operations performed, in dependency order.
+
+        Raises:
+            ValueError: If max_workers or on_error is invalid.
         """
-        self._log.info("applying_config", dry_run=dry_run)
+        dbless = self.is_dbless_mode()
+        if bulk is None:
+            bulk = dbless
 
-        diff = self.diff_config(config)
+        self._log.info("applying_config", dry_run=dry_run, bulk=bulk)
+
+        diff = self.diff_config(config, dbless=dbless)
+        ordered_diffs = self._ordered_diffs(diff)
         operations: list[ApplyOperation] = []
 
         if dry_run:
             # Return what would be done
-            for d in diff.diffs:
-                operations.append(
-                    ApplyOperation(
-                        operation=d.operation,
-                        entity_type=d.entity_type,
-                        id_or_name=d.id_or_name,
-                        result="success",
-                    )
-                )
-            return operations
-
-        # Apply creates and updates in dependency order
-        for entity_type in self.ENTITY_ORDER:
-            type_diffs = [d for d in diff.diffs if d.entity_type == entity_type]
-
-            # Creates first, then updates
-            for operation in ["create", "update"]:
-                for diff_item in type_diffs:
-                    if diff_item.operation == operation and diff_item.desired:
-                        result = self._apply_entity(entity_type, diff_item)
-                        operations.append(result)
-
-        # Deletes in reverse dependency order
-        for entity_type in self.DELETE_ORDER:
-            type_diffs = [
-                d for d in diff.diffs if d.entity_type == entity_type and d.operation == "delete"
-            ]
-            for diff_item in type_diffs:
-                result = self._delete_entity(entity_type, diff_item)
-                operations.append(result)
+            return [self._operation_result(d, "success") for d in ordered_diffs]
+
+        if bulk:
+            operations = self._apply_bulk(config, ordered_diffs)
+        else:
+            scheduler = ApplyScheduler(
+                self._apply_diff,
+                resolve_ref=self._extract_ref_name,
+                max_workers=self._validate_max_workers(max_workers or self._max_workers),
+                on_error=on_error,
+            )
+            operations = scheduler.run(ordered_diffs)
 
         self._log.info(
             "apply_complete",
@@ -784,6 +967,82 @@ class ConfigManager:
 
         return operations
 
+    def _ordered_diffs(self, diff: ConfigDiffSummary) -> list[ConfigDiff]:
+        """Order diffs for application.
+
+        Creates then updates per type in ENTITY_ORDER, followed by deletes
+        in DELETE_ORDER. Diffs are bucketed in a single pass.
+
+        Args:
+            diff: Diff summary to order.
+
+        Returns:
+            Diffs in the order they are applied.
+        """
+        buckets: dict[tuple[str, str], list[ConfigDiff]] = {}
+        for d in diff.diffs:
+            if d.operation != "delete" and not d.desired:
+                continue
+            buckets.setdefault((d.entity_type, d.operation), []).append(d)
+
+        ordered: list[ConfigDiff] = []
+        for entity_type in self.ENTITY_ORDER:
+            # Creates first, then updates
+            ordered.extend(buckets.get((entity_type, "create"), []))
+            ordered.extend(buckets.get((entity_type, "update"), []))
+        for entity_type in self.DELETE_ORDER:
+            ordered.extend(buckets.get((entity_type, "delete"), []))
+
+        return ordered
+
+    def _apply_diff(self, diff_item: ConfigDiff) -> ApplyOperation:
+        """Apply a single diff through the per-entity endpoints."""
+        if diff_item.operation == "delete":
+            return self._delete_entity(diff_item.entity_type, diff_item)
+        return self._apply_entity(diff_item.entity_type, diff_item)
+
+    def _apply_bulk(
+        self,
+        config: DeclarativeConfig,
+        ordered_diffs: list[ConfigDiff],
+    ) -> list[ApplyOperation]:
+        """Apply the full document through /config in one request.
+
+        Args:
+            config: The complete desired configuration.
+            ordered_diffs: Local diff the operations are reported from.
+
+        Returns:
+            One ApplyOperation per diff, all successful or all failed.
+        """
+        if not ordered_diffs:
+            self._log.info("bulk_apply_skipped", reason="no changes")
+            return []
+
+        try:
+            self.sync_config(config)
+        except Exception as e:
+            self._log.error("bulk_apply_failed", operations=len(ordered_diffs), error=str(e))
+            return [self._operation_result(d, "failed", error=str(e)) for d in ordered_diffs]
+
+        return [self._operation_result(d, "success") for d in ordered_diffs]
+
+    @staticmethod
+    def _operation_result(
+        diff_item: ConfigDiff,
+        result: Literal["success", "failed"],
+        *,
+        error: str | None = None,
+    ) -> ApplyOperation:
+        """Build the ApplyOperation reported for a diff."""
+        return ApplyOperation(
+            operation=diff_item.operation,
+            entity_type=diff_item.entity_type,
+            id_or_name=diff_item.id_or_name,
+            result=result,
+            error=error,
+        )
+
     def _apply_entity(
         self,
         entity_type: str,
@@ -19,15 +19,30 @@ from system_operations_manager.integrations.kong.models.config import (
     PercentileMetrics,
 )
 from system_operations_manager.integrations.kong.models.observability import (
+    METRIC_TYPES,
     MetricsSummary,
     NodeStatus,
     PrometheusMetric,
     TargetHealthDetail,
     UpstreamHealthSummary,
 )
+from system_operations_manager.utils.prometheus import (
+    Sample,
+    histogram_buckets,
+    iter_families,
+    iter_samples,
+)
 
 logger = structlog.get_logger()
 
+# Metric families aggregated by get_metrics_summary
+SUMMARY_METRICS = (
+    "kong_http_requests_total",
+    "kong_request_latency_ms_sum",
+    "kong_request_latency_ms_count",
+    "kong_nginx_connections_total",
+)
+
 
 class ObservabilityManager:
     """Manager for Kong observability data.
@@ -75,92 +90,44 @@ class ObservabilityManager:
     def parse_prometheus_metrics(self, raw_text: str) -> list[PrometheusMetric]:
         """Parse Prometheus exposition format into metric objects.
 
+        Hot paths (summary and percentiles) use the streaming parser in
+        utils.prometheus directly; this method builds models for callers
+        that need them, without re-validating each sample.
+
         Args:
             raw_text: Raw Prometheus metrics text.
 
         Returns:
             List of parsed PrometheusMetric objects.
         """
-        metrics: list[PrometheusMetric] = []
-        current_help = ""
-        current_type = "untyped"
-
-        for line in raw_text.strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-
-            # Parse HELP lines
-            if line.startswith("# HELP "):
-                parts = line[7:].split(" ", 1)
-                current_help = parts[1] if len(parts) > 1 else ""
-                continue
-
-            # Parse TYPE lines
-            if line.startswith("# TYPE "):
-                parts = line[7:].split(" ", 1)
-                current_type = parts[1] if len(parts) > 1 else "untyped"
-                continue
-
-            # Skip other comments
-            if line.startswith("#"):
-                continue
-
-            # Parse metric line: name{labels} value
-            metric = self._parse_metric_line(line, current_help, current_type)
-            if metric:
-                metrics.append(metric)
-
-        return metrics
-
-    def _parse_metric_line(
-        self,
-        line: str,
-        help_text: str,
-        metric_type: str,
-    ) -> PrometheusMetric | None:
-        """Parse a single Prometheus metric line.
-
-        Args:
-            line: Metric line (e.g., 'kong_http_requests_total{service="api"} 1234').
-            help_text: HELP text from previous line.
-            metric_type: TYPE from previous line.
-
-        Returns:
-            PrometheusMetric or None if parsing fails.
-        """
-        # Match: metric_name{label="value",...} value
-        # Or: metric_name value (no labels)
-        match = re.match(
-            r"^([a-zA-Z_:][a-zA-Z0-9_:]*)\{?(.*?)\}?\s+([+-]?\d*\.?\d+(?:[eE][+-]?\d+)?|NaN|[+-]Inf)$",
-            line,
+        return [
+            self._to_model(sample, family.help, family.type)
+            for family in iter_families(raw_text)
+            for sample in family.samples
+        ]
+
+    @staticmethod
+    def _to_model(sample: Sample, help_text: str | None, metric_type: str) -> PrometheusMetric:
+        """Build a PrometheusMetric from an already-parsed sample."""
+        return PrometheusMetric.model_construct(
+            name=sample.name,
+            help_text=help_text,
+            type=metric_type if metric_type in METRIC_TYPES else "untyped",
+            labels=sample.labels,
+            value=sample.value,
+            buckets=None,
+            quantiles=None,
         )
-        if not match:
-            return None
-
-        name = match.group(1)
-        labels_str = match.group(2)
-        value_str = match.group(3)
 
-        # Parse labels
-        labels: dict[str, str] = {}
-        if labels_str:
-            for label_match in re.finditer(r'([a-zA-Z_][a-zA-Z0-9_]*)="([^"]*)"', labels_str):
-                labels[label_match.group(1)] = label_match.group(2)
-
-        # Parse value
-        try:
-            value = float(value_str)
-        except ValueError:
-            return None
-
-        return PrometheusMetric(
-            name=name,
-            help_text=help_text if help_text else None,
-            type=metric_type,  # type: ignore[arg-type]
-            labels=labels,
-            value=value,
-        )
+    @staticmethod
+    def _label_filter(service: str | None, route: str | None) -> dict[str, str]:
+        """Build a label filter for the streaming parser."""
+        match: dict[str, str] = {}
+        if service:
+            match["service"] = service
+        if route:
+            match["route"] = route
+        return match
 
     def get_metrics_summary(
         self,
@@ -187,7 +154,6 @@ class ObservabilityManager:
 
         try:
             raw_metrics = self.get_raw_metrics()
-            metrics = self.parse_prometheus_metrics(raw_metrics)
         except Exception as e:
             self._log.warning("metrics_not_available", error=str(e))
             return MetricsSummary()
@@ -196,38 +162,38 @@ class ObservabilityManager:
         latency_sum = 0.0
         latency_count = 0
 
-        for metric in metrics:
-            # Filter by service/route if specified
-            if service_filter and metric.labels.get("service") != service_filter:
-                continue
-            if route_filter and metric.labels.get("route") != route_filter:
-                continue
-
+        # Only the families aggregated below are parsed; service/route
+        # filters are applied before labels are split
+        for name, labels, value in iter_samples(
+            raw_metrics,
+            prefix=SUMMARY_METRICS,
+            match_labels=self._label_filter(service_filter, route_filter),
+        ):
             # Aggregate request counts
-            if metric.name == "kong_http_requests_total" and metric.value is not None:
-                summary.total_requests += int(metric.value)
-                status = metric.labels.get("code", "unknown")
+            if name == "kong_http_requests_total":
+                summary.total_requests += int(value)
+                status = labels.get("code", "unknown")
                 summary.requests_per_status[status] = summary.requests_per_status.get(
                     status, 0
-                ) + int(metric.value)
-                service = metric.labels.get("service", "unknown")
+                ) + int(value)
+                service = labels.get("service", "unknown")
                 summary.requests_per_service[service] = summary.requests_per_service.get(
                     service, 0
-                ) + int(metric.value)
+                ) + int(value)
 
             # Latency metrics (from histogram)
-            if metric.name == "kong_request_latency_ms_sum" and metric.value is not None:
-                latency_sum += metric.value
-            if metric.name == "kong_request_latency_ms_count" and metric.value is not None:
-                latency_count += int(metric.value)
+            elif name == "kong_request_latency_ms_sum":
+                latency_sum += value
+            elif name == "kong_request_latency_ms_count":
+                latency_count += int(value)
 
             # Connection stats
-            if metric.name == "kong_nginx_connections_total" and metric.value is not None:
-                state = metric.labels.get("state", "")
+            elif name == "kong_nginx_connections_total":
+                state = labels.get("state", "")
                 if state == "active":
-                    summary.connections_active = int(metric.value)
+                    summary.connections_active = int(value)
                 elif state == "total" or state == "accepted":
-                    summary.connections_total = int(metric.value)
+                    summary.connections_total = int(value)
 
         # Calculate average latency
         if latency_count > 0:
@@ -405,43 +371,19 @@ class ObservabilityManager:
 
         try:
             raw_metrics = self.get_raw_metrics()
-            metrics = self.parse_prometheus_metrics(raw_metrics)
         except Exception as e:
             self._log.warning("metrics_not_available", error=str(e))
             return PercentileMetrics(service=service_filter, route=route_filter)
 
-        # Collect histogram bucket data for latency
-        buckets: dict[float, float] = {}
-        total_count = 0.0
-
-        for metric in metrics:
-            if not metric.name.startswith("kong_request_latency_ms_bucket"):
-                continue
-            if service_filter and metric.labels.get("service") != service_filter:
-                continue
-            if route_filter and metric.labels.get("route") != route_filter:
-                continue
-
-            le_str = metric.labels.get("le", "")
-            if not le_str:
-                continue
-
-            try:
-                le = float(le_str) if le_str != "+Inf" else float("inf")
-            except ValueError:
-                continue
-
-            count = metric.value or 0.0
-            buckets[le] = buckets.get(le, 0.0) + count
-
-            # Track total from +Inf bucket
-            if le == float("inf"):
-                total_count = max(total_count, count)
-
-        # Calculate percentiles from buckets
-        p50 = self._calculate_percentile(buckets, total_count, 0.50)
-        p95 = self._calculate_percentile(buckets, total_count, 0.95)
-        p99 = self._calculate_percentile(buckets, total_count, 0.99)
+        # Fold latency histogram series straight into one bucket array
+        buckets = histogram_buckets(
+            raw_metrics,
+            "kong_request_latency_ms",
+            match_labels=self._label_filter(service_filter, route_filter),
+        )
+        p50 = buckets.quantile(0.50)
+        p95 = buckets.quantile(0.95)
+        p99 = buckets.quantile(0.99)
 
         return PercentileMetrics(
             p50_ms=p50,
@@ -451,50 +393,6 @@ class ObservabilityManager:
             route=route_filter,
         )
 
-    def _calculate_percentile(
-        self,
-        buckets: dict[float, float],
-        total: float,
-        percentile: float,
-    ) -> float | None:
-        """Calculate a percentile from histogram buckets.
-
-        Uses linear interpolation within buckets to estimate the percentile value.
-
-        Args:
-            buckets: Histogram buckets as {upper_bound: cumulative_count}.
-            total: Total number of observations.
-            percentile: Percentile to calculate (0.0 to 1.0).
-
-        Returns:
-            Estimated percentile value, or None if insufficient data.
-        """
-        if total == 0 or not buckets:
-            return None
-
-        target = total * percentile
-        sorted_buckets = sorted([(b, c) for b, c in buckets.items() if b != float("inf")])
-
-        if not sorted_buckets:
-            return None
-
-        prev_bound = 0.0
-        prev_count = 0.0
-
-        for bound, count in sorted_buckets:
-            if count >= target:
-                # Linear interpolation within bucket
-                if count > prev_count:
-                    bucket_fraction = (target - prev_count) / (count - prev_count)
-                else:
-                    bucket_fraction = 0.0
-                return prev_bound + bucket_fraction * (bound - prev_bound)
-            prev_bound = bound
-            prev_count = count
-
-        # Return last bucket bound if percentile is beyond all buckets
-        return sorted_buckets[-1][0] if sorted_buckets else None
-
     # =========================================================================
     # Health Failures
     # =========================================================================
@@ -29,6 +29,7 @@ from system_operations_manager.integrations.kong.models.openapi import (
     SyncResult,
 )
 from system_operations_manager.integrations.kong.models.route import Route
+from system_operations_manager.utils.pagination import iter_items
 
 if TYPE_CHECKING:
     from system_operations_manager.integrations.kong.client import KongAdminClient
@@ -533,16 +534,12 @@ class OpenAPISyncManager:
         Returns:
             List of all routes for the service.
         """
-        all_routes: list[Route] = []
-        offset: str | None = None
-
-        while True:
-            routes, offset = self._route_manager.list_by_service(service_name, offset=offset)
-            all_routes.extend(routes)
-            if not offset:
-                break
-
-        return all_routes
+        return list(
+            iter_items(
+                lambda offset: self._route_manager.list_by_service(service_name, offset=offset),
+                prefetch=False,
+            )
+        )
 
     def _compare_route(
         self,
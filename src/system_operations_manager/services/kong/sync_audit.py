@@ -3,22 +3,50 @@
 This module provides an audit log for sync operations between Kong Gateway
 and Konnect control plane. It tracks each entity operation (create, update,
 skip) and provides query capabilities for history review and future rollback.
+
+Entries are appended to a JSONL file and indexed in a SQLite sidecar (see
+sync_audit_index), so history queries read only the matching lines. The log
+is rotated into segments by size or age, and old segments can be compacted.
+
+Within a sync run, batch() buffers entries in memory and appends them in
+one locked write per batch, fsyncing the log at each flush so a crash loses
+at most the entries of the current, unflushed batch.
 """
 
 from __future__ import annotations
 
+import contextlib
 import fcntl
+import os
 import re
+import threading
+import time
 import uuid
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from system_operations_manager.services.kong.sync_audit_index import (
+    IndexRecord,
+    SyncAuditIndex,
+    segment_name,
+)
 
 # Default audit file location following XDG spec
 DEFAULT_AUDIT_FILE = Path.home() / ".local" / "state" / "ops" / "kong_sync_audit.jsonl"
 
+# Rotate the active log once it reaches this size (bytes)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# A batch is flushed once it holds this many entries ...
+DEFAULT_BATCH_SIZE = 500
+
+# ... or once its oldest entry has waited this long (seconds)
+DEFAULT_BATCH_INTERVAL = 2.0
+
 
 class SyncAuditEntry(BaseModel):
     """A single audit entry for a sync operation.
@@ -94,6 +122,46 @@ class SyncSummary(BaseModel):
     entity_types: list[str] = Field(default_factory=list, description="Entity types involved")
 
 
+# Serializes entries straight to bytes, skipping the intermediate str
+_ENTRY_JSON: TypeAdapter[SyncAuditEntry] = TypeAdapter(SyncAuditEntry)
+
+
+def _outcome(entry: SyncAuditEntry) -> str | None:
+    """Classify an entry into the SyncSummary counter it contributes to."""
+    if entry.status in ("success", "would_create") and entry.action == "create":
+        return "created"
+    if entry.status in ("success", "would_update") and entry.action == "update":
+        # Check if this was a merge resolution
+        return "merged" if entry.resolution_action == "merge" else "updated"
+    if entry.status == "failed":
+        return "errors"
+    if entry.action == "skip":
+        return "skipped"
+    return None
+
+
+def _index_record(line: bytes) -> IndexRecord | None:
+    """Extract index fields from one audit log line, skipping malformed entries."""
+    try:
+        entry = SyncAuditEntry.model_validate_json(line)
+    except ValidationError:
+        return None
+    return _entry_record(entry)
+
+
+def _entry_record(entry: SyncAuditEntry) -> IndexRecord:
+    """Get the index fields of an audit entry."""
+    return IndexRecord(
+        sync_id=entry.sync_id,
+        timestamp=entry.timestamp,
+        operation=entry.operation,
+        dry_run=entry.dry_run,
+        entity_type=entry.entity_type,
+        entity_name=entry.entity_name,
+        outcome=_outcome(entry),
+    )
+
+
 class SyncAuditService:
     """Service for recording and querying sync audit logs.
 
@@ -102,26 +170,71 @@ class SyncAuditService:
     - Query capabilities for reviewing sync history
     - Entity-level history tracking
     - Thread-safe file writes
+    - Buffered batch writes for the duration of a sync run
+    - Size/age based rotation and compaction of old segments
 
     The audit log is stored in JSONL format (one JSON object per line)
-    for efficient append operations and streaming reads.
+    for efficient append operations and streaming reads. A SQLite index
+    beside it is updated on every write and caught up with any lines
+    appended by other writers before each query.
     """
 
-    def __init__(self, audit_file: Path | None = None) -> None:
+    def __init__(
+        self,
+        audit_file: Path | None = None,
+        *,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        max_age: timedelta | None = None,
+        retention: timedelta | None = None,
+    ) -> None:
         """Initialize the audit service.
 
         Args:
             audit_file: Path to the audit file. Defaults to
                 ~/.local/state/ops/kong_sync_audit.jsonl
+            max_bytes: Rotate the active log once it reaches this size.
+                None disables size-based rotation.
+            max_age: Rotate the active log once its oldest entry is older
+                than this. None disables age-based rotation.
+            retention: When set, segments whose newest entry is older than
+                this are removed after each rotation.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
         """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
         self._audit_file = audit_file or DEFAULT_AUDIT_FILE
         self._audit_file.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._retention = retention
+        self._index: SyncAuditIndex | None = None
+        self._buffer: list[SyncAuditEntry] | None = None
+        self._buffer_lock = threading.Lock()
+        self._batch_size = DEFAULT_BATCH_SIZE
+        self._batch_interval = DEFAULT_BATCH_INTERVAL
+        self._batch_started = 0.0
 
     @property
     def audit_file(self) -> Path:
         """Get the audit file path."""
         return self._audit_file
 
+    @property
+    def index(self) -> SyncAuditIndex:
+        """Get the audit log index, opening it on first use."""
+        if self._index is None:
+            self._index = SyncAuditIndex(self._audit_file, parse_line=_index_record)
+        return self._index
+
+    def _has_log(self) -> bool:
+        """Check whether the active log or any rotated segment exists."""
+        return self._audit_file.exists() or any(
+            self._audit_file.parent.glob(f"{self._audit_file.stem}.*{self._audit_file.suffix}")
+        )
+
     def start_sync(self, operation: str, dry_run: bool) -> str:
         """Start a new sync operation.
 
@@ -137,110 +250,256 @@ class SyncAuditService:
     def record(self, entry: SyncAuditEntry) -> None:
         """Record an audit entry to the log.
 
-        Appends the entry to the JSONL file with file locking
-        to ensure thread-safety.
+        Outside batch() the entry is written immediately. Inside it the
+        entry is buffered, and the buffer is flushed once it reaches the
+        batch size or its oldest entry reaches the batch interval.
 
         Args:
             entry: The audit entry to record
         """
-        with self._audit_file.open("a") as f:
+        with self._buffer_lock:
+            if self._buffer is None:
+                self._write([entry])
+                return
+            if not self._buffer:
+                self._batch_started = time.monotonic()
+            self._buffer.append(entry)
+            if (
+                len(self._buffer) >= self._batch_size
+                or time.monotonic() - self._batch_started >= self._batch_interval
+            ):
+                self._flush_buffer()
+
+    def record_many(self, entries: Sequence[SyncAuditEntry]) -> None:
+        """Write several audit entries in one locked, fsynced append.
+
+        Args:
+            entries: The audit entries to record, in order
+        """
+        if entries:
+            with self._buffer_lock:
+                self._write(entries, fsync=True)
+
+    @contextlib.contextmanager
+    def batch(
+        self,
+        *,
+        max_entries: int = DEFAULT_BATCH_SIZE,
+        max_interval: float = DEFAULT_BATCH_INTERVAL,
+    ) -> Iterator[None]:
+        """Buffer record() calls and write them in batches.
+
+        Each flush takes the file lock once, appends the whole batch,
+        fsyncs the log and updates the index. Remaining entries are
+        flushed when the block exits, including on error. Nested calls
+        join the outer batch.
+
+        Args:
+            max_entries: Flush once this many entries are buffered.
+            max_interval: Flush once the oldest buffered entry is this
+                many seconds old (checked on each record()).
+
+        Yields:
+            None
+
+        Raises:
+            ValueError: If max_entries is not positive.
+
+        Example:
+            >>> with audit_service.batch():
+            ...     for entry in entries:
+            ...         audit_service.record(entry)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        with self._buffer_lock:
+            if self._buffer is not None:
+                outer = True
+            else:
+                outer = False
+                self._buffer = []
+                self._batch_size = max_entries
+                self._batch_interval = max_interval
+        if outer:
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            with self._buffer_lock:
+                try:
+                    self._flush_buffer()
+                finally:
+                    self._buffer = None
+
+    def flush(self) -> None:
+        """Write any buffered entries to the log now."""
+        with self._buffer_lock:
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        """Write and clear the buffer (buffer lock held)."""
+        if self._buffer:
+            entries, self._buffer = self._buffer, []
+            self._write(entries, fsync=True)
+
+    def _write(self, entries: Sequence[SyncAuditEntry], *, fsync: bool = False) -> None:
+        """Append entries to the log under the file lock, then index and rotate.
+
+        Args:
+            entries: The audit entries to append.
+            fsync: Force the appended lines to disk before releasing the lock.
+        """
+        lines = [_ENTRY_JSON.dump_json(entry) + b"\n" for entry in entries]
+        with self._locked_log() as f:
+            stat = os.fstat(f.fileno())
+            f.write(b"".join(lines))
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+            self.index.append(
+                stat.st_ino,
+                stat.st_size,
+                [
+                    (len(line), _entry_record(entry))
+                    for line, entry in zip(lines, entries, strict=True)
+                ],
+            )
+            if self._should_rotate():
+                self._rotate()
+
+    @contextlib.contextmanager
+    def _locked_log(self) -> Iterator[IO[bytes]]:
+        """Open the active log for appending under an exclusive file lock."""
+        while True:
+            f = self._audit_file.open("ab")
             # Use file locking for concurrent writes
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                f.write(entry.model_dump_json() + "\n")
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            # Another writer may have rotated the file while we waited
+            with contextlib.suppress(FileNotFoundError):
+                if os.fstat(f.fileno()).st_ino == self._audit_file.stat().st_ino:
+                    break
+            f.close()
+
+        try:
+            yield f
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            f.close()
+
+    def _should_rotate(self) -> bool:
+        """Check whether the active log exceeds the size or age limit."""
+        size, first_ts = self.index.active_stats()
+        if self._max_bytes is not None and size >= self._max_bytes:
+            return True
+        if self._max_age is not None and first_ts is not None:
+            return datetime.now(UTC).timestamp() - first_ts >= self._max_age.total_seconds()
+        return False
+
+    def _rotate(self) -> None:
+        """Move the active log to a segment and apply retention."""
+        self.index.rotate(segment_name(self._audit_file, datetime.now(UTC)))
+        if self._retention is not None:
+            self.compact(self._retention)
+
+    def compact(self, older_than: timedelta) -> list[str]:
+        """Remove rotated segments whose newest entry is older than a cutoff.
+
+        The active log is never removed.
+
+        Args:
+            older_than: Age beyond which whole segments are dropped.
+
+        Returns:
+            File names of the removed segments.
+        """
+        self.index.catch_up()
+        return self.index.compact(datetime.now(UTC) - older_than)
 
     def list_syncs(
         self,
         *,
         limit: int = 20,
         since: datetime | None = None,
+        until: datetime | None = None,
         operation: str | None = None,
     ) -> list[SyncSummary]:
         """List sync operations with aggregated stats.
 
         Args:
             limit: Maximum number of syncs to return
-            since: Only include syncs after this time
+            since: Only include entries at or after this time
+            until: Only include entries before this time
             operation: Filter by operation type ('push' or 'pull')
 
         Returns:
             List of SyncSummary objects, most recent first
         """
-        if not self._audit_file.exists():
+        if not self._has_log():
             return []
-
-        # Group entries by sync_id
-        syncs: dict[str, list[SyncAuditEntry]] = {}
-        with self._audit_file.open() as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = SyncAuditEntry.model_validate_json(line)
-
-                    # Apply filters
-                    if operation and entry.operation != operation:
-                        continue
-
-                    if since:
-                        entry_time = datetime.fromisoformat(entry.timestamp.replace("Z", "+00:00"))
-                        if entry_time < since:
-                            continue
-
-                    if entry.sync_id not in syncs:
-                        syncs[entry.sync_id] = []
-                    syncs[entry.sync_id].append(entry)
-                except Exception:
-                    # Skip malformed entries
-                    continue
-
-        # Convert to summaries
-        summaries: list[SyncSummary] = []
-        for sync_id, entries in syncs.items():
-            if not entries:
-                continue
-
-            first_entry = entries[0]
-            entity_types = set()
-            created = updated = merged = errors = skipped = 0
-
-            for entry in entries:
-                entity_types.add(entry.entity_type)
-                if entry.status in ("success", "would_create") and entry.action == "create":
-                    created += 1
-                elif entry.status in ("success", "would_update") and entry.action == "update":
-                    # Check if this was a merge resolution
-                    if entry.resolution_action == "merge":
-                        merged += 1
-                    else:
-                        updated += 1
-                elif entry.status == "failed":
-                    errors += 1
-                elif entry.action == "skip":
-                    skipped += 1
-
-            summaries.append(
-                SyncSummary(
-                    sync_id=sync_id,
-                    timestamp=first_entry.timestamp,
-                    operation=first_entry.operation,
-                    dry_run=first_entry.dry_run,
-                    created=created,
-                    updated=updated,
-                    merged=merged,
-                    errors=errors,
-                    skipped=skipped,
-                    entity_types=sorted(entity_types),
-                )
+        self.index.catch_up()
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if operation:
+            clauses.append("operation = ?")
+            params.append(operation)
+        if since:
+            clauses.append("ts >= ?")
+            params.append(since.timestamp())
+        if until:
+            clauses.append("ts < ?")
+            params.append(until.timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        # Bare columns take their values from the row holding MIN(seq),
+        # i.e. the first entry of each sync
+        rows = self.index.query(
+            f"""
+            SELECT * FROM (
+                SELECT
+                    sync_id, MIN(seq) AS first_seq, timestamp, operation, dry_run,
+                    SUM(outcome IS 'created'), SUM(outcome IS 'updated'),
+                    SUM(outcome IS 'merged'), SUM(outcome IS 'errors'),
+                    SUM(outcome IS 'skipped'), GROUP_CONCAT(DISTINCT entity_type)
+                FROM entries {where}
+                GROUP BY sync_id
             )
-
-        # Sort by timestamp, most recent first
-        summaries.sort(key=lambda s: s.timestamp, reverse=True)
-
-        return summaries[:limit]
+            ORDER BY timestamp DESC, first_seq
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+
+        return [
+            SyncSummary(
+                sync_id=sync_id,
+                timestamp=timestamp,
+                operation=op,
+                dry_run=bool(dry_run),
+                created=created,
+                updated=updated,
+                merged=merged,
+                errors=errors,
+                skipped=skipped,
+                entity_types=sorted(entity_types.split(",")),
+            )
+            for (
+                sync_id,
+                _,
+                timestamp,
+                op,
+                dry_run,
+                created,
+                updated,
+                merged,
+                errors,
+                skipped,
+                entity_types,
+            ) in rows
+        ]
 
     def get_sync_details(self, sync_id: str) -> list[SyncAuditEntry]:
         """Get all entries for a specific sync operation.
@@ -251,23 +510,10 @@ class SyncAuditService:
         Returns:
             List of all audit entries for this sync, empty if not found
         """
-        if not self._audit_file.exists():
+        if not self._has_log():
             return []
-
-        entries: list[SyncAuditEntry] = []
-        with self._audit_file.open() as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = SyncAuditEntry.model_validate_json(line)
-                    if entry.sync_id == sync_id:
-                        entries.append(entry)
-                except Exception:
-                    continue
-
-        return entries
+        self.index.catch_up()
+        return self._load(self.index.sync_locations(sync_id))
 
     def get_entity_history(
         self,
@@ -285,26 +531,20 @@ class SyncAuditService:
         Returns:
             List of audit entries for this entity, most recent first
         """
-        if not self._audit_file.exists():
+        if not self._has_log():
             return []
+        self.index.catch_up()
+        return self._load(self.index.entity_locations(entity_type, entity_name, limit))
 
+    def _load(self, locations: list[tuple[str, int, int]]) -> list[SyncAuditEntry]:
+        """Parse the audit entries stored at the given index locations."""
         entries: list[SyncAuditEntry] = []
-        with self._audit_file.open() as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = SyncAuditEntry.model_validate_json(line)
-                    if entry.entity_type == entity_type and entry.entity_name == entity_name:
-                        entries.append(entry)
-                except Exception:
-                    continue
-
-        # Sort by timestamp, most recent first
-        entries.sort(key=lambda e: e.timestamp, reverse=True)
-
-        return entries[:limit]
+        for line in self.index.read(locations):
+            try:
+                entries.append(SyncAuditEntry.model_validate_json(line))
+            except ValidationError:
+                continue
+        return entries
 
 
 def parse_since(since_str: str) -> datetime:
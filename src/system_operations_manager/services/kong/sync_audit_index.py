@@ -0,0 +1,495 @@
+"""SQLite index for the sync audit log.
+
+The audit log stays an append-only JSONL file; this module keeps a SQLite
+sidecar that maps sync IDs, entities and timestamps to byte ranges in the
+log. Queries read only the matching lines instead of scanning the file.
+
+Writers index the lines they append straight from memory. The index is also
+brought up to date incrementally before every query by indexing only the
+bytes appended since the last catch-up, so entries written by other
+processes (or by hand) are picked up without a full rebuild. A log
+file that shrank or was replaced is re-indexed from the start.
+
+Rotated logs become read-only segments next to the active file. Segments
+stay indexed until they are compacted away by age, and segments on disk that
+the index does not know about (e.g. after the index file was deleted) are
+registered again, oldest first, on the next catch-up.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Bumped whenever the schema changes; older index files are rebuilt
+INDEX_SCHEMA_VERSION = 1
+
+# Entries are ordered by file then byte offset: seq = file_id << SEQ_SHIFT | offset
+SEQ_SHIFT = 40
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    inode INTEGER NOT NULL,
+    indexed_size INTEGER NOT NULL DEFAULT 0,
+    first_ts REAL,
+    last_ts REAL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    seq INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    sync_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    ts REAL,
+    operation TEXT NOT NULL,
+    dry_run INTEGER NOT NULL,
+    entity_type TEXT NOT NULL,
+    entity_name TEXT NOT NULL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_sync ON entries (sync_id, seq);
+CREATE INDEX IF NOT EXISTS entries_entity ON entries (entity_type, entity_name, timestamp);
+CREATE INDEX IF NOT EXISTS entries_ts ON entries (ts);
+CREATE INDEX IF NOT EXISTS entries_file ON entries (file_id);
+"""
+
+
+class IndexRecord(NamedTuple):
+    """Fields of one audit entry stored in the index."""
+
+    sync_id: str
+    timestamp: str
+    operation: str
+    dry_run: bool
+    entity_type: str
+    entity_name: str
+    outcome: str | None
+
+
+type LineParser = Callable[[bytes], IndexRecord | None]
+
+
+def parse_timestamp(timestamp: str) -> float | None:
+    """Convert an ISO 8601 timestamp to epoch seconds.
+
+    Args:
+        timestamp: ISO 8601 timestamp, optionally ending in "Z".
+
+    Returns:
+        Epoch seconds, or None if the timestamp cannot be parsed.
+    """
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class SyncAuditIndex:
+    """SQLite index over an audit log and its rotated segments.
+
+    Example:
+        >>> index = SyncAuditIndex(audit_file, parse_line=parse)
+        >>> index.catch_up()
+        >>> lines = list(index.read(index.sync_locations(sync_id)))
+    """
+
+    def __init__(
+        self,
+        audit_file: Path,
+        *,
+        parse_line: LineParser,
+        index_file: Path | None = None,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            audit_file: Path to the active JSONL audit log.
+            parse_line: Extracts index fields from one log line, returning
+                None for lines that should not be indexed (e.g. malformed).
+            index_file: Path to the SQLite index. Defaults to the audit file
+                path with an ``.idx`` suffix appended.
+        """
+        self._audit_file = audit_file
+        self._parse_line = parse_line
+        self._index_file = index_file or audit_file.with_name(audit_file.name + ".idx")
+        self._lock = threading.Lock()
+        self._log = logger.bind(service="sync_audit_index", index=str(self._index_file))
+        self._conn = self._connect()
+
+    @property
+    def index_file(self) -> Path:
+        """Get the index file path."""
+        return self._index_file
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index, recreating it if the schema is outdated or corrupt."""
+        try:
+            conn = self._open()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == INDEX_SCHEMA_VERSION:
+                return conn
+            conn.close()
+        except sqlite3.DatabaseError:
+            pass
+
+        self._log.debug("audit_index_created")
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(self._index_file) + suffix).unlink(missing_ok=True)
+        conn = self._open()
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a connection configured for concurrent readers and writers."""
+        conn = sqlite3.connect(
+            self._index_file, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA schema_version")  # Raises DatabaseError on corrupt files
+        return conn
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, serialized across threads and processes."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+
+    def catch_up(self) -> None:
+        """Index every byte appended to the log files since the last call.
+
+        Rotated segments and the active log that are not registered yet are
+        added in log order (oldest segment first, active log last).
+        """
+        with self._transaction() as conn:
+            files = conn.execute("SELECT id, name, inode, indexed_size FROM files").fetchall()
+            known = {name for _, name, _, _ in files}
+            for file_id, name, inode, indexed_size in files:
+                self._catch_up_file(conn, file_id, name, inode, indexed_size)
+
+            unknown = [name for name in self._segment_names() if name not in known]
+            if self._audit_file.name not in known and self._audit_file.exists():
+                unknown.append(self._audit_file.name)
+            for name in unknown:
+                file_id = self._add_file(conn, name)
+                self._catch_up_file(conn, file_id, name, -1, 0)
+
+    def _segment_names(self) -> list[str]:
+        """List rotated segments of the log on disk, oldest first."""
+        stem, suffix = self._audit_file.stem, self._audit_file.suffix
+
+        def rotation_order(name: str) -> tuple[str, int]:
+            # "<stem>.<stamp>[-<counter>]<suffix>", see segment_name()
+            stamp, _, counter = name[len(stem) + 1 : len(name) - len(suffix)].partition("-")
+            return stamp, int(counter) if counter.isdigit() else 0
+
+        names = [path.name for path in self._audit_file.parent.glob(f"{stem}.*{suffix}")]
+        return sorted(names, key=rotation_order)
+
+    def _add_file(self, conn: sqlite3.Connection, name: str) -> int:
+        """Register a log file and return its ID."""
+        cursor = conn.execute("INSERT INTO files (name, inode) VALUES (?, -1)", (name,))
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+    def _catch_up_file(
+        self,
+        conn: sqlite3.Connection,
+        file_id: int,
+        name: str,
+        inode: int,
+        indexed_size: int,
+    ) -> None:
+        """Index the unindexed tail of one log file."""
+        path = self._audit_file.with_name(name)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            conn.execute("DELETE FROM entries WHERE file_id = ?", (file_id,))
+            conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            return
+
+        if stat.st_ino != inode or stat.st_size < indexed_size:
+            # Replaced or truncated: re-index from the start
+            conn.execute("DELETE FROM entries WHERE file_id = ?", (file_id,))
+            conn.execute(
+                "UPDATE files SET first_ts = NULL, last_ts = NULL WHERE id = ?", (file_id,)
+            )
+            indexed_size = 0
+        elif stat.st_size == indexed_size:
+            return
+
+        rows, end = self._scan(path, file_id, indexed_size)
+        self._store(conn, file_id, stat.st_ino, end, rows)
+
+    def append(self, inode: int, start: int, lines: Sequence[tuple[int, IndexRecord]]) -> None:
+        """Index lines the caller has just appended to the active log.
+
+        The caller must hold the audit log's write lock and pass the records
+        it wrote, so nothing is read back from disk. If the index is not
+        exactly at ``start`` (another process appended first, or the file is
+        new to the index), it catches up from disk instead.
+
+        Args:
+            inode: Inode of the active log.
+            start: Byte offset the appended lines start at.
+            lines: Length in bytes and index record of each appended line.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id, inode, indexed_size FROM files WHERE name = ?",
+                (self._audit_file.name,),
+            ).fetchone()
+            if row is not None and (row[1], row[2]) == (inode, start):
+                rows: list[tuple[Any, ...]] = []
+                offset = start
+                for length, record in lines:
+                    rows.append(self._row(row[0], offset, length, record))
+                    offset += length
+                self._store(conn, row[0], inode, offset, rows)
+                return
+        self.catch_up()
+
+    def _store(
+        self,
+        conn: sqlite3.Connection,
+        file_id: int,
+        inode: int,
+        end: int,
+        rows: list[tuple[Any, ...]],
+    ) -> None:
+        """Insert index rows for a file and advance its indexed size."""
+        conn.executemany(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        conn.execute(
+            "UPDATE files SET inode = ?, indexed_size = ? WHERE id = ?",
+            (inode, end, file_id),
+        )
+        if timestamps := [row[6] for row in rows if row[6] is not None]:
+            conn.execute(
+                """
+                UPDATE files SET
+                    first_ts = MIN(COALESCE(first_ts, :first), :first),
+                    last_ts = MAX(COALESCE(last_ts, :last), :last)
+                WHERE id = :id
+                """,
+                {"first": min(timestamps), "last": max(timestamps), "id": file_id},
+            )
+
+    def _scan(self, path: Path, file_id: int, start: int) -> tuple[list[tuple[Any, ...]], int]:
+        """Parse complete lines from ``start`` and build index rows.
+
+        A trailing line without a newline is left for the next catch-up, since
+        a writer may still be appending it.
+        """
+        rows: list[tuple[Any, ...]] = []
+        offset = start
+        with path.open("rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                length = len(line)
+                record = self._parse_line(line) if line.strip() else None
+                if record is not None:
+                    rows.append(self._row(file_id, offset, length, record))
+                offset += length
+        return rows, offset
+
+    @staticmethod
+    def _row(file_id: int, offset: int, length: int, record: IndexRecord) -> tuple[Any, ...]:
+        """Build the entries row for one log line."""
+        return (
+            (file_id << SEQ_SHIFT) | offset,
+            file_id,
+            offset,
+            length,
+            record.sync_id,
+            record.timestamp,
+            parse_timestamp(record.timestamp),
+            record.operation,
+            int(record.dry_run),
+            record.entity_type,
+            record.entity_name,
+            record.outcome,
+        )
+
+    # -------------------------------------------------------------------------
+    # Rotation and compaction
+    # -------------------------------------------------------------------------
+
+    def active_stats(self) -> tuple[int, float | None]:
+        """Get the indexed size and oldest entry time of the active log.
+
+        Returns:
+            Tuple of (indexed bytes, epoch seconds of the first entry or None).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT indexed_size, first_ts FROM files WHERE name = ?",
+                (self._audit_file.name,),
+            ).fetchone()
+        return (row[0], row[1]) if row else (0, None)
+
+    def rotate(self, segment_name: str) -> None:
+        """Rename the active log to a segment, keeping its entries indexed.
+
+        The caller must hold the audit log's write lock.
+
+        Args:
+            segment_name: File name for the rotated segment.
+        """
+        with self._transaction() as conn:
+            self._audit_file.rename(self._audit_file.with_name(segment_name))
+            conn.execute(
+                "UPDATE files SET name = ? WHERE name = ?",
+                (segment_name, self._audit_file.name),
+            )
+        self._log.info("audit_log_rotated", segment=segment_name)
+
+    def compact(self, before: datetime) -> list[str]:
+        """Drop rotated segments whose newest entry is older than ``before``.
+
+        Args:
+            before: Cutoff time.
+
+        Returns:
+            File names of the removed segments.
+        """
+        cutoff = before.timestamp()
+        with self._transaction() as conn:
+            expired = conn.execute(
+                "SELECT id, name FROM files WHERE name != ? AND COALESCE(last_ts, 0) < ?",
+                (self._audit_file.name, cutoff),
+            ).fetchall()
+            for file_id, name in expired:
+                conn.execute("DELETE FROM entries WHERE file_id = ?", (file_id,))
+                conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                self._audit_file.with_name(name).unlink(missing_ok=True)
+
+        if expired:
+            with self._lock:
+                self._conn.execute("VACUUM")
+            self._log.info("audit_log_compacted", segments=len(expired))
+        return [name for _, name in expired]
+
+    def rebuild(self) -> None:
+        """Drop the index and re-index the active log and every segment on disk."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM files")
+        self.catch_up()
+        self._log.info("audit_index_rebuilt")
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def query(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read query against the index.
+
+        Args:
+            sql: SELECT statement over the ``entries`` and ``files`` tables.
+            params: Query parameters.
+
+        Returns:
+            Result rows.
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def read(self, locations: list[tuple[str, int, int]]) -> Iterator[bytes]:
+        """Load log lines from (file name, offset, length) locations.
+
+        Args:
+            locations: Byte ranges as returned by the location queries.
+
+        Yields:
+            Raw lines in the given order. Lines in files that have since been
+            removed are skipped.
+        """
+        handles: dict[str, BinaryIO] = {}
+        try:
+            for name, offset, length in locations:
+                f = handles.get(name)
+                if f is None:
+                    try:
+                        f = handles[name] = self._audit_file.with_name(name).open("rb")
+                    except FileNotFoundError:
+                        continue
+                f.seek(offset)
+                yield f.read(length)
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def sync_locations(self, sync_id: str) -> list[tuple[str, int, int]]:
+        """Locate every entry of one sync run in log order."""
+        return self.query(
+            """
+            SELECT f.name, e.offset, e.length FROM entries e JOIN files f ON f.id = e.file_id
+            WHERE e.sync_id = ? ORDER BY e.seq
+            """,
+            (sync_id,),
+        )
+
+    def entity_locations(
+        self, entity_type: str, entity_name: str, limit: int
+    ) -> list[tuple[str, int, int]]:
+        """Locate the most recent entries for one entity."""
+        return self.query(
+            """
+            SELECT f.name, e.offset, e.length FROM entries e JOIN files f ON f.id = e.file_id
+            WHERE e.entity_type = ? AND e.entity_name = ?
+            ORDER BY e.timestamp DESC, e.seq DESC LIMIT ?
+            """,
+            (entity_type, entity_name, limit),
+        )
+
+
+def segment_name(audit_file: Path, now: datetime) -> str:
+    """Build a unique file name for a rotated segment of ``audit_file``.
+
+    Args:
+        audit_file: Active audit log path.
+        now: Rotation time.
+
+    Returns:
+        File name such as ``kong_sync_audit.20260101T000000123456Z.jsonl``.
+    """
+    stamp = now.strftime("%Y%m%dT%H%M%S%fZ")
+    name = f"{audit_file.stem}.{stamp}{audit_file.suffix}"
+    counter = 1
+    while audit_file.with_name(name).exists():
+        name = f"{audit_file.stem}.{stamp}-{counter}{audit_file.suffix}"
+        counter += 1
+    return name
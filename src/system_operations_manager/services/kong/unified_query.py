@@ -6,10 +6,14 @@ and returns unified results with source tracking and drift detection.
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from system_operations_manager.integrations.kong.exceptions import KongConnectionError
 from system_operations_manager.integrations.kong.models.certificate import (
     SNI,
     CACertificate,
@@ -26,6 +30,12 @@ from system_operations_manager.integrations.kong.models.unified import (
     merge_entities,
 )
 from system_operations_manager.integrations.kong.models.upstream import Target, Upstream
+from system_operations_manager.integrations.konnect.exceptions import KonnectConnectionError
+from system_operations_manager.utils.pagination import (
+    PageFetcher,
+    iter_items,
+    validate_page_size,
+)
 
 if TYPE_CHECKING:
     from system_operations_manager.services.kong.certificate_manager import (
@@ -70,6 +80,59 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Default number of pagination chains fetched concurrently
+DEFAULT_MAX_WORKERS = 8
+
+GATEWAY = "gateway"
+KONNECT = "konnect"
+
+# Entity types covered by get_sync_summary, in display order
+SYNC_ENTITY_TYPES = [
+    "services",
+    "routes",
+    "consumers",
+    "plugins",
+    "upstreams",
+    "certificates",
+    "snis",
+    "ca_certificates",
+    "key_sets",
+    "keys",
+    "vaults",
+]
+
+# Key field used to match entities across planes (plugins use _merge_plugins)
+MERGE_KEYS = {
+    "services": "name",
+    "routes": "name",
+    "consumers": "username",
+    "upstreams": "name",
+    "certificates": "id",
+    "snis": "name",
+    "ca_certificates": "id",
+    "key_sets": "name",
+    "keys": "kid",
+    "vaults": "name",
+}
+
+
+def sync_stats(entities: UnifiedEntityList[Any]) -> dict[str, int]:
+    """Count an entity list's entities by sync state.
+
+    Args:
+        entities: Unified entity list of one entity type.
+
+    Returns:
+        Dict with gateway_only, konnect_only, synced, drift and total counts.
+    """
+    return {
+        "gateway_only": entities.gateway_only_count,
+        "konnect_only": entities.konnect_only_count,
+        "synced": entities.synced_count,
+        "drift": entities.drift_count,
+        "total": len(entities),
+    }
+
 
 class UnifiedQueryService:
     """Service for querying entities from both Gateway and Konnect.
@@ -101,6 +164,18 @@ class UnifiedQueryService:
         konnect_key_set_manager: Konnect KeySetManager (None if not configured).
         konnect_key_manager: Konnect KeyManager (None if not configured).
         konnect_vault_manager: Konnect VaultManager (None if not configured).
+        max_workers: Maximum number of pagination chains fetched concurrently.
+            Gateway and Konnect are queried in parallel, and get_sync_summary
+            fans out across entity types. A value of 1 fetches sequentially.
+        gateway_timeout: Seconds allowed for all Gateway fetches of one query
+            (None waits indefinitely).
+        konnect_timeout: Seconds allowed for all Konnect fetches of one query
+            (None waits indefinitely).
+        page_size: Entities requested per page on every fetch chain (1-1000,
+            None for the server default).
+
+    Raises:
+        ValueError: If page_size is outside 1-1000.
     """
 
     def __init__(
@@ -128,6 +203,10 @@ class UnifiedQueryService:
         konnect_key_set_manager: KonnectKeySetManager | None = None,
         konnect_key_manager: KonnectKeyManager | None = None,
         konnect_vault_manager: KonnectVaultManager | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        gateway_timeout: float | None = None,
+        konnect_timeout: float | None = None,
+        page_size: int | None = None,
     ) -> None:
         # Gateway managers
         self._gateway_services = gateway_service_manager
@@ -155,11 +234,146 @@ class UnifiedQueryService:
         self._konnect_keys = konnect_key_manager
         self._konnect_vaults = konnect_vault_manager
 
+        # Fetch concurrency settings
+        self._max_workers = max_workers
+        self._timeouts = {GATEWAY: gateway_timeout, KONNECT: konnect_timeout}
+        self._page_size = validate_page_size(page_size)
+
     @property
     def konnect_configured(self) -> bool:
         """Check if Konnect is configured."""
         return self._konnect_services is not None
 
+    # -------------------------------------------------------------------------
+    # Concurrent Fetching
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _collect[E](fetch_page: PageFetcher[E]) -> list[E]:
+        """Collect every page of a listing into one list.
+
+        Prefetch is disabled because each pagination chain already runs on
+        its own worker and the loop does no per-page work to overlap with.
+        """
+        return list(iter_items(fetch_page, prefetch=False))
+
+    def _run_fetches(
+        self,
+        fetches: dict[tuple[str, str], Callable[[], list[Any]]],
+    ) -> dict[tuple[str, str], list[Any]]:
+        """Run independent pagination chains concurrently.
+
+        Each chain is keyed by (entity_type, source). Chains are executed on a
+        thread pool bounded by max_workers; all chains of a source must finish
+        within that source's timeout, measured from the start of this call.
+        With a single worker the chains run one at a time, and each gets its
+        source's full timeout from the moment it starts.
+
+        Args:
+            fetches: Mapping of (entity_type, source) to a fetch callable.
+
+        Returns:
+            Mapping of (entity_type, source) to fetched entities.
+
+        Raises:
+            KongConnectionError: If Gateway fetches exceed gateway_timeout.
+            KonnectConnectionError: If Konnect fetches exceed konnect_timeout.
+        """
+        if not fetches:
+            return {}
+
+        workers = max(1, min(self._max_workers, len(fetches)))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unified-query")
+        try:
+            if workers == 1:
+                # Submit one chain at a time so a queued chain's wait doesn't
+                # count against its timeout
+                return {
+                    key: self._await_fetch(key, pool.submit(fetch), time.monotonic())
+                    for key, fetch in fetches.items()
+                }
+
+            started = time.monotonic()
+            futures: dict[tuple[str, str], Future[list[Any]]] = {
+                key: pool.submit(fetch) for key, fetch in fetches.items()
+            }
+            return {key: self._await_fetch(key, future, started) for key, future in futures.items()}
+        finally:
+            # Don't block on chains abandoned after a timeout or error
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _await_fetch(
+        self,
+        key: tuple[str, str],
+        future: Future[list[Any]],
+        started: float,
+    ) -> list[Any]:
+        """Wait for a fetch chain within its source's timeout.
+
+        Args:
+            key: (entity_type, source) of the chain.
+            future: Future running the chain.
+            started: time.monotonic() value the timeout is measured from.
+
+        Returns:
+            Fetched entities.
+
+        Raises:
+            KongConnectionError: If a Gateway chain exceeds gateway_timeout.
+            KonnectConnectionError: If a Konnect chain exceeds konnect_timeout.
+        """
+        entity_type, source = key
+        timeout = self._timeouts.get(source)
+        remaining = None
+        if timeout is not None:
+            remaining = max(0.0, timeout - (time.monotonic() - started))
+        try:
+            return future.result(timeout=remaining)
+        except TimeoutError as e:
+            raise self._timeout_error(entity_type, source, timeout) from e
+
+    @staticmethod
+    def _timeout_error(
+        entity_type: str,
+        source: str,
+        timeout: float | None,
+    ) -> KongConnectionError | KonnectConnectionError:
+        """Build the connection error raised when a source exceeds its timeout."""
+        message = f"Timed out after {timeout}s fetching {entity_type} from {source}"
+        if source == KONNECT:
+            return KonnectConnectionError(message, details=f"entity_type={entity_type}")
+        return KongConnectionError(message=message, endpoint=entity_type)
+
+    def _fetch_sources[E](
+        self,
+        entity_type: str,
+        gateway_fetch: Callable[[], list[E]],
+        konnect_fetch: Callable[[], list[E]],
+        *,
+        gateway: bool = True,
+        konnect: bool,
+    ) -> tuple[list[E], list[E]]:
+        """Fetch one entity type from Gateway and Konnect in parallel.
+
+        Args:
+            entity_type: Entity type being fetched (for error reporting).
+            gateway_fetch: Callable fetching every Gateway page.
+            konnect_fetch: Callable fetching every Konnect page.
+            gateway: Whether the Gateway manager is available.
+            konnect: Whether the Konnect manager is available.
+
+        Returns:
+            Tuple of (gateway entities, konnect entities).
+        """
+        fetches: dict[tuple[str, str], Callable[[], list[Any]]] = {}
+        if gateway:
+            fetches[(entity_type, GATEWAY)] = gateway_fetch
+        if konnect:
+            fetches[(entity_type, KONNECT)] = konnect_fetch
+
+        results = self._run_fetches(fetches)
+        return results.get((entity_type, GATEWAY), []), results.get((entity_type, KONNECT), [])
+
     # -------------------------------------------------------------------------
     # Service Queries
     # -------------------------------------------------------------------------
@@ -177,46 +391,33 @@ class UnifiedQueryService:
         Returns:
             Unified list of services with source information.
         """
-        # Fetch from Gateway
-        gateway_services = self._fetch_all_gateway_services(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_services: list[Service] = []
-        if self._konnect_services:
-            konnect_services = self._fetch_all_konnect_services(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_services, konnect_services = self._fetch_sources(
+            "services",
+            lambda: self._fetch_all_gateway_services(tags=tags),
+            lambda: self._fetch_all_konnect_services(tags=tags),
+            konnect=self._konnect_services is not None,
+        )
 
         return merge_entities(gateway_services, konnect_services, key_field="name")
 
     def _fetch_all_gateway_services(self, *, tags: list[str] | None = None) -> list[Service]:
         """Fetch all services from Gateway with pagination."""
-        services: list[Service] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_services.list(tags=tags, offset=offset)
-            services.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return services
+        return self._collect(
+            lambda offset: self._gateway_services.list(
+                tags=tags, limit=self._page_size, offset=offset
+            )
+        )
 
     def _fetch_all_konnect_services(self, *, tags: list[str] | None = None) -> list[Service]:
         """Fetch all services from Konnect with pagination."""
-        if not self._konnect_services:
+        manager = self._konnect_services
+        if not manager:
             return []
 
-        services: list[Service] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_services.list(tags=tags, offset=offset)
-            services.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return services
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # Route Queries
@@ -237,17 +438,17 @@ class UnifiedQueryService:
         Returns:
             Unified list of routes with source information.
         """
-        # Fetch from Gateway
-        gateway_routes = self._fetch_all_gateway_routes(
-            tags=tags, service_name_or_id=service_name_or_id
-        )
-
-        # Fetch from Konnect if configured
-        konnect_routes: list[Route] = []
-        if self._konnect_routes:
-            konnect_routes = self._fetch_all_konnect_routes(
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_routes, konnect_routes = self._fetch_sources(
+            "routes",
+            lambda: self._fetch_all_gateway_routes(
                 tags=tags, service_name_or_id=service_name_or_id
-            )
+            ),
+            lambda: self._fetch_all_konnect_routes(
+                tags=tags, service_name_or_id=service_name_or_id
+            ),
+            konnect=self._konnect_routes is not None,
+        )
 
         return merge_entities(gateway_routes, konnect_routes, key_field="name")
 
@@ -258,22 +459,17 @@ class UnifiedQueryService:
         service_name_or_id: str | None = None,
     ) -> list[Route]:
         """Fetch all routes from Gateway with pagination."""
-        routes: list[Route] = []
-        offset: str | None = None
-
-        while True:
-            if service_name_or_id:
-                batch, next_offset = self._gateway_routes.list_by_service(
-                    service_name_or_id, tags=tags, offset=offset
+        if service_name_or_id:
+            return self._collect(
+                lambda offset: self._gateway_routes.list_by_service(
+                    service_name_or_id, tags=tags, limit=self._page_size, offset=offset
                 )
-            else:
-                batch, next_offset = self._gateway_routes.list(tags=tags, offset=offset)
-            routes.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return routes
+            )
+        return self._collect(
+            lambda offset: self._gateway_routes.list(
+                tags=tags, limit=self._page_size, offset=offset
+            )
+        )
 
     def _fetch_all_konnect_routes(
         self,
@@ -282,25 +478,19 @@ class UnifiedQueryService:
         service_name_or_id: str | None = None,
     ) -> list[Route]:
         """Fetch all routes from Konnect with pagination."""
-        if not self._konnect_routes:
+        manager = self._konnect_routes
+        if not manager:
             return []
 
-        routes: list[Route] = []
-        offset: str | None = None
-
-        while True:
-            if service_name_or_id:
-                batch, next_offset = self._konnect_routes.list_by_service(
-                    service_name_or_id, tags=tags, offset=offset
+        if service_name_or_id:
+            return self._collect(
+                lambda offset: manager.list_by_service(
+                    service_name_or_id, tags=tags, limit=self._page_size, offset=offset
                 )
-            else:
-                batch, next_offset = self._konnect_routes.list(tags=tags, offset=offset)
-            routes.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return routes
+            )
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # Consumer Queries
@@ -319,47 +509,34 @@ class UnifiedQueryService:
         Returns:
             Unified list of consumers with source information.
         """
-        # Fetch from Gateway
-        gateway_consumers = self._fetch_all_gateway_consumers(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_consumers: list[Consumer] = []
-        if self._konnect_consumers:
-            konnect_consumers = self._fetch_all_konnect_consumers(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_consumers, konnect_consumers = self._fetch_sources(
+            "consumers",
+            lambda: self._fetch_all_gateway_consumers(tags=tags),
+            lambda: self._fetch_all_konnect_consumers(tags=tags),
+            konnect=self._konnect_consumers is not None,
+        )
 
         # Use username as key for consumers
         return merge_entities(gateway_consumers, konnect_consumers, key_field="username")
 
     def _fetch_all_gateway_consumers(self, *, tags: list[str] | None = None) -> list[Consumer]:
         """Fetch all consumers from Gateway with pagination."""
-        consumers: list[Consumer] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_consumers.list(tags=tags, offset=offset)
-            consumers.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return consumers
+        return self._collect(
+            lambda offset: self._gateway_consumers.list(
+                tags=tags, limit=self._page_size, offset=offset
+            )
+        )
 
     def _fetch_all_konnect_consumers(self, *, tags: list[str] | None = None) -> list[Consumer]:
         """Fetch all consumers from Konnect with pagination."""
-        if not self._konnect_consumers:
+        manager = self._konnect_consumers
+        if not manager:
             return []
 
-        consumers: list[Consumer] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_consumers.list(tags=tags, offset=offset)
-            consumers.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return consumers
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # Plugin Queries
@@ -384,23 +561,23 @@ class UnifiedQueryService:
         Returns:
             Unified list of plugins with source information.
         """
-        # Fetch from Gateway
-        gateway_plugins = self._fetch_all_gateway_plugins(
-            tags=tags,
-            service_name_or_id=service_name_or_id,
-            route_name_or_id=route_name_or_id,
-            consumer_name_or_id=consumer_name_or_id,
-        )
-
-        # Fetch from Konnect if configured
-        konnect_plugins: list[KongPluginEntity] = []
-        if self._konnect_plugins:
-            konnect_plugins = self._fetch_all_konnect_plugins(
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_plugins, konnect_plugins = self._fetch_sources(
+            "plugins",
+            lambda: self._fetch_all_gateway_plugins(
                 tags=tags,
                 service_name_or_id=service_name_or_id,
                 route_name_or_id=route_name_or_id,
                 consumer_name_or_id=consumer_name_or_id,
-            )
+            ),
+            lambda: self._fetch_all_konnect_plugins(
+                tags=tags,
+                service_name_or_id=service_name_or_id,
+                route_name_or_id=route_name_or_id,
+                consumer_name_or_id=consumer_name_or_id,
+            ),
+            konnect=self._konnect_plugins is not None,
+        )
 
         # Use instance_name or name+scope as key for plugins
         return self._merge_plugins(gateway_plugins, konnect_plugins)
@@ -414,16 +591,12 @@ class UnifiedQueryService:
         consumer_name_or_id: str | None = None,
     ) -> list[KongPluginEntity]:
         """Fetch all plugins from Gateway with pagination."""
-        plugins: list[KongPluginEntity] = []
-        offset: str | None = None
-
-        while True:
-            # Gateway plugin manager may have different filtering API
-            batch, next_offset = self._gateway_plugins.list(tags=tags, offset=offset)
-            plugins.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
+        # Gateway plugin manager may have different filtering API
+        plugins: list[KongPluginEntity] = self._collect(
+            lambda offset: self._gateway_plugins.list(
+                tags=tags, limit=self._page_size, offset=offset
+            )
+        )
 
         # Filter by scope if specified
         if service_name_or_id:
@@ -459,34 +632,32 @@ class UnifiedQueryService:
         consumer_name_or_id: str | None = None,
     ) -> list[KongPluginEntity]:
         """Fetch all plugins from Konnect with pagination."""
-        if not self._konnect_plugins:
+        manager = self._konnect_plugins
+        if not manager:
             return []
 
-        plugins: list[KongPluginEntity] = []
-        offset: str | None = None
-
         # Use filtered list if scope is specified
-        while True:
-            if service_name_or_id:
-                batch, next_offset = self._konnect_plugins.list_by_service(
-                    service_name_or_id, tags=tags, offset=offset
+        if service_name_or_id:
+            return self._collect(
+                lambda offset: manager.list_by_service(
+                    service_name_or_id, tags=tags, limit=self._page_size, offset=offset
                 )
-            elif route_name_or_id:
-                batch, next_offset = self._konnect_plugins.list_by_route(
-                    route_name_or_id, tags=tags, offset=offset
+            )
+        if route_name_or_id:
+            return self._collect(
+                lambda offset: manager.list_by_route(
+                    route_name_or_id, tags=tags, limit=self._page_size, offset=offset
                 )
-            elif consumer_name_or_id:
-                batch, next_offset = self._konnect_plugins.list_by_consumer(
-                    consumer_name_or_id, tags=tags, offset=offset
+            )
+        if consumer_name_or_id:
+            return self._collect(
+                lambda offset: manager.list_by_consumer(
+                    consumer_name_or_id, tags=tags, limit=self._page_size, offset=offset
                 )
-            else:
-                batch, next_offset = self._konnect_plugins.list(tags=tags, offset=offset)
-            plugins.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return plugins
+            )
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def _merge_plugins(
         self,
@@ -510,59 +681,7 @@ class UnifiedQueryService:
                 parts.append(f"con:{plugin.consumer.id or 'unknown'}")
             return "|".join(parts)
 
-        # Index by key
-        gateway_by_key = {plugin_key(p): p for p in gateway_plugins}
-        konnect_by_key = {plugin_key(p): p for p in konnect_plugins}
-
-        # Get all unique keys
-        all_keys = sorted(set(gateway_by_key.keys()) | set(konnect_by_key.keys()))
-
-        # Create unified entries
-        from system_operations_manager.integrations.kong.models.unified import (
-            EntitySource,
-            UnifiedEntity,
-            detect_drift,
-        )
-
-        unified: list[UnifiedEntity[Any]] = []
-        for key in all_keys:
-            gw = gateway_by_key.get(key)
-            kn = konnect_by_key.get(key)
-
-            if gw and kn:
-                has_drift, drift_fields = detect_drift(gw, kn)
-                unified.append(
-                    UnifiedEntity(
-                        entity=gw,
-                        source=EntitySource.BOTH,
-                        gateway_id=gw.id,
-                        konnect_id=kn.id,
-                        has_drift=has_drift,
-                        drift_fields=drift_fields if drift_fields else None,
-                        gateway_entity=gw,
-                        konnect_entity=kn,
-                    )
-                )
-            elif gw:
-                unified.append(
-                    UnifiedEntity(
-                        entity=gw,
-                        source=EntitySource.GATEWAY,
-                        gateway_id=gw.id,
-                        gateway_entity=gw,
-                    )
-                )
-            elif kn:
-                unified.append(
-                    UnifiedEntity(
-                        entity=kn,
-                        source=EntitySource.KONNECT,
-                        konnect_id=kn.id,
-                        konnect_entity=kn,
-                    )
-                )
-
-        return UnifiedEntityList(entities=unified)
+        return merge_entities(gateway_plugins, konnect_plugins, key=plugin_key)
 
     # -------------------------------------------------------------------------
     # Upstream Queries
@@ -581,46 +700,33 @@ class UnifiedQueryService:
         Returns:
             Unified list of upstreams with source information.
         """
-        # Fetch from Gateway
-        gateway_upstreams = self._fetch_all_gateway_upstreams(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_upstreams: list[Upstream] = []
-        if self._konnect_upstreams:
-            konnect_upstreams = self._fetch_all_konnect_upstreams(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_upstreams, konnect_upstreams = self._fetch_sources(
+            "upstreams",
+            lambda: self._fetch_all_gateway_upstreams(tags=tags),
+            lambda: self._fetch_all_konnect_upstreams(tags=tags),
+            konnect=self._konnect_upstreams is not None,
+        )
 
         return merge_entities(gateway_upstreams, konnect_upstreams, key_field="name")
 
     def _fetch_all_gateway_upstreams(self, *, tags: list[str] | None = None) -> list[Upstream]:
         """Fetch all upstreams from Gateway with pagination."""
-        upstreams: list[Upstream] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_upstreams.list(tags=tags, offset=offset)
-            upstreams.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return upstreams
+        return self._collect(
+            lambda offset: self._gateway_upstreams.list(
+                tags=tags, limit=self._page_size, offset=offset
+            )
+        )
 
     def _fetch_all_konnect_upstreams(self, *, tags: list[str] | None = None) -> list[Upstream]:
         """Fetch all upstreams from Konnect with pagination."""
-        if not self._konnect_upstreams:
+        manager = self._konnect_upstreams
+        if not manager:
             return []
 
-        upstreams: list[Upstream] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_upstreams.list(tags=tags, offset=offset)
-            upstreams.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return upstreams
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def list_targets_for_upstream(
         self,
@@ -634,13 +740,13 @@ class UnifiedQueryService:
         Returns:
             Unified list of targets with source information.
         """
-        # Fetch from Gateway
-        gateway_targets = self._fetch_all_gateway_targets(upstream_name_or_id)
-
-        # Fetch from Konnect if configured
-        konnect_targets: list[Target] = []
-        if self._konnect_upstreams:
-            konnect_targets = self._fetch_all_konnect_targets(upstream_name_or_id)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_targets, konnect_targets = self._fetch_sources(
+            "targets",
+            lambda: self._fetch_all_gateway_targets(upstream_name_or_id),
+            lambda: self._fetch_all_konnect_targets(upstream_name_or_id),
+            konnect=self._konnect_upstreams is not None,
+        )
 
         return merge_entities(gateway_targets, konnect_targets, key_field="target")
 
@@ -649,43 +755,30 @@ class UnifiedQueryService:
         upstream_name_or_id: str,
     ) -> list[Target]:
         """Fetch all targets from Gateway for an upstream with pagination."""
-        targets: list[Target] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_upstreams.list_targets(
+        return self._collect(
+            lambda offset: self._gateway_upstreams.list_targets(
                 upstream_name_or_id,
+                limit=self._page_size,
                 offset=offset,
             )
-            targets.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return targets
+        )
 
     def _fetch_all_konnect_targets(
         self,
         upstream_name_or_id: str,
     ) -> list[Target]:
         """Fetch all targets from Konnect for an upstream with pagination."""
-        if not self._konnect_upstreams:
+        manager = self._konnect_upstreams
+        if not manager:
             return []
 
-        targets: list[Target] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_upstreams.list_targets(
+        return self._collect(
+            lambda offset: manager.list_targets(
                 upstream_name_or_id,
+                limit=self._page_size,
                 offset=offset,
             )
-            targets.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return targets
+        )
 
     # -------------------------------------------------------------------------
     # Certificate Queries
@@ -704,15 +797,14 @@ class UnifiedQueryService:
         Returns:
             Unified list of certificates with source information.
         """
-        # Fetch from Gateway
-        gateway_certs: list[Certificate] = []
-        if self._gateway_certificates:
-            gateway_certs = self._fetch_all_gateway_certificates(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_certs: list[Certificate] = []
-        if self._konnect_certificates:
-            konnect_certs = self._fetch_all_konnect_certificates(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_certs, konnect_certs = self._fetch_sources(
+            "certificates",
+            lambda: self._fetch_all_gateway_certificates(tags=tags),
+            lambda: self._fetch_all_konnect_certificates(tags=tags),
+            gateway=self._gateway_certificates is not None,
+            konnect=self._konnect_certificates is not None,
+        )
 
         return merge_entities(gateway_certs, konnect_certs, key_field="id")
 
@@ -720,39 +812,25 @@ class UnifiedQueryService:
         self, *, tags: list[str] | None = None
     ) -> list[Certificate]:
         """Fetch all certificates from Gateway with pagination."""
-        if not self._gateway_certificates:
+        manager = self._gateway_certificates
+        if not manager:
             return []
 
-        certificates: list[Certificate] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_certificates.list(tags=tags, offset=offset)
-            certificates.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return certificates
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def _fetch_all_konnect_certificates(
         self, *, tags: list[str] | None = None
     ) -> list[Certificate]:
         """Fetch all certificates from Konnect with pagination."""
-        if not self._konnect_certificates:
+        manager = self._konnect_certificates
+        if not manager:
             return []
 
-        certificates: list[Certificate] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_certificates.list(tags=tags, offset=offset)
-            certificates.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return certificates
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # SNI Queries
@@ -771,51 +849,36 @@ class UnifiedQueryService:
         Returns:
             Unified list of SNIs with source information.
         """
-        # Fetch from Gateway
-        gateway_snis: list[SNI] = []
-        if self._gateway_snis:
-            gateway_snis = self._fetch_all_gateway_snis(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_snis: list[SNI] = []
-        if self._konnect_snis:
-            konnect_snis = self._fetch_all_konnect_snis(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_snis, konnect_snis = self._fetch_sources(
+            "snis",
+            lambda: self._fetch_all_gateway_snis(tags=tags),
+            lambda: self._fetch_all_konnect_snis(tags=tags),
+            gateway=self._gateway_snis is not None,
+            konnect=self._konnect_snis is not None,
+        )
 
         return merge_entities(gateway_snis, konnect_snis, key_field="name")
 
     def _fetch_all_gateway_snis(self, *, tags: list[str] | None = None) -> list[SNI]:
         """Fetch all SNIs from Gateway with pagination."""
-        if not self._gateway_snis:
+        manager = self._gateway_snis
+        if not manager:
             return []
 
-        snis: list[SNI] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_snis.list(tags=tags, offset=offset)
-            snis.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return snis
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def _fetch_all_konnect_snis(self, *, tags: list[str] | None = None) -> list[SNI]:
         """Fetch all SNIs from Konnect with pagination."""
-        if not self._konnect_snis:
+        manager = self._konnect_snis
+        if not manager:
             return []
 
-        snis: list[SNI] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_snis.list(tags=tags, offset=offset)
-            snis.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return snis
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # CA Certificate Queries
@@ -834,15 +897,14 @@ class UnifiedQueryService:
         Returns:
             Unified list of CA certificates with source information.
         """
-        # Fetch from Gateway
-        gateway_ca_certs: list[CACertificate] = []
-        if self._gateway_ca_certificates:
-            gateway_ca_certs = self._fetch_all_gateway_ca_certificates(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_ca_certs: list[CACertificate] = []
-        if self._konnect_ca_certificates:
-            konnect_ca_certs = self._fetch_all_konnect_ca_certificates(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_ca_certs, konnect_ca_certs = self._fetch_sources(
+            "ca_certificates",
+            lambda: self._fetch_all_gateway_ca_certificates(tags=tags),
+            lambda: self._fetch_all_konnect_ca_certificates(tags=tags),
+            gateway=self._gateway_ca_certificates is not None,
+            konnect=self._konnect_ca_certificates is not None,
+        )
 
         return merge_entities(gateway_ca_certs, konnect_ca_certs, key_field="id")
 
@@ -850,39 +912,25 @@ class UnifiedQueryService:
         self, *, tags: list[str] | None = None
     ) -> list[CACertificate]:
         """Fetch all CA certificates from Gateway with pagination."""
-        if not self._gateway_ca_certificates:
+        manager = self._gateway_ca_certificates
+        if not manager:
             return []
 
-        ca_certs: list[CACertificate] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_ca_certificates.list(tags=tags, offset=offset)
-            ca_certs.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return ca_certs
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def _fetch_all_konnect_ca_certificates(
         self, *, tags: list[str] | None = None
     ) -> list[CACertificate]:
         """Fetch all CA certificates from Konnect with pagination."""
-        if not self._konnect_ca_certificates:
+        manager = self._konnect_ca_certificates
+        if not manager:
             return []
 
-        ca_certs: list[CACertificate] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_ca_certificates.list(tags=tags, offset=offset)
-            ca_certs.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return ca_certs
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # Key Set Queries
@@ -901,51 +949,36 @@ class UnifiedQueryService:
         Returns:
             Unified list of key sets with source information.
         """
-        # Fetch from Gateway
-        gateway_key_sets: list[KeySet] = []
-        if self._gateway_key_sets:
-            gateway_key_sets = self._fetch_all_gateway_key_sets(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_key_sets: list[KeySet] = []
-        if self._konnect_key_sets:
-            konnect_key_sets = self._fetch_all_konnect_key_sets(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_key_sets, konnect_key_sets = self._fetch_sources(
+            "key_sets",
+            lambda: self._fetch_all_gateway_key_sets(tags=tags),
+            lambda: self._fetch_all_konnect_key_sets(tags=tags),
+            gateway=self._gateway_key_sets is not None,
+            konnect=self._konnect_key_sets is not None,
+        )
 
         return merge_entities(gateway_key_sets, konnect_key_sets, key_field="name")
 
     def _fetch_all_gateway_key_sets(self, *, tags: list[str] | None = None) -> list[KeySet]:
         """Fetch all key sets from Gateway with pagination."""
-        if not self._gateway_key_sets:
+        manager = self._gateway_key_sets
+        if not manager:
             return []
 
-        key_sets: list[KeySet] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_key_sets.list(tags=tags, offset=offset)
-            key_sets.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return key_sets
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def _fetch_all_konnect_key_sets(self, *, tags: list[str] | None = None) -> list[KeySet]:
         """Fetch all key sets from Konnect with pagination."""
-        if not self._konnect_key_sets:
+        manager = self._konnect_key_sets
+        if not manager:
             return []
 
-        key_sets: list[KeySet] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_key_sets.list(tags=tags, offset=offset)
-            key_sets.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return key_sets
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # Key Queries
@@ -964,51 +997,36 @@ class UnifiedQueryService:
         Returns:
             Unified list of keys with source information.
         """
-        # Fetch from Gateway
-        gateway_keys: list[Key] = []
-        if self._gateway_keys:
-            gateway_keys = self._fetch_all_gateway_keys(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_keys: list[Key] = []
-        if self._konnect_keys:
-            konnect_keys = self._fetch_all_konnect_keys(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_keys, konnect_keys = self._fetch_sources(
+            "keys",
+            lambda: self._fetch_all_gateway_keys(tags=tags),
+            lambda: self._fetch_all_konnect_keys(tags=tags),
+            gateway=self._gateway_keys is not None,
+            konnect=self._konnect_keys is not None,
+        )
 
         return merge_entities(gateway_keys, konnect_keys, key_field="kid")
 
     def _fetch_all_gateway_keys(self, *, tags: list[str] | None = None) -> list[Key]:
         """Fetch all keys from Gateway with pagination."""
-        if not self._gateway_keys:
+        manager = self._gateway_keys
+        if not manager:
             return []
 
-        keys: list[Key] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_keys.list(tags=tags, offset=offset)
-            keys.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return keys
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def _fetch_all_konnect_keys(self, *, tags: list[str] | None = None) -> list[Key]:
         """Fetch all keys from Konnect with pagination."""
-        if not self._konnect_keys:
+        manager = self._konnect_keys
+        if not manager:
             return []
 
-        keys: list[Key] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_keys.list(tags=tags, offset=offset)
-            keys.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return keys
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # Vault Queries
@@ -1029,56 +1047,88 @@ class UnifiedQueryService:
         Returns:
             Unified list of vaults with source information.
         """
-        # Fetch from Gateway
-        gateway_vaults: list[Vault] = []
-        if self._gateway_vaults:
-            gateway_vaults = self._fetch_all_gateway_vaults(tags=tags)
-
-        # Fetch from Konnect if configured
-        konnect_vaults: list[Vault] = []
-        if self._konnect_vaults:
-            konnect_vaults = self._fetch_all_konnect_vaults(tags=tags)
+        # Fetch from Gateway and Konnect (if configured) in parallel
+        gateway_vaults, konnect_vaults = self._fetch_sources(
+            "vaults",
+            lambda: self._fetch_all_gateway_vaults(tags=tags),
+            lambda: self._fetch_all_konnect_vaults(tags=tags),
+            gateway=self._gateway_vaults is not None,
+            konnect=self._konnect_vaults is not None,
+        )
 
         return merge_entities(gateway_vaults, konnect_vaults, key_field="name")
 
     def _fetch_all_gateway_vaults(self, *, tags: list[str] | None = None) -> list[Vault]:
         """Fetch all vaults from Gateway with pagination."""
-        if not self._gateway_vaults:
+        manager = self._gateway_vaults
+        if not manager:
             return []
 
-        vaults: list[Vault] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._gateway_vaults.list(tags=tags, offset=offset)
-            vaults.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return vaults
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     def _fetch_all_konnect_vaults(self, *, tags: list[str] | None = None) -> list[Vault]:
         """Fetch all vaults from Konnect with pagination."""
-        if not self._konnect_vaults:
+        manager = self._konnect_vaults
+        if not manager:
             return []
 
-        vaults: list[Vault] = []
-        offset: str | None = None
-
-        while True:
-            batch, next_offset = self._konnect_vaults.list(tags=tags, offset=offset)
-            vaults.extend(batch)
-            if not next_offset:
-                break
-            offset = next_offset
-
-        return vaults
+        return self._collect(
+            lambda offset: manager.list(tags=tags, limit=self._page_size, offset=offset)
+        )
 
     # -------------------------------------------------------------------------
     # Summary Methods
     # -------------------------------------------------------------------------
 
+    def get_sync_snapshot(
+        self,
+        entity_types: list[str] | None = None,
+    ) -> dict[str, UnifiedEntityList[Any]]:
+        """Fetch and merge the full state of several entity types at once.
+
+        All Gateway and Konnect pagination chains for the requested entity
+        types are fetched concurrently (bounded by max_workers), so the call
+        takes roughly as long as the slowest chain.
+
+        Args:
+            entity_types: Entity types to fetch. Defaults to all types.
+
+        Returns:
+            Dict mapping entity type to its unified entity list. Unknown
+            entity types are omitted.
+        """
+        if entity_types is None:
+            entity_types = SYNC_ENTITY_TYPES
+
+        # Queue every (entity type, source) pagination chain up front so all
+        # of them share one bounded pool instead of running type by type
+        fetchers = self._sync_fetchers()
+        fetches: dict[tuple[str, str], Callable[[], list[Any]]] = {}
+        for entity_type in entity_types:
+            if entity_type not in fetchers:
+                continue
+            for source, (available, fetch) in fetchers[entity_type].items():
+                if available:
+                    fetches[(entity_type, source)] = fetch
+
+        results = self._run_fetches(fetches)
+
+        snapshot: dict[str, UnifiedEntityList[Any]] = {}
+        for entity_type in entity_types:
+            if entity_type not in fetchers:
+                continue
+            gateway_entities = results.get((entity_type, GATEWAY), [])
+            konnect_entities = results.get((entity_type, KONNECT), [])
+            if entity_type == "plugins":
+                snapshot[entity_type] = self._merge_plugins(gateway_entities, konnect_entities)
+            else:
+                snapshot[entity_type] = merge_entities(
+                    gateway_entities, konnect_entities, key_field=MERGE_KEYS[entity_type]
+                )
+        return snapshot
+
     def get_sync_summary(
         self,
         entity_types: list[str] | None = None,
@@ -1101,54 +1151,226 @@ class UnifiedQueryService:
                 ...
             }
         """
-        if entity_types is None:
-            entity_types = [
-                "services",
-                "routes",
-                "consumers",
-                "plugins",
-                "upstreams",
-                "certificates",
-                "snis",
-                "ca_certificates",
-                "key_sets",
-                "keys",
-                "vaults",
-            ]
+        snapshot = self.get_sync_snapshot(entity_types)
+        return {entity_type: sync_stats(entities) for entity_type, entities in snapshot.items()}
 
-        summary: dict[str, dict[str, int]] = {}
+    def _sync_fetchers(
+        self,
+    ) -> dict[str, dict[str, tuple[bool, Callable[[], list[Any]]]]]:
+        """Map each sync entity type to its unfiltered Gateway and Konnect fetchers.
 
-        def extract_stats(entities: UnifiedEntityList[Any]) -> dict[str, int]:
-            return {
-                "gateway_only": entities.gateway_only_count,
-                "konnect_only": entities.konnect_only_count,
-                "synced": entities.synced_count,
-                "drift": entities.drift_count,
-                "total": len(entities),
-            }
+        Returns:
+            Mapping of entity type to {source: (manager available, fetch callable)}.
+        """
+        return {
+            "services": {
+                GATEWAY: (True, self._fetch_all_gateway_services),
+                KONNECT: (self._konnect_services is not None, self._fetch_all_konnect_services),
+            },
+            "routes": {
+                GATEWAY: (True, self._fetch_all_gateway_routes),
+                KONNECT: (self._konnect_routes is not None, self._fetch_all_konnect_routes),
+            },
+            "consumers": {
+                GATEWAY: (True, self._fetch_all_gateway_consumers),
+                KONNECT: (self._konnect_consumers is not None, self._fetch_all_konnect_consumers),
+            },
+            "plugins": {
+                GATEWAY: (True, self._fetch_all_gateway_plugins),
+                KONNECT: (self._konnect_plugins is not None, self._fetch_all_konnect_plugins),
+            },
+            "upstreams": {
+                GATEWAY: (True, self._fetch_all_gateway_upstreams),
+                KONNECT: (self._konnect_upstreams is not None, self._fetch_all_konnect_upstreams),
+            },
+            "certificates": {
+                GATEWAY: (
+                    self._gateway_certificates is not None,
+                    self._fetch_all_gateway_certificates,
+                ),
+                KONNECT: (
+                    self._konnect_certificates is not None,
+                    self._fetch_all_konnect_certificates,
+                ),
+            },
+            "snis": {
+                GATEWAY: (self._gateway_snis is not None, self._fetch_all_gateway_snis),
+                KONNECT: (self._konnect_snis is not None, self._fetch_all_konnect_snis),
+            },
+            "ca_certificates": {
+                GATEWAY: (
+                    self._gateway_ca_certificates is not None,
+                    self._fetch_all_gateway_ca_certificates,
+                ),
+                KONNECT: (
+                    self._konnect_ca_certificates is not None,
+                    self._fetch_all_konnect_ca_certificates,
+                ),
+            },
+            "key_sets": {
+                GATEWAY: (self._gateway_key_sets is not None, self._fetch_all_gateway_key_sets),
+                KONNECT: (self._konnect_key_sets is not None, self._fetch_all_konnect_key_sets),
+            },
+            "keys": {
+                GATEWAY: (self._gateway_keys is not None, self._fetch_all_gateway_keys),
+                KONNECT: (self._konnect_keys is not None, self._fetch_all_konnect_keys),
+            },
+            "vaults": {
+                GATEWAY: (self._gateway_vaults is not None, self._fetch_all_gateway_vaults),
+                KONNECT: (self._konnect_vaults is not None, self._fetch_all_konnect_vaults),
+            },
+        }
+
+
+class SyncSession:
+    """One sync operation's snapshot of Gateway and Konnect state.
+
+    A push or pull reads the same entity lists several times: for the
+    summary, the conflict TUI, each entity type's push/pull, the service ID
+    map used to remap routes, and the upstream names used for target sync.
+    A session fetches each entity type once, all requested types in one
+    concurrent pass, and serves every later read from that snapshot.
+
+    The read methods mirror UnifiedQueryService, so sync helpers accept
+    either. Call refresh() when a step changes state that a later step
+    depends on, e.g. after creating services in Konnect before remapping
+    routes to their new IDs.
+
+    Args:
+        service: Service the snapshot is fetched through.
+
+    Example:
+        >>> session = SyncSession(unified_service)
+        >>> summary = session.get_sync_summary(["services", "routes"])
+        >>> session.list_services().gateway_only  # no further requests
+    """
+
+    def __init__(self, service: UnifiedQueryService) -> None:
+        self._service = service
+        self._entities: dict[str, UnifiedEntityList[Any]] = {}
+        self._targets: dict[str, UnifiedEntityList[Target]] = {}
+
+    @property
+    def konnect_configured(self) -> bool:
+        """Check if Konnect is configured."""
+        return self._service.konnect_configured
 
+    def load(self, entity_types: list[str] | None = None) -> None:
+        """Fetch every requested entity type not yet in the snapshot.
+
+        Args:
+            entity_types: Entity types to load. Defaults to all types.
+        """
+        if entity_types is None:
+            entity_types = SYNC_ENTITY_TYPES
+        missing = [t for t in entity_types if t not in self._entities]
+        if missing:
+            self._entities.update(self._service.get_sync_snapshot(missing))
+
+    def refresh(self, entity_types: list[str] | None = None) -> None:
+        """Re-fetch entity types whose state changed during the sync.
+
+        Args:
+            entity_types: Entity types to re-fetch. Defaults to every type
+                loaded so far, plus dropping cached upstream targets.
+        """
+        if entity_types is None:
+            entity_types = list(self._entities)
+            self._targets.clear()
+        elif "upstreams" in entity_types:
+            self._targets.clear()
         for entity_type in entity_types:
-            if entity_type == "services":
-                summary[entity_type] = extract_stats(self.list_services())
-            elif entity_type == "routes":
-                summary[entity_type] = extract_stats(self.list_routes())
-            elif entity_type == "consumers":
-                summary[entity_type] = extract_stats(self.list_consumers())
-            elif entity_type == "plugins":
-                summary[entity_type] = extract_stats(self.list_plugins())
-            elif entity_type == "upstreams":
-                summary[entity_type] = extract_stats(self.list_upstreams())
-            elif entity_type == "certificates":
-                summary[entity_type] = extract_stats(self.list_certificates())
-            elif entity_type == "snis":
-                summary[entity_type] = extract_stats(self.list_snis())
-            elif entity_type == "ca_certificates":
-                summary[entity_type] = extract_stats(self.list_ca_certificates())
-            elif entity_type == "key_sets":
-                summary[entity_type] = extract_stats(self.list_key_sets())
-            elif entity_type == "keys":
-                summary[entity_type] = extract_stats(self.list_keys())
-            elif entity_type == "vaults":
-                summary[entity_type] = extract_stats(self.list_vaults())
-
-        return summary
+            self._entities.pop(entity_type, None)
+        self.load(entity_types)
+
+    def get_sync_summary(
+        self,
+        entity_types: list[str] | None = None,
+    ) -> dict[str, dict[str, int]]:
+        """Summarize sync status from the snapshot, loading missing types.
+
+        Args:
+            entity_types: Entity types to check. Defaults to all types.
+
+        Returns:
+            Dict mapping entity type to sync statistics, as returned by
+            UnifiedQueryService.get_sync_summary.
+        """
+        if entity_types is None:
+            entity_types = SYNC_ENTITY_TYPES
+        self.load(entity_types)
+        return {t: sync_stats(self._entities[t]) for t in entity_types if t in self._entities}
+
+    def entities(self, entity_type: str) -> UnifiedEntityList[Any]:
+        """Return the snapshot of one entity type, loading it if needed.
+
+        Args:
+            entity_type: Entity type, e.g. "services".
+
+        Returns:
+            Unified entity list; empty for unknown entity types.
+        """
+        self.load([entity_type])
+        return self._entities.get(entity_type, UnifiedEntityList(entities=[]))
+
+    def list_services(self) -> UnifiedEntityList[Service]:
+        """Snapshot of services."""
+        return self.entities("services")
+
+    def list_routes(self) -> UnifiedEntityList[Route]:
+        """Snapshot of routes."""
+        return self.entities("routes")
+
+    def list_consumers(self) -> UnifiedEntityList[Consumer]:
+        """Snapshot of consumers."""
+        return self.entities("consumers")
+
+    def list_plugins(self) -> UnifiedEntityList[KongPluginEntity]:
+        """Snapshot of plugins."""
+        return self.entities("plugins")
+
+    def list_upstreams(self) -> UnifiedEntityList[Upstream]:
+        """Snapshot of upstreams."""
+        return self.entities("upstreams")
+
+    def list_certificates(self) -> UnifiedEntityList[Certificate]:
+        """Snapshot of certificates."""
+        return self.entities("certificates")
+
+    def list_snis(self) -> UnifiedEntityList[SNI]:
+        """Snapshot of SNIs."""
+        return self.entities("snis")
+
+    def list_ca_certificates(self) -> UnifiedEntityList[CACertificate]:
+        """Snapshot of CA certificates."""
+        return self.entities("ca_certificates")
+
+    def list_key_sets(self) -> UnifiedEntityList[KeySet]:
+        """Snapshot of key sets."""
+        return self.entities("key_sets")
+
+    def list_keys(self) -> UnifiedEntityList[Key]:
+        """Snapshot of keys."""
+        return self.entities("keys")
+
+    def list_vaults(self) -> UnifiedEntityList[Vault]:
+        """Snapshot of vaults."""
+        return self.entities("vaults")
+
+    def list_targets_for_upstream(self, upstream_name_or_id: str) -> UnifiedEntityList[Target]:
+        """Targets of one upstream, fetched on first use.
+
+        Targets are per upstream and only needed for target sync, so they
+        are fetched lazily after upstreams have been pushed or pulled.
+
+        Args:
+            upstream_name_or_id: Upstream name or ID.
+
+        Returns:
+            Unified list of targets with source information.
+        """
+        if upstream_name_or_id not in self._targets:
+            self._targets[upstream_name_or_id] = self._service.list_targets_for_upstream(
+                upstream_name_or_id
+            )
+        return self._targets[upstream_name_or_id]
@@ -0,0 +1,92 @@
+"""Shared pagination support for Konnect control plane managers."""
+
+from __future__ import annotations
+
+import builtins
+from collections.abc import Iterator
+from typing import Protocol
+
+from system_operations_manager.integrations.kong.models.base import KongEntityBase
+from system_operations_manager.utils.pagination import (
+    iter_items,
+    iter_pages,
+    validate_page_size,
+)
+
+
+class PaginatedLister[T: KongEntityBase](Protocol):
+    """A manager whose ``list`` returns one page and the next offset."""
+
+    def list(
+        self,
+        *,
+        tags: builtins.list[str] | None = None,
+        limit: int | None = None,
+        offset: str | None = None,
+    ) -> tuple[builtins.list[T], str | None]:
+        """List one page of entities."""
+        ...
+
+
+class KonnectPaginationMixin[T: KongEntityBase]:
+    """Streaming iterators for Konnect managers exposing a paginated ``list``.
+
+    Mirrors ``BaseEntityManager.iter_pages``/``iter_all`` so callers can
+    page through Gateway and Konnect entities the same way. The host class
+    must satisfy PaginatedLister.
+
+    Type Parameters:
+        T: The Pydantic model class returned by ``list``.
+    """
+
+    def iter_pages(
+        self: PaginatedLister[T],
+        *,
+        tags: builtins.list[str] | None = None,
+        page_size: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[builtins.list[T]]:
+        """Stream entities one page at a time.
+
+        Args:
+            tags: Filter by tags.
+            page_size: Entities per page (1-1000).
+            prefetch: Fetch the next page in the background.
+
+        Yields:
+            Lists of entity models, one per page.
+
+        Raises:
+            ValueError: If page_size is outside 1-1000.
+        """
+        limit = validate_page_size(page_size)
+        return iter_pages(
+            lambda offset: self.list(tags=tags, limit=limit, offset=offset),
+            prefetch=prefetch,
+        )
+
+    def iter_all(
+        self: PaginatedLister[T],
+        *,
+        tags: builtins.list[str] | None = None,
+        page_size: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[T]:
+        """Stream every entity across all pages.
+
+        Args:
+            tags: Filter by tags.
+            page_size: Entities per page (1-1000).
+            prefetch: Fetch the next page in the background.
+
+        Yields:
+            Entity models in server order.
+
+        Raises:
+            ValueError: If page_size is outside 1-1000.
+        """
+        limit = validate_page_size(page_size)
+        return iter_items(
+            lambda offset: self.list(tags=tags, limit=limit, offset=offset),
+            prefetch=prefetch,
+        )
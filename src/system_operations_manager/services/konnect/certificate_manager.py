@@ -12,6 +12,7 @@ from system_operations_manager.integrations.kong.models.certificate import (
     Certificate,
 )
 from system_operations_manager.integrations.konnect.exceptions import KonnectNotFoundError
+from system_operations_manager.services.konnect.base import KonnectPaginationMixin
 
 if TYPE_CHECKING:
     from system_operations_manager.integrations.konnect.client import KonnectClient
@@ -19,7 +20,7 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
-class KonnectCertificateManager:
+class KonnectCertificateManager(KonnectPaginationMixin[Certificate]):
     """Manager for Konnect Control Plane certificate operations.
 
     Provides CRUD operations for TLS certificates via the Konnect Control Plane
@@ -125,7 +126,7 @@ class KonnectCertificateManager:
         self._client.delete_certificate(self._control_plane_id, certificate_id)
 
 
-class KonnectSNIManager:
+class KonnectSNIManager(KonnectPaginationMixin[SNI]):
     """Manager for Konnect Control Plane SNI operations.
 
     Provides CRUD operations for Server Name Indications via the Konnect
@@ -231,7 +232,7 @@ class KonnectSNIManager:
         self._client.delete_sni(self._control_plane_id, name_or_id)
 
 
-class KonnectCACertificateManager:
+class KonnectCACertificateManager(KonnectPaginationMixin[CACertificate]):
     """Manager for Konnect Control Plane CA certificate operations.
 
     Provides CRUD operations for CA certificates via the Konnect Control Plane
@@ -8,6 +8,7 @@ import structlog
 
 from system_operations_manager.integrations.kong.models.key import Key, KeySet
 from system_operations_manager.integrations.konnect.exceptions import KonnectNotFoundError
+from system_operations_manager.services.konnect.base import KonnectPaginationMixin
 
 if TYPE_CHECKING:
     from system_operations_manager.integrations.konnect.client import KonnectClient
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
-class KonnectKeySetManager:
+class KonnectKeySetManager(KonnectPaginationMixin[KeySet]):
     """Manager for Konnect Control Plane key set operations.
 
     Provides CRUD operations for key sets via the Konnect Control Plane
@@ -121,7 +122,7 @@ class KonnectKeySetManager:
         self._client.delete_key_set(self._control_plane_id, name_or_id)
 
 
-class KonnectKeyManager:
+class KonnectKeyManager(KonnectPaginationMixin[Key]):
     """Manager for Konnect Control Plane key operations.
 
     Provides CRUD operations for cryptographic keys via the Konnect Control
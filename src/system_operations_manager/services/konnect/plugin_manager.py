@@ -9,6 +9,7 @@ import structlog
 
 from system_operations_manager.integrations.kong.models.plugin import KongPluginEntity
 from system_operations_manager.integrations.konnect.exceptions import KonnectNotFoundError
+from system_operations_manager.services.konnect.base import KonnectPaginationMixin
 
 if TYPE_CHECKING:
     from system_operations_manager.integrations.konnect.client import KonnectClient
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
-class KonnectPluginManager:
+class KonnectPluginManager(KonnectPaginationMixin[KongPluginEntity]):
     """Manager for Konnect Control Plane plugin operations.
 
     Provides CRUD operations for plugins via the Konnect Control Plane
@@ -8,6 +8,7 @@ import structlog
 
 from system_operations_manager.integrations.kong.models.service import Service
 from system_operations_manager.integrations.konnect.exceptions import KonnectNotFoundError
+from system_operations_manager.services.konnect.base import KonnectPaginationMixin
 
 if TYPE_CHECKING:
     from system_operations_manager.integrations.konnect.client import KonnectClient
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
-class KonnectServiceManager:
+class KonnectServiceManager(KonnectPaginationMixin[Service]):
     """Manager for Konnect Control Plane service operations.
 
     Provides CRUD operations for services via the Konnect Control Plane
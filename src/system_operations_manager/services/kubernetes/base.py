@@ -6,15 +6,26 @@ including client access, namespace resolution, and error translation.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NoReturn
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import structlog
 
+from system_operations_manager.utils.pagination import iter_pages
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is used when installed; stdlib json accepts the same bytes
+    import json as _json  # type: ignore[no-redef, unused-ignore]
+
 if TYPE_CHECKING:
     from system_operations_manager.integrations.kubernetes.client import KubernetesClient
 
 logger = structlog.get_logger()
 
+# Objects per LIST request, matching kubectl's default --chunk-size
+DEFAULT_LIST_CHUNK_SIZE = 500
+
 
 class K8sBaseManager:
     """Base class for Kubernetes service managers.
@@ -23,6 +34,8 @@ class K8sBaseManager:
     - Client reference and API group access
     - Structured logging with entity binding
     - Namespace resolution with config fallback
+    - Chunked LIST calls (limit/continue), optionally served from informers
+      or decoded straight from JSON when the client's fast list mode is on
     - Consistent API error translation
 
     Subclasses set ``_entity_name`` for structured log context.
@@ -54,6 +67,117 @@ class K8sBaseManager:
         """
         return namespace or self._client.default_namespace
 
+    def _list_from_informer(
+        self, resource: str, namespace: str | None, list_kwargs: dict[str, Any]
+    ) -> list[Any] | None:
+        """Answer a list call from the client's informer cache.
+
+        Args:
+            resource: Informer resource name (e.g. "pods").
+            namespace: Namespace to list, or None for all namespaces.
+            list_kwargs: Keyword arguments of the equivalent LIST call.
+
+        Returns:
+            The matching API objects, or None if informers are disabled or
+            the call needs something the cache cannot answer (field
+            selectors, set-based label selectors); the caller then LISTs.
+        """
+        if set(list_kwargs) - {"label_selector"}:
+            return None
+        informer = self._client.informer(resource)
+        if informer is None:
+            return None
+        return informer.list_objects(namespace, label_selector=list_kwargs.get("label_selector"))
+
+    def _iter_list_pages[S](
+        self,
+        convert: Callable[[Any], S],
+        list_call: Callable[..., Any],
+        list_kwargs: dict[str, Any],
+        *,
+        resource_type: str,
+        namespace: str | None = None,
+        informer: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+        json_convert: Callable[[dict[str, Any]], S] | None = None,
+    ) -> Iterator[list[S]]:
+        """Stream a LIST call as pages of converted objects.
+
+        Pages are requested with ``limit``/``_continue``, and the next page
+        is fetched while the caller processes the current one, so neither
+        the API server nor the client ever holds the whole collection.
+        When the client's informers are enabled and can answer the call,
+        the cached objects are yielded as a single page instead.
+
+        With the client's fast list mode on and a ``json_convert`` given,
+        responses are requested with ``_preload_content=False`` and decoded
+        here, so the SDK never builds its typed model objects.
+
+        Args:
+            convert: Builds a summary from one API object.
+            list_call: LIST method, with any namespace argument already bound.
+            list_kwargs: Selector arguments for the LIST call.
+            resource_type: Resource type for error translation.
+            namespace: Namespace being listed, or None for all namespaces.
+            informer: Informer resource name, if the type has one.
+            chunk_size: Objects per request, or None for one unbounded LIST.
+            json_convert: Builds a summary from one raw JSON object, enabling
+                the fast list path for this resource type.
+
+        Yields:
+            Lists of converted objects, one per page.
+
+        Raises:
+            ValueError: If chunk_size is less than 1.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        def fetch(token: str | None) -> tuple[list[Any], str | None]:
+            kwargs = dict(list_kwargs)
+            if chunk_size is not None:
+                kwargs["limit"] = chunk_size
+            if token:
+                kwargs["_continue"] = token
+            result = list_call(**kwargs)
+            next_token = getattr(result.metadata, "_continue", None)
+            return result.items, next_token if isinstance(next_token, str) and next_token else None
+
+        def fetch_json(token: str | None) -> tuple[list[Any], str | None]:
+            kwargs = dict(list_kwargs, _preload_content=False)
+            if chunk_size is not None:
+                kwargs["limit"] = chunk_size
+            if token:
+                kwargs["_continue"] = token
+            response = list_call(**kwargs)
+            try:
+                body = _json.loads(response.data)
+            finally:
+                response.release_conn()
+            next_token = (body.get("metadata") or {}).get("continue")
+            return body.get("items") or [], next_token or None
+
+        fast_convert = json_convert if self._client.fast_list_enabled else None
+
+        def pages() -> Iterator[list[S]]:
+            try:
+                cached = (
+                    self._list_from_informer(informer, namespace, list_kwargs) if informer else None
+                )
+                if cached is not None:
+                    yield [convert(obj) for obj in cached]
+                    return
+                if fast_convert is not None:
+                    for page in iter_pages(fetch_json):
+                        yield [fast_convert(obj) for obj in page]
+                    return
+                for page in iter_pages(fetch):
+                    yield [convert(obj) for obj in page]
+            except Exception as e:
+                self._handle_api_error(e, resource_type, None, namespace)
+
+        return pages()
+
     def _handle_api_error(
         self,
         e: Exception,
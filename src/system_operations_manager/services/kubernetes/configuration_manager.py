@@ -8,13 +8,18 @@ from __future__ import annotations
 
 import base64
 import json
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.configuration import (
     ConfigMapSummary,
     SecretSummary,
 )
-from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.base import (
+    DEFAULT_LIST_CHUNK_SIZE,
+    K8sBaseManager,
+)
 
 
 class ConfigurationManager(K8sBaseManager):
@@ -49,23 +54,54 @@ class ConfigurationManager(K8sBaseManager):
         Returns:
             List of configmap summaries.
         """
+        items = [
+            item
+            for page in self.iter_config_maps(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_configmaps", count=len(items))
+        return items
+
+    def iter_config_maps(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[ConfigMapSummary]]:
+        """Stream configmaps page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of configmap summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_configmaps", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.core_v1.list_config_map_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.core_v1.list_namespaced_config_map(namespace=ns, **kwargs)
-
-            items = [ConfigMapSummary.from_k8s_object(cm) for cm in result.items]
-            self._log.debug("listed_configmaps", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "ConfigMap", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.core_v1.list_config_map_for_all_namespaces
+        else:
+            list_call = partial(self._client.core_v1.list_namespaced_config_map, namespace=ns)
+        return self._iter_list_pages(
+            ConfigMapSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="ConfigMap",
+            namespace=None if all_namespaces else ns,
+            informer="config_maps",
+            chunk_size=chunk_size,
+        )
 
     def get_config_map(self, name: str, namespace: str | None = None) -> ConfigMapSummary:
         """Get a single configmap by name (metadata only).
@@ -207,23 +243,53 @@ class ConfigurationManager(K8sBaseManager):
         Returns:
             List of secret summaries (no secret values).
         """
+        items = [
+            item
+            for page in self.iter_secrets(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_secrets", count=len(items))
+        return items
+
+    def iter_secrets(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[SecretSummary]]:
+        """Stream secrets (keys only, values hidden) page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of secret summaries (no secret values).
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_secrets", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.core_v1.list_secret_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.core_v1.list_namespaced_secret(namespace=ns, **kwargs)
-
-            items = [SecretSummary.from_k8s_object(s) for s in result.items]
-            self._log.debug("listed_secrets", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "Secret", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.core_v1.list_secret_for_all_namespaces
+        else:
+            list_call = partial(self._client.core_v1.list_namespaced_secret, namespace=ns)
+        return self._iter_list_pages(
+            SecretSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Secret",
+            namespace=None if all_namespaces else ns,
+            chunk_size=chunk_size,
+        )
 
     def get_secret(self, name: str, namespace: str | None = None) -> SecretSummary:
         """Get a single secret by name (keys only, values hidden).
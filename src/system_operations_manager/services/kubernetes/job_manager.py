@@ -6,13 +6,18 @@ including suspend/resume operations for CronJobs.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.jobs import (
     CronJobSummary,
     JobSummary,
 )
-from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.base import (
+    DEFAULT_LIST_CHUNK_SIZE,
+    K8sBaseManager,
+)
 
 
 class JobManager(K8sBaseManager):
@@ -45,23 +50,53 @@ class JobManager(K8sBaseManager):
         Returns:
             List of job summaries.
         """
+        items = [
+            item
+            for page in self.iter_jobs(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_jobs", count=len(items))
+        return items
+
+    def iter_jobs(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[JobSummary]]:
+        """Stream jobs page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of job summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_jobs", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.batch_v1.list_job_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.batch_v1.list_namespaced_job(namespace=ns, **kwargs)
-
-            items = [JobSummary.from_k8s_object(j) for j in result.items]
-            self._log.debug("listed_jobs", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "Job", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.batch_v1.list_job_for_all_namespaces
+        else:
+            list_call = partial(self._client.batch_v1.list_namespaced_job, namespace=ns)
+        return self._iter_list_pages(
+            JobSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Job",
+            namespace=None if all_namespaces else ns,
+            chunk_size=chunk_size,
+        )
 
     def get_job(self, name: str, namespace: str | None = None) -> JobSummary:
         """Get a single job by name.
@@ -196,23 +231,53 @@ class JobManager(K8sBaseManager):
         Returns:
             List of cronjob summaries.
         """
+        items = [
+            item
+            for page in self.iter_cron_jobs(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_cronjobs", count=len(items))
+        return items
+
+    def iter_cron_jobs(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[CronJobSummary]]:
+        """Stream cronjobs page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of cronjob summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_cronjobs", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.batch_v1.list_cron_job_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.batch_v1.list_namespaced_cron_job(namespace=ns, **kwargs)
-
-            items = [CronJobSummary.from_k8s_object(cj) for cj in result.items]
-            self._log.debug("listed_cronjobs", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "CronJob", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.batch_v1.list_cron_job_for_all_namespaces
+        else:
+            list_call = partial(self._client.batch_v1.list_namespaced_cron_job, namespace=ns)
+        return self._iter_list_pages(
+            CronJobSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="CronJob",
+            namespace=None if all_namespaces else ns,
+            chunk_size=chunk_size,
+        )
 
     def get_cron_job(self, name: str, namespace: str | None = None) -> CronJobSummary:
         """Get a single cronjob by name.
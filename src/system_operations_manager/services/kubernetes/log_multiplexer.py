@@ -0,0 +1,392 @@
+"""Multiplexed log tailing across many pods and containers.
+
+Following every replica of a deployment or every step of a workflow one
+``read_namespaced_pod_log`` call at a time means one terminal per pod, so
+LogMultiplexer runs one reader thread per pod/container stream and merges
+their lines into a single iterator of LogLine records.
+
+Readers always request kubelet timestamps and push parsed lines onto their
+own bounded buffer. A full buffer stalls that reader (and, through TCP flow
+control, the kubelet) rather than growing without limit while the consumer
+is busy with other streams.
+
+The consumer is a k-way merge over the stream buffers ordered by timestamp.
+A line is released as soon as every live stream has something buffered, or
+once it has waited ``reorder_window`` seconds, so a quiet pod delays output
+by at most that window instead of blocking it.
+
+Targets are re-discovered every ``rediscover_interval`` seconds until the
+discovery callback reports that no more can appear, and streams are opened
+for pods that showed up since (new replicas, new workflow steps).
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, NamedTuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Lines buffered per stream before its reader pauses
+DEFAULT_BUFFER_LINES = 1000
+
+# Longest a line waits for quieter streams before it is released out of order
+DEFAULT_REORDER_WINDOW = 0.25
+
+# Seconds between target re-discovery passes while following
+DEFAULT_REDISCOVER_INTERVAL = 5.0
+
+# Upper bound on concurrently open log streams
+DEFAULT_MAX_STREAMS = 500
+
+
+class LogTarget(NamedTuple):
+    """A pod/container whose log can be streamed."""
+
+    pod: str
+    container: str
+
+
+class LogLine(NamedTuple):
+    """One log line from a multiplexed stream.
+
+    Attributes:
+        pod: Pod that emitted the line.
+        container: Container that emitted the line.
+        timestamp: Kubelet RFC 3339 timestamp, empty if the line had none.
+        message: Line text without the trailing newline.
+    """
+
+    pod: str
+    container: str
+    timestamp: str
+    message: str
+
+    def format(self, *, timestamps: bool = False) -> str:
+        """Render the line with a ``[pod/container]`` prefix.
+
+        Args:
+            timestamps: Include the kubelet timestamp after the prefix.
+
+        Returns:
+            The prefixed line, newline-terminated.
+        """
+        stamp = f"{self.timestamp} " if timestamps and self.timestamp else ""
+        return f"[{self.pod}/{self.container}] {stamp}{self.message}\n"
+
+
+# Opens a target's log stream; the flag is True for targets found by the
+# first discovery pass, which is where tail/since limits belong.
+type OpenStream = Callable[[LogTarget, bool], Iterable[bytes | str]]
+
+# Returns the current targets and whether the set is final.
+type Discover = Callable[[], tuple[Iterable[LogTarget], bool]]
+
+
+def parse_log_line(raw: bytes | str) -> tuple[str, str]:
+    """Split a kubelet line into its timestamp and message.
+
+    Args:
+        raw: Line as read from a ``timestamps=true`` log stream.
+
+    Returns:
+        Tuple of (timestamp, message); the timestamp is empty when the line
+        does not start with one.
+    """
+    text = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+    text = text.rstrip("\r\n")
+    stamp, sep, message = text.partition(" ")
+    if sep and len(stamp) >= 20 and stamp[4] == "-" and stamp[10] == "T":
+        return stamp, message
+    return "", text
+
+
+def _sort_key(timestamp: str) -> str:
+    """Make RFC 3339 UTC timestamps compare correctly as strings.
+
+    The kubelet trims trailing zeros from the fraction, so ``.1Z`` would
+    otherwise sort after ``.12Z``.
+    """
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return f"{seconds}.{fraction:0<9}"
+
+
+class _Stream:
+    """One pod/container follower and its bounded line buffer."""
+
+    __slots__ = ("done", "last_key", "lines", "response", "target")
+
+    def __init__(self, target: LogTarget) -> None:
+        self.target = target
+        self.lines: deque[tuple[str, LogLine, float]] = deque()
+        self.done = False
+        self.last_key = ""
+        self.response: Any = None
+
+
+class LogMultiplexer:
+    """Follow many pod/container logs concurrently as one ordered stream.
+
+    Iterating yields LogLine records merged by timestamp. Iteration ends
+    once discovery reports a final target set and every stream has ended;
+    breaking out of it (or calling close()) shuts all streams down.
+
+    Example:
+        >>> mux = LogMultiplexer(open_stream, discover)
+        >>> for line in mux:
+        ...     print(line.format(), end="")
+    """
+
+    def __init__(
+        self,
+        open_stream: OpenStream,
+        discover: Discover,
+        *,
+        buffer_lines: int = DEFAULT_BUFFER_LINES,
+        reorder_window: float = DEFAULT_REORDER_WINDOW,
+        rediscover_interval: float = DEFAULT_REDISCOVER_INTERVAL,
+        max_streams: int = DEFAULT_MAX_STREAMS,
+    ) -> None:
+        """Initialize the multiplexer.
+
+        Args:
+            open_stream: Opens the log stream of a target.
+            discover: Lists current targets and whether the set is final.
+            buffer_lines: Lines buffered per stream before its reader pauses.
+            reorder_window: Seconds a line may wait for slower streams.
+            rediscover_interval: Seconds between discovery passes.
+            max_streams: Maximum number of streams opened.
+
+        Raises:
+            ValueError: If buffer_lines or max_streams is below 1.
+        """
+        if buffer_lines < 1:
+            raise ValueError(f"buffer_lines must be at least 1, got {buffer_lines}")
+        if max_streams < 1:
+            raise ValueError(f"max_streams must be at least 1, got {max_streams}")
+        self._open = open_stream
+        self._discover = discover
+        self._buffer_lines = buffer_lines
+        self._reorder_window = reorder_window
+        self._rediscover_interval = rediscover_interval
+        self._max_streams = max_streams
+
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._space = threading.Condition(self._lock)
+        self._streams: dict[LogTarget, _Stream] = {}
+        # Streams whose buffer went from empty to non-empty since the last merge
+        self._arrived: list[_Stream] = []
+        # Live streams with nothing buffered; while any exist, lines wait
+        self._starved = 0
+        self._live = 0
+        self._discoveries = 0
+        self._closed = False
+
+    def __iter__(self) -> Iterator[LogLine]:
+        try:
+            yield from self._merge()
+        finally:
+            self.close()
+
+    @property
+    def targets(self) -> list[LogTarget]:
+        """Targets that have been opened so far."""
+        with self._lock:
+            return list(self._streams)
+
+    def close(self) -> None:
+        """Stop all readers and close their connections."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            streams = list(self._streams.values())
+            self._space.notify_all()
+            self._ready.notify_all()
+        for stream in streams:
+            close = getattr(stream.response, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug("log_stream_close_failed", pod=stream.target.pod, error=str(e))
+
+    # -------------------------------------------------------------------------
+    # Discovery and readers
+    # -------------------------------------------------------------------------
+
+    def _rediscover(self) -> bool:
+        """Open streams for new targets.
+
+        The first pass propagates errors; later failures are logged and
+        retried on the next pass.
+
+        Returns:
+            Whether the target set is final.
+        """
+        initial = self._discoveries == 0
+        self._discoveries += 1
+        try:
+            targets, final = self._discover()
+        except Exception as e:
+            if initial:
+                raise
+            logger.warning("log_target_discovery_failed", error=str(e))
+            return False
+
+        for target in targets:
+            with self._lock:
+                if self._closed or target in self._streams:
+                    continue
+                if len(self._streams) >= self._max_streams:
+                    logger.warning(
+                        "log_stream_limit_reached",
+                        max_streams=self._max_streams,
+                        skipped=target.pod,
+                    )
+                    break
+                stream = _Stream(target)
+                self._streams[target] = stream
+                self._live += 1
+                self._starved += 1
+            threading.Thread(
+                target=self._read,
+                args=(stream, initial),
+                name=f"logs-{target.pod}-{target.container}",
+                daemon=True,
+            ).start()
+        return final
+
+    def _read(self, stream: _Stream, initial: bool) -> None:
+        """Reader thread: buffer one stream's lines until it ends."""
+        pod, container = stream.target
+        try:
+            stream.response = self._open(stream.target, initial)
+            for raw in stream.response:
+                timestamp, message = parse_log_line(raw)
+                key = _sort_key(timestamp) if timestamp else stream.last_key
+                stream.last_key = key
+                line = LogLine(pod, container, timestamp, message)
+                with self._lock:
+                    while len(stream.lines) >= self._buffer_lines and not self._closed:
+                        self._space.wait()
+                    if self._closed:
+                        return
+                    if not stream.lines:
+                        self._starved -= 1
+                        self._arrived.append(stream)
+                        self._ready.notify()
+                    stream.lines.append((key, line, time.monotonic()))
+        except Exception as e:
+            if not self._closed:
+                logger.warning("log_stream_failed", pod=pod, container=container, error=str(e))
+        finally:
+            with self._lock:
+                stream.done = True
+                self._live -= 1
+                if not stream.lines:
+                    self._starved -= 1
+                self._ready.notify()
+
+    # -------------------------------------------------------------------------
+    # Merge
+    # -------------------------------------------------------------------------
+
+    def _merge(self) -> Iterator[LogLine]:
+        """Yield buffered lines in timestamp order across all streams."""
+        # One entry per stream with buffered lines: (head key, tiebreak, stream)
+        heads: list[tuple[str, int, _Stream]] = []
+        order = itertools.count()
+        final = False
+        next_discovery = 0.0
+
+        while True:
+            if not final and time.monotonic() >= next_discovery:
+                final = self._rediscover()
+                next_discovery = time.monotonic() + self._rediscover_interval
+
+            released: list[LogLine] = []
+            with self._lock:
+                if self._closed:
+                    return
+                for stream in self._arrived:
+                    heapq.heappush(heads, (stream.lines[0][0], next(order), stream))
+                self._arrived.clear()
+
+                now = time.monotonic()
+                while heads:
+                    stream = heads[0][2]
+                    _, line, arrived = stream.lines[0]
+                    if self._starved and now - arrived < self._reorder_window:
+                        break
+                    stream.lines.popleft()
+                    released.append(line)
+                    if stream.lines:
+                        heapq.heapreplace(heads, (stream.lines[0][0], next(order), stream))
+                    else:
+                        heapq.heappop(heads)
+                        if not stream.done:
+                            self._starved += 1
+
+                if released:
+                    self._space.notify_all()
+                elif final and not heads and not self._live:
+                    return
+                else:
+                    timeout = None if final else max(next_discovery - now, 0.0)
+                    if heads:
+                        wait = self._reorder_window - (now - heads[0][2].lines[0][2])
+                        timeout = max(wait, 0.0) if timeout is None else min(timeout, wait)
+                    self._ready.wait(timeout)
+            yield from released
+
+
+def pod_log_opener(
+    core_v1: Any,
+    namespace: str,
+    *,
+    follow: bool,
+    tail_lines: int | None = None,
+    since_seconds: int | None = None,
+) -> OpenStream:
+    """Build an OpenStream that reads pod logs through CoreV1Api.
+
+    Tail and since limits only apply to targets found by the first
+    discovery pass; pods that appear later are read from their first line.
+
+    Args:
+        core_v1: CoreV1Api client.
+        namespace: Namespace of the target pods.
+        follow: Keep streams open for new lines.
+        tail_lines: Lines from the end of each initial stream.
+        since_seconds: Only read initial streams' lines newer than this.
+
+    Returns:
+        Callable opening a target's raw log response.
+    """
+
+    def open_stream(target: LogTarget, initial: bool) -> Iterable[bytes | str]:
+        kwargs: dict[str, Any] = {
+            "name": target.pod,
+            "namespace": namespace,
+            "container": target.container,
+            "follow": follow,
+            "timestamps": True,
+            "_preload_content": False,
+        }
+        if initial and tail_lines is not None:
+            kwargs["tail_lines"] = tail_lines
+        if initial and since_seconds is not None:
+            kwargs["since_seconds"] = since_seconds
+        response: Iterable[bytes | str] = core_v1.read_namespaced_pod_log(**kwargs)
+        return response
+
+    return open_stream
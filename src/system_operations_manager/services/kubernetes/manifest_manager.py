@@ -7,6 +7,9 @@ YAML manifests (single files, multi-document files, and directories).
 from __future__ import annotations
 
 import difflib
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -39,6 +42,50 @@ SERVER_MANAGED_METADATA_FIELDS = (
 # Top-level fields added by the server
 SERVER_MANAGED_TOP_LEVEL_FIELDS = ("status",)
 
+# Manifests applied at once within a kind tier
+DEFAULT_APPLY_CONCURRENCY = 16
+
+# How long to wait for kinds defined by CRDs applied in the same batch
+CRD_ESTABLISH_TIMEOUT = 30.0
+CRD_POLL_INTERVAL = 0.5
+
+# Apply order by kind. Cluster-wide foundations come first, then the
+# identity and configuration objects workloads reference, then everything
+# else (workloads, services, custom resources).
+KIND_TIERS: tuple[frozenset[str], ...] = (
+    frozenset(
+        {
+            "Namespace",
+            "CustomResourceDefinition",
+            "PriorityClass",
+            "StorageClass",
+            "RuntimeClass",
+            "IngressClass",
+        }
+    ),
+    frozenset(
+        {
+            "ServiceAccount",
+            "Secret",
+            "ConfigMap",
+            "Role",
+            "ClusterRole",
+            "RoleBinding",
+            "ClusterRoleBinding",
+            "ResourceQuota",
+            "LimitRange",
+            "PersistentVolume",
+            "PersistentVolumeClaim",
+            "NetworkPolicy",
+        }
+    ),
+)
+
+# Applied after everything else so they cannot reject the batch's own resources
+LATE_KINDS = frozenset(
+    {"MutatingWebhookConfiguration", "ValidatingWebhookConfiguration", "APIService"}
+)
+
 
 # ---------------------------------------------------------------------------
 # Result Dataclasses
@@ -251,28 +298,118 @@ class ManifestManager(K8sBaseManager):
         dry_run: bool = False,
         server_dry_run: bool = False,
         force: bool = False,
+        server_side: bool = True,
+        max_concurrency: int = DEFAULT_APPLY_CONCURRENCY,
     ) -> list[ApplyResult]:
         """Apply manifests to the Kubernetes cluster.
 
-        Uses ``kubernetes.utils.create_from_dict`` for initial creation.
-        On 409 Conflict (resource already exists), falls back to a
-        server-side apply via the dynamic client.
+        By default each manifest is sent as a single server-side apply
+        request, which creates or updates the resource in one round trip.
+        With ``server_side=False`` (and always for ``List`` manifests),
+        ``kubernetes.utils.create_from_dict`` is tried first and a 409
+        Conflict (resource already exists) falls back to server-side apply.
+
+        Manifests are applied in kind tiers (see :meth:`iter_apply_manifests`),
+        concurrently within each tier.
 
         Args:
             manifests: Parsed manifest dicts.
             namespace: Override namespace for namespaced resources.
             dry_run: Client-side dry run (skip all API calls).
             server_dry_run: Server-side dry run (``dry_run="All"``).
-            force: Passed through for conflict resolution.
+            force: Take ownership of fields managed by other field managers
+                instead of failing on server-side apply conflicts.
+            server_side: Apply with server-side apply first instead of
+                create-then-patch.
+            max_concurrency: Maximum manifests applied at once.
 
         Returns:
-            One :class:`ApplyResult` per manifest.
+            One :class:`ApplyResult` per manifest, in input order.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        results: list[ApplyResult] = []
-        dry_run_strategy: str | None = None
-        if server_dry_run:
-            dry_run_strategy = SERVER_SIDE_DRY_RUN
+        _check_concurrency(max_concurrency)
+        results: list[ApplyResult | None] = [None] * len(manifests)
+        for index, result in self._apply_tiered(
+            manifests,
+            namespace,
+            dry_run=dry_run,
+            server_dry_run=server_dry_run,
+            force=force,
+            server_side=server_side,
+            max_concurrency=max_concurrency,
+        ):
+            results[index] = result
+        return [r for r in results if r is not None]
+
+    def iter_apply_manifests(
+        self,
+        manifests: list[dict[str, Any]],
+        namespace: str | None = None,
+        *,
+        dry_run: bool = False,
+        server_dry_run: bool = False,
+        force: bool = False,
+        server_side: bool = True,
+        max_concurrency: int = DEFAULT_APPLY_CONCURRENCY,
+    ) -> Iterator[ApplyResult]:
+        """Apply manifests in kind tiers, yielding results as they finish.
+
+        Namespaces, CRDs and other cluster-wide foundations are applied
+        first, then service accounts, RBAC, ConfigMaps, Secrets and volumes,
+        then workloads and every other kind (including custom resources),
+        and admission webhooks and APIServices last. Each tier is applied
+        concurrently and finishes before the next one starts, so a tier's
+        failures are reported before dependents are attempted.
+
+        Custom resources whose CRD was applied earlier in the batch are held
+        back until the API server serves their kind (up to
+        ``CRD_ESTABLISH_TIMEOUT`` seconds).
 
+        Args:
+            manifests: Parsed manifest dicts.
+            namespace: Override namespace for namespaced resources.
+            dry_run: Client-side dry run (skip all API calls).
+            server_dry_run: Server-side dry run (``dry_run="All"``).
+            force: Take ownership of conflicting fields.
+            server_side: Apply with server-side apply first.
+            max_concurrency: Maximum manifests applied at once.
+
+        Returns:
+            Iterator of :class:`ApplyResult` in completion order.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        _check_concurrency(max_concurrency)
+        return (
+            result
+            for _, result in self._apply_tiered(
+                manifests,
+                namespace,
+                dry_run=dry_run,
+                server_dry_run=server_dry_run,
+                force=force,
+                server_side=server_side,
+                max_concurrency=max_concurrency,
+            )
+        )
+
+    def _apply_tiered(
+        self,
+        manifests: list[dict[str, Any]],
+        namespace: str | None,
+        *,
+        dry_run: bool,
+        server_dry_run: bool,
+        force: bool,
+        server_side: bool,
+        max_concurrency: int,
+    ) -> Iterator[tuple[int, ApplyResult]]:
+        """Apply manifests tier by tier, yielding (input index, result) pairs."""
+        dry_run_strategy = SERVER_SIDE_DRY_RUN if server_dry_run else None
+        prepared: list[tuple[dict[str, Any], str, str]] = []
         for manifest in manifests:
             clean = self._strip_source_metadata(manifest)
             ns = (
@@ -280,35 +417,124 @@ class ManifestManager(K8sBaseManager):
                 or clean.get("metadata", {}).get("namespace")
                 or self._resolve_namespace(None)
             )
-            resource_id = self._get_resource_identifier(clean)
-
-            if dry_run:
-                results.append(
+            # Override namespace if provided
+            if namespace and "metadata" in clean:
+                clean.setdefault("metadata", {})["namespace"] = namespace
+            prepared.append((clean, ns, self._get_resource_identifier(clean)))
+
+        total = succeeded = 0
+        if dry_run:
+            for index, (_, ns, resource_id) in enumerate(prepared):
+                total += 1
+                succeeded += 1
+                yield (
+                    index,
                     ApplyResult(
                         resource=resource_id,
                         action="skipped (client dry-run)",
                         namespace=ns,
                         success=True,
                         message="Would apply to cluster",
-                    )
+                    ),
                 )
-                continue
-
-            # Override namespace if provided
-            if namespace and "metadata" in clean:
-                clean.setdefault("metadata", {})["namespace"] = namespace
+        else:
+            tiers: dict[int, list[int]] = {}
+            for index, (clean, _, _) in enumerate(prepared):
+                tiers.setdefault(self._kind_tier(clean), []).append(index)
 
-            result = self._apply_single(clean, ns, dry_run_strategy=dry_run_strategy)
-            results.append(result)
+            def apply_one(index: int) -> ApplyResult:
+                clean, ns, resource_id = prepared[index]
+                if server_side and not self._is_list(clean):
+                    return self._server_side_apply(
+                        clean, ns, resource_id, dry_run_strategy=dry_run_strategy, force=force
+                    )
+                return self._apply_single(clean, ns, dry_run_strategy=dry_run_strategy, force=force)
+
+            crd_kinds: set[tuple[str, str]] = set()
+            pool: ThreadPoolExecutor | None = None
+            try:
+                for tier in sorted(tiers):
+                    indexes = tiers[tier]
+                    self._discover_kinds([prepared[i][0] for i in indexes], crd_kinds)
+
+                    if max_concurrency == 1 or len(indexes) == 1:
+                        completed: Iterator[tuple[int, ApplyResult]] = (
+                            (i, apply_one(i)) for i in indexes
+                        )
+                    else:
+                        if pool is None:
+                            pool = ThreadPoolExecutor(
+                                max_workers=max_concurrency, thread_name_prefix="k8s-apply"
+                            )
+                        futures: dict[Future[ApplyResult], int] = {
+                            pool.submit(apply_one, i): i for i in indexes
+                        }
+                        completed = ((futures[f], f.result()) for f in as_completed(futures))
+
+                    for index, result in completed:
+                        total += 1
+                        if result.success:
+                            succeeded += 1
+                            clean = prepared[index][0]
+                            if (
+                                clean.get("kind") == "CustomResourceDefinition"
+                                and not server_dry_run
+                            ):
+                                spec = clean.get("spec", {})
+                                crd_kinds.add(
+                                    (spec.get("group", ""), spec.get("names", {}).get("kind", ""))
+                                )
+                        yield index, result
+
+                    self._log.debug(
+                        "manifest_tier_applied",
+                        tier=tier,
+                        resources=len(indexes),
+                    )
+            finally:
+                if pool is not None:
+                    pool.shutdown(cancel_futures=True)
 
-        applied_count = sum(1 for r in results if r.success)
         self._log.info(
             "applied_manifests",
-            total=len(results),
-            succeeded=applied_count,
+            total=total,
+            succeeded=succeeded,
             dry_run=dry_run or server_dry_run,
         )
-        return results
+
+    def _discover_kinds(
+        self, manifests: list[dict[str, Any]], crd_kinds: set[tuple[str, str]]
+    ) -> None:
+        """Resolve each kind's API resource before a tier fans out.
+
+        Warming the dynamic client's discovery cache here keeps the worker
+        threads from refreshing it concurrently. Kinds defined by a CRD that
+        was applied earlier in the batch are polled until the API server
+        serves them or ``CRD_ESTABLISH_TIMEOUT`` passes. Lookup errors are
+        left for the apply itself to report.
+        """
+        kinds = dict.fromkeys(
+            (m.get("apiVersion", ""), m.get("kind", "")) for m in manifests if not self._is_list(m)
+        )
+        if not kinds:
+            return
+        try:
+            dynamic = self._get_dynamic_client()
+        except Exception:
+            return
+
+        for api_version, kind in kinds:
+            group = api_version.rpartition("/")[0]
+            wait = (group, kind) in crd_kinds
+            deadline = time.monotonic() + CRD_ESTABLISH_TIMEOUT
+            while True:
+                try:
+                    dynamic.resources.get(api_version=api_version, kind=kind)
+                    break
+                except Exception:
+                    if not wait or time.monotonic() >= deadline:
+                        break
+                    time.sleep(CRD_POLL_INTERVAL)
 
     def _apply_single(
         self,
@@ -316,13 +542,14 @@ class ManifestManager(K8sBaseManager):
         namespace: str,
         *,
         dry_run_strategy: str | None,
+        force: bool = False,
     ) -> ApplyResult:
         """Apply a single manifest using create-or-patch semantics."""
         from kubernetes import utils
-        from kubernetes.client import ApiClient, ApiException
+        from kubernetes.client import ApiException
 
         resource_id = self._get_resource_identifier(manifest)
-        api_client = ApiClient()
+        api_client = self._client.api_client
 
         try:
             kwargs: dict[str, Any] = {"verbose": False}
@@ -345,7 +572,11 @@ class ManifestManager(K8sBaseManager):
             for api_exception in e.api_exceptions:
                 if api_exception.status == 409:
                     return self._server_side_apply(
-                        manifest, namespace, resource_id, dry_run_strategy=dry_run_strategy
+                        manifest,
+                        namespace,
+                        resource_id,
+                        dry_run_strategy=dry_run_strategy,
+                        force=force,
                     )
             # Non-conflict errors
             error_msg = "; ".join(str(ex.reason) for ex in e.api_exceptions)
@@ -383,8 +614,13 @@ class ManifestManager(K8sBaseManager):
         resource_id: str,
         *,
         dry_run_strategy: str | None,
+        force: bool = False,
     ) -> ApplyResult:
-        """Perform server-side apply via the dynamic client for existing resources."""
+        """Perform server-side apply via the dynamic client.
+
+        The API server answers 201 when the apply created the resource and
+        200 when it updated an existing one.
+        """
         try:
             dynamic = self._get_dynamic_client()
             api_version = manifest.get("apiVersion", "")
@@ -399,9 +635,13 @@ class ManifestManager(K8sBaseManager):
                 kwargs["namespace"] = namespace
             if dry_run_strategy:
                 kwargs["dry_run"] = dry_run_strategy
+            if force:
+                kwargs["force_conflicts"] = True
 
-            resource_api.server_side_apply(**kwargs)
-            action = "configured (server dry-run)" if dry_run_strategy else "configured"
+            response = resource_api.server_side_apply(**kwargs, serialize=False)
+            action = "created" if getattr(response, "status", None) == 201 else "configured"
+            if dry_run_strategy:
+                action += " (server dry-run)"
             self._log.info(
                 "manifest_applied", resource=resource_id, action=action, namespace=namespace
             )
@@ -544,6 +784,20 @@ class ManifestManager(K8sBaseManager):
         name = manifest.get("metadata", {}).get("name", "unnamed")
         return f"{kind}/{name}"
 
+    @staticmethod
+    def _kind_tier(manifest: dict[str, Any]) -> int:
+        """Get the apply tier of a manifest's kind (lower tiers go first)."""
+        kind = manifest.get("kind", "")
+        for tier, kinds in enumerate(KIND_TIERS):
+            if kind in kinds:
+                return tier
+        return len(KIND_TIERS) + 1 if kind in LATE_KINDS else len(KIND_TIERS)
+
+    @staticmethod
+    def _is_list(manifest: dict[str, Any]) -> bool:
+        """Check whether a manifest is a ``List`` of resources."""
+        return str(manifest.get("kind", "")).endswith("List") and "items" in manifest
+
     @staticmethod
     def _strip_source_metadata(manifest: dict[str, Any]) -> dict[str, Any]:
         """Return a copy of *manifest* without internal tracking fields."""
@@ -552,11 +806,8 @@ class ManifestManager(K8sBaseManager):
         return clean
 
     def _get_dynamic_client(self) -> Any:
-        """Create a ``kubernetes.dynamic.DynamicClient``."""
-        from kubernetes.client import ApiClient
-        from kubernetes.dynamic import DynamicClient
-
-        return DynamicClient(ApiClient())
+        """Get the client's cached ``kubernetes.dynamic.DynamicClient``."""
+        return self._client.dynamic_client
 
     @staticmethod
     def _serialize_for_diff(resource: dict[str, Any]) -> str:
@@ -586,3 +837,9 @@ class ManifestManager(K8sBaseManager):
             cleaned["metadata"] = metadata
 
         return cleaned
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    """Reject a concurrency limit below one."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
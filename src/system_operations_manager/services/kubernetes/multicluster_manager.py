@@ -2,12 +2,22 @@
 
 Provides cross-cluster operations: status overview, multi-cluster deploy,
 and resource synchronization between clusters.
+
+Each cluster is reached through its own pooled, isolated API client (see
+KubernetesClient.for_cluster), so clusters are visited concurrently without
+switching the global kubeconfig context. A cluster that does not finish within
+its timeout is reported straight away, but its worker thread cannot be
+cancelled: it keeps its concurrency slot until it really finishes, and deploys
+and syncs report it as timed out with an unknown outcome rather than failed.
+Worker threads are daemons and never delay interpreter exit.
 """
 
 from __future__ import annotations
 
 import contextlib
-from contextlib import contextmanager
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -27,17 +37,20 @@ from system_operations_manager.services.kubernetes.manifest_manager import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable
 
     from system_operations_manager.integrations.kubernetes.client import KubernetesClient
 
+# Upper bound on clusters visited at once when no limit is given
+DEFAULT_MAX_CONCURRENCY = 64
+
 
 class MultiClusterManager(K8sBaseManager):
     """Manager for multi-cluster Kubernetes operations.
 
-    Provides operations that span multiple clusters by sequentially
-    switching contexts, performing operations, and collecting results.
-    The original context is always restored after operations complete.
+    Provides operations that span multiple clusters by fanning out over
+    per-cluster clients on worker threads and collecting results in the
+    order clusters were given. The shared client's context is never changed.
     """
 
     _entity_name: str = "multicluster"
@@ -89,30 +102,123 @@ class MultiClusterManager(K8sBaseManager):
         return clusters
 
     # -----------------------------------------------------------------------
-    # Context Management
+    # Fan-out
     # -----------------------------------------------------------------------
 
-    @contextmanager
-    def _save_and_restore_context(self) -> Generator[None]:
-        """Context manager that saves and restores the current cluster context.
+    def _cluster_timeout(self, cluster_name: str, timeout: float | None) -> float:
+        """Get the time budget for one cluster (override or configured timeout)."""
+        if timeout is not None:
+            return timeout
+        return float(self._client._config.clusters[cluster_name].timeout)
+
+    def _for_each_cluster[R](
+        self,
+        clusters: list[str],
+        task: Callable[[str], R],
+        on_failure: Callable[[str, str], R],
+        *,
+        on_timeout: Callable[[str, str], R] | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> list[R]:
+        """Run a task for each cluster concurrently, each under its own timeout.
+
+        A cluster's timeout starts when its task starts. Clusters that raise
+        are reported through ``on_failure``; clusters that time out are
+        reported through ``on_timeout`` without waiting for them. A timed-out
+        worker may still be talking to its cluster, so it keeps its slot
+        until it finishes and its late result is discarded. If every slot is
+        held by such workers for longer than the next cluster's timeout, the
+        clusters still queued are reported as not started.
+
+        Args:
+            clusters: Cluster names to visit.
+            task: Function producing the result for one cluster.
+            on_failure: Builds a failed result from a cluster name and message.
+            on_timeout: Builds the result for a cluster that timed out
+                (default: ``on_failure``).
+            max_concurrency: Maximum clusters in flight (default: all, up to
+                DEFAULT_MAX_CONCURRENCY).
+            timeout: Per-cluster timeout in seconds (default: each cluster's
+                configured timeout).
+
+        Returns:
+            One result per distinct cluster, in the order of ``clusters``.
 
-        Ensures the original context is restored even if an error occurs
-        during multi-cluster operations.
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        original_context = self._client.get_current_context()
-        self._log.debug("saving_context", original=original_context)
-        try:
-            yield
-        finally:
-            if original_context and original_context != "unknown":
-                try:
-                    self._client.switch_context(original_context)
-                    self._log.debug("restored_context", context=original_context)
-                except Exception:
+        clusters = list(dict.fromkeys(clusters))
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        limit = max_concurrency or min(len(clusters), DEFAULT_MAX_CONCURRENCY)
+        timed_out = on_timeout or on_failure
+
+        results: dict[str, R] = {}
+        pending = deque(clusters)
+        running: dict[str, float] = {}  # cluster -> deadline
+        abandoned: set[str] = set()  # timed out, worker still running
+        stalled_until: float | None = None
+        finished = threading.Condition()
+
+        def run(cluster_name: str) -> None:
+            try:
+                result = task(cluster_name)
+            except Exception as e:
+                result = on_failure(cluster_name, str(e))
+            with finished:
+                # A cluster that already timed out keeps its timeout result
+                if running.pop(cluster_name, None) is not None:
+                    results[cluster_name] = result
+                else:
+                    abandoned.discard(cluster_name)
+                    self._log.warning("cluster_finished_after_timeout", cluster=cluster_name)
+                finished.notify()
+
+        with finished:
+            while pending or running:
+                while pending and len(running) + len(abandoned) < limit:
+                    cluster_name = pending.popleft()
+                    running[cluster_name] = time.monotonic() + self._cluster_timeout(
+                        cluster_name, timeout
+                    )
+                    stalled_until = None
+                    threading.Thread(
+                        target=run,
+                        args=(cluster_name,),
+                        name=f"multicluster-{cluster_name}",
+                        daemon=True,
+                    ).start()
+
+                now = time.monotonic()
+                for cluster_name, deadline in list(running.items()):
+                    if deadline <= now:
+                        del running[cluster_name]
+                        abandoned.add(cluster_name)
+                        budget = self._cluster_timeout(cluster_name, timeout)
+                        self._log.warning("cluster_timed_out", cluster=cluster_name, timeout=budget)
+                        results[cluster_name] = timed_out(
+                            cluster_name, f"Timed out after {budget:g}s"
+                        )
+
+                if running:
+                    finished.wait(timeout=min(running.values()) - now)
+                elif pending:
+                    # Every slot is held by a worker that already timed out
+                    if stalled_until is None:
+                        stalled_until = now + self._cluster_timeout(pending[0], timeout)
+                    if stalled_until > now:
+                        finished.wait(timeout=stalled_until - now)
+                        continue
                     self._log.warning(
-                        "failed_to_restore_context",
-                        original=original_context,
+                        "clusters_not_started", clusters=list(pending), blocked_by=sorted(abandoned)
                     )
+                    message = f"Not started: {len(abandoned)} timed-out cluster(s) still running"
+                    while pending:
+                        cluster_name = pending.popleft()
+                        results[cluster_name] = on_failure(cluster_name, message)
+
+        return [results[cluster_name] for cluster_name in clusters]
 
     # -----------------------------------------------------------------------
     # Status
@@ -121,11 +227,20 @@ class MultiClusterManager(K8sBaseManager):
     def multi_cluster_status(
         self,
         clusters: list[str] | None = None,
+        *,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
     ) -> MultiClusterStatusResult:
         """Get connectivity and version status for multiple clusters.
 
+        Clusters are checked concurrently, so the overall time is bounded by
+        the slowest cluster rather than the sum of all of them.
+
         Args:
             clusters: Specific cluster names, or None for all configured.
+            max_concurrency: Maximum clusters checked at once.
+            timeout: Per-cluster timeout in seconds (default: each cluster's
+                configured timeout).
 
         Returns:
             Aggregated status result with per-cluster details.
@@ -133,12 +248,13 @@ class MultiClusterManager(K8sBaseManager):
         target_clusters = self._resolve_clusters(clusters)
         self._log.info("checking_multi_cluster_status", clusters=target_clusters)
 
-        statuses: list[ClusterStatus] = []
-
-        with self._save_and_restore_context():
-            for cluster_name in target_clusters:
-                status = self._get_single_cluster_status(cluster_name)
-                statuses.append(status)
+        statuses = self._for_each_cluster(
+            target_clusters,
+            self._get_single_cluster_status,
+            self._failed_status,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+        )
 
         connected_count = sum(1 for s in statuses if s.connected)
 
@@ -155,39 +271,38 @@ class MultiClusterManager(K8sBaseManager):
         )
         return result
 
+    def _failed_status(self, cluster_name: str, error: str) -> ClusterStatus:
+        """Build a disconnected status for a cluster."""
+        cluster_cfg = self._client._config.clusters[cluster_name]
+        return ClusterStatus(
+            cluster=cluster_name,
+            context=cluster_cfg.context,
+            connected=False,
+            namespace=cluster_cfg.namespace,
+            error=error,
+        )
+
     def _get_single_cluster_status(self, cluster_name: str) -> ClusterStatus:
-        """Get status for a single cluster by switching context."""
+        """Get status for a single cluster through its own client."""
         cluster_cfg = self._client._config.clusters[cluster_name]
 
         try:
-            self._client.switch_context(cluster_name)
+            cluster_client = self._client.for_cluster(cluster_name)
         except Exception as e:
-            return ClusterStatus(
-                cluster=cluster_name,
-                context=cluster_cfg.context,
-                connected=False,
-                namespace=cluster_cfg.namespace,
-                error=f"Failed to switch context: {e}",
-            )
+            return self._failed_status(cluster_name, f"Failed to load context: {e}")
 
-        connected = self._client.check_connection()
+        connected = cluster_client.check_connection()
         if not connected:
-            return ClusterStatus(
-                cluster=cluster_name,
-                context=cluster_cfg.context,
-                connected=False,
-                namespace=cluster_cfg.namespace,
-                error="Cluster unreachable",
-            )
+            return self._failed_status(cluster_name, "Cluster unreachable")
 
         version: str | None = None
         node_count: int | None = None
 
         with contextlib.suppress(Exception):
-            version = self._client.get_cluster_version()
+            version = cluster_client.get_cluster_version()
 
         try:
-            nodes = self._client.core_v1.list_node()
+            nodes = cluster_client.core_v1.list_node()
             node_count = len(nodes.items) if nodes.items else 0
         except Exception:
             pass
@@ -265,51 +380,103 @@ class MultiClusterManager(K8sBaseManager):
         clusters: list[str] | None = None,
         namespace: str | None = None,
         dry_run: bool = False,
+        max_concurrency: int | None = None,
+        wave_size: int | None = None,
+        halt_on_failure: bool = False,
+        timeout: float | None = None,
     ) -> MultiClusterDeployResult:
         """Deploy manifests to multiple clusters.
 
+        Clusters are deployed concurrently. With ``wave_size``, they are
+        rolled out in waves of that many clusters in the order given, each
+        wave starting once the previous one has finished.
+
         Args:
             manifests: Parsed manifest dictionaries.
             clusters: Target cluster names, or None for all configured.
             namespace: Override namespace for all resources.
             dry_run: If True, only simulate the deploy.
+            max_concurrency: Maximum clusters deployed at once within a wave.
+            wave_size: Number of clusters per wave (default: one wave).
+            halt_on_failure: Skip the remaining waves once a wave has a
+                failed cluster.
+            timeout: Per-cluster timeout in seconds (default: each cluster's
+                configured timeout).
 
         Returns:
             Aggregated deploy result with per-cluster details.
+
+        Raises:
+            ValueError: If wave_size or max_concurrency is less than 1.
         """
-        target_clusters = self._resolve_clusters(clusters)
+        if wave_size is not None and wave_size < 1:
+            raise ValueError("wave_size must be at least 1")
+        target_clusters = list(dict.fromkeys(self._resolve_clusters(clusters)))
         self._log.info(
             "deploying_to_clusters",
             clusters=target_clusters,
             manifest_count=len(manifests),
             dry_run=dry_run,
+            wave_size=wave_size,
         )
 
+        def deploy(cluster_name: str) -> ClusterDeployResult:
+            return self._deploy_to_single_cluster(
+                cluster_name, manifests, namespace=namespace, dry_run=dry_run
+            )
+
+        def failed(cluster_name: str, error: str) -> ClusterDeployResult:
+            return ClusterDeployResult(cluster=cluster_name, success=False, error=error)
+
+        def timed_out(cluster_name: str, error: str) -> ClusterDeployResult:
+            return ClusterDeployResult(
+                cluster=cluster_name,
+                success=False,
+                timed_out=True,
+                error=f"{error}; still running, outcome unknown",
+            )
+
+        size = wave_size or max(len(target_clusters), 1)
+        waves = [target_clusters[i : i + size] for i in range(0, len(target_clusters), size)]
         cluster_results: list[ClusterDeployResult] = []
 
-        with self._save_and_restore_context():
-            for cluster_name in target_clusters:
-                result = self._deploy_to_single_cluster(
-                    cluster_name,
-                    manifests,
-                    namespace=namespace,
-                    dry_run=dry_run,
+        for index, wave in enumerate(waves, start=1):
+            wave_results = self._for_each_cluster(
+                wave,
+                deploy,
+                failed,
+                on_timeout=timed_out,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+            )
+            cluster_results.extend(wave_results)
+            wave_failed = sum(1 for r in wave_results if not r.success)
+            self._log.info("deploy_wave_complete", wave=index, clusters=wave, failed=wave_failed)
+
+            if wave_failed and halt_on_failure and index < len(waves):
+                skipped = [c for later in waves[index:] for c in later]
+                self._log.warning("deploy_halted", wave=index, skipped=skipped)
+                cluster_results.extend(
+                    failed(c, f"Not deployed: wave {index} had failures") for c in skipped
                 )
-                cluster_results.append(result)
+                break
 
         successful = sum(1 for r in cluster_results if r.success)
+        unknown = sum(1 for r in cluster_results if r.timed_out)
 
         deploy_result = MultiClusterDeployResult(
             cluster_results=cluster_results,
             total_clusters=len(cluster_results),
             successful=successful,
-            failed=len(cluster_results) - successful,
+            failed=len(cluster_results) - successful - unknown,
+            unknown=unknown,
         )
         self._log.info(
             "deploy_complete",
             total=deploy_result.total_clusters,
             successful=deploy_result.successful,
             failed=deploy_result.failed,
+            unknown=deploy_result.unknown,
         )
         return deploy_result
 
@@ -323,16 +490,16 @@ class MultiClusterManager(K8sBaseManager):
     ) -> ClusterDeployResult:
         """Deploy manifests to a single cluster."""
         try:
-            self._client.switch_context(cluster_name)
+            cluster_client = self._client.for_cluster(cluster_name)
         except Exception as e:
             return ClusterDeployResult(
                 cluster=cluster_name,
                 success=False,
-                error=f"Failed to switch context: {e}",
+                error=f"Failed to load context: {e}",
             )
 
         try:
-            manifest_mgr = ManifestManager(self._client)
+            manifest_mgr = ManifestManager(cluster_client)
             apply_results = manifest_mgr.apply_manifests(
                 manifests,
                 namespace=namespace,
@@ -379,11 +546,13 @@ class MultiClusterManager(K8sBaseManager):
         resource_name: str,
         namespace: str | None = None,
         dry_run: bool = False,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
     ) -> MultiClusterSyncResult:
         """Sync a resource from one cluster to others.
 
         Reads the resource from the source cluster, strips server-managed
-        fields, and applies it to each target cluster.
+        fields, and applies it to the target clusters concurrently.
 
         Args:
             source_cluster: Cluster to read the resource from.
@@ -392,6 +561,9 @@ class MultiClusterManager(K8sBaseManager):
             resource_name: Name of the resource.
             namespace: Namespace of the resource (for namespaced resources).
             dry_run: If True, only simulate the sync.
+            max_concurrency: Maximum target clusters written at once.
+            timeout: Per-cluster timeout in seconds (default: each cluster's
+                configured timeout).
 
         Returns:
             Aggregated sync result with per-target-cluster details.
@@ -411,39 +583,45 @@ class MultiClusterManager(K8sBaseManager):
 
         cluster_results: list[ClusterSyncResult] = []
 
-        with self._save_and_restore_context():
-            # Step 1: Read resource from source cluster
-            resource_dict = self._read_resource_from_cluster(
-                source_cluster,
-                resource_type=resource_type,
-                resource_name=resource_name,
-                namespace=namespace,
-            )
+        # Step 1: Read resource from source cluster
+        resource_dict = self._read_resource_from_cluster(
+            source_cluster,
+            resource_type=resource_type,
+            resource_name=resource_name,
+            namespace=namespace,
+        )
 
-            if resource_dict is None:
-                # Source read failed, mark all targets as failed
-                for target in target_clusters:
-                    cluster_results.append(
-                        ClusterSyncResult(
-                            cluster=target,
-                            success=False,
-                            error=f"Failed to read {resource_type}/{resource_name} from {source_cluster}",
-                        )
+        if resource_dict is None:
+            # Source read failed, mark all targets as failed
+            for target in target_clusters:
+                cluster_results.append(
+                    ClusterSyncResult(
+                        cluster=target,
+                        success=False,
+                        error=f"Failed to read {resource_type}/{resource_name} from {source_cluster}",
                     )
-            else:
-                # Step 2: Clean the resource for sync
-                cleaned = self._strip_server_fields(resource_dict)
-
-                # Step 3: Apply to each target cluster
-                for target in target_clusters:
-                    result = self._sync_to_single_cluster(
-                        target,
-                        cleaned,
-                        dry_run=dry_run,
-                    )
-                    cluster_results.append(result)
+                )
+        else:
+            # Step 2: Clean the resource for sync
+            cleaned = self._strip_server_fields(resource_dict)
+
+            # Step 3: Apply to the target clusters concurrently
+            cluster_results = self._for_each_cluster(
+                target_clusters,
+                lambda target: self._sync_to_single_cluster(target, cleaned, dry_run=dry_run),
+                lambda target, error: ClusterSyncResult(cluster=target, success=False, error=error),
+                on_timeout=lambda target, error: ClusterSyncResult(
+                    cluster=target,
+                    success=False,
+                    timed_out=True,
+                    error=f"{error}; still running, outcome unknown",
+                ),
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+            )
 
         successful = sum(1 for r in cluster_results if r.success)
+        unknown = sum(1 for r in cluster_results if r.timed_out)
 
         sync_result = MultiClusterSyncResult(
             source_cluster=source_cluster,
@@ -453,12 +631,14 @@ class MultiClusterManager(K8sBaseManager):
             cluster_results=cluster_results,
             total_targets=len(cluster_results),
             successful=successful,
-            failed=len(cluster_results) - successful,
+            failed=len(cluster_results) - successful - unknown,
+            unknown=unknown,
         )
         self._log.info(
             "sync_complete",
             successful=sync_result.successful,
             failed=sync_result.failed,
+            unknown=sync_result.unknown,
         )
         return sync_result
 
@@ -472,7 +652,7 @@ class MultiClusterManager(K8sBaseManager):
     ) -> dict[str, Any] | None:
         """Read a resource from a cluster using the dynamic client."""
         try:
-            self._client.switch_context(cluster_name)
+            cluster_client = self._client.for_cluster(cluster_name)
         except Exception as e:
             self._log.error(
                 "sync_source_context_failed",
@@ -482,7 +662,7 @@ class MultiClusterManager(K8sBaseManager):
             return None
 
         try:
-            dynamic = self._get_dynamic_client()
+            dynamic = self._get_dynamic_client(cluster_client)
             # Search across common API groups for the resource kind
             resource_api = self._find_resource_api(dynamic, resource_type)
             if resource_api is None:
@@ -544,12 +724,12 @@ class MultiClusterManager(K8sBaseManager):
     ) -> ClusterSyncResult:
         """Apply a cleaned resource to a single target cluster."""
         try:
-            self._client.switch_context(cluster_name)
+            cluster_client = self._client.for_cluster(cluster_name)
         except Exception as e:
             return ClusterSyncResult(
                 cluster=cluster_name,
                 success=False,
-                error=f"Failed to switch context: {e}",
+                error=f"Failed to load context: {e}",
             )
 
         if dry_run:
@@ -560,7 +740,7 @@ class MultiClusterManager(K8sBaseManager):
             )
 
         try:
-            manifest_mgr = ManifestManager(self._client)
+            manifest_mgr = ManifestManager(cluster_client)
             apply_results = manifest_mgr.apply_manifests([resource_dict])
 
             if apply_results and apply_results[0].success:
@@ -618,9 +798,7 @@ class MultiClusterManager(K8sBaseManager):
 
         return cleaned
 
-    def _get_dynamic_client(self) -> Any:
-        """Create a DynamicClient for the current context."""
-        from kubernetes.client import ApiClient
-        from kubernetes.dynamic import DynamicClient
-
-        return DynamicClient(ApiClient())
+    @staticmethod
+    def _get_dynamic_client(cluster_client: KubernetesClient) -> Any:
+        """Get a cluster client's cached DynamicClient."""
+        return cluster_client.dynamic_client
@@ -6,6 +6,8 @@ through the Kubernetes API.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.cluster import (
@@ -13,7 +15,10 @@ from system_operations_manager.integrations.kubernetes.models.cluster import (
     NamespaceSummary,
     NodeSummary,
 )
-from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.base import (
+    DEFAULT_LIST_CHUNK_SIZE,
+    K8sBaseManager,
+)
 
 
 class NamespaceClusterManager(K8sBaseManager):
@@ -41,18 +46,41 @@ class NamespaceClusterManager(K8sBaseManager):
         Returns:
             List of namespace summaries.
         """
+        items = [
+            item for page in self.iter_namespaces(label_selector=label_selector) for item in page
+        ]
+        self._log.debug("listed_namespaces", count=len(items))
+        return items
+
+    def iter_namespaces(
+        self,
+        *,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[NamespaceSummary]]:
+        """Stream all namespaces page by page.
+
+        Args:
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of namespace summaries.
+        """
         self._log.debug("listing_namespaces")
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            result = self._client.core_v1.list_namespace(**kwargs)
-            items = [NamespaceSummary.from_k8s_object(ns) for ns in result.items]
-            self._log.debug("listed_namespaces", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "Namespace", None, None)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        list_call = self._client.core_v1.list_namespace
+        return self._iter_list_pages(
+            NamespaceSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Namespace",
+            informer="namespaces",
+            chunk_size=chunk_size,
+        )
 
     def get_namespace(self, name: str) -> NamespaceSummary:
         """Get a single namespace by name.
@@ -160,18 +188,39 @@ class NamespaceClusterManager(K8sBaseManager):
         Returns:
             List of node summaries.
         """
+        items = [item for page in self.iter_nodes(label_selector=label_selector) for item in page]
+        self._log.debug("listed_nodes", count=len(items))
+        return items
+
+    def iter_nodes(
+        self,
+        *,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[NodeSummary]]:
+        """Stream all nodes page by page.
+
+        Args:
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of node summaries.
+        """
         self._log.debug("listing_nodes")
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            result = self._client.core_v1.list_node(**kwargs)
-            items = [NodeSummary.from_k8s_object(node) for node in result.items]
-            self._log.debug("listed_nodes", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "Node", None, None)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        list_call = self._client.core_v1.list_node
+        return self._iter_list_pages(
+            NodeSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Node",
+            informer="nodes",
+            chunk_size=chunk_size,
+        )
 
     def get_node(self, name: str) -> NodeSummary:
         """Get a single node by name.
@@ -213,29 +262,67 @@ class NamespaceClusterManager(K8sBaseManager):
         Returns:
             List of event summaries.
         """
+        items = [
+            item
+            for page in self.iter_events(
+                namespace,
+                all_namespaces=all_namespaces,
+                field_selector=field_selector,
+                involved_object=involved_object,
+            )
+            for item in page
+        ]
+        self._log.debug("listed_events", count=len(items))
+        return items
+
+    def iter_events(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        field_selector: str | None = None,
+        involved_object: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[EventSummary]]:
+        """Stream events page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            field_selector: Filter by field selector.
+            involved_object: Filter by involved object name
+                (adds involvedObject.name field selector).
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of event summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_events", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-
-            selectors = []
-            if field_selector:
-                selectors.append(field_selector)
-            if involved_object:
-                selectors.append(f"involvedObject.name={involved_object}")
-            if selectors:
-                kwargs["field_selector"] = ",".join(selectors)
-
-            if all_namespaces:
-                result = self._client.core_v1.list_event_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.core_v1.list_namespaced_event(namespace=ns, **kwargs)
-
-            items = [EventSummary.from_k8s_object(evt) for evt in result.items]
-            self._log.debug("listed_events", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "Event", None, ns)
+        kwargs: dict[str, Any] = {}
+
+        selectors = []
+        if field_selector:
+            selectors.append(field_selector)
+        if involved_object:
+            selectors.append(f"involvedObject.name={involved_object}")
+        if selectors:
+            kwargs["field_selector"] = ",".join(selectors)
+
+        if all_namespaces:
+            list_call = self._client.core_v1.list_event_for_all_namespaces
+        else:
+            list_call = partial(self._client.core_v1.list_namespaced_event, namespace=ns)
+        return self._iter_list_pages(
+            EventSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Event",
+            namespace=None if all_namespaces else ns,
+            informer="events",
+            chunk_size=chunk_size,
+            json_convert=EventSummary.from_json,
+        )
 
     # =========================================================================
     # Cluster Info
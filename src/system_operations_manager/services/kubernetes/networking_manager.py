@@ -5,6 +5,8 @@ Manages Services, Ingresses, and NetworkPolicies through the Kubernetes API.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.networking import (
@@ -12,7 +14,10 @@ from system_operations_manager.integrations.kubernetes.models.networking import
     NetworkPolicySummary,
     ServiceSummary,
 )
-from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.base import (
+    DEFAULT_LIST_CHUNK_SIZE,
+    K8sBaseManager,
+)
 
 
 class NetworkingManager(K8sBaseManager):
@@ -44,23 +49,54 @@ class NetworkingManager(K8sBaseManager):
         Returns:
             List of service summaries.
         """
+        items = [
+            item
+            for page in self.iter_services(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_services", count=len(items))
+        return items
+
+    def iter_services(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[ServiceSummary]]:
+        """Stream services page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of service summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_services", namespace=ns, all_namespaces=all_namespaces)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.core_v1.list_service_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.core_v1.list_namespaced_service(namespace=ns, **kwargs)
-
-            services = [ServiceSummary.from_k8s_object(svc) for svc in result.items]
-            self._log.debug("listed_services", count=len(services))
-            return services
-        except Exception as e:
-            self._handle_api_error(e, "Service", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.core_v1.list_service_for_all_namespaces
+        else:
+            list_call = partial(self._client.core_v1.list_namespaced_service, namespace=ns)
+        return self._iter_list_pages(
+            ServiceSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Service",
+            namespace=None if all_namespaces else ns,
+            informer="services",
+            chunk_size=chunk_size,
+        )
 
     def get_service(self, name: str, namespace: str | None = None) -> ServiceSummary:
         """Get a single service by name.
@@ -224,23 +260,54 @@ class NetworkingManager(K8sBaseManager):
         Returns:
             List of ingress summaries.
         """
+        items = [
+            item
+            for page in self.iter_ingresses(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_ingresses", count=len(items))
+        return items
+
+    def iter_ingresses(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[IngressSummary]]:
+        """Stream ingresses page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of ingress summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_ingresses", namespace=ns, all_namespaces=all_namespaces)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.networking_v1.list_ingress_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.networking_v1.list_namespaced_ingress(namespace=ns, **kwargs)
-
-            items = [IngressSummary.from_k8s_object(ing) for ing in result.items]
-            self._log.debug("listed_ingresses", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "Ingress", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.networking_v1.list_ingress_for_all_namespaces
+        else:
+            list_call = partial(self._client.networking_v1.list_namespaced_ingress, namespace=ns)
+        return self._iter_list_pages(
+            IngressSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Ingress",
+            namespace=None if all_namespaces else ns,
+            informer="ingresses",
+            chunk_size=chunk_size,
+        )
 
     def get_ingress(self, name: str, namespace: str | None = None) -> IngressSummary:
         """Get a single ingress by name.
@@ -449,25 +516,56 @@ class NetworkingManager(K8sBaseManager):
         Returns:
             List of network policy summaries.
         """
+        items = [
+            item
+            for page in self.iter_network_policies(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_network_policies", count=len(items))
+        return items
+
+    def iter_network_policies(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[NetworkPolicySummary]]:
+        """Stream network policies page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of network policy summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_network_policies", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.networking_v1.list_network_policy_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.networking_v1.list_namespaced_network_policy(
-                    namespace=ns, **kwargs
-                )
-
-            items = [NetworkPolicySummary.from_k8s_object(np) for np in result.items]
-            self._log.debug("listed_network_policies", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "NetworkPolicy", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.networking_v1.list_network_policy_for_all_namespaces
+        else:
+            list_call = partial(
+                self._client.networking_v1.list_namespaced_network_policy, namespace=ns
+            )
+        return self._iter_list_pages(
+            NetworkPolicySummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="NetworkPolicy",
+            namespace=None if all_namespaces else ns,
+            informer="network_policies",
+            chunk_size=chunk_size,
+        )
 
     def get_network_policy(self, name: str, namespace: str | None = None) -> NetworkPolicySummary:
         """Get a single network policy by name.
@@ -7,7 +7,8 @@ metrics-server API.
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.optimization import (
@@ -17,9 +18,15 @@ from system_operations_manager.integrations.kubernetes.models.optimization impor
     ResourceSpec,
     RightsizingRecommendation,
     StaleJob,
+    UsagePercentiles,
     WorkloadResourceAnalysis,
 )
 from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.usage_history import (
+    UsageHistory,
+    UsageSample,
+    usage_percentiles,
+)
 
 # =============================================================================
 # Constants
@@ -32,10 +39,106 @@ DEFAULT_STALE_JOB_HOURS = 24
 IDLE_CPU_MILLICORES = 1
 IDLE_MEMORY_BYTES = 1048576  # 1Mi
 
+# Sampled history considered by default when history is used
+DEFAULT_HISTORY_WINDOW = timedelta(hours=24)
+
 METRICS_API_GROUP = "metrics.k8s.io"
 METRICS_API_VERSION = "v1beta1"
 
 
+# Workload kinds that own their pods directly (Deployments go through ReplicaSets)
+DIRECT_POD_OWNERS = frozenset({"StatefulSet", "DaemonSet"})
+
+
+class _WorkloadPodIndex:
+    """Join pods to the workloads that own them from one pod listing.
+
+    Pods are matched to their controller through owner references, with
+    ReplicaSets resolved to the Deployment that owns them. Workloads whose
+    pods cannot be found that way (e.g. when ReplicaSets could not be
+    listed) fall back to matching their selector's ``matchLabels`` against
+    an inverted label index, so no lookup scans every pod.
+    """
+
+    def __init__(self, pods: Iterable[Any], replica_sets: Iterable[Any] = ()) -> None:
+        """Build the index.
+
+        Args:
+            pods: Pod objects from a namespace or cluster-wide listing.
+            replica_sets: ReplicaSet objects from the same scope.
+        """
+        rs_owners: dict[tuple[str, str], tuple[str, str]] = {}
+        for rs in replica_sets:
+            owner = _controller_ref(rs)
+            ns = _safe_nested_get(rs, "metadata", "namespace")
+            name = _safe_nested_get(rs, "metadata", "name")
+            if owner and ns and name:
+                rs_owners[(ns, name)] = owner
+
+        self._owned: dict[tuple[str, str, str], list[str]] = {}
+        self._owners: dict[str, tuple[str, str]] = {}
+        self._labels: dict[tuple[str, str, str], set[str]] = {}
+        for pod in pods:
+            ns = _safe_nested_get(pod, "metadata", "namespace")
+            name = _safe_nested_get(pod, "metadata", "name")
+            if not ns or not name:
+                continue
+            key = f"{ns}/{name}"
+
+            for label, value in (_safe_nested_get(pod, "metadata", "labels") or {}).items():
+                self._labels.setdefault((ns, label, value), set()).add(key)
+
+            owner = _controller_ref(pod)
+            if owner is None:
+                continue
+            kind, owner_name = owner
+            if kind == "ReplicaSet":
+                owner = rs_owners.get((ns, owner_name))
+                if owner is None or owner[0] != "Deployment":
+                    continue
+                kind, owner_name = owner
+            elif kind not in DIRECT_POD_OWNERS:
+                continue
+            self._owned.setdefault((kind, ns, owner_name), []).append(key)
+            self._owners[key] = (kind, owner_name)
+
+    def owner_of(self, pod_key: str) -> tuple[str, str] | None:
+        """Get the (kind, name) of the workload owning a ``namespace/pod-name`` key."""
+        return self._owners.get(pod_key)
+
+    def pods_for(
+        self,
+        kind: str,
+        namespace: str,
+        name: str,
+        match_labels: dict[str, str] | None,
+    ) -> Iterable[str]:
+        """Get the ``namespace/pod-name`` keys of a workload's pods.
+
+        Args:
+            kind: Workload kind (Deployment, StatefulSet, DaemonSet).
+            namespace: Workload namespace.
+            name: Workload name.
+            match_labels: The workload's selector ``matchLabels``.
+
+        Returns:
+            Pod keys owned by the workload, or matching its selector.
+        """
+        owned = self._owned.get((kind, namespace, name))
+        if owned:
+            return owned
+        if not match_labels:
+            return ()
+        candidates = sorted(
+            (
+                self._labels.get((namespace, label, value), set())
+                for label, value in match_labels.items()
+            ),
+            key=len,
+        )
+        return candidates[0].intersection(*candidates[1:])
+
+
 class OptimizationManager(K8sBaseManager):
     """Manager for Kubernetes resource optimization analysis.
 
@@ -146,15 +249,25 @@ class OptimizationManager(K8sBaseManager):
         all_namespaces: bool = False,
         label_selector: str | None = None,
         threshold: float = UNDERUTILIZED_CPU_THRESHOLD,
+        history: UsageHistory | None = None,
+        window: timedelta = DEFAULT_HISTORY_WINDOW,
     ) -> list[WorkloadResourceAnalysis]:
         """Analyze resource usage vs requests for controller-managed workloads.
 
-        Covers Deployments, StatefulSets, and DaemonSets.
+        Covers Deployments, StatefulSets, and DaemonSets. Pods and ReplicaSets
+        are listed once for the whole scope and joined to workloads in memory,
+        so the number of API calls does not grow with the number of workloads.
+
+        With ``history``, a workload's usage is its sampled p95 per-pod usage
+        over ``window`` times its replica count, instead of the current
+        metrics-server snapshot. Workloads without samples use the snapshot.
         """
         ns = self._resolve_namespace(namespace)
         self._log.info("analyzing_workloads", namespace=ns, all_namespaces=all_namespaces)
 
         pod_metrics = self._fetch_pod_metrics(namespace=namespace, all_namespaces=all_namespaces)
+        pod_index = self._build_pod_index(ns, all_namespaces)
+        since = datetime.now(UTC) - window
         analyses: list[WorkloadResourceAnalysis] = []
 
         for kind, list_fn, replica_fn in self._workload_list_fns(
@@ -162,7 +275,14 @@ class OptimizationManager(K8sBaseManager):
         ):
             for workload in list_fn():
                 analysis = self._analyze_single_workload(
-                    workload, kind, pod_metrics, replica_fn, threshold
+                    workload,
+                    kind,
+                    pod_metrics,
+                    replica_fn,
+                    threshold,
+                    pod_index=pod_index,
+                    history=history,
+                    since=since,
                 )
                 if analysis:
                     analyses.append(analysis)
@@ -176,8 +296,16 @@ class OptimizationManager(K8sBaseManager):
         namespace: str | None = None,
         *,
         workload_type: str = "Deployment",
+        history: UsageHistory | None = None,
+        window: timedelta = DEFAULT_HISTORY_WINDOW,
     ) -> RightsizingRecommendation:
-        """Get a right-sizing recommendation for a specific workload."""
+        """Get a right-sizing recommendation for a specific workload.
+
+        Without history, requests are the current usage plus a safety buffer.
+        With ``history`` and samples for the workload within ``window``,
+        requests follow p95 per-pod usage and limits also cover the observed
+        peak, both scaled by the replica count.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.info("generating_recommendation", name=name, namespace=ns, kind=workload_type)
 
@@ -190,10 +318,27 @@ class OptimizationManager(K8sBaseManager):
         selector = self._get_workload_pod_selector(workload)
         total_usage = self._sum_pod_usage(pod_metrics, ns, selector)
 
-        rec_cpu_req = max(1, int(total_usage.cpu_millicores * OVERPROVISIONED_BUFFER))
-        rec_mem_req = max(1048576, int(total_usage.memory_bytes * OVERPROVISIONED_BUFFER))
-        rec_cpu_lim = max(rec_cpu_req, int(rec_cpu_req * 2))
-        rec_mem_lim = max(rec_mem_req, int(rec_mem_req * 1.5))
+        percentiles: UsagePercentiles | None = None
+        if history is not None:
+            since = datetime.now(UTC) - window
+            percentiles = usage_percentiles(
+                history.workload_series(ns, workload_type, name, since=since)
+            )
+
+        if percentiles is not None:
+            cpu_basis = percentiles.cpu_p95_millicores * replicas
+            mem_basis = percentiles.memory_p95_bytes * replicas
+            cpu_peak = percentiles.cpu_max_millicores * replicas
+            mem_peak = int(percentiles.memory_max_bytes * replicas * OVERPROVISIONED_BUFFER)
+        else:
+            cpu_basis = total_usage.cpu_millicores
+            mem_basis = total_usage.memory_bytes
+            cpu_peak = mem_peak = 0
+
+        rec_cpu_req = max(1, int(cpu_basis * OVERPROVISIONED_BUFFER))
+        rec_mem_req = max(1048576, int(mem_basis * OVERPROVISIONED_BUFFER))
+        rec_cpu_lim = max(rec_cpu_req, int(rec_cpu_req * 2), cpu_peak)
+        rec_mem_lim = max(rec_mem_req, int(rec_mem_req * 1.5), mem_peak)
 
         return RightsizingRecommendation(
             name=name,
@@ -207,8 +352,50 @@ class OptimizationManager(K8sBaseManager):
             recommended_memory_limit_bytes=rec_mem_lim,
             cpu_savings_millicores=max(0, current_spec.cpu_request_millicores - rec_cpu_req),
             memory_savings_bytes=max(0, current_spec.memory_request_bytes - rec_mem_req),
+            usage_percentiles=percentiles,
         )
 
+    def sample_usage(
+        self,
+        history: UsageHistory,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+    ) -> int:
+        """Record one round of pod usage from metrics-server into ``history``.
+
+        Each pod is filed under the workload that owns it, so percentiles can
+        later be computed per workload across pod restarts. Pods without a
+        Deployment, StatefulSet or DaemonSet owner are not recorded.
+
+        Returns:
+            Number of pod samples recorded.
+        """
+        ns = self._resolve_namespace(namespace)
+        pod_metrics = self._fetch_pod_metrics(namespace=namespace, all_namespaces=all_namespaces)
+        pod_index = self._build_pod_index(ns, all_namespaces)
+
+        samples: list[UsageSample] = []
+        for key, metrics in pod_metrics.items():
+            owner = pod_index.owner_of(key)
+            if owner is None:
+                continue
+            pod_ns, _, pod_name = key.partition("/")
+            samples.append(
+                UsageSample(
+                    pod_ns,
+                    owner[0],
+                    owner[1],
+                    pod_name,
+                    metrics.cpu_millicores,
+                    metrics.memory_bytes,
+                )
+            )
+
+        recorded = history.record(samples, timestamp=datetime.now(UTC))
+        self._log.info("usage_sampled", namespace=ns, pods=recorded)
+        return recorded
+
     def find_unused(
         self,
         namespace: str | None = None,
@@ -329,8 +516,17 @@ class OptimizationManager(K8sBaseManager):
         pod_metrics: dict[str, ResourceMetrics],
         replica_fn: Any,
         threshold: float,
+        *,
+        pod_index: _WorkloadPodIndex | None = None,
+        history: UsageHistory | None = None,
+        since: datetime | None = None,
     ) -> WorkloadResourceAnalysis | None:
-        """Analyze a single workload against its pod metrics."""
+        """Analyze a single workload against its pod metrics.
+
+        Pods are looked up in ``pod_index`` when given; otherwise they are
+        listed from the API by the workload's selector. Sampled p95 usage
+        from ``history`` takes precedence over the snapshot when available.
+        """
         name = _safe_nested_get(workload, "metadata", "name")
         ns = _safe_nested_get(workload, "metadata", "namespace")
         if not name or not ns:
@@ -340,8 +536,22 @@ class OptimizationManager(K8sBaseManager):
         pod_template = _safe_nested_get(workload, "spec", "template")
         spec = self._aggregate_resource_spec(pod_template, replicas)
 
-        selector = self._get_workload_pod_selector(workload)
-        usage = self._sum_pod_usage(pod_metrics, ns, selector)
+        percentiles = (
+            usage_percentiles(history.workload_series(ns, kind, name, since=since))
+            if history is not None
+            else None
+        )
+        if percentiles is not None:
+            usage = ResourceMetrics(
+                cpu_millicores=percentiles.cpu_p95_millicores * replicas,
+                memory_bytes=percentiles.memory_p95_bytes * replicas,
+            )
+        elif pod_index is not None:
+            match_labels = _safe_nested_get(workload, "spec", "selector", "match_labels")
+            usage = _sum_metrics(pod_metrics, pod_index.pods_for(kind, ns, name, match_labels))
+        else:
+            selector = self._get_workload_pod_selector(workload)
+            usage = self._sum_pod_usage(pod_metrics, ns, selector)
 
         cpu_util = (
             (usage.cpu_millicores / spec.cpu_request_millicores)
@@ -415,14 +625,38 @@ class OptimizationManager(K8sBaseManager):
         except Exception:
             pod_names = set()
 
-        total_cpu = 0
-        total_mem = 0
-        for key, m in pod_metrics.items():
-            if key in pod_names:
-                total_cpu += m.cpu_millicores
-                total_mem += m.memory_bytes
+        return _sum_metrics(pod_metrics, pod_names)
+
+    def _build_pod_index(self, namespace: str, all_namespaces: bool) -> _WorkloadPodIndex:
+        """List pods and ReplicaSets once and index them by owning workload.
+
+        Listing failures degrade to an empty index (zero usage), matching
+        the per-workload lookup in _sum_pod_usage.
+        """
+        try:
+            if all_namespaces:
+                pods = self._client.core_v1.list_pod_for_all_namespaces().items or []
+            else:
+                pods = self._client.core_v1.list_namespaced_pod(namespace=namespace).items or []
+        except Exception as e:
+            self._log.warning("pod_listing_failed", namespace=namespace, error=str(e))
+            pods = []
+
+        try:
+            if all_namespaces:
+                replica_sets = self._client.apps_v1.list_replica_set_for_all_namespaces().items
+            else:
+                replica_sets = self._client.apps_v1.list_namespaced_replica_set(
+                    namespace=namespace
+                ).items
+        except Exception as e:
+            # Deployments then fall back to selector matching
+            self._log.warning("replica_set_listing_failed", namespace=namespace, error=str(e))
+            replica_sets = []
 
-        return ResourceMetrics(cpu_millicores=total_cpu, memory_bytes=total_mem)
+        index = _WorkloadPodIndex(pods, replica_sets or [])
+        self._log.debug("built_pod_index", pods=len(pods))
+        return index
 
     def _get_workload(self, name: str, namespace: str, kind: str) -> Any:
         """Fetch a single workload by name and kind."""
@@ -597,6 +831,35 @@ def _safe_nested_get(obj: Any, *attrs: str, default: Any = None) -> Any:
     return current if current is not None else default
 
 
+def _controller_ref(obj: Any) -> tuple[str, str] | None:
+    """Get the (kind, name) of an object's controlling owner, if any."""
+    refs = _safe_nested_get(obj, "metadata", "owner_references") or []
+    fallback: tuple[str, str] | None = None
+    for ref in refs:
+        kind = getattr(ref, "kind", None)
+        name = getattr(ref, "name", None)
+        if not kind or not name:
+            continue
+        if getattr(ref, "controller", None) is True:
+            return (kind, name)
+        fallback = fallback or (kind, name)
+    return fallback
+
+
+def _sum_metrics(
+    pod_metrics: dict[str, ResourceMetrics], pod_keys: Iterable[str]
+) -> ResourceMetrics:
+    """Sum the metrics of the given ``namespace/pod-name`` keys."""
+    total_cpu = 0
+    total_mem = 0
+    for key in pod_keys:
+        m = pod_metrics.get(key)
+        if m is not None:
+            total_cpu += m.cpu_millicores
+            total_mem += m.memory_bytes
+    return ResourceMetrics(cpu_millicores=total_cpu, memory_bytes=total_mem)
+
+
 def _get_replicas(workload: Any, kind: str) -> int:
     """Extract the effective replica count from a workload."""
     if kind == "DaemonSet":
@@ -6,6 +6,8 @@ and ClusterRoleBindings through the Kubernetes API.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.rbac import (
@@ -13,7 +15,10 @@ from system_operations_manager.integrations.kubernetes.models.rbac import (
     RoleSummary,
     ServiceAccountSummary,
 )
-from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.base import (
+    DEFAULT_LIST_CHUNK_SIZE,
+    K8sBaseManager,
+)
 
 
 class RBACManager(K8sBaseManager):
@@ -46,25 +51,53 @@ class RBACManager(K8sBaseManager):
         Returns:
             List of service account summaries.
         """
+        items = [
+            item
+            for page in self.iter_service_accounts(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_service_accounts", count=len(items))
+        return items
+
+    def iter_service_accounts(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[ServiceAccountSummary]]:
+        """Stream service accounts page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of service account summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_service_accounts", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.core_v1.list_service_account_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.core_v1.list_namespaced_service_account(
-                    namespace=ns, **kwargs
-                )
-
-            items = [ServiceAccountSummary.from_k8s_object(sa) for sa in result.items]
-            self._log.debug("listed_service_accounts", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "ServiceAccount", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.core_v1.list_service_account_for_all_namespaces
+        else:
+            list_call = partial(self._client.core_v1.list_namespaced_service_account, namespace=ns)
+        return self._iter_list_pages(
+            ServiceAccountSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="ServiceAccount",
+            namespace=None if all_namespaces else ns,
+            chunk_size=chunk_size,
+        )
 
     def get_service_account(self, name: str, namespace: str | None = None) -> ServiceAccountSummary:
         """Get a single service account by name.
@@ -151,19 +184,46 @@ class RBACManager(K8sBaseManager):
         Returns:
             List of role summaries.
         """
+        items = [
+            item
+            for page in self.iter_roles(namespace, label_selector=label_selector)
+            for item in page
+        ]
+        self._log.debug("listed_roles", count=len(items))
+        return items
+
+    def iter_roles(
+        self,
+        namespace: str | None = None,
+        *,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[RoleSummary]]:
+        """Stream roles in a namespace page by page.
+
+        Args:
+            namespace: Target namespace.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of role summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_roles", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            result = self._client.rbac_v1.list_namespaced_role(namespace=ns, **kwargs)
-            items = [RoleSummary.from_k8s_object(r) for r in result.items]
-            self._log.debug("listed_roles", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "Role", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        list_call = partial(self._client.rbac_v1.list_namespaced_role, namespace=ns)
+        return self._iter_list_pages(
+            RoleSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Role",
+            namespace=ns,
+            chunk_size=chunk_size,
+        )
 
     def get_role(self, name: str, namespace: str | None = None) -> RoleSummary:
         """Get a single role by name.
@@ -261,18 +321,40 @@ class RBACManager(K8sBaseManager):
         Returns:
             List of role summaries (with is_cluster_role=True).
         """
+        items = [
+            item for page in self.iter_cluster_roles(label_selector=label_selector) for item in page
+        ]
+        self._log.debug("listed_cluster_roles", count=len(items))
+        return items
+
+    def iter_cluster_roles(
+        self,
+        *,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[RoleSummary]]:
+        """Stream cluster roles page by page.
+
+        Args:
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of role summaries (with is_cluster_role=True).
+        """
         self._log.debug("listing_cluster_roles")
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            result = self._client.rbac_v1.list_cluster_role(**kwargs)
-            items = [RoleSummary.from_k8s_object(r, is_cluster_role=True) for r in result.items]
-            self._log.debug("listed_cluster_roles", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "ClusterRole", None, None)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        list_call = self._client.rbac_v1.list_cluster_role
+        return self._iter_list_pages(
+            lambda r: RoleSummary.from_k8s_object(r, is_cluster_role=True),
+            list_call,
+            kwargs,
+            resource_type="ClusterRole",
+            chunk_size=chunk_size,
+        )
 
     def get_cluster_role(self, name: str) -> RoleSummary:
         """Get a single cluster role by name.
@@ -364,19 +446,46 @@ class RBACManager(K8sBaseManager):
         Returns:
             List of role binding summaries.
         """
+        items = [
+            item
+            for page in self.iter_role_bindings(namespace, label_selector=label_selector)
+            for item in page
+        ]
+        self._log.debug("listed_role_bindings", count=len(items))
+        return items
+
+    def iter_role_bindings(
+        self,
+        namespace: str | None = None,
+        *,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[RoleBindingSummary]]:
+        """Stream role bindings in a namespace page by page.
+
+        Args:
+            namespace: Target namespace.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of role binding summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_role_bindings", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            result = self._client.rbac_v1.list_namespaced_role_binding(namespace=ns, **kwargs)
-            items = [RoleBindingSummary.from_k8s_object(rb) for rb in result.items]
-            self._log.debug("listed_role_bindings", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "RoleBinding", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        list_call = partial(self._client.rbac_v1.list_namespaced_role_binding, namespace=ns)
+        return self._iter_list_pages(
+            RoleBindingSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="RoleBinding",
+            namespace=ns,
+            chunk_size=chunk_size,
+        )
 
     def get_role_binding(self, name: str, namespace: str | None = None) -> RoleBindingSummary:
         """Get a single role binding by name.
@@ -484,21 +593,42 @@ class RBACManager(K8sBaseManager):
         Returns:
             List of role binding summaries (with is_cluster_binding=True).
         """
+        items = [
+            item
+            for page in self.iter_cluster_role_bindings(label_selector=label_selector)
+            for item in page
+        ]
+        self._log.debug("listed_cluster_role_bindings", count=len(items))
+        return items
+
+    def iter_cluster_role_bindings(
+        self,
+        *,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[RoleBindingSummary]]:
+        """Stream cluster role bindings page by page.
+
+        Args:
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of role binding summaries (with is_cluster_binding=True).
+        """
         self._log.debug("listing_cluster_role_bindings")
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            result = self._client.rbac_v1.list_cluster_role_binding(**kwargs)
-            items = [
-                RoleBindingSummary.from_k8s_object(rb, is_cluster_binding=True)
-                for rb in result.items
-            ]
-            self._log.debug("listed_cluster_role_bindings", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "ClusterRoleBinding", None, None)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        list_call = self._client.rbac_v1.list_cluster_role_binding
+        return self._iter_list_pages(
+            lambda rb: RoleBindingSummary.from_k8s_object(rb, is_cluster_binding=True),
+            list_call,
+            kwargs,
+            resource_type="ClusterRoleBinding",
+            chunk_size=chunk_size,
+        )
 
     def get_cluster_role_binding(self, name: str) -> RoleBindingSummary:
         """Get a single cluster role binding by name.
@@ -6,6 +6,8 @@ through the Kubernetes API.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.storage import (
@@ -13,7 +15,10 @@ from system_operations_manager.integrations.kubernetes.models.storage import (
     PersistentVolumeSummary,
     StorageClassSummary,
 )
-from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.base import (
+    DEFAULT_LIST_CHUNK_SIZE,
+    K8sBaseManager,
+)
 
 
 class StorageManager(K8sBaseManager):
@@ -42,18 +47,42 @@ class StorageManager(K8sBaseManager):
         Returns:
             List of persistent volume summaries.
         """
+        items = [
+            item
+            for page in self.iter_persistent_volumes(label_selector=label_selector)
+            for item in page
+        ]
+        self._log.debug("listed_persistent_volumes", count=len(items))
+        return items
+
+    def iter_persistent_volumes(
+        self,
+        *,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[PersistentVolumeSummary]]:
+        """Stream persistent volumes page by page.
+
+        Args:
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of persistent volume summaries.
+        """
         self._log.debug("listing_persistent_volumes")
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            result = self._client.core_v1.list_persistent_volume(**kwargs)
-            items = [PersistentVolumeSummary.from_k8s_object(pv) for pv in result.items]
-            self._log.debug("listed_persistent_volumes", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "PersistentVolume", None, None)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        list_call = self._client.core_v1.list_persistent_volume
+        return self._iter_list_pages(
+            PersistentVolumeSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="PersistentVolume",
+            chunk_size=chunk_size,
+        )
 
     def get_persistent_volume(self, name: str) -> PersistentVolumeSummary:
         """Get a single persistent volume by name.
@@ -105,27 +134,55 @@ class StorageManager(K8sBaseManager):
         Returns:
             List of PVC summaries.
         """
+        items = [
+            item
+            for page in self.iter_persistent_volume_claims(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_pvcs", count=len(items))
+        return items
+
+    def iter_persistent_volume_claims(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[PersistentVolumeClaimSummary]]:
+        """Stream persistent volume claims page by page.
+
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of PVC summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_pvcs", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-
-            if all_namespaces:
-                result = self._client.core_v1.list_persistent_volume_claim_for_all_namespaces(
-                    **kwargs
-                )
-            else:
-                result = self._client.core_v1.list_namespaced_persistent_volume_claim(
-                    namespace=ns, **kwargs
-                )
-
-            items = [PersistentVolumeClaimSummary.from_k8s_object(pvc) for pvc in result.items]
-            self._log.debug("listed_pvcs", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "PersistentVolumeClaim", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.core_v1.list_persistent_volume_claim_for_all_namespaces
+        else:
+            list_call = partial(
+                self._client.core_v1.list_namespaced_persistent_volume_claim, namespace=ns
+            )
+        return self._iter_list_pages(
+            PersistentVolumeClaimSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="PersistentVolumeClaim",
+            namespace=None if all_namespaces else ns,
+            chunk_size=chunk_size,
+        )
 
     def get_persistent_volume_claim(
         self, name: str, namespace: str | None = None
@@ -228,14 +285,34 @@ class StorageManager(K8sBaseManager):
         Returns:
             List of storage class summaries.
         """
+        items = [item for page in self.iter_storage_classes() for item in page]
+        self._log.debug("listed_storage_classes", count=len(items))
+        return items
+
+    def iter_storage_classes(
+        self,
+        *,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[StorageClassSummary]]:
+        """Stream storage classes page by page.
+
+        Args:
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of storage class summaries.
+        """
         self._log.debug("listing_storage_classes")
-        try:
-            result = self._client.storage_v1.list_storage_class()
-            items = [StorageClassSummary.from_k8s_object(sc) for sc in result.items]
-            self._log.debug("listed_storage_classes", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "StorageClass", None, None)
+        kwargs: dict[str, Any] = {}
+
+        list_call = self._client.storage_v1.list_storage_class
+        return self._iter_list_pages(
+            StorageClassSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="StorageClass",
+            chunk_size=chunk_size,
+        )
 
     def get_storage_class(self, name: str) -> StorageClassSummary:
         """Get a single storage class by name.
@@ -13,10 +13,54 @@ from system_operations_manager.integrations.kubernetes.exceptions import (
     KubernetesNotFoundError,
 )
 from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.log_multiplexer import (
+    DEFAULT_MAX_STREAMS,
+    LogLine,
+    LogMultiplexer,
+    LogTarget,
+    pod_log_opener,
+)
 
 if TYPE_CHECKING:
     pass
 
+# Workload kinds whose pods can be tailed together, keyed by accepted alias
+WORKLOAD_KINDS: dict[str, str] = {
+    "deployment": "Deployment",
+    "deploy": "Deployment",
+    "statefulset": "StatefulSet",
+    "sts": "StatefulSet",
+    "daemonset": "DaemonSet",
+    "ds": "DaemonSet",
+    "replicaset": "ReplicaSet",
+    "rs": "ReplicaSet",
+    "job": "Job",
+}
+
+# AppsV1Api reader for each apps/v1 workload kind
+_APPS_READERS = {
+    "Deployment": "read_namespaced_deployment",
+    "StatefulSet": "read_namespaced_stateful_set",
+    "DaemonSet": "read_namespaced_daemon_set",
+    "ReplicaSet": "read_namespaced_replica_set",
+}
+
+
+def _selector_to_string(selector: Any) -> str:
+    """Render a V1LabelSelector as a label selector query string."""
+    terms = [f"{k}={v}" for k, v in (selector.match_labels or {}).items()]
+    for expr in selector.match_expressions or []:
+        values = ",".join(expr.values or [])
+        if expr.operator == "In":
+            terms.append(f"{expr.key} in ({values})")
+        elif expr.operator == "NotIn":
+            terms.append(f"{expr.key} notin ({values})")
+        elif expr.operator == "Exists":
+            terms.append(expr.key)
+        elif expr.operator == "DoesNotExist":
+            terms.append(f"!{expr.key}")
+    return ",".join(terms)
+
 
 class StreamingManager(K8sBaseManager):
     """Manager for streaming Kubernetes operations.
@@ -149,6 +193,134 @@ class StreamingManager(K8sBaseManager):
             else:
                 yield str(line)
 
+    def stream_selector_logs(
+        self,
+        label_selector: str,
+        namespace: str | None = None,
+        *,
+        container: str | None = None,
+        follow: bool = False,
+        tail_lines: int | None = None,
+        since_seconds: int | None = None,
+        max_streams: int = DEFAULT_MAX_STREAMS,
+    ) -> Iterator[LogLine]:
+        """Tail every pod matching a label selector as one stream.
+
+        All containers of each matching pod (or only ``container``) are read
+        concurrently and interleaved by timestamp. While following, pods
+        that start matching later are picked up and read from their start.
+
+        Args:
+            label_selector: Label selector for the pods.
+            namespace: Target namespace.
+            container: Only read this container of each pod.
+            follow: Keep streaming new lines and new pods.
+            tail_lines: Lines from the end of each initial stream.
+            since_seconds: Only return logs newer than this many seconds.
+            max_streams: Maximum number of pod/container streams opened.
+
+        Returns:
+            Iterator of log lines tagged with their pod and container.
+
+        Raises:
+            KubernetesNotFoundError: If no pod matches and not following.
+        """
+        ns = self._resolve_namespace(namespace)
+        self._log.debug(
+            "streaming_selector_logs",
+            selector=label_selector,
+            namespace=ns,
+            follow=follow,
+            container=container,
+        )
+
+        def discover() -> tuple[list[LogTarget], bool]:
+            try:
+                pods = self._client.core_v1.list_namespaced_pod(
+                    namespace=ns,
+                    label_selector=label_selector,
+                )
+            except Exception as e:
+                self._handle_api_error(e, "Pod", f"(selector '{label_selector}')", ns)
+            targets = [
+                LogTarget(pod.metadata.name, c.name)
+                for pod in pods.items
+                # Pending pods have no container output to read yet
+                if pod.status is None or pod.status.phase != "Pending"
+                for c in pod.spec.containers
+                if container is None or c.name == container
+            ]
+            return targets, not follow
+
+        # Discover up front so a selector matching nothing fails here rather
+        # than in the middle of iteration
+        initial = discover()
+        if not initial[0] and not follow:
+            raise KubernetesNotFoundError(
+                resource_type="Pod",
+                resource_name=f"(selector '{label_selector}')",
+                namespace=ns,
+            )
+        pending = [initial]
+
+        mux = LogMultiplexer(
+            pod_log_opener(
+                self._client.core_v1,
+                ns,
+                follow=follow,
+                tail_lines=tail_lines,
+                since_seconds=since_seconds,
+            ),
+            lambda: pending.pop() if pending else discover(),
+            max_streams=max_streams,
+        )
+        return iter(mux)
+
+    def resolve_workload_selector(
+        self,
+        kind: str,
+        name: str,
+        namespace: str | None = None,
+    ) -> str:
+        """Resolve a workload to the label selector of its pods.
+
+        Args:
+            kind: Workload kind or alias (e.g. ``deployment``, ``sts``, ``job``).
+            name: Workload name.
+            namespace: Target namespace.
+
+        Returns:
+            Label selector query string matching the workload's pods.
+
+        Raises:
+            ValueError: If the kind is not a supported workload kind.
+            KubernetesNotFoundError: If the workload has no pod selector.
+        """
+        resource_type = WORKLOAD_KINDS.get(kind.lower())
+        if resource_type is None:
+            raise ValueError(f"Unsupported workload kind '{kind}'")
+        ns = self._resolve_namespace(namespace)
+        self._log.debug("resolving_workload_selector", kind=resource_type, name=name, namespace=ns)
+
+        try:
+            if resource_type == "Job":
+                workload = self._client.batch_v1.read_namespaced_job(name=name, namespace=ns)
+            else:
+                read = getattr(self._client.apps_v1, _APPS_READERS[resource_type])
+                workload = read(name=name, namespace=ns)
+        except Exception as e:
+            self._handle_api_error(e, resource_type, name, ns)
+
+        selector = workload.spec.selector
+        label_selector = _selector_to_string(selector) if selector else ""
+        if not label_selector:
+            raise KubernetesNotFoundError(
+                resource_type="Pod",
+                resource_name=f"(selector of {resource_type} '{name}')",
+                namespace=ns,
+            )
+        return label_selector
+
     # =========================================================================
     # Exec
     # =========================================================================
@@ -0,0 +1,359 @@
+"""On-disk ring buffers of sampled pod resource usage.
+
+metrics-server only exposes the latest usage of each pod. To base
+right-sizing on percentiles instead of a single snapshot, a sampler polls it
+periodically and appends each pod's usage to a fixed-size ring buffer file.
+
+Each file holds three array-backed columns (timestamp, CPU millicores,
+memory bytes) behind a small header, so a sample costs 16 bytes on disk,
+files never grow past their capacity, and reading a window is a handful of
+bulk array operations rather than per-sample parsing.
+
+Files are grouped by the workload that owned the pod when it was sampled::
+
+    <directory>/<namespace>/<Kind>/<workload>/<pod>.usage
+
+so a workload's history survives pod restarts and rollouts, and old pod
+files are removed with prune().
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+import structlog
+
+from system_operations_manager.integrations.kubernetes.models.optimization import (
+    UsagePercentiles,
+)
+
+logger = structlog.get_logger()
+
+# Default history location following XDG spec
+DEFAULT_USAGE_HISTORY_DIR = Path.home() / ".local" / "state" / "ops" / "k8s_usage"
+
+# 24 hours at the default 30 second sampling interval
+DEFAULT_CAPACITY = 2880
+
+USAGE_FILE_SUFFIX = ".usage"
+
+# magic, version, reserved, capacity, count, head
+_HEADER = struct.Struct("<4sHHIII")
+_MAGIC = b"OPUH"
+_VERSION = 1
+
+# Column typecodes: epoch seconds, CPU millicores, memory bytes
+_COLUMNS = ("I", "I", "Q")
+_SWAP = sys.byteorder != "little"
+
+
+class UsageSample(NamedTuple):
+    """One pod's usage at sampling time, keyed by its owning workload."""
+
+    namespace: str
+    kind: str
+    workload: str
+    pod: str
+    cpu_millicores: int
+    memory_bytes: int
+
+
+@dataclass(slots=True)
+class UsageSeries:
+    """Usage samples in chronological order (or pooled across pods).
+
+    Attributes:
+        timestamps: Epoch seconds of each sample.
+        cpu: CPU usage in millicores.
+        memory: Memory usage in bytes.
+    """
+
+    timestamps: array[int] = field(default_factory=lambda: array("I"))
+    cpu: array[int] = field(default_factory=lambda: array("I"))
+    memory: array[int] = field(default_factory=lambda: array("Q"))
+
+    def __len__(self) -> int:
+        """Get the number of samples."""
+        return len(self.timestamps)
+
+    def extend(self, other: UsageSeries) -> None:
+        """Append another series' samples."""
+        self.timestamps.extend(other.timestamps)
+        self.cpu.extend(other.cpu)
+        self.memory.extend(other.memory)
+
+
+def _nearest_rank(ordered: list[int], q: float) -> int:
+    """Get the nearest-rank quantile of a sorted, non-empty list."""
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def usage_percentiles(series: UsageSeries) -> UsagePercentiles | None:
+    """Compute p50, p95 and max of a usage series.
+
+    Each column is sorted once and every percentile is read by index
+    (nearest-rank method).
+
+    Args:
+        series: Samples to summarize (typically pooled across a workload's pods).
+
+    Returns:
+        The percentiles, or None if the series is empty.
+    """
+    if not len(series):
+        return None
+    cpu = sorted(series.cpu)
+    memory = sorted(series.memory)
+    return UsagePercentiles(
+        samples=len(series),
+        cpu_p50_millicores=_nearest_rank(cpu, 0.5),
+        cpu_p95_millicores=_nearest_rank(cpu, 0.95),
+        cpu_max_millicores=cpu[-1],
+        memory_p50_bytes=_nearest_rank(memory, 0.5),
+        memory_p95_bytes=_nearest_rank(memory, 0.95),
+        memory_max_bytes=memory[-1],
+    )
+
+
+class _RingFile:
+    """Fixed-capacity columnar ring buffer stored in one file."""
+
+    def __init__(self, f: BinaryIO, capacity: int, count: int, head: int) -> None:
+        self._f = f
+        self.capacity = capacity
+        self.count = count
+        self.head = head
+        sizes = [array(code).itemsize * capacity for code in _COLUMNS]
+        self._offsets = [_HEADER.size + sum(sizes[:i]) for i in range(len(_COLUMNS))]
+
+    @classmethod
+    def create(cls, f: BinaryIO, capacity: int) -> _RingFile:
+        """Initialize an empty ring in a new file."""
+        ring = cls(f, capacity, 0, 0)
+        ring._write_header()
+        f.truncate(ring._offsets[-1] + array(_COLUMNS[-1]).itemsize * capacity)
+        return ring
+
+    @classmethod
+    def open(cls, f: BinaryIO) -> _RingFile | None:
+        """Load a ring from an existing file, or None if it is not one."""
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return None
+        magic, version, _, capacity, count, head = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION or not capacity or head >= capacity:
+            return None
+        return cls(f, capacity, min(count, capacity), head)
+
+    def _write_header(self) -> None:
+        self._f.seek(0)
+        self._f.write(_HEADER.pack(_MAGIC, _VERSION, 0, self.capacity, self.count, self.head))
+
+    def append(self, timestamp: int, cpu: int, memory: int) -> None:
+        """Write one sample over the oldest slot."""
+        for offset, code, value in zip(
+            self._offsets, _COLUMNS, (timestamp, cpu, memory), strict=True
+        ):
+            cell = array(code, [value])
+            if _SWAP:
+                cell.byteswap()
+            self._f.seek(offset + self.head * cell.itemsize)
+            self._f.write(cell.tobytes())
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self._write_header()
+
+    def read(self) -> UsageSeries:
+        """Load every stored sample in chronological order."""
+        columns = []
+        for offset, code in zip(self._offsets, _COLUMNS, strict=True):
+            column = array(code)
+            self._f.seek(offset)
+            column.fromfile(self._f, self.capacity)
+            if _SWAP:
+                column.byteswap()
+            if self.count < self.capacity:
+                column = column[: self.count]
+            else:
+                column = column[self.head :] + column[: self.head]
+            columns.append(column)
+        return UsageSeries(*columns)
+
+
+class UsageHistory:
+    """Directory of per-pod usage ring buffers.
+
+    The history is designed for a single sampling process; readers can run
+    concurrently and at worst miss the sample being written.
+
+    Example:
+        >>> history = UsageHistory(Path("/var/lib/ops/usage"))
+        >>> history.record(samples, timestamp=now)
+        >>> series = history.workload_series("prod", "Deployment", "web", since=day_ago)
+        >>> usage_percentiles(series)
+    """
+
+    def __init__(
+        self, directory: Path = DEFAULT_USAGE_HISTORY_DIR, *, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """Initialize the history.
+
+        Args:
+            directory: Root directory for the ring buffer files.
+            capacity: Samples kept per pod when creating new files. Existing
+                files keep the capacity they were created with.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._directory = directory
+        self._capacity = capacity
+        self._log = logger.bind(service="usage_history", directory=str(directory))
+
+    @property
+    def directory(self) -> Path:
+        """Get the history directory."""
+        return self._directory
+
+    def _path(self, namespace: str, kind: str, workload: str, pod: str | None = None) -> Path:
+        path = self._directory / namespace / kind / workload
+        return path / f"{pod}{USAGE_FILE_SUFFIX}" if pod is not None else path
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def record(self, samples: Iterable[UsageSample], *, timestamp: datetime) -> int:
+        """Append one sampling round to the pods' ring buffers.
+
+        Args:
+            samples: Usage of each pod at ``timestamp``.
+            timestamp: Sampling time shared by every sample in the round.
+
+        Returns:
+            Number of samples written.
+        """
+        ts = int(timestamp.timestamp())
+        written = 0
+        for sample in samples:
+            path = self._path(sample.namespace, sample.kind, sample.workload, sample.pod)
+            with _open_ring(path, self._capacity) as ring:
+                ring.append(ts, sample.cpu_millicores, sample.memory_bytes)
+            written += 1
+        self._log.debug("usage_recorded", samples=written)
+        return written
+
+    def prune(self, before: datetime) -> int:
+        """Delete pod files whose newest sample is older than ``before``.
+
+        Args:
+            before: Cutoff time.
+
+        Returns:
+            Number of files removed.
+        """
+        cutoff = before.timestamp()
+        removed = 0
+        for path in self._directory.rglob(f"*{USAGE_FILE_SUFFIX}"):
+            series = _read_series(path)
+            if series is None or not len(series) or series.timestamps[-1] < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        # Drop directories emptied by the removal, deepest first
+        for directory in sorted(
+            self._directory.rglob("*"), key=lambda p: len(p.parts), reverse=True
+        ):
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+        if removed:
+            self._log.info("usage_history_pruned", files=removed)
+        return removed
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def pod_series(
+        self, namespace: str, kind: str, workload: str, pod: str, *, since: datetime | None = None
+    ) -> UsageSeries:
+        """Load one pod's samples, optionally limited to a window.
+
+        Returns:
+            The pod's samples in chronological order (empty if none).
+        """
+        series = _read_series(self._path(namespace, kind, workload, pod))
+        if series is None:
+            return UsageSeries()
+        return _since(series, since)
+
+    def workload_series(
+        self, namespace: str, kind: str, workload: str, *, since: datetime | None = None
+    ) -> UsageSeries:
+        """Pool the samples of every pod a workload has had.
+
+        Args:
+            namespace: Workload namespace.
+            kind: Workload kind (Deployment, StatefulSet, DaemonSet).
+            workload: Workload name.
+            since: Only include samples taken at or after this time.
+
+        Returns:
+            Per-pod samples concatenated across pods (not time-ordered).
+        """
+        pooled = UsageSeries()
+        for path in self._pod_files(namespace, kind, workload):
+            series = _read_series(path)
+            if series is not None:
+                pooled.extend(_since(series, since))
+        return pooled
+
+    def _pod_files(self, namespace: str, kind: str, workload: str) -> Iterator[Path]:
+        directory = self._path(namespace, kind, workload)
+        if directory.is_dir():
+            yield from directory.glob(f"*{USAGE_FILE_SUFFIX}")
+
+
+@contextmanager
+def _open_ring(path: Path, capacity: int) -> Iterator[_RingFile]:
+    """Open a ring file for writing, creating it (or replacing garbage) if needed."""
+    try:
+        f = path.open("r+b")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = path.open("w+b")
+    with f:
+        ring = _RingFile.open(f)
+        yield ring if ring is not None else _RingFile.create(f, capacity)
+
+
+def _read_series(path: Path) -> UsageSeries | None:
+    """Read a ring file, or None if it is missing or not a ring file."""
+    try:
+        with path.open("rb") as f:
+            ring = _RingFile.open(f)
+            return ring.read() if ring is not None else None
+    except FileNotFoundError, EOFError:
+        return None
+
+
+def _since(series: UsageSeries, since: datetime | None) -> UsageSeries:
+    """Slice a chronological series to samples at or after ``since``."""
+    if since is None:
+        return series
+    start = bisect_left(series.timestamps, since.timestamp())
+    if start == 0:
+        return series
+    return UsageSeries(series.timestamps[start:], series.cpu[start:], series.memory[start:])
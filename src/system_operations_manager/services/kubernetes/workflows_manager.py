@@ -7,6 +7,7 @@ through the Kubernetes ``CustomObjectsApi``.
 from __future__ import annotations
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.argo_workflows import (
@@ -16,6 +17,11 @@ from system_operations_manager.integrations.kubernetes.models.argo_workflows imp
     WorkflowTemplateSummary,
 )
 from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.log_multiplexer import (
+    LogMultiplexer,
+    LogTarget,
+    pod_log_opener,
+)
 
 # Argo Workflows CRD coordinates
 ARGO_WF_GROUP = "argoproj.io"
@@ -24,6 +30,12 @@ WORKFLOW_PLURAL = "workflows"
 WORKFLOW_TEMPLATE_PLURAL = "workflowtemplates"
 CRON_WORKFLOW_PLURAL = "cronworkflows"
 
+# Workflow phases after which no new step pods appear
+_FINISHED_PHASES = frozenset({"Succeeded", "Failed", "Error"})
+
+# Concurrent pod log reads for static workflow logs
+_LOG_FETCH_WORKERS = 8
+
 
 class WorkflowsManager(K8sBaseManager):
     """Manager for Argo Workflows resources.
@@ -180,6 +192,12 @@ class WorkflowsManager(K8sBaseManager):
     ) -> str | Iterator[str]:
         """Get logs for a Workflow's pods.
 
+        Static logs of all step pods are fetched concurrently and returned
+        per pod. In follow mode every step pod is streamed at once, lines
+        are interleaved by timestamp with a ``[pod/container]`` prefix, and
+        pods of steps that start later are picked up until the workflow
+        finishes.
+
         Args:
             name: Workflow name.
             namespace: Target namespace.
@@ -192,67 +210,69 @@ class WorkflowsManager(K8sBaseManager):
         ns = self._resolve_namespace(namespace)
         self._log.debug("getting_workflow_logs", name=name, namespace=ns, follow=follow)
         try:
-            # Get workflow to find its pods via status.nodes
-            wf = self._client.custom_objects.get_namespaced_custom_object(
-                ARGO_WF_GROUP,
-                ARGO_WF_VERSION,
-                ns,
-                WORKFLOW_PLURAL,
-                name,
-            )
-            status: dict[str, Any] = wf.get("status", {})
-            nodes: dict[str, Any] = status.get("nodes", {})
-
-            # Collect pod names from workflow nodes
-            pod_names: list[str] = []
-            for node_info in nodes.values():
-                if node_info.get("type") == "Pod":
-                    pod_name = node_info.get("id", "")
-                    if pod_name:
-                        pod_names.append(pod_name)
+            pod_names, finished = self._workflow_pods(name, ns)
 
-            if not pod_names:
+            if not pod_names and (finished or not follow):
                 return "No pods found for this workflow."
 
             if follow:
-                return self._stream_pod_logs(pod_names[-1], ns, container)
+                return self._follow_workflow_logs(name, ns, container, (pod_names, finished))
 
-            # Collect logs from all pods
-            all_logs: list[str] = []
-            for pod_name in pod_names:
+            def read(pod_name: str) -> str:
                 try:
                     log = self._client.core_v1.read_namespaced_pod_log(
                         name=pod_name,
                         namespace=ns,
                         container=container,
                     )
-                    all_logs.append(f"=== Pod: {pod_name} ===\n{log}")
+                    return f"=== Pod: {pod_name} ===\n{log}"
                 except Exception:
-                    all_logs.append(f"=== Pod: {pod_name} ===\n(logs unavailable)")
+                    return f"=== Pod: {pod_name} ===\n(logs unavailable)"
 
-            return "\n\n".join(all_logs)
+            workers = min(len(pod_names), _LOG_FETCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wf-logs") as pool:
+                return "\n\n".join(pool.map(read, pod_names))
         except Exception as e:
             self._handle_api_error(e, "Workflow", name, ns)
 
-    def _stream_pod_logs(
+    def _workflow_pods(self, name: str, namespace: str) -> tuple[list[str], bool]:
+        """Return a workflow's step pod names and whether it has finished."""
+        wf = self._client.custom_objects.get_namespaced_custom_object(
+            ARGO_WF_GROUP,
+            ARGO_WF_VERSION,
+            namespace,
+            WORKFLOW_PLURAL,
+            name,
+        )
+        status: dict[str, Any] = wf.get("status", {})
+        nodes: dict[str, Any] = status.get("nodes", {})
+        pod_names = [
+            node_info["id"]
+            for node_info in nodes.values()
+            if node_info.get("type") == "Pod" and node_info.get("id")
+        ]
+        return pod_names, status.get("phase") in _FINISHED_PHASES
+
+    def _follow_workflow_logs(
         self,
-        pod_name: str,
+        name: str,
         namespace: str,
         container: str,
+        initial: tuple[list[str], bool],
     ) -> Iterator[str]:
-        """Stream logs from a pod."""
-        stream = self._client.core_v1.read_namespaced_pod_log(
-            name=pod_name,
-            namespace=namespace,
-            container=container,
-            follow=True,
-            _preload_content=False,
+        """Stream all of a workflow's pods as one interleaved log."""
+        pending = [initial]
+
+        def discover() -> tuple[list[LogTarget], bool]:
+            pod_names, finished = pending.pop() if pending else self._workflow_pods(name, namespace)
+            return [LogTarget(pod_name, container) for pod_name in pod_names], finished
+
+        mux = LogMultiplexer(
+            pod_log_opener(self._client.core_v1, namespace, follow=True),
+            discover,
         )
-        for line in stream:
-            if isinstance(line, bytes):
-                yield line.decode("utf-8", errors="replace")
-            else:
-                yield str(line)
+        for line in mux:
+            yield line.format()
 
     # =========================================================================
     # WorkflowTemplate Operations
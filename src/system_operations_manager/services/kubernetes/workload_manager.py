@@ -7,7 +7,9 @@ actions like scale, restart, rollout status, and rollback.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
 from system_operations_manager.integrations.kubernetes.models.workloads import (
@@ -17,7 +19,10 @@ from system_operations_manager.integrations.kubernetes.models.workloads import (
     ReplicaSetSummary,
     StatefulSetSummary,
 )
-from system_operations_manager.services.kubernetes.base import K8sBaseManager
+from system_operations_manager.services.kubernetes.base import (
+    DEFAULT_LIST_CHUNK_SIZE,
+    K8sBaseManager,
+)
 
 
 class WorkloadManager(K8sBaseManager):
@@ -52,25 +57,62 @@ class WorkloadManager(K8sBaseManager):
         Returns:
             List of pod summaries.
         """
+        items = [
+            item
+            for page in self.iter_pods(
+                namespace,
+                all_namespaces=all_namespaces,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
+            for item in page
+        ]
+        self._log.debug("listed_pods", count=len(items))
+        return items
+
+    def iter_pods(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[PodSummary]]:
+        """Stream pods in a namespace or across all namespaces page by page.
+
+        Args:
+            namespace: Target namespace (uses default if None).
+            all_namespaces: List pods across all namespaces.
+            label_selector: Filter by label selector (e.g., 'app=nginx').
+            field_selector: Filter by field selector (e.g., 'status.phase=Running').
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of pod summaries.
+        """
         ns = self._resolve_namespace(namespace)
         self._log.debug("listing_pods", namespace=ns, all_namespaces=all_namespaces)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-            if field_selector:
-                kwargs["field_selector"] = field_selector
-
-            if all_namespaces:
-                result = self._client.core_v1.list_pod_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.core_v1.list_namespaced_pod(namespace=ns, **kwargs)
-
-            pods = [PodSummary.from_k8s_object(pod) for pod in result.items]
-            self._log.debug("listed_pods", count=len(pods))
-            return pods
-        except Exception as e:
-            self._handle_api_error(e, "Pod", None, ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+
+        if all_namespaces:
+            list_call = self._client.core_v1.list_pod_for_all_namespaces
+        else:
+            list_call = partial(self._client.core_v1.list_namespaced_pod, namespace=ns)
+        return self._iter_list_pages(
+            PodSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Pod",
+            namespace=None if all_namespaces else ns,
+            informer="pods",
+            chunk_size=chunk_size,
+            json_convert=PodSummary.from_json,
+        )
 
     def get_pod(self, name: str, namespace: str | None = None) -> PodSummary:
         """Get a single pod by name.
@@ -163,23 +205,55 @@ class WorkloadManager(K8sBaseManager):
         Returns:
             List of deployment summaries.
         """
-        ns = self._resolve_namespace(namespace)
-        self._log.debug("listing_deployments", namespace=ns, all_namespaces=all_namespaces)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
+        items = [
+            item
+            for page in self.iter_deployments(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_deployments", count=len(items))
+        return items
 
-            if all_namespaces:
-                result = self._client.apps_v1.list_deployment_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.apps_v1.list_namespaced_deployment(namespace=ns, **kwargs)
+    def iter_deployments(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[DeploymentSummary]]:
+        """Stream deployments page by page.
 
-            deployments = [DeploymentSummary.from_k8s_object(d) for d in result.items]
-            self._log.debug("listed_deployments", count=len(deployments))
-            return deployments
-        except Exception as e:
-            self._handle_api_error(e, "Deployment", None, ns)
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of deployment summaries.
+        """
+        ns = self._resolve_namespace(namespace)
+        self._log.debug("listing_deployments", namespace=ns, all_namespaces=all_namespaces)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.apps_v1.list_deployment_for_all_namespaces
+        else:
+            list_call = partial(self._client.apps_v1.list_namespaced_deployment, namespace=ns)
+        return self._iter_list_pages(
+            DeploymentSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="Deployment",
+            namespace=None if all_namespaces else ns,
+            informer="deployments",
+            chunk_size=chunk_size,
+            json_convert=DeploymentSummary.from_json,
+        )
 
     def get_deployment(self, name: str, namespace: str | None = None) -> DeploymentSummary:
         """Get a single deployment by name.
@@ -517,23 +591,55 @@ class WorkloadManager(K8sBaseManager):
         Returns:
             List of statefulset summaries.
         """
-        ns = self._resolve_namespace(namespace)
-        self._log.debug("listing_statefulsets", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
+        items = [
+            item
+            for page in self.iter_stateful_sets(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_statefulsets", count=len(items))
+        return items
 
-            if all_namespaces:
-                result = self._client.apps_v1.list_stateful_set_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.apps_v1.list_namespaced_stateful_set(namespace=ns, **kwargs)
+    def iter_stateful_sets(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[StatefulSetSummary]]:
+        """Stream statefulsets page by page.
 
-            items = [StatefulSetSummary.from_k8s_object(s) for s in result.items]
-            self._log.debug("listed_statefulsets", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "StatefulSet", None, ns)
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of statefulset summaries.
+        """
+        ns = self._resolve_namespace(namespace)
+        self._log.debug("listing_statefulsets", namespace=ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.apps_v1.list_stateful_set_for_all_namespaces
+        else:
+            list_call = partial(self._client.apps_v1.list_namespaced_stateful_set, namespace=ns)
+        return self._iter_list_pages(
+            StatefulSetSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="StatefulSet",
+            namespace=None if all_namespaces else ns,
+            informer="stateful_sets",
+            chunk_size=chunk_size,
+            json_convert=StatefulSetSummary.from_json,
+        )
 
     def get_stateful_set(self, name: str, namespace: str | None = None) -> StatefulSetSummary:
         """Get a single statefulset by name.
@@ -747,23 +853,55 @@ class WorkloadManager(K8sBaseManager):
         Returns:
             List of daemonset summaries.
         """
-        ns = self._resolve_namespace(namespace)
-        self._log.debug("listing_daemonsets", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
+        items = [
+            item
+            for page in self.iter_daemon_sets(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_daemonsets", count=len(items))
+        return items
 
-            if all_namespaces:
-                result = self._client.apps_v1.list_daemon_set_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.apps_v1.list_namespaced_daemon_set(namespace=ns, **kwargs)
+    def iter_daemon_sets(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[DaemonSetSummary]]:
+        """Stream daemonsets page by page.
 
-            items = [DaemonSetSummary.from_k8s_object(d) for d in result.items]
-            self._log.debug("listed_daemonsets", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "DaemonSet", None, ns)
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of daemonset summaries.
+        """
+        ns = self._resolve_namespace(namespace)
+        self._log.debug("listing_daemonsets", namespace=ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.apps_v1.list_daemon_set_for_all_namespaces
+        else:
+            list_call = partial(self._client.apps_v1.list_namespaced_daemon_set, namespace=ns)
+        return self._iter_list_pages(
+            DaemonSetSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="DaemonSet",
+            namespace=None if all_namespaces else ns,
+            informer="daemon_sets",
+            chunk_size=chunk_size,
+            json_convert=DaemonSetSummary.from_json,
+        )
 
     def get_daemon_set(self, name: str, namespace: str | None = None) -> DaemonSetSummary:
         """Get a single daemonset by name.
@@ -942,23 +1080,55 @@ class WorkloadManager(K8sBaseManager):
         Returns:
             List of replicaset summaries.
         """
-        ns = self._resolve_namespace(namespace)
-        self._log.debug("listing_replicasets", namespace=ns)
-        try:
-            kwargs: dict[str, Any] = {}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
+        items = [
+            item
+            for page in self.iter_replica_sets(
+                namespace, all_namespaces=all_namespaces, label_selector=label_selector
+            )
+            for item in page
+        ]
+        self._log.debug("listed_replicasets", count=len(items))
+        return items
 
-            if all_namespaces:
-                result = self._client.apps_v1.list_replica_set_for_all_namespaces(**kwargs)
-            else:
-                result = self._client.apps_v1.list_namespaced_replica_set(namespace=ns, **kwargs)
+    def iter_replica_sets(
+        self,
+        namespace: str | None = None,
+        *,
+        all_namespaces: bool = False,
+        label_selector: str | None = None,
+        chunk_size: int | None = DEFAULT_LIST_CHUNK_SIZE,
+    ) -> Iterator[list[ReplicaSetSummary]]:
+        """Stream replicasets page by page.
 
-            items = [ReplicaSetSummary.from_k8s_object(rs) for rs in result.items]
-            self._log.debug("listed_replicasets", count=len(items))
-            return items
-        except Exception as e:
-            self._handle_api_error(e, "ReplicaSet", None, ns)
+        Args:
+            namespace: Target namespace.
+            all_namespaces: List across all namespaces.
+            label_selector: Filter by label selector.
+            chunk_size: Objects per LIST request (None for a single request).
+
+        Yields:
+            Pages of replicaset summaries.
+        """
+        ns = self._resolve_namespace(namespace)
+        self._log.debug("listing_replicasets", namespace=ns)
+        kwargs: dict[str, Any] = {}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        if all_namespaces:
+            list_call = self._client.apps_v1.list_replica_set_for_all_namespaces
+        else:
+            list_call = partial(self._client.apps_v1.list_namespaced_replica_set, namespace=ns)
+        return self._iter_list_pages(
+            ReplicaSetSummary.from_k8s_object,
+            list_call,
+            kwargs,
+            resource_type="ReplicaSet",
+            namespace=None if all_namespaces else ns,
+            informer="replica_sets",
+            chunk_size=chunk_size,
+            json_convert=ReplicaSetSummary.from_json,
+        )
 
     def get_replica_set(self, name: str, namespace: str | None = None) -> ReplicaSetSummary:
         """Get a single replicaset by name.
@@ -277,10 +277,11 @@ class LogsManager:
                 end_time=end_time,
                 service=service,
             )
-        # Loki doesn't support aggregations natively
-        # Would need to implement a workaround
-        logger.warning("Status distribution not supported for Loki backend")
-        return {}
+        return self.loki_client.get_kong_status_distribution(
+            service=service,
+            start_time=start_time,
+            end_time=end_time,
+        )
 
     def get_service_distribution(
         self,
@@ -301,9 +302,10 @@ class LogsManager:
                 start_time=start_time,
                 end_time=end_time,
             )
-        # Loki doesn't support aggregations natively
-        logger.warning("Service distribution not supported for Loki backend")
-        return {}
+        return self.loki_client.get_kong_service_distribution(
+            start_time=start_time,
+            end_time=end_time,
+        )
 
     def count_logs(
         self,
@@ -327,10 +329,11 @@ class LogsManager:
                 end_time=end_time,
                 service=service,
             )
-        # Loki doesn't have a direct count endpoint
-        # Could estimate from rate queries
-        logger.warning("Log count not directly supported for Loki backend")
-        return 0
+        return self.loki_client.count_kong_logs(
+            service=service,
+            start_time=start_time,
+            end_time=end_time,
+        )
 
     def get_summary(
         self,
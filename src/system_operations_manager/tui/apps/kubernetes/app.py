@@ -78,9 +78,19 @@ class KubernetesApp(App[None]):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Push the initial resource list screen on mount."""
+        """Push the initial resource list screen on mount.
+
+        Informers are enabled for the lifetime of the app, so refreshing a
+        resource list or the dashboard reads a watch-maintained cache
+        instead of re-listing the cluster.
+        """
+        self._client.enable_informers()
         self.push_screen(ResourceListScreen(client=self._client))
 
+    def on_unmount(self) -> None:
+        """Stop the informers started for this app."""
+        self._client.disable_informers()
+
     async def action_quit(self) -> None:
         """Quit the application."""
         self.exit()
@@ -6,6 +6,7 @@ from system_operations_manager.utils.editor import (
     parse_merge_result,
     strip_json_comments,
 )
+from system_operations_manager.utils.fingerprint import canonical_json, fingerprint
 from system_operations_manager.utils.merge import (
     MergeAnalysis,
     MergeValidationResult,
@@ -13,15 +14,27 @@ from system_operations_manager.utils.merge import (
     compute_auto_merge,
     validate_merged_state,
 )
+from system_operations_manager.utils.pagination import (
+    MAX_PAGE_SIZE,
+    iter_items,
+    iter_pages,
+    validate_page_size,
+)
 
 __all__ = [
+    "MAX_PAGE_SIZE",
     "MergeAnalysis",
     "MergeValidationResult",
     "analyze_merge_potential",
+    "canonical_json",
     "compute_auto_merge",
     "create_merge_template",
+    "fingerprint",
     "get_editor",
+    "iter_items",
+    "iter_pages",
     "parse_merge_result",
     "strip_json_comments",
     "validate_merged_state",
+    "validate_page_size",
 ]
@@ -0,0 +1,90 @@
+"""Offset-token pagination helpers.
+
+Kong's Admin API and the Konnect control plane API page collections with an
+opaque ``offset`` token. This module turns any ``fetch_page(offset)`` callable
+into a page stream, optionally fetching the next page in a background thread
+while the caller consumes the current one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+MAX_PAGE_SIZE = 1000
+"""Largest page size accepted by the Kong Admin API and Konnect."""
+
+type PageFetcher[T] = Callable[[str | None], tuple[list[T], str | None]]
+
+
+def validate_page_size(page_size: int | None) -> int | None:
+    """Validate a requested page size.
+
+    Args:
+        page_size: Entities per page, or None for the server default.
+
+    Returns:
+        The validated page size.
+
+    Raises:
+        ValueError: If page_size is outside 1..MAX_PAGE_SIZE.
+    """
+    if page_size is not None and not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+    return page_size
+
+
+def iter_pages[T](fetch_page: PageFetcher[T], *, prefetch: bool = True) -> Iterator[list[T]]:
+    """Stream pages from an offset-paginated endpoint.
+
+    With ``prefetch`` enabled the request for page N+1 is issued as soon as
+    page N arrives, so network latency overlaps with the caller's processing.
+    At most one request is in flight, so requests for a single collection
+    are still issued strictly in order. Closing the generator early cancels
+    the pending request if it has not started.
+
+    Args:
+        fetch_page: Callable taking an offset token (None for the first page)
+            and returning (items, next_offset).
+        prefetch: Fetch the next page in the background.
+
+    Yields:
+        Lists of items, one per page. Empty pages are yielded as-is.
+
+    Example:
+        >>> for page in iter_pages(lambda offset: manager.list(offset=offset)):
+        ...     process(page)
+    """
+    if not prefetch:
+        offset: str | None = None
+        while True:
+            items, offset = fetch_page(offset)
+            yield items
+            if not offset:
+                return
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch") as pool:
+        pending: Future[tuple[list[T], str | None]] | None = pool.submit(fetch_page, None)
+        try:
+            while pending is not None:
+                items, next_offset = pending.result()
+                pending = pool.submit(fetch_page, next_offset) if next_offset else None
+                yield items
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+def iter_items[T](fetch_page: PageFetcher[T], *, prefetch: bool = True) -> Iterator[T]:
+    """Stream individual items from an offset-paginated endpoint.
+
+    Args:
+        fetch_page: Callable taking an offset token and returning
+            (items, next_offset).
+        prefetch: Fetch the next page in the background.
+
+    Yields:
+        Items in server order.
+    """
+    for page in iter_pages(fetch_page, prefetch=prefetch):
+        yield from page
@@ -0,0 +1,330 @@
+"""Streaming parser for the Prometheus text exposition format.
+
+Samples are yielded as lightweight tuples instead of validated models, and
+callers can push filters down into the parser: lines whose metric name does
+not match a prefix are rejected with a single ``startswith`` check before
+any label parsing, and label filters are pre-checked with a substring search
+before labels are split. Histogram series can be folded straight into
+cumulative bucket arrays for quantile estimation.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+_NAME_RE = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*")
+_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"')
+_ESCAPES = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+_ESCAPE_RE = re.compile(r'\\[\\"n]')
+
+# Suffixes Prometheus appends to histogram and summary sample names
+_FAMILY_SUFFIXES = ("_bucket", "_sum", "_count", "_total", "_created")
+
+
+class Sample(NamedTuple):
+    """A single parsed sample.
+
+    Attributes:
+        name: Sample name, including any _bucket/_sum/_count suffix.
+        labels: Label key-value pairs.
+        value: Sample value (NaN and +/-Inf are supported).
+    """
+
+    name: str
+    labels: dict[str, str]
+    value: float
+
+
+@dataclass(slots=True)
+class MetricFamily:
+    """Samples sharing one HELP/TYPE header.
+
+    Attributes:
+        name: Family name from the TYPE/HELP line (or the sample name).
+        type: Metric type (counter, gauge, histogram, summary, untyped).
+        help: HELP text, if any.
+        samples: Samples belonging to the family, in exposition order.
+    """
+
+    name: str
+    type: str = "untyped"
+    help: str | None = None
+    samples: list[Sample] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class HistogramBuckets:
+    """Cumulative histogram buckets aggregated across matching series.
+
+    Attributes:
+        bounds: Finite upper bounds in ascending order.
+        counts: Cumulative observation counts for each bound.
+        total: Total observations (the summed +Inf bucket).
+    """
+
+    bounds: list[float] = field(default_factory=list)
+    counts: list[float] = field(default_factory=list)
+    total: float = 0.0
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile by linear interpolation within buckets.
+
+        Args:
+            q: Quantile between 0.0 and 1.0.
+
+        Returns:
+            Estimated value, or None if there are no observations.
+        """
+        return histogram_quantile(self.bounds, self.counts, self.total, q)
+
+
+def _unescape(value: str) -> str:
+    """Resolve escape sequences in a label value."""
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group(0)], value)
+
+
+def parse_labels(labels: str) -> dict[str, str]:
+    """Parse the text between a sample's braces into a label dict.
+
+    Args:
+        labels: Label text, e.g. 'service="api",code="200"'.
+
+    Returns:
+        Label key-value pairs.
+    """
+    if "\\" not in labels:
+        return dict(_LABEL_RE.findall(labels))
+    return {key: _unescape(value) for key, value in _LABEL_RE.findall(labels)}
+
+
+def parse_sample(line: str) -> Sample | None:
+    """Parse one sample line.
+
+    Args:
+        line: Sample line such as 'kong_http_requests_total{code="200"} 12'.
+            An optional trailing timestamp is ignored.
+
+    Returns:
+        The parsed Sample, or None if the line is not a valid sample.
+    """
+    brace = line.find("{")
+    if brace == -1:
+        name, _, rest = line.partition(" ")
+        labels: dict[str, str] = {}
+    else:
+        close = line.rfind("}")
+        if close < brace:
+            return None
+        name, rest = line[:brace].rstrip(), line[close + 1 :]
+        labels = parse_labels(line[brace + 1 : close])
+
+    value_str = rest.split(None, 1)[0] if rest.strip() else ""
+    if not value_str or not _NAME_RE.fullmatch(name):
+        return None
+    try:
+        value = float(value_str)
+    except ValueError:
+        return None
+    return Sample(name, labels, value)
+
+
+def _lines(source: str | Iterable[str]) -> Iterable[str]:
+    """Split exposition text into lines, or pass an iterable of lines through."""
+    return source.splitlines() if isinstance(source, str) else source
+
+
+def _matches(labels: Mapping[str, str], match_labels: Mapping[str, str]) -> bool:
+    """Check that every required label has the expected value."""
+    return all(labels.get(key) == value for key, value in match_labels.items())
+
+
+def iter_samples(
+    source: str | Iterable[str],
+    *,
+    prefix: str | tuple[str, ...] | None = None,
+    match_labels: Mapping[str, str] | None = None,
+) -> Iterator[Sample]:
+    """Stream samples, skipping comments and non-matching lines cheaply.
+
+    Args:
+        source: Exposition text, or an iterable of lines (e.g. a streamed
+            HTTP response).
+        prefix: Only yield samples whose name starts with this prefix (or
+            any of these prefixes).
+        match_labels: Only yield samples carrying all of these label values.
+
+    Yields:
+        Matching samples in exposition order.
+
+    Example:
+        >>> for name, labels, value in iter_samples(text, prefix="kong_http_"):
+        ...     ...
+    """
+    needles = [f'{key}="{value}"' for key, value in (match_labels or {}).items()]
+    for raw in _lines(source):
+        line = raw.strip()
+        if not line or line[0] == "#":
+            continue
+        if prefix is not None and not line.startswith(prefix):
+            continue
+        if needles and not all(needle in line for needle in needles):
+            continue
+        sample = parse_sample(line)
+        if sample is None:
+            continue
+        if prefix is not None and not sample.name.startswith(prefix):
+            continue
+        if match_labels and not _matches(sample.labels, match_labels):
+            continue
+        yield sample
+
+
+def _family_name(sample_name: str, family: MetricFamily | None) -> str:
+    """Resolve the family a sample belongs to, falling back to its own name."""
+    if family is not None and sample_name.startswith(family.name):
+        suffix = sample_name[len(family.name) :]
+        if not suffix or suffix in _FAMILY_SUFFIXES:
+            return family.name
+    return sample_name
+
+
+def iter_families(
+    source: str | Iterable[str],
+    *,
+    prefix: str | tuple[str, ...] | None = None,
+    match_labels: Mapping[str, str] | None = None,
+) -> Iterator[MetricFamily]:
+    """Stream metric families with their HELP/TYPE metadata.
+
+    Families are yielded as soon as the next family starts, so memory is
+    bounded by the largest family rather than the whole exposition.
+    Families left without samples after filtering are not yielded.
+
+    Args:
+        source: Exposition text or an iterable of lines.
+        prefix: Only include samples whose name starts with this prefix.
+        match_labels: Only include samples carrying all of these label values.
+
+    Yields:
+        MetricFamily objects in exposition order.
+    """
+    needles = [f'{key}="{value}"' for key, value in (match_labels or {}).items()]
+    family: MetricFamily | None = None
+
+    for raw in _lines(source):
+        line = raw.strip()
+        if not line:
+            continue
+
+        if line[0] == "#":
+            parts = line.split(None, 3)
+            if len(parts) < 3 or parts[1] not in ("HELP", "TYPE"):
+                continue
+            name = parts[2]
+            if family is None or family.name != name:
+                if family is not None and family.samples:
+                    yield family
+                family = MetricFamily(name=name)
+            text = parts[3] if len(parts) > 3 else ""
+            if parts[1] == "HELP":
+                family.help = text or None
+            else:
+                family.type = text or "untyped"
+            continue
+
+        if prefix is not None and not line.startswith(prefix):
+            continue
+        if needles and not all(needle in line for needle in needles):
+            continue
+        sample = parse_sample(line)
+        if sample is None:
+            continue
+        if prefix is not None and not sample.name.startswith(prefix):
+            continue
+        if match_labels and not _matches(sample.labels, match_labels):
+            continue
+
+        name = _family_name(sample.name, family)
+        if family is None or family.name != name:
+            if family is not None and family.samples:
+                yield family
+            family = MetricFamily(name=name)
+        family.samples.append(sample)
+
+    if family is not None and family.samples:
+        yield family
+
+
+def histogram_buckets(
+    source: str | Iterable[str],
+    family: str,
+    *,
+    match_labels: Mapping[str, str] | None = None,
+) -> HistogramBuckets:
+    """Fold every matching ``<family>_bucket`` series into one bucket array.
+
+    Args:
+        source: Exposition text or an iterable of lines.
+        family: Histogram family name, e.g. 'kong_request_latency_ms'.
+        match_labels: Only include series carrying all of these label values.
+
+    Returns:
+        Cumulative buckets summed across the matching series.
+    """
+    by_bound: dict[float, float] = {}
+    for _, labels, value in iter_samples(
+        source, prefix=f"{family}_bucket", match_labels=match_labels
+    ):
+        le = labels.get("le")
+        if not le:
+            continue
+        try:
+            bound = float(le)
+        except ValueError:
+            continue
+        by_bound[bound] = by_bound.get(bound, 0.0) + value
+
+    total = by_bound.pop(math.inf, 0.0)
+    bounds = sorted(by_bound)
+    return HistogramBuckets(bounds=bounds, counts=[by_bound[b] for b in bounds], total=total)
+
+
+def histogram_quantile(
+    bounds: list[float],
+    counts: list[float],
+    total: float,
+    q: float,
+) -> float | None:
+    """Estimate a quantile from cumulative histogram buckets.
+
+    Uses linear interpolation within the bucket containing the target rank,
+    treating the lower edge of the first bucket as 0.
+
+    Args:
+        bounds: Finite upper bounds in ascending order.
+        counts: Cumulative counts for each bound.
+        total: Total number of observations.
+        q: Quantile between 0.0 and 1.0.
+
+    Returns:
+        Estimated value, the last finite bound if the rank falls in the +Inf
+        bucket, or None if there is no data.
+    """
+    if total == 0 or not bounds:
+        return None
+
+    target = total * q
+    prev_bound = 0.0
+    prev_count = 0.0
+    for bound, count in zip(bounds, counts, strict=True):
+        if count >= target:
+            fraction = (target - prev_count) / (count - prev_count) if count > prev_count else 0.0
+            return prev_bound + fraction * (bound - prev_bound)
+        prev_bound = bound
+        prev_count = count
+
+    return bounds[-1]
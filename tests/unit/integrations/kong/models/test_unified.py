@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import pytest
 
+from system_operations_manager.integrations.kong.models.base import KongEntityReference
+from system_operations_manager.integrations.kong.models.plugin import KongPluginEntity
 from system_operations_manager.integrations.kong.models.service import Service
 from system_operations_manager.integrations.kong.models.unified import (
     EntitySource,
@@ -313,6 +315,28 @@ class TestDetectDrift:
         assert fields == ["host"]
         assert "port" not in fields
 
+    @pytest.mark.unit
+    def test_nested_and_dict_fields(self) -> None:
+        """Nested references and config dicts should compare by value."""
+        gw = KongPluginEntity(
+            id="gw-1",
+            name="rate-limiting",
+            service=KongEntityReference(id="svc-1"),
+            config={"minute": 10},
+        )
+        same = KongPluginEntity(
+            id="kon-1",
+            name="rate-limiting",
+            service=KongEntityReference(id="svc-1"),
+            config={"minute": 10},
+        )
+        changed = same.model_copy(
+            update={"service": KongEntityReference(id="svc-2"), "config": {"minute": 20}}
+        )
+
+        assert detect_drift(gw, same) == (False, [])
+        assert detect_drift(gw, changed) == (True, ["service", "config"])
+
 
 class TestMergeEntities:
     """Tests for merge_entities function."""
@@ -400,3 +424,37 @@ class TestMergeEntities:
 
         names = [e.entity.name for e in result.entities]
         assert names == ["alpha", "zebra"]
+
+    @pytest.mark.unit
+    def test_merge_tallies_counts(self) -> None:
+        """Counters should be available without rescanning and track list changes."""
+        result = merge_entities(
+            [Service(name="a", host="a.local"), Service(name="b", host="b.local")],
+            [Service(name="b", host="other.local"), Service(name="c", host="c.local")],
+        )
+
+        assert (
+            result.gateway_only_count,
+            result.konnect_only_count,
+            result.in_both_count,
+            result.drift_count,
+            result.synced_count,
+        ) == (1, 1, 1, 1, 0)
+
+        result.entities.append(
+            UnifiedEntity(entity=Service(name="d", host="d.local"), source=EntitySource.GATEWAY)
+        )
+        assert result.gateway_only_count == 2
+
+    @pytest.mark.unit
+    def test_merge_with_key_function(self) -> None:
+        """A key function should replace key_field for matching."""
+        result = merge_entities(
+            [Service(name="api", host="api.local", path="/v1")],
+            [Service(name="API", host="api.local", path="/v1")],
+            key=lambda s: s.name.lower() if s.name else None,
+        )
+
+        assert len(result) == 1
+        assert result.entities[0].source == EntitySource.BOTH
+        assert result.entities[0].drift_fields == ["name"]
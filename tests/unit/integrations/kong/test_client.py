@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
-from system_operations_manager.integrations.kong.client import KongAdminClient
+from system_operations_manager.integrations.kong.client import (
+    AsyncKongAdminClient,
+    KongAdminClient,
+)
 from system_operations_manager.integrations.kong.config import (
     KongAuthConfig,
     KongConnectionConfig,
@@ -654,3 +658,167 @@ class TestKongAdminClientApiKeyHeaders:
 
         call_kwargs = mock_httpx.call_args[1]
         assert call_kwargs["headers"] == {"X-Custom-Auth": "my-key"}
+
+
+class TestKongAdminClientPooling:
+    """Tests for connection pool and HTTP/2 configuration."""
+
+    @pytest.mark.unit
+    def test_pool_limits_from_config(self, mocker: Any) -> None:
+        """Client should build httpx limits from the connection config."""
+        mock_httpx = mocker.patch("httpx.Client", return_value=MagicMock(spec=httpx.Client))
+        connection_config = KongConnectionConfig(
+            max_connections=10, max_keepalive_connections=4, keepalive_expiry=30.0
+        )
+
+        KongAdminClient(connection_config)
+
+        limits = mock_httpx.call_args[1]["limits"]
+        assert limits.max_connections == 10
+        assert limits.max_keepalive_connections == 4
+        assert limits.keepalive_expiry == 30.0
+
+    @pytest.mark.unit
+    def test_http2_enabled_when_available(self, mocker: Any) -> None:
+        """http2=True should be passed through when h2 is installed."""
+        mock_httpx = mocker.patch("httpx.Client", return_value=MagicMock(spec=httpx.Client))
+        mocker.patch(
+            "system_operations_manager.integrations.kong.client._http2_available",
+            return_value=True,
+        )
+
+        KongAdminClient(KongConnectionConfig(http2=True))
+
+        assert mock_httpx.call_args[1]["http2"] is True
+
+    @pytest.mark.unit
+    def test_http2_falls_back_without_h2(self, mocker: Any) -> None:
+        """http2=True should fall back to HTTP/1.1 when h2 is missing."""
+        mock_httpx = mocker.patch("httpx.Client", return_value=MagicMock(spec=httpx.Client))
+        mocker.patch(
+            "system_operations_manager.integrations.kong.client._http2_available",
+            return_value=False,
+        )
+
+        KongAdminClient(KongConnectionConfig(http2=True))
+
+        assert "http2" not in mock_httpx.call_args[1]
+
+    @pytest.mark.unit
+    def test_retry_decorator_built_once(
+        self,
+        connection_config: KongConnectionConfig,
+        mock_httpx_client: MagicMock,
+        mocker: Any,
+    ) -> None:
+        """Requests should reuse the retry wrapper built at construction."""
+        spy = mocker.spy(KongAdminClient, "_make_retry_decorator")
+        mock_response = MagicMock()
+        mock_response.json.return_value = {}
+        mock_httpx_client.request.return_value = mock_response
+
+        client = KongAdminClient(connection_config)
+        client.get("status")
+        client.post("services", json={})
+
+        assert spy.call_count == 1
+
+
+def _async_response(status_code: int, body: dict[str, Any]) -> MagicMock:
+    """Build a mock httpx response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.is_success = 200 <= status_code < 300
+    response.content = b"{}"
+    response.json.return_value = body
+    return response
+
+
+class TestAsyncKongAdminClient:
+    """Tests for AsyncKongAdminClient."""
+
+    @pytest.fixture
+    def mock_async_httpx(self, mocker: Any) -> MagicMock:
+        """Patch httpx.AsyncClient with an AsyncMock-backed client."""
+        mock_client = MagicMock(spec=httpx.AsyncClient)
+        mock_client.request = AsyncMock()
+        mock_client.aclose = AsyncMock()
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+        return mock_client
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_request(self, mock_async_httpx: MagicMock) -> None:
+        """GET should await the request and return the parsed body."""
+        mock_async_httpx.request.return_value = _async_response(200, {"data": []})
+
+        async with AsyncKongAdminClient(KongConnectionConfig()) as client:
+            result = await client.get("services", params={"size": 10})
+
+        assert result == {"data": []}
+        mock_async_httpx.request.assert_awaited_once_with("GET", "/services", params={"size": 10})
+        mock_async_httpx.aclose.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_post_request(self, mock_async_httpx: MagicMock) -> None:
+        """POST should send the JSON body."""
+        mock_async_httpx.request.return_value = _async_response(201, {"id": "svc-1"})
+        client = AsyncKongAdminClient(KongConnectionConfig())
+
+        result = await client.post("services", json={"name": "svc"})
+
+        assert result == {"id": "svc-1"}
+        mock_async_httpx.request.assert_awaited_once_with("POST", "/services", json={"name": "svc"})
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_not_found_translated(self, mock_async_httpx: MagicMock) -> None:
+        """404 responses should raise KongNotFoundError like the sync client."""
+        mock_async_httpx.request.return_value = _async_response(404, {"message": "Not found"})
+        client = AsyncKongAdminClient(KongConnectionConfig())
+
+        with pytest.raises(KongNotFoundError):
+            await client.get("services/missing")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connect_error_raises_connection_error(self, mock_async_httpx: MagicMock) -> None:
+        """Connection failures should raise KongConnectionError."""
+        mock_async_httpx.request.side_effect = httpx.ConnectError("Connection refused")
+        client = AsyncKongAdminClient(KongConnectionConfig(retries=1))
+
+        with pytest.raises(KongConnectionError, match="Connection refused"):
+            await client.get("services")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_capped(self, mock_async_httpx: MagicMock) -> None:
+        """No more than max_in_flight requests should run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def request(*args: Any, **kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _async_response(200, {})
+
+        mock_async_httpx.request.side_effect = request
+        client = AsyncKongAdminClient(KongConnectionConfig(max_in_flight=3))
+
+        await asyncio.gather(*(client.get(f"services/{i}") for i in range(12)))
+
+        assert peak == 3
+        assert mock_async_httpx.request.await_count == 12
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_check_connection_false_on_api_error(self, mock_async_httpx: MagicMock) -> None:
+        """check_connection should return False when Kong reports an error."""
+        mock_async_httpx.request.return_value = _async_response(500, {"message": "boom"})
+        client = AsyncKongAdminClient(KongConnectionConfig())
+
+        assert await client.check_connection() is False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from datetime import timedelta
 from typing import Any
 from unittest.mock import patch
 
@@ -14,6 +15,7 @@ from system_operations_manager.integrations.kong.config import (
     KongConnectionConfig,
     KongEnterpriseConfig,
     KongPluginConfig,
+    KongSyncConfig,
 )
 
 
@@ -119,6 +121,36 @@ class TestKongConnectionConfig:
             KongConnectionConfig(unknown_field="value")  # type: ignore[call-arg]
 
 
+class TestKongConnectionPoolConfig:
+    """Tests for KongConnectionConfig pool and concurrency settings."""
+
+    @pytest.mark.unit
+    def test_pool_defaults(self) -> None:
+        """Pool settings should default to HTTP/1.1 with bounded concurrency."""
+        config = KongConnectionConfig()
+
+        assert config.http2 is False
+        assert config.max_connections == 100
+        assert config.max_keepalive_connections == 20
+        assert config.keepalive_expiry == 5.0
+        assert config.max_in_flight == 50
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "field", ["max_connections", "max_keepalive_connections", "max_in_flight"]
+    )
+    def test_pool_limits_must_be_positive(self, field: str) -> None:
+        """Pool limits below 1 should be rejected."""
+        with pytest.raises(ValidationError, match="connection limits must be at least 1"):
+            KongConnectionConfig(**{field: 0})
+
+    @pytest.mark.unit
+    def test_negative_keepalive_expiry_rejected(self) -> None:
+        """Negative keepalive expiry should be rejected."""
+        with pytest.raises(ValidationError, match="keepalive_expiry must be non-negative"):
+            KongConnectionConfig(keepalive_expiry=-1)
+
+
 class TestKongAuthConfig:
     """Tests for KongAuthConfig model."""
 
@@ -203,6 +235,43 @@ class TestKongEnterpriseConfig:
         assert config.enabled is True
 
 
+class TestKongSyncConfig:
+    """Tests for KongSyncConfig model."""
+
+    @pytest.mark.unit
+    def test_sync_config_defaults(self) -> None:
+        """Sync config should default to bounded concurrency without timeouts."""
+        config = KongSyncConfig()
+
+        assert config.max_concurrency == 8
+        assert config.gateway_timeout is None
+        assert config.konnect_timeout is None
+
+    @pytest.mark.unit
+    def test_sync_config_rejects_zero_concurrency(self) -> None:
+        """Sync config should reject max_concurrency below 1."""
+        with pytest.raises(ValidationError, match="max_concurrency must be at least 1"):
+            KongSyncConfig(max_concurrency=0)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("field", ["gateway_timeout", "konnect_timeout"])
+    def test_sync_config_rejects_non_positive_timeout(self, field: str) -> None:
+        """Sync config should reject non-positive source timeouts."""
+        with pytest.raises(ValidationError, match="timeout must be positive"):
+            KongSyncConfig(**{field: 0})
+
+    @pytest.mark.unit
+    def test_sync_config_audit_retention(self) -> None:
+        """Rotation should default on, retention should be opt-in, both as timedeltas."""
+        config = KongSyncConfig()
+
+        assert config.audit_max_age == timedelta(days=30)
+        assert config.audit_retention is None
+        assert KongSyncConfig(audit_retention_days=180).audit_retention == timedelta(days=180)
+        with pytest.raises(ValidationError, match="at least 1 day"):
+            KongSyncConfig(audit_rotate_days=0)
+
+
 class TestKongPluginConfig:
     """Tests for KongPluginConfig model."""
 
@@ -0,0 +1,176 @@
+"""Unit tests for the Konnect control plane cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import SecretStr
+
+from system_operations_manager.integrations.konnect.cache import ControlPlaneCache
+from system_operations_manager.integrations.konnect.config import (
+    KonnectConfig,
+    KonnectRegion,
+)
+from system_operations_manager.integrations.konnect.exceptions import KonnectNotFoundError
+
+
+@pytest.fixture
+def config() -> KonnectConfig:
+    """Create a Konnect config for cache keys."""
+    return KonnectConfig(token=SecretStr("token-a"), region=KonnectRegion.US)
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    """Return a temporary cache file path."""
+    return tmp_path / "ops" / "konnect_control_planes.json"
+
+
+class TestControlPlaneCache:
+    """Tests for ControlPlaneCache."""
+
+    @pytest.mark.unit
+    def test_default_cache_path(self) -> None:
+        """Cache should live under ~/.cache/ops."""
+        path = ControlPlaneCache.get_cache_path()
+
+        assert path.parts[-3:] == (".cache", "ops", "konnect_control_planes.json")
+
+    @pytest.mark.unit
+    def test_get_missing_returns_none(self, config: KonnectConfig, cache_path: Path) -> None:
+        """Missing cache file should behave like an empty cache."""
+        assert ControlPlaneCache(cache_path).get(config, "prod") is None
+
+    @pytest.mark.unit
+    def test_set_then_get(self, config: KonnectConfig, cache_path: Path) -> None:
+        """Stored resolutions should be returned and written owner-only."""
+        cache = ControlPlaneCache(cache_path)
+
+        cache.set(config, "prod", "cp-123")
+
+        assert cache.get(config, "prod") == "cp-123"
+        assert cache_path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.unit
+    def test_entries_are_scoped_by_token_and_region(
+        self, config: KonnectConfig, cache_path: Path
+    ) -> None:
+        """A different token or region should not see cached IDs."""
+        cache = ControlPlaneCache(cache_path)
+        cache.set(config, "prod", "cp-123")
+
+        other_token = KonnectConfig(token=SecretStr("token-b"), region=KonnectRegion.US)
+        other_region = KonnectConfig(token=SecretStr("token-a"), region=KonnectRegion.EU)
+
+        assert cache.get(other_token, "prod") is None
+        assert cache.get(other_region, "prod") is None
+        assert "token-a" not in cache_path.read_text()
+
+    @pytest.mark.unit
+    def test_expired_entries_are_ignored(self, config: KonnectConfig, cache_path: Path) -> None:
+        """Entries older than the TTL should be treated as misses."""
+        cache = ControlPlaneCache(cache_path, ttl_seconds=60)
+
+        with patch("system_operations_manager.integrations.konnect.cache.time.time") as now:
+            now.return_value = 1000.0
+            cache.set(config, "prod", "cp-123")
+            now.return_value = 1061.0
+            assert cache.get(config, "prod") is None
+
+    @pytest.mark.unit
+    def test_corrupt_file_is_ignored(self, config: KonnectConfig, cache_path: Path) -> None:
+        """An unreadable cache file should not raise."""
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json")
+        cache = ControlPlaneCache(cache_path)
+
+        assert cache.get(config, "prod") is None
+        cache.set(config, "prod", "cp-123")
+        assert json.loads(cache_path.read_text())
+
+    @pytest.mark.unit
+    def test_invalidate(self, config: KonnectConfig, cache_path: Path) -> None:
+        """invalidate should drop a cached resolution."""
+        cache = ControlPlaneCache(cache_path)
+        cache.set(config, "prod", "cp-123")
+
+        cache.invalidate(config, "prod")
+
+        assert cache.get(config, "prod") is None
+
+    @pytest.mark.unit
+    def test_resolve_uses_cache_after_first_lookup(
+        self, config: KonnectConfig, cache_path: Path
+    ) -> None:
+        """resolve should only call the API on a cache miss."""
+        client = MagicMock()
+        client.find_control_plane.return_value.id = "cp-123"
+        cache = ControlPlaneCache(cache_path)
+
+        assert cache.resolve(client, config, "prod") == "cp-123"
+        assert ControlPlaneCache(cache_path).resolve(client, config, "prod") == "cp-123"
+
+        client.find_control_plane.assert_called_once_with("prod")
+
+    @pytest.mark.unit
+    def test_bind_returns_cached_id_without_requests(
+        self, config: KonnectConfig, cache_path: Path
+    ) -> None:
+        """bind should serve a cached ID with no round trip."""
+        cache = ControlPlaneCache(cache_path)
+        cache.set(config, "prod", "cp-123")
+        client = MagicMock()
+
+        assert cache.bind(client, config, "prod") == "cp-123"
+
+        client.find_control_plane.assert_not_called()
+        client.get_control_plane.assert_not_called()
+        client.set_control_plane_resolver.assert_called_once()
+
+    @pytest.mark.unit
+    def test_bind_resolver_reresolves_recreated_control_plane(
+        self, config: KonnectConfig, cache_path: Path
+    ) -> None:
+        """The resolver should replace a stale cached ID with a fresh lookup."""
+        cache = ControlPlaneCache(cache_path)
+        cache.set(config, "prod", "cp-old")
+        client = MagicMock()
+        client.find_control_plane.return_value.id = "cp-new"
+        cache.bind(client, config, "prod")
+        resolver = client.set_control_plane_resolver.call_args.args[0]
+
+        assert resolver("cp-old") == "cp-new"
+        assert cache.get(config, "prod") == "cp-new"
+        client.find_control_plane.assert_called_once_with("prod")
+
+    @pytest.mark.unit
+    def test_bind_resolver_skips_fresh_resolution(
+        self, config: KonnectConfig, cache_path: Path
+    ) -> None:
+        """An ID just resolved from the API should not be looked up again on 404."""
+        cache = ControlPlaneCache(cache_path)
+        client = MagicMock()
+        client.find_control_plane.return_value.id = "cp-123"
+        cache.bind(client, config, "prod")
+        resolver = client.set_control_plane_resolver.call_args.args[0]
+
+        assert resolver("cp-123") is None
+        client.find_control_plane.assert_called_once_with("prod")
+
+    @pytest.mark.unit
+    def test_bind_resolver_handles_deleted_control_plane(
+        self, config: KonnectConfig, cache_path: Path
+    ) -> None:
+        """If the control plane is gone entirely, the resolver should give up."""
+        cache = ControlPlaneCache(cache_path)
+        cache.set(config, "prod", "cp-old")
+        client = MagicMock()
+        client.find_control_plane.side_effect = KonnectNotFoundError("gone", status_code=404)
+        cache.bind(client, config, "prod")
+        resolver = client.set_control_plane_resolver.call_args.args[0]
+
+        assert resolver("cp-old") is None
+        assert cache.get(config, "prod") is None
@@ -31,6 +31,8 @@ from system_operations_manager.integrations.konnect.exceptions import (
     KonnectAuthError,
     KonnectConnectionError,
     KonnectNotFoundError,
+    KonnectRateLimitError,
+    KonnectTimeoutError,
 )
 from system_operations_manager.integrations.konnect.models import (
     ControlPlane,
@@ -61,12 +63,19 @@ def mock_httpx_client(mocker: Any) -> MagicMock:
     return mock_client
 
 
-def _make_response(status_code: int, json_data: Any = None, text: str = "") -> Any:
+def _make_response(
+    status_code: int,
+    json_data: Any = None,
+    text: str = "",
+    headers: dict[str, str] | None = None,
+) -> Any:
     """Helper: build a mock httpx Response."""
     resp: Any = MagicMock()
     resp.status_code = status_code
     resp.json.return_value = json_data if json_data is not None else {}
     resp.text = text
+    if headers is not None:
+        resp.headers = httpx.Headers(headers)
     return resp
 
 
@@ -207,6 +216,7 @@ class TestKonnectClientRequests:
         self,
         client: KonnectClient,
         mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
     ) -> None:
         """Connection error should raise KonnectConnectionError."""
         mock_httpx_client.request.side_effect = httpx.ConnectError("Connection failed")
@@ -219,6 +229,7 @@ class TestKonnectClientRequests:
         self,
         client: KonnectClient,
         mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
     ) -> None:
         """Timeout should raise KonnectConnectionError."""
         mock_httpx_client.request.side_effect = httpx.TimeoutException("Timeout")
@@ -238,6 +249,217 @@ class TestKonnectClientRequests:
         result = client._request("DELETE", "/v2/control-planes/123")
         assert result == {}
 
+    @pytest.fixture
+    def no_retry_sleep(self, mocker: Any) -> MagicMock:
+        """Skip tenacity's backoff sleeps."""
+        sleep: MagicMock = mocker.patch.object(KonnectClient._send.retry, "sleep")  # type: ignore[attr-defined]
+        return sleep
+
+    @pytest.mark.unit
+    def test_429_pauses_limiter_and_retries(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """429 should pause the shared limiter for Retry-After, then retry."""
+        client.rate_limiter = MagicMock()
+        mock_httpx_client.request.side_effect = [
+            _make_response(429, headers={"Retry-After": "7"}),
+            _make_response(201, {"id": "svc-1"}),
+        ]
+
+        result = client._request("POST", "/v2/control-planes/cp/core-entities/services")
+
+        assert result == {"id": "svc-1"}
+        client.rate_limiter.pause.assert_called_once_with(7.0)
+        assert client.rate_limiter.acquire.call_count == 2
+
+    @pytest.mark.unit
+    def test_429_exhausts_attempts(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """Persistent 429s should surface as KonnectRateLimitError."""
+        client.rate_limiter = MagicMock()
+        mock_httpx_client.request.return_value = _make_response(429, headers={})
+
+        with pytest.raises(KonnectRateLimitError) as exc_info:
+            client._request("GET", "/v2/control-planes")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after is None
+        assert mock_httpx_client.request.call_count == 5
+
+    @pytest.mark.unit
+    def test_5xx_is_retried(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """Transient server errors should be retried with backoff."""
+        mock_httpx_client.request.side_effect = [
+            _make_response(503, text="unavailable"),
+            _make_response(200, {"data": []}),
+        ]
+
+        assert client._request("GET", "/v2/control-planes") == {"data": []}
+        no_retry_sleep.assert_called_once()
+
+    @pytest.mark.unit
+    def test_post_5xx_is_not_retried(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """A POST answered with a 5xx may have been committed, so it is not retried."""
+        mock_httpx_client.request.return_value = _make_response(502, text="bad gateway")
+
+        with pytest.raises(KonnectAPIError) as exc_info:
+            client._request("POST", "/v2/control-planes/cp/core-entities/services")
+
+        assert exc_info.value.status_code == 502
+        assert mock_httpx_client.request.call_count == 1
+        no_retry_sleep.assert_not_called()
+
+    @pytest.mark.unit
+    def test_post_connection_error_is_retried(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """A POST that never reached Konnect should still be retried."""
+        mock_httpx_client.request.side_effect = [
+            httpx.ConnectError("refused"),
+            _make_response(201, {"id": "svc-1"}),
+        ]
+
+        assert client._request("POST", "/v2/control-planes") == {"id": "svc-1"}
+
+    @pytest.mark.unit
+    def test_post_read_timeout_is_not_retried(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """A POST that timed out after being sent may have been applied, so it is not re-sent."""
+        mock_httpx_client.request.side_effect = httpx.ReadTimeout("no answer")
+
+        with pytest.raises(KonnectTimeoutError):
+            client._request("POST", "/v2/control-planes")
+
+        assert mock_httpx_client.request.call_count == 1
+
+    @pytest.mark.unit
+    def test_post_connect_timeout_is_retried(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """A POST that timed out before it was sent should still be retried."""
+        mock_httpx_client.request.side_effect = [
+            httpx.ConnectTimeout("slow handshake"),
+            _make_response(201, {"id": "svc-1"}),
+        ]
+
+        assert client._request("POST", "/v2/control-planes") == {"id": "svc-1"}
+
+    @pytest.mark.unit
+    def test_get_read_timeout_is_retried(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """Idempotent requests should be retried after a read timeout."""
+        mock_httpx_client.request.side_effect = [
+            httpx.ReadTimeout("no answer"),
+            _make_response(200, {"data": []}),
+        ]
+
+        assert client._request("GET", "/v2/control-planes") == {"data": []}
+
+    @pytest.mark.unit
+    def test_4xx_is_not_retried(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+        no_retry_sleep: MagicMock,
+    ) -> None:
+        """Client errors other than 429 should fail immediately."""
+        mock_httpx_client.request.return_value = _make_response(409, {"message": "exists"})
+
+        with pytest.raises(KonnectAPIError):
+            client._request("POST", "/v2/control-planes")
+
+        assert mock_httpx_client.request.call_count == 1
+
+    @pytest.mark.unit
+    def test_rate_limit_headers_adjust_limiter(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+    ) -> None:
+        """Quota headers on successful responses should lower the request rate."""
+        mock_httpx_client.request.return_value = _make_response(
+            200, {"data": []}, headers={"RateLimit-Remaining": "10", "RateLimit-Reset": "5"}
+        )
+
+        client._request("GET", "/v2/control-planes")
+
+        assert client.rate_limiter.rate == 2.0
+
+    @pytest.mark.unit
+    def test_stale_control_plane_is_rebound_on_404(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+    ) -> None:
+        """A 404 under a stale control plane ID should re-resolve it and resend once."""
+        mock_httpx_client.request.side_effect = [
+            _make_response(404),
+            _make_response(200, {"data": []}),
+            _make_response(200, {"data": []}),
+        ]
+        resolver = MagicMock(return_value="cp-new")
+        client.set_control_plane_resolver(resolver)
+
+        client._request("GET", "/v2/control-planes/cp-old/core-entities/services")
+        client._request("GET", "/v2/control-planes/cp-old/core-entities/routes")
+
+        resolver.assert_called_once_with("cp-old")
+        urls = [call.args[1] for call in mock_httpx_client.request.call_args_list]
+        assert urls == [
+            "/v2/control-planes/cp-old/core-entities/services",
+            "/v2/control-planes/cp-new/core-entities/services",
+            "/v2/control-planes/cp-new/core-entities/routes",
+        ]
+
+    @pytest.mark.unit
+    def test_entity_404_does_not_reresolve_confirmed_control_plane(
+        self,
+        client: KonnectClient,
+        mock_httpx_client: MagicMock,
+    ) -> None:
+        """Once a control plane ID is confirmed, later 404s are ordinary misses."""
+        mock_httpx_client.request.return_value = _make_response(404)
+        resolver = MagicMock(return_value=None)
+        client.set_control_plane_resolver(resolver)
+
+        for _ in range(2):
+            with pytest.raises(KonnectNotFoundError):
+                client._request("GET", "/v2/control-planes/cp-1/core-entities/services/missing")
+
+        resolver.assert_called_once_with("cp-1")
+        assert mock_httpx_client.request.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # TestKonnectClientValidateToken
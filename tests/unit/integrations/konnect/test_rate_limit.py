@@ -0,0 +1,129 @@
+"""Unit tests for the Konnect rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from system_operations_manager.integrations.konnect.rate_limit import (
+    MIN_REQUESTS_PER_SECOND,
+    KonnectRateLimiter,
+    parse_retry_after,
+    remaining_quota,
+)
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+def _limiter(clock: FakeClock, rate: float = 10.0) -> KonnectRateLimiter:
+    return KonnectRateLimiter(rate, clock=clock, sleep=clock.sleep)
+
+
+class TestParseHeaders:
+    """Tests for rate-limit header parsing."""
+
+    @pytest.mark.unit
+    def test_retry_after_seconds(self) -> None:
+        """Delay-seconds values should parse as floats."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    @pytest.mark.unit
+    def test_retry_after_http_date(self) -> None:
+        """HTTP-date values should be converted to a delay."""
+        assert parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=10.0) == 20.0
+
+    @pytest.mark.unit
+    def test_ietf_headers(self) -> None:
+        """RateLimit-Remaining/Reset should be read as the quota."""
+        assert remaining_quota({"RateLimit-Remaining": "30", "RateLimit-Reset": "15"}) == (
+            30.0,
+            15.0,
+        )
+
+    @pytest.mark.unit
+    def test_kong_headers_pick_tightest_window(self) -> None:
+        """With several Kong windows the lowest allowed rate should win."""
+        headers = {
+            "X-RateLimit-Remaining-Second": "50",
+            "X-RateLimit-Remaining-Minute": "120",
+        }
+        assert remaining_quota(headers) == (120.0, 60.0)
+
+    @pytest.mark.unit
+    def test_no_quota_headers(self) -> None:
+        """Responses without rate-limit headers carry no quota."""
+        assert remaining_quota({"Content-Type": "application/json"}) is None
+
+
+class TestKonnectRateLimiter:
+    """Tests for KonnectRateLimiter pacing."""
+
+    @pytest.mark.unit
+    def test_burst_then_paced(self, clock: FakeClock) -> None:
+        """A full bucket should allow a burst, then pace at the rate."""
+        limiter = _limiter(clock, rate=10.0)
+
+        for _ in range(10):
+            limiter.acquire()
+        assert clock.slept == []
+
+        limiter.acquire()
+        assert clock.slept == [pytest.approx(0.1)]
+
+    @pytest.mark.unit
+    def test_update_lowers_rate_to_quota(self, clock: FakeClock) -> None:
+        """A reported quota should spread the remaining requests over the window."""
+        limiter = _limiter(clock, rate=10.0)
+
+        limiter.update({"RateLimit-Remaining": "20", "RateLimit-Reset": "10"})
+        assert limiter.rate == 2.0
+
+        limiter.update({"RateLimit-Remaining": "1000", "RateLimit-Reset": "10"})
+        assert limiter.rate == 10.0
+
+    @pytest.mark.unit
+    def test_exhausted_quota_pauses_until_reset(self, clock: FakeClock) -> None:
+        """Zero remaining requests should hold callers until the window resets."""
+        limiter = _limiter(clock, rate=10.0)
+
+        limiter.update({"RateLimit-Remaining": "0", "RateLimit-Reset": "5"})
+        limiter.acquire()
+
+        assert limiter.rate == MIN_REQUESTS_PER_SECOND
+        assert clock.now >= 5.0
+
+    @pytest.mark.unit
+    def test_pause_holds_every_caller(self, clock: FakeClock) -> None:
+        """pause should empty the bucket and block until it expires."""
+        limiter = _limiter(clock, rate=10.0)
+
+        limiter.pause(3.0)
+        limiter.acquire()
+
+        assert clock.now == pytest.approx(3.1)
+
+    @pytest.mark.unit
+    def test_rejects_non_positive_rate(self) -> None:
+        """The ceiling rate must be positive."""
+        with pytest.raises(ValueError):
+            KonnectRateLimiter(0)
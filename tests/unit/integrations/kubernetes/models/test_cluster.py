@@ -343,3 +343,30 @@ class TestEventSummary:
     def test_entity_name(self) -> None:
         """Test entity name class variable."""
         assert EventSummary._entity_name == "event"
+
+    def test_from_json_matches_sdk_path(self) -> None:
+        """from_json should build the same summary as from_k8s_object."""
+        from kubernetes.client import ApiClient
+
+        raw = {
+            "metadata": {
+                "name": "web.17a",
+                "namespace": "default",
+                "uid": "uid-evt-1",
+                "creationTimestamp": "2024-01-01T00:00:00Z",
+            },
+            "involvedObject": {"kind": "Pod", "name": "web"},
+            "type": "Warning",
+            "reason": "BackOff",
+            "message": "Back-off restarting failed container",
+            "source": {"component": "kubelet"},
+            "firstTimestamp": "2024-01-01T00:00:00Z",
+            "lastTimestamp": "2024-01-01T00:05:00Z",
+            "count": 5,
+        }
+        sdk_obj = ApiClient()._ApiClient__deserialize(raw, "CoreV1Event")  # type: ignore[attr-defined]
+
+        event = EventSummary.from_json(raw)
+
+        assert event.model_dump() == EventSummary.from_k8s_object(sdk_obj).model_dump()
+        assert event.last_timestamp == "2024-01-01T00:05:00+00:00"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -663,3 +664,142 @@ class TestReplicaSetSummary:
     def test_entity_name(self) -> None:
         """Test entity name class variable."""
         assert ReplicaSetSummary._entity_name == "replicaset"
+
+
+def _sdk_object(raw: dict[str, Any], type_name: str) -> Any:
+    """Deserialize a raw API object the way the kubernetes SDK does."""
+    from kubernetes.client import ApiClient
+
+    return ApiClient()._ApiClient__deserialize(raw, type_name)  # type: ignore[attr-defined]
+
+
+_METADATA: dict[str, Any] = {
+    "name": "web",
+    "namespace": "default",
+    "uid": "uid-1",
+    "creationTimestamp": "2024-01-01T00:00:00Z",
+    "labels": {"app": "web"},
+}
+
+_RAW_OBJECTS: list[tuple[type[Any], str, dict[str, Any]]] = [
+    (
+        PodSummary,
+        "V1Pod",
+        {
+            "metadata": _METADATA,
+            "spec": {"nodeName": "node-1", "containers": [{"name": "app"}, {"name": "sidecar"}]},
+            "status": {
+                "phase": "Running",
+                "podIP": "10.0.0.5",
+                "containerStatuses": [
+                    {
+                        "name": "app",
+                        "image": "nginx:1.25",
+                        "imageID": "",
+                        "ready": True,
+                        "restartCount": 2,
+                        "state": {"running": {"startedAt": "2024-01-01T00:00:05Z"}},
+                    },
+                    {
+                        "name": "sidecar",
+                        "image": "envoy:1.30",
+                        "imageID": "",
+                        "ready": False,
+                        "restartCount": 1,
+                        "state": {"waiting": {"reason": "CrashLoopBackOff"}},
+                    },
+                ],
+            },
+        },
+    ),
+    (
+        DeploymentSummary,
+        "V1Deployment",
+        {
+            "metadata": _METADATA,
+            "spec": {
+                "replicas": 3,
+                "selector": {"matchLabels": {"app": "web"}},
+                "template": {"spec": {"containers": [{"name": "app"}]}},
+                "strategy": {"type": "RollingUpdate"},
+            },
+            "status": {"readyReplicas": 2, "availableReplicas": 2, "updatedReplicas": 3},
+        },
+    ),
+    (
+        StatefulSetSummary,
+        "V1StatefulSet",
+        {
+            "metadata": _METADATA,
+            "spec": {
+                "replicas": 2,
+                "serviceName": "web",
+                "selector": {"matchLabels": {"app": "web"}},
+                "template": {"spec": {"containers": [{"name": "app"}]}},
+            },
+            "status": {"replicas": 2, "readyReplicas": 1},
+        },
+    ),
+    (
+        DaemonSetSummary,
+        "V1DaemonSet",
+        {
+            "metadata": _METADATA,
+            "spec": {
+                "selector": {"matchLabels": {"app": "web"}},
+                "template": {
+                    "spec": {
+                        "containers": [{"name": "app"}],
+                        "nodeSelector": {"disk": "ssd"},
+                    }
+                },
+            },
+            "status": {
+                "desiredNumberScheduled": 4,
+                "currentNumberScheduled": 4,
+                "numberReady": 3,
+                "numberMisscheduled": 0,
+            },
+        },
+    ),
+    (
+        ReplicaSetSummary,
+        "V1ReplicaSet",
+        {
+            "metadata": {
+                **_METADATA,
+                "ownerReferences": [
+                    {"apiVersion": "apps/v1", "kind": "Deployment", "name": "web", "uid": "d-1"}
+                ],
+            },
+            "spec": {"replicas": 3, "selector": {"matchLabels": {"app": "web"}}},
+            "status": {"replicas": 3, "readyReplicas": 3},
+        },
+    ),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestFromJson:
+    """Test the raw JSON conversion path used by fast list mode."""
+
+    @pytest.mark.parametrize(
+        ("model", "type_name", "raw"),
+        _RAW_OBJECTS,
+        ids=[model.__name__ for model, _, _ in _RAW_OBJECTS],
+    )
+    def test_matches_sdk_path(self, model: Any, type_name: str, raw: dict[str, Any]) -> None:
+        """from_json should build the same summary as from_k8s_object."""
+        expected = model.from_k8s_object(_sdk_object(raw, type_name))
+
+        assert model.from_json(raw).model_dump() == expected.model_dump()
+
+    @pytest.mark.parametrize("model", [model for model, _, _ in _RAW_OBJECTS])
+    def test_minimal_object(self, model: Any) -> None:
+        """from_json should fall back to field defaults for an empty object."""
+        summary = model.from_json({"metadata": {"name": "bare"}})
+
+        assert summary.name == "bare"
+        assert summary.labels is None
+        assert summary.model_dump() == model(name="bare").model_dump()
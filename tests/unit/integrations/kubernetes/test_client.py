@@ -560,3 +560,234 @@ class TestKubernetesClientLifecycle:
         assert client._rbac_v1 is None
         assert client._storage_v1 is None
         assert client._version_api is None
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestKubernetesClientForCluster:
+    """Test isolated per-cluster clients."""
+
+    @staticmethod
+    def _plugin_config() -> KubernetesPluginConfig:
+        return KubernetesPluginConfig(
+            clusters={
+                "staging": ClusterConfig(context="staging-ctx", namespace="stage", timeout=30),
+                "production": ClusterConfig(
+                    context="prod-ctx", kubeconfig="/path/to/prod", timeout=60
+                ),
+            },
+            active_cluster="staging",
+        )
+
+    @patch("kubernetes.config")
+    def test_builds_private_api_client(self, mock_config: MagicMock) -> None:
+        """Cluster clients should not load into the global configuration."""
+        client = KubernetesClient(self._plugin_config())
+        mock_config.load_kube_config.reset_mock()
+
+        prod = client.for_cluster("production")
+
+        mock_config.load_kube_config.assert_not_called()
+        mock_config.new_client_from_config.assert_called_once_with(
+            config_file="/path/to/prod", context="prod-ctx"
+        )
+        assert prod.api_client is mock_config.new_client_from_config.return_value
+        assert prod.get_current_context() == "prod-ctx"
+        assert prod.timeout == 60
+        assert client.get_current_context() == "staging-ctx"
+
+    @patch("kubernetes.config")
+    def test_api_groups_use_private_api_client(self, mock_config: MagicMock) -> None:
+        """API group instances should be bound to the cluster's ApiClient."""
+        prod = KubernetesClient(self._plugin_config()).for_cluster("production")
+
+        with patch("kubernetes.client.CoreV1Api") as mock_api:
+            _ = prod.core_v1
+
+        mock_api.assert_called_once_with(mock_config.new_client_from_config.return_value)
+
+    @patch("kubernetes.config")
+    def test_clients_are_pooled(self, mock_config: MagicMock) -> None:
+        """Repeated lookups should reuse the same cluster client."""
+        client = KubernetesClient(self._plugin_config())
+
+        assert client.for_cluster("staging") is client.for_cluster("staging")
+        assert client.for_cluster("staging") is not client.for_cluster("production")
+        assert mock_config.new_client_from_config.call_count == 2
+
+    @patch("kubernetes.config")
+    def test_unknown_cluster_raises(self, mock_config: MagicMock) -> None:
+        """Unknown cluster names should raise KubernetesConnectionError."""
+        client = KubernetesClient(self._plugin_config())
+
+        with pytest.raises(KubernetesConnectionError, match="not configured"):
+            client.for_cluster("missing")
+
+    @patch("kubernetes.config")
+    def test_close_releases_cluster_clients(self, mock_config: MagicMock) -> None:
+        """Closing the client should close pooled ApiClients."""
+        api_client = MagicMock()
+        mock_config.new_client_from_config.return_value = api_client
+        client = KubernetesClient(self._plugin_config())
+        client.for_cluster("staging")
+
+        client.close()
+
+        api_client.close.assert_called_once()
+        assert client._cluster_clients == {}
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestKubernetesClientSharedApiClient:
+    """Test the shared ApiClient and cached DynamicClient."""
+
+    @patch("kubernetes.config")
+    def test_api_groups_share_one_api_client(self, mock_config: MagicMock) -> None:
+        """Every API group should be built on the same ApiClient."""
+        client = KubernetesClient(KubernetesPluginConfig())
+
+        with (
+            patch("kubernetes.client.ApiClient") as mock_api_client,
+            patch("kubernetes.client.CoreV1Api") as mock_core,
+            patch("kubernetes.client.AppsV1Api") as mock_apps,
+        ):
+            _ = client.core_v1
+            _ = client.apps_v1
+
+        mock_api_client.assert_called_once_with()
+        mock_core.assert_called_once_with(mock_api_client.return_value)
+        mock_apps.assert_called_once_with(mock_api_client.return_value)
+
+    @patch("kubernetes.config")
+    def test_switch_context_replaces_api_client(self, mock_config: MagicMock) -> None:
+        """The shared ApiClient should be rebuilt after a context switch."""
+        client = KubernetesClient(KubernetesPluginConfig())
+
+        with patch("kubernetes.client.ApiClient") as mock_api_client:
+            first = MagicMock()
+            mock_api_client.return_value = first
+            assert client.api_client is first
+            client.switch_context("other")
+            mock_api_client.return_value = MagicMock()
+            assert client.api_client is not first
+
+        first.close.assert_called_once()
+
+    @patch("system_operations_manager.integrations.kubernetes.client.new_dynamic_client")
+    @patch("kubernetes.config")
+    def test_dynamic_client_is_cached(
+        self, mock_config: MagicMock, mock_new_dynamic: MagicMock
+    ) -> None:
+        """Discovery should run once per client, not once per lookup."""
+        client = KubernetesClient(KubernetesPluginConfig())
+
+        with patch("kubernetes.client.ApiClient"):
+            first = client.dynamic_client
+            second = client.dynamic_client
+
+        assert first is second
+        mock_new_dynamic.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestKubernetesClientInformers:
+    """Test opt-in informers."""
+
+    @patch("kubernetes.config")
+    def test_informers_disabled_by_default(self, mock_config: MagicMock) -> None:
+        """Without enable_informers, list calls should not be cached."""
+        client = KubernetesClient(KubernetesPluginConfig())
+
+        assert client.informers_enabled is False
+        assert client.informer("pods") is None
+
+    @patch("system_operations_manager.integrations.kubernetes.client.Informer")
+    @patch("kubernetes.config")
+    def test_informer_started_once_per_resource(
+        self, mock_config: MagicMock, mock_informer_cls: MagicMock
+    ) -> None:
+        """Each resource type should be listed and watched once."""
+        client = KubernetesClient(KubernetesPluginConfig())
+        client._core_v1 = MagicMock()
+        client.enable_informers()
+
+        first = client.informer("pods")
+        second = client.informer("pods")
+
+        assert first is second is mock_informer_cls.return_value
+        mock_informer_cls.assert_called_once_with(
+            client._core_v1.list_pod_for_all_namespaces, resource="pods"
+        )
+        mock_informer_cls.return_value.start.assert_called_once()
+        assert client.informer("unknown") is None
+
+    @patch("system_operations_manager.integrations.kubernetes.client.Informer")
+    @patch("kubernetes.config")
+    def test_switch_context_stops_informers(
+        self, mock_config: MagicMock, mock_informer_cls: MagicMock
+    ) -> None:
+        """Informers should stop on a context switch and restart on next use."""
+        client = KubernetesClient(KubernetesPluginConfig())
+        client._core_v1 = MagicMock()
+        client.enable_informers()
+        client.informer("pods")
+
+        client.switch_context("other")
+
+        mock_informer_cls.return_value.stop.assert_called_once()
+        assert client.informers_enabled is True
+        client._core_v1 = MagicMock()
+        client.informer("pods")
+        assert mock_informer_cls.call_count == 2
+
+        client.disable_informers()
+        assert client.informer("pods") is None
+
+    @patch("system_operations_manager.integrations.kubernetes.client.Informer")
+    @patch("kubernetes.config")
+    def test_forbidden_informer_falls_back_to_list(
+        self, mock_config: MagicMock, mock_informer_cls: MagicMock
+    ) -> None:
+        """A 403 on the cluster-wide LIST should be remembered until the context changes."""
+        from kubernetes.client import ApiException
+
+        client = KubernetesClient(KubernetesPluginConfig())
+        client._core_v1 = MagicMock()
+        client.enable_informers()
+        mock_informer_cls.return_value.start.side_effect = ApiException(
+            status=403, reason="Forbidden"
+        )
+
+        assert client.informer("pods") is None
+        assert client.informer("pods") is None
+        mock_informer_cls.return_value.start.assert_called_once()
+
+        client.switch_context("other")
+        mock_informer_cls.return_value.start.side_effect = None
+        client._core_v1 = MagicMock()
+
+        assert client.informer("pods") is mock_informer_cls.return_value
+
+    @patch("system_operations_manager.integrations.kubernetes.client.Informer")
+    @patch("kubernetes.config")
+    def test_transient_informer_failure_is_retried(
+        self, mock_config: MagicMock, mock_informer_cls: MagicMock
+    ) -> None:
+        """Non-auth start failures should fall back to a LIST and retry next time."""
+        client = KubernetesClient(KubernetesPluginConfig())
+        client._core_v1 = MagicMock()
+        client.enable_informers()
+        mock_informer_cls.return_value.start.side_effect = [OSError("reset"), None]
+
+        assert client.informer("pods") is None
+        assert client.informer("pods") is mock_informer_cls.return_value
+
+    def test_secrets_are_not_cached(self) -> None:
+        """Secrets should never be mirrored by an informer."""
+        from system_operations_manager.integrations.kubernetes.informer import (
+            INFORMER_RESOURCES,
+        )
+
+        assert "secrets" not in INFORMER_RESOURCES
@@ -139,6 +139,7 @@ class TestKubernetesDefaultsConfig:
         assert config.timeout == 300
         assert config.retry_attempts == 3
         assert config.dry_run_strategy == "none"
+        assert config.fast_list is False
 
     def test_custom_values(self) -> None:
         """Test initialization with custom values."""
@@ -375,6 +376,12 @@ class TestKubernetesPluginConfig:
         config = KubernetesPluginConfig.from_env()
         assert config.defaults.dry_run_strategy == "server"
 
+    def test_from_env_fast_list_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test from_env with OPS_K8S_FAST_LIST."""
+        monkeypatch.setenv("OPS_K8S_FAST_LIST", "true")
+        config = KubernetesPluginConfig.from_env()
+        assert config.defaults.fast_list is True
+
     def test_from_env_with_base_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test from_env merges with base config."""
         base = {
@@ -0,0 +1,81 @@
+"""Unit tests for the persistent discovery cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from system_operations_manager.integrations.kubernetes.discovery import (
+    discovery_cache_path,
+    new_dynamic_client,
+)
+
+
+def _api_client(host: str = "https://prod.example:6443") -> MagicMock:
+    api_client = MagicMock()
+    api_client.configuration.host = host
+    return api_client
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestDiscoveryCachePath:
+    """Tests for discovery_cache_path."""
+
+    def test_one_file_per_host(self, tmp_path: Path) -> None:
+        """Different API servers should get different cache files."""
+        prod = discovery_cache_path("https://prod.example:6443", tmp_path)
+        staging = discovery_cache_path("https://staging.example:6443", tmp_path)
+
+        assert prod != staging
+        assert prod == discovery_cache_path("https://prod.example:6443", tmp_path)
+        assert prod.parent == tmp_path
+        assert prod.suffix == ".json"
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestNewDynamicClient:
+    """Tests for new_dynamic_client."""
+
+    @patch("kubernetes.dynamic.DynamicClient")
+    def test_uses_cluster_cache_file(self, mock_dynamic: MagicMock, tmp_path: Path) -> None:
+        """The DynamicClient should persist discovery to the cluster's cache file."""
+        api_client = _api_client()
+        directory = tmp_path / "discovery"
+
+        result = new_dynamic_client(api_client, directory=directory)
+
+        expected = discovery_cache_path(api_client.configuration.host, directory)
+        mock_dynamic.assert_called_once_with(api_client, cache_file=str(expected))
+        assert result is mock_dynamic.return_value
+        assert directory.is_dir()
+
+    @patch("kubernetes.dynamic.DynamicClient")
+    def test_fresh_cache_is_kept(self, mock_dynamic: MagicMock, tmp_path: Path) -> None:
+        """A cache file younger than the TTL should be reused."""
+        api_client = _api_client()
+        path = discovery_cache_path(api_client.configuration.host, tmp_path)
+        path.write_text("{}")
+
+        new_dynamic_client(api_client, directory=tmp_path, ttl=timedelta(hours=1))
+
+        assert path.exists()
+
+    @patch("kubernetes.dynamic.DynamicClient")
+    def test_expired_cache_is_discarded(self, mock_dynamic: MagicMock, tmp_path: Path) -> None:
+        """A cache file older than the TTL should be removed before discovery."""
+        api_client = _api_client()
+        path = discovery_cache_path(api_client.configuration.host, tmp_path)
+        path.write_text("{}")
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+
+        new_dynamic_client(api_client, directory=tmp_path, ttl=timedelta(hours=1))
+
+        assert not path.exists()
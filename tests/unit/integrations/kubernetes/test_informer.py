@@ -0,0 +1,217 @@
+"""Unit tests for the watch-backed informer cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from system_operations_manager.integrations.kubernetes.informer import (
+    WATCH_UNHEALTHY_FAILURES,
+    Informer,
+    parse_label_selector,
+)
+
+
+def _obj(
+    name: str,
+    namespace: str | None = "default",
+    *,
+    labels: dict[str, str] | None = None,
+    owners: tuple[str, ...] = (),
+    resource_version: str = "1",
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(
+            name=name,
+            namespace=namespace,
+            labels=labels,
+            owner_references=[SimpleNamespace(uid=uid) for uid in owners] or None,
+            resource_version=resource_version,
+        )
+    )
+
+
+def _list_func(*objects: Any, resource_version: str = "100") -> MagicMock:
+    return MagicMock(
+        return_value=SimpleNamespace(
+            items=list(objects), metadata=SimpleNamespace(resource_version=resource_version)
+        )
+    )
+
+
+def _informer(*objects: Any) -> Informer:
+    informer = Informer(_list_func(*objects), resource="pods")
+    informer._relist()
+    return informer
+
+
+def _names(objects: list[Any] | None) -> list[str]:
+    assert objects is not None
+    return [o.metadata.name for o in objects]
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestParseLabelSelector:
+    """Tests for parse_label_selector."""
+
+    def test_equality_and_existence(self) -> None:
+        """=, == and bare keys should be parsed."""
+        assert parse_label_selector("app=web, tier==front,canary") == [
+            ("app", "web"),
+            ("tier", "front"),
+            ("canary", None),
+        ]
+
+    @pytest.mark.parametrize("selector", ["app!=web", "!canary", "env in (prod,staging)"])
+    def test_set_based_selectors_are_unsupported(self, selector: str) -> None:
+        """Selectors the index cannot answer should return None."""
+        assert parse_label_selector(selector) is None
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestInformerStore:
+    """Tests for the indexed store."""
+
+    def test_list_filters_by_namespace_and_labels(self) -> None:
+        """Namespace and label filters should intersect."""
+        informer = _informer(
+            _obj("web-1", "prod", labels={"app": "web"}),
+            _obj("web-2", "staging", labels={"app": "web"}),
+            _obj("db-1", "prod", labels={"app": "db", "tier": "data"}),
+        )
+
+        assert _names(informer.list_objects()) == ["db-1", "web-1", "web-2"]
+        assert _names(informer.list_objects("prod")) == ["db-1", "web-1"]
+        assert _names(informer.list_objects("prod", label_selector="app=web")) == ["web-1"]
+        assert _names(informer.list_objects(label_selector="tier")) == ["db-1"]
+        assert informer.list_objects(label_selector="app!=web") is None
+        assert informer.resource_version == "100"
+
+    def test_owned_by(self) -> None:
+        """Objects should be indexed by owner UID."""
+        informer = _informer(
+            _obj("web-1", owners=("rs-1",)),
+            _obj("web-2", owners=("rs-1",)),
+            _obj("other", owners=("rs-2",)),
+        )
+
+        assert _names(informer.owned_by("rs-1")) == ["web-1", "web-2"]
+        assert informer.owned_by("missing") == []
+
+    def test_events_update_store_and_indexes(self) -> None:
+        """ADDED, MODIFIED and DELETED events should keep every index in sync."""
+        informer = _informer(_obj("web-1", labels={"app": "web"}))
+
+        informer.apply_event(
+            {
+                "type": "ADDED",
+                "object": _obj("web-2", labels={"app": "web"}, resource_version="101"),
+            }
+        )
+        informer.apply_event(
+            {
+                "type": "MODIFIED",
+                "object": _obj("web-1", labels={"app": "api"}, resource_version="102"),
+            }
+        )
+        assert _names(informer.list_objects(label_selector="app=web")) == ["web-2"]
+        assert _names(informer.list_objects(label_selector="app=api")) == ["web-1"]
+
+        informer.apply_event({"type": "DELETED", "object": _obj("web-2", resource_version="103")})
+        assert _names(informer.list_objects()) == ["web-1"]
+        assert informer.list_objects(label_selector="app=web") == []
+        assert informer._by_label.get(("app", "web")) is None
+        assert informer.resource_version == "103"
+
+    def test_bookmark_advances_resource_version(self) -> None:
+        """BOOKMARK events should only move the resume point."""
+        informer = _informer(_obj("web-1"))
+
+        informer.apply_event(
+            {"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "250"}}}
+        )
+
+        assert informer.resource_version == "250"
+        assert len(informer) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestInformerWatch:
+    """Tests for the watch loop."""
+
+    def test_resumes_from_bookmark_and_relists_on_gone(self) -> None:
+        """A 410 should trigger a re-list; watches resume from the latest version."""
+        from kubernetes.client import ApiException
+
+        list_func = _list_func(_obj("web-1"))
+        informer = Informer(list_func, resource="pods")
+        informer._relist()
+        calls: list[str | None] = []
+
+        def stream(func: Any, **kwargs: Any) -> Any:
+            calls.append(kwargs["resource_version"])
+            assert kwargs["allow_watch_bookmarks"] is True
+            if len(calls) == 1:
+                yield {"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "150"}}}
+            elif len(calls) == 2:
+                raise ApiException(status=410, reason="Gone")
+            else:
+                informer._stopped.set()
+                yield {"type": "ADDED", "object": _obj("web-2", resource_version="201")}
+
+        with patch("kubernetes.watch.Watch") as mock_watch:
+            mock_watch.return_value.stream.side_effect = stream
+            informer._run()
+
+        assert calls == ["100", "150", "100"]
+        assert list_func.call_count == 2
+        assert _names(informer.list_objects()) == ["web-1"]
+
+    def test_repeated_watch_failures_mark_store_unhealthy(self) -> None:
+        """Failing watches should stop list_objects serving the stale store."""
+        from kubernetes.client import ApiException
+
+        informer = Informer(_list_func(_obj("web-1")), resource="pods")
+        informer._relist()
+        attempts = 0
+
+        def stream(func: Any, **kwargs: Any) -> Any:
+            nonlocal attempts
+            attempts += 1
+            if attempts == WATCH_UNHEALTHY_FAILURES:
+                informer._stopped.set()
+            raise ApiException(status=403, reason="Forbidden")
+
+        with (
+            patch("kubernetes.watch.Watch") as mock_watch,
+            patch.object(informer._stopped, "wait"),
+        ):
+            mock_watch.return_value.stream.side_effect = stream
+            informer._run()
+
+        assert attempts == WATCH_UNHEALTHY_FAILURES
+        assert not informer.healthy
+        assert informer.list_objects() is None
+
+    def test_watch_event_restores_health(self) -> None:
+        """A delivered event should make the store servable again."""
+        informer = Informer(_list_func(_obj("web-1")), resource="pods")
+        informer._relist()
+        informer._watch_failures = WATCH_UNHEALTHY_FAILURES
+
+        def stream(func: Any, **kwargs: Any) -> Any:
+            yield {"type": "ADDED", "object": _obj("web-2", resource_version="101")}
+            informer._stopped.set()
+
+        with patch("kubernetes.watch.Watch") as mock_watch:
+            mock_watch.return_value.stream.side_effect = stream
+            informer._run()
+
+        assert informer.healthy
+        assert _names(informer.list_objects()) == ["web-1", "web-2"]
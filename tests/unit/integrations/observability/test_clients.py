@@ -1265,6 +1265,102 @@ class TestLokiClient:
         assert entries[1]["value"] == 6.2
         assert "labels" in entries[0]
 
+    @pytest.mark.unit
+    def test_parse_query_response_matrix_shares_step_timestamps(
+        self, client: LokiClient, mock_httpx_client: MagicMock
+    ) -> None:
+        """Series sampled at the same step should share one datetime per step."""
+        data = {
+            "status": "success",
+            "data": {
+                "resultType": "matrix",
+                "result": [
+                    {"metric": {"service": "a"}, "values": [[1708387200, "1"], [1708387260, "2"]]},
+                    {"metric": {"service": "b"}, "values": [[1708387200, "3"]]},
+                ],
+            },
+        }
+
+        entries = client._parse_query_response(data)
+
+        assert [e["value"] for e in entries] == [1.0, 2.0, 3.0]
+        assert entries[0]["timestamp"] is entries[2]["timestamp"]
+        assert entries[0]["timestamp"] == datetime.fromtimestamp(1708387200)
+
+    @pytest.mark.unit
+    def test_count_kong_logs_runs_instant_metric_query(
+        self, client: LokiClient, mock_httpx_client: MagicMock
+    ) -> None:
+        """count_kong_logs should aggregate server-side with count_over_time."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "status": "success",
+            "data": {"resultType": "vector", "result": [{"metric": {}, "value": [1, "1234"]}]},
+        }
+        mock_httpx_client.request.return_value = mock_response
+        end = datetime(2024, 6, 1, 13, 0, 0)
+
+        count = client.count_kong_logs(
+            service="api", start_time=end - timedelta(minutes=30), end_time=end
+        )
+
+        assert count == 1234
+        params = mock_httpx_client.request.call_args.kwargs["params"]
+        assert mock_httpx_client.request.call_args.args[1] == "/loki/api/v1/query"
+        assert params["query"] == 'sum (count_over_time({job="kong",service="api"} [1800s]))'
+        assert params["time"] == client._datetime_to_ns(end)
+
+    @pytest.mark.unit
+    def test_get_kong_status_distribution(
+        self, client: LokiClient, mock_httpx_client: MagicMock
+    ) -> None:
+        """Status distribution should group by the parsed response_status."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "status": "success",
+            "data": {
+                "resultType": "vector",
+                "result": [
+                    {"metric": {"response_status": "200"}, "value": [1, "90"]},
+                    {"metric": {"response_status": "503"}, "value": [1, "4"]},
+                    {"metric": {}, "value": [1, "2"]},
+                ],
+            },
+        }
+        mock_httpx_client.request.return_value = mock_response
+
+        dist = client.get_kong_status_distribution()
+
+        assert dist == {200: 90, 503: 4}
+        query = mock_httpx_client.request.call_args.kwargs["params"]["query"]
+        assert query.startswith("sum by (response_status) (count_over_time(")
+        assert '| json | __error__=""' in query
+
+    @pytest.mark.unit
+    def test_get_kong_service_distribution(
+        self, client: LokiClient, mock_httpx_client: MagicMock
+    ) -> None:
+        """Service distribution should group by the service stream label."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "status": "success",
+            "data": {
+                "resultType": "vector",
+                "result": [
+                    {"metric": {"service": "svc-a"}, "value": [1, "12"]},
+                    {"metric": {"service": "svc-b"}, "value": [1, "3"]},
+                ],
+            },
+        }
+        mock_httpx_client.request.return_value = mock_response
+
+        assert client.get_kong_service_distribution() == {"svc-a": 12, "svc-b": 3}
+        query = mock_httpx_client.request.call_args.kwargs["params"]["query"]
+        assert query.startswith('sum by (service) (count_over_time({job="kong"} [')
+
     @pytest.mark.unit
     def test_get_series_parses_result(
         self, client: LokiClient, mock_httpx_client: MagicMock
@@ -512,6 +512,65 @@ class TestApplyCommandDblessMode:
             mock_config_manager.sync_config.assert_called_once()
             mock_config_manager.apply_config.assert_not_called()
 
+    @pytest.mark.unit
+    def test_apply_bulk_in_db_mode(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_config_manager: MagicMock,
+        sample_valid_config: dict[str, Any],
+        sample_diff_with_changes: ConfigDiffSummary,
+    ) -> None:
+        """--bulk should ask apply_config to use /config in DB mode."""
+        mock_config_manager.is_dbless_mode.return_value = False
+        mock_config_manager.diff_config.return_value = sample_diff_with_changes
+        mock_config_manager.apply_config.return_value = [
+            ApplyOperation(
+                operation="create",
+                entity_type="services",
+                id_or_name="new-service",
+                result="success",
+            ),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "kong.yaml"
+            config_path.write_text(yaml.dump(sample_valid_config))
+
+            result = cli_runner.invoke(app, [str(config_path), "--no-confirm", "--bulk"])
+
+            assert result.exit_code == 0
+            mock_config_manager.apply_config.assert_called_once()
+            assert mock_config_manager.apply_config.call_args.kwargs["bulk"] is True
+
+    @pytest.mark.unit
+    def test_apply_concurrency_and_fail_fast(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_config_manager: MagicMock,
+        sample_valid_config: dict[str, Any],
+        sample_diff_with_changes: ConfigDiffSummary,
+    ) -> None:
+        """--concurrency and --fail-fast should be passed to apply_config."""
+        mock_config_manager.is_dbless_mode.return_value = False
+        mock_config_manager.diff_config.return_value = sample_diff_with_changes
+        mock_config_manager.apply_config.return_value = []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "kong.yaml"
+            config_path.write_text(yaml.dump(sample_valid_config))
+
+            result = cli_runner.invoke(
+                app,
+                [str(config_path), "--no-confirm", "--concurrency", "16", "--fail-fast"],
+            )
+
+            assert result.exit_code == 0
+            kwargs = mock_config_manager.apply_config.call_args.kwargs
+            assert kwargs["max_workers"] == 16
+            assert kwargs["on_error"] == "fail-fast"
+
     @pytest.mark.unit
     def test_apply_dbless_mode_sync_failure(
         self,
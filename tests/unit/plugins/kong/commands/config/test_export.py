@@ -141,6 +141,41 @@ class TestExportCommand:
             assert call_kwargs[1]["include_credentials"] is True
             assert "warning" in result.stdout.lower()
 
+    @pytest.mark.unit
+    def test_export_with_page_size_and_concurrency(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_config_manager: MagicMock,
+    ) -> None:
+        """export should pass --page-size and --concurrency to manager."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "kong.yaml"
+
+            result = cli_runner.invoke(
+                app,
+                [str(output_path), "--page-size", "500", "--concurrency", "16"],
+            )
+
+            assert result.exit_code == 0
+            call_kwargs = mock_config_manager.export_state.call_args
+            assert call_kwargs[1]["page_size"] == 500
+            assert call_kwargs[1]["max_workers"] == 16
+
+    @pytest.mark.unit
+    def test_export_rejects_page_size_above_kong_limit(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+    ) -> None:
+        """export should reject page sizes Kong does not accept."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "kong.yaml"
+
+            result = cli_runner.invoke(app, [str(output_path), "--page-size", "5000"])
+
+            assert result.exit_code != 0
+
     @pytest.mark.unit
     def test_export_includes_metadata(
         self,
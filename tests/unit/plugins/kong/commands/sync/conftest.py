@@ -43,6 +43,18 @@ def mock_unified_service() -> MagicMock:
     service.list_consumers.return_value = empty_list
     service.list_plugins.return_value = empty_list
     service.list_upstreams.return_value = empty_list
+    service.list_certificates.return_value = empty_list
+    service.list_snis.return_value = empty_list
+    service.list_ca_certificates.return_value = empty_list
+    service.list_key_sets.return_value = empty_list
+    service.list_keys.return_value = empty_list
+    service.list_vaults.return_value = empty_list
+
+    # Sync sessions snapshot through get_sync_snapshot; serve it from the
+    # list_* mocks so tests only configure those
+    service.get_sync_snapshot.side_effect = lambda entity_types: {
+        entity_type: getattr(service, f"list_{entity_type}")() for entity_type in entity_types
+    }
 
     return service
 
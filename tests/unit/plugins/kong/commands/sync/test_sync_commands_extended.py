@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,84 +15,56 @@ from system_operations_manager.integrations.kong.models.unified import (
     UnifiedEntity,
     UnifiedEntityList,
 )
+from system_operations_manager.integrations.kong.models.upstream import Upstream
 from system_operations_manager.plugins.kong.commands.sync import register_sync_commands
 
 
-def _summary_with_drift() -> dict[str, dict[str, int]]:
-    """Return a sync summary with drift in services."""
-    return {
-        "services": {"gateway_only": 0, "konnect_only": 0, "synced": 1, "drift": 1, "total": 2},
-        "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "consumers": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "upstreams": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-    }
-
-
-def _summary_with_gateway_only() -> dict[str, dict[str, int]]:
-    """Return a sync summary with gateway-only services."""
-    return {
-        "services": {"gateway_only": 2, "konnect_only": 0, "synced": 0, "drift": 0, "total": 2},
-        "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "consumers": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "upstreams": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-    }
-
-
-def _summary_with_konnect_only() -> dict[str, dict[str, int]]:
-    """Return a sync summary with konnect-only services."""
-    return {
-        "services": {"gateway_only": 0, "konnect_only": 2, "synced": 0, "drift": 0, "total": 2},
-        "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "consumers": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "upstreams": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-    }
-
-
-def _summary_with_gateway_only_and_drift() -> dict[str, dict[str, int]]:
-    """Return a sync summary with both gateway-only and drift."""
-    return {
-        "services": {"gateway_only": 1, "konnect_only": 0, "synced": 0, "drift": 1, "total": 2},
-        "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "consumers": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "upstreams": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-    }
-
-
-def _summary_with_upstreams() -> dict[str, dict[str, int]]:
-    """Return a sync summary with upstream entities."""
-    return {
-        "services": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "consumers": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "upstreams": {"gateway_only": 1, "konnect_only": 0, "synced": 1, "drift": 0, "total": 2},
-    }
-
-
-def _summary_konnect_upstreams() -> dict[str, dict[str, int]]:
-    """Return a sync summary with konnect-only upstream entities."""
-    return {
-        "services": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "consumers": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "upstreams": {"gateway_only": 0, "konnect_only": 1, "synced": 1, "drift": 0, "total": 2},
-    }
-
-
-def _empty_summary() -> dict[str, dict[str, int]]:
-    """Return an empty sync summary."""
-    return {
-        "services": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "consumers": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-        "upstreams": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-    }
+def _unified(
+    entity: Service | Upstream, source: EntitySource, *, has_drift: bool = False
+) -> UnifiedEntity[Any]:
+    """Wrap an entity as a unified entity from the given source."""
+    in_gateway = source != EntitySource.KONNECT
+    in_konnect = source != EntitySource.GATEWAY
+    return UnifiedEntity(
+        entity=entity,
+        source=source,
+        gateway_id=entity.id if in_gateway else None,
+        konnect_id=f"konnect-{entity.id}" if in_konnect else None,
+        has_drift=has_drift,
+        gateway_entity=entity if in_gateway else None,
+        konnect_entity=entity if in_konnect else None,
+    )
+
+
+def _konnect_only_services() -> UnifiedEntityList[Service]:
+    """Return two services that only exist in Konnect."""
+    return UnifiedEntityList(
+        entities=[
+            _unified(
+                Service(id=f"svc-{i}", name=f"konnect-{i}", host="konnect.local"),
+                EntitySource.KONNECT,
+            )
+            for i in (1, 2)
+        ]
+    )
+
+
+def _gateway_only_services() -> UnifiedEntityList[Service]:
+    """Return two services that only exist in the Gateway."""
+    return UnifiedEntityList(
+        entities=[
+            _unified(
+                Service(id=f"svc-{i}", name=f"gateway-{i}", host="gw.local"), EntitySource.GATEWAY
+            )
+            for i in (1, 2)
+        ]
+    )
+
+
+def _drifted_services() -> UnifiedEntityList[Service]:
+    """Return one service present in both with drift."""
+    service = Service(id="svc-drift", name="my-api", host="old-host.local")
+    return UnifiedEntityList(entities=[_unified(service, EntitySource.BOTH, has_drift=True)])
 
 
 @pytest.fixture
@@ -177,7 +150,7 @@ class TestPushExtended:
         mock_unified_service: MagicMock,
     ) -> None:
         """push --skip-conflicts with only drift shows skip message."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
+        mock_unified_service.list_services.return_value = _drifted_services()
         result = cli_runner.invoke(full_app, ["sync", "push", "--skip-conflicts", "--force"])
 
         assert result.exit_code == 0
@@ -192,8 +165,9 @@ class TestPushExtended:
         sample_gateway_only_services: UnifiedEntityList[Service],
     ) -> None:
         """push --skip-conflicts still creates gateway-only but skips drifted."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_gateway_only_and_drift()
-        mock_unified_service.list_services.return_value = sample_gateway_only_services
+        mock_unified_service.list_services.return_value = UnifiedEntityList(
+            entities=[*sample_gateway_only_services.entities[:1], *_drifted_services().entities]
+        )
 
         result = cli_runner.invoke(full_app, ["sync", "push", "--skip-conflicts", "--force"])
 
@@ -209,7 +183,7 @@ class TestPushExtended:
         mock_unified_service: MagicMock,
     ) -> None:
         """push --skip-conflicts --interactive should error."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_gateway_only()
+        mock_unified_service.list_services.return_value = _gateway_only_services()
         result = cli_runner.invoke(
             full_app, ["sync", "push", "--skip-conflicts", "--interactive", "--force"]
         )
@@ -225,7 +199,7 @@ class TestPushExtended:
         mock_unified_service: MagicMock,
     ) -> None:
         """push with no konnect managers shows error."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_gateway_only()
+        mock_unified_service.list_services.return_value = _gateway_only_services()
         result = cli_runner.invoke(app_no_managers, ["sync", "push", "--force"])
 
         assert result.exit_code == 1
@@ -263,7 +237,6 @@ class TestPushExtended:
             action=ResolutionAction.KEEP_SOURCE,
         )
         mock_tui.return_value = [resolution]
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
         mock_unified_service.list_services.return_value = sample_drifted_services
 
         result = cli_runner.invoke(full_app, ["sync", "push", "--interactive"])
@@ -283,7 +256,7 @@ class TestPushExtended:
     ) -> None:
         """push --interactive with empty resolutions cancels."""
         mock_tui.return_value = []
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
+        mock_unified_service.list_services.return_value = _drifted_services()
 
         result = cli_runner.invoke(full_app, ["sync", "push", "--interactive"])
 
@@ -302,7 +275,6 @@ class TestPushExtended:
     ) -> None:
         """push without --force asks for confirmation; declining cancels."""
         mock_confirm.return_value = False
-        mock_unified_service.get_sync_summary.return_value = _summary_with_gateway_only()
         mock_unified_service.list_services.return_value = sample_gateway_only_services
 
         result = cli_runner.invoke(full_app, ["sync", "push"])
@@ -342,7 +314,6 @@ class TestPushExtended:
             action=ResolutionAction.KEEP_TARGET,
         )
         mock_tui.return_value = [resolution]
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
         mock_unified_service.list_services.return_value = sample_drifted_services
 
         result = cli_runner.invoke(full_app, ["sync", "push", "--interactive"])
@@ -383,7 +354,6 @@ class TestPushExtended:
             merged_state={"host": "merged-host.local"},
         )
         mock_tui.return_value = [resolution]
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
         mock_unified_service.list_services.return_value = sample_drifted_services
 
         result = cli_runner.invoke(full_app, ["sync", "push", "--interactive"])
@@ -403,9 +373,12 @@ class TestPushExtended:
     ) -> None:
         """push --include-targets pushes targets for upstream entities."""
 
-        mock_unified_service.get_sync_summary.return_value = _summary_with_upstreams()
-        mock_unified_service.list_upstreams.return_value = sample_upstreams
+        new_upstream = Upstream(id="up-3", name="new-upstream")
+        mock_unified_service.list_upstreams.return_value = UnifiedEntityList(
+            entities=[_unified(new_upstream, EntitySource.GATEWAY), *sample_upstreams.entities]
+        )
         mock_unified_service.list_targets_for_upstream.return_value = sample_gateway_only_targets
+        mock_konnect_upstream_manager.create.return_value = new_upstream
 
         result = cli_runner.invoke(
             full_app, ["sync", "push", "--type", "upstreams", "--include-targets", "--force"]
@@ -426,7 +399,7 @@ class TestPullExtended:
         mock_unified_service: MagicMock,
     ) -> None:
         """pull --skip-conflicts with only drift shows skip message."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
+        mock_unified_service.list_services.return_value = _drifted_services()
         result = cli_runner.invoke(full_app, ["sync", "pull", "--skip-conflicts", "--force"])
 
         assert result.exit_code == 0
@@ -440,7 +413,7 @@ class TestPullExtended:
         mock_unified_service: MagicMock,
     ) -> None:
         """pull --skip-conflicts --interactive should error."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_konnect_only()
+        mock_unified_service.list_services.return_value = _konnect_only_services()
         result = cli_runner.invoke(
             full_app, ["sync", "pull", "--skip-conflicts", "--interactive", "--force"]
         )
@@ -456,7 +429,7 @@ class TestPullExtended:
         mock_unified_service: MagicMock,
     ) -> None:
         """pull with no gateway managers shows error."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_konnect_only()
+        mock_unified_service.list_services.return_value = _konnect_only_services()
         result = cli_runner.invoke(app_no_managers, ["sync", "pull", "--force"])
 
         assert result.exit_code == 1
@@ -493,7 +466,6 @@ class TestPullExtended:
             action=ResolutionAction.KEEP_SOURCE,
         )
         mock_tui.return_value = [resolution]
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
         mock_unified_service.list_services.return_value = sample_drifted_services
 
         result = cli_runner.invoke(full_app, ["sync", "pull", "--interactive"])
@@ -512,7 +484,7 @@ class TestPullExtended:
     ) -> None:
         """pull --interactive with empty resolutions cancels."""
         mock_tui.return_value = []
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
+        mock_unified_service.list_services.return_value = _drifted_services()
 
         result = cli_runner.invoke(full_app, ["sync", "pull", "--interactive"])
 
@@ -530,7 +502,7 @@ class TestPullExtended:
     ) -> None:
         """pull without --force asks for confirmation; declining cancels."""
         mock_confirm.return_value = False
-        mock_unified_service.get_sync_summary.return_value = _summary_with_konnect_only()
+        mock_unified_service.list_services.return_value = _konnect_only_services()
 
         result = cli_runner.invoke(full_app, ["sync", "pull"])
 
@@ -545,58 +517,10 @@ class TestPullExtended:
         mock_unified_service: MagicMock,
     ) -> None:
         """pull --skip-conflicts with konnect-only shows skip message and pulls new."""
-        summary = {
-            "services": {
-                "gateway_only": 0,
-                "konnect_only": 1,
-                "synced": 0,
-                "drift": 1,
-                "total": 2,
-            },
-            "routes": {
-                "gateway_only": 0,
-                "konnect_only": 0,
-                "synced": 0,
-                "drift": 0,
-                "total": 0,
-            },
-            "consumers": {
-                "gateway_only": 0,
-                "konnect_only": 0,
-                "synced": 0,
-                "drift": 0,
-                "total": 0,
-            },
-            "plugins": {
-                "gateway_only": 0,
-                "konnect_only": 0,
-                "synced": 0,
-                "drift": 0,
-                "total": 0,
-            },
-            "upstreams": {
-                "gateway_only": 0,
-                "konnect_only": 0,
-                "synced": 0,
-                "drift": 0,
-                "total": 0,
-            },
-        }
         konnect_svc = Service(id="konnect-svc-1", name="konnect-api", host="konnect.local")
-        konnect_only_entities = UnifiedEntityList(
-            entities=[
-                UnifiedEntity(
-                    entity=konnect_svc,
-                    source=EntitySource.KONNECT,
-                    gateway_id=None,
-                    konnect_id="konnect-svc-1",
-                    has_drift=False,
-                    konnect_entity=konnect_svc,
-                ),
-            ]
+        mock_unified_service.list_services.return_value = UnifiedEntityList(
+            entities=[_unified(konnect_svc, EntitySource.KONNECT), *_drifted_services().entities]
         )
-        mock_unified_service.get_sync_summary.return_value = summary
-        mock_unified_service.list_services.return_value = konnect_only_entities
 
         result = cli_runner.invoke(full_app, ["sync", "pull", "--skip-conflicts", "--force"])
 
@@ -614,8 +538,10 @@ class TestPullExtended:
         sample_konnect_only_targets: MagicMock,
     ) -> None:
         """pull --include-targets pulls targets for upstream entities."""
-        mock_unified_service.get_sync_summary.return_value = _summary_konnect_upstreams()
-        mock_unified_service.list_upstreams.return_value = sample_upstreams
+        new_upstream = Upstream(id="up-3", name="new-upstream")
+        mock_unified_service.list_upstreams.return_value = UnifiedEntityList(
+            entities=[_unified(new_upstream, EntitySource.KONNECT), *sample_upstreams.entities]
+        )
         mock_unified_service.list_targets_for_upstream.return_value = sample_konnect_only_targets
 
         result = cli_runner.invoke(
@@ -652,7 +578,7 @@ class TestPullExtended:
         )
         resolution = Resolution(conflict=conflict, action=ResolutionAction.SKIP)
         mock_tui.return_value = [resolution]
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
+        mock_unified_service.list_services.return_value = _drifted_services()
 
         result = cli_runner.invoke(full_app, ["sync", "pull", "--interactive"])
 
@@ -668,7 +594,6 @@ class TestPullExtended:
         sample_drifted_services: UnifiedEntityList[Service],
     ) -> None:
         """pull --with-drift shows 'Would update' in dry run summary."""
-        mock_unified_service.get_sync_summary.return_value = _summary_with_drift()
         mock_unified_service.list_services.return_value = sample_drifted_services
 
         result = cli_runner.invoke(full_app, ["sync", "pull", "--with-drift", "--dry-run"])
@@ -438,28 +438,11 @@ class TestSyncPullCommand:
         cli_runner: CliRunner,
         app: typer.Typer,
         mock_unified_service: MagicMock,
+        sample_drifted_services: UnifiedEntityList[Service],
     ) -> None:
         """pull without --with-drift should show hint about drifted entities."""
         # No konnect_only but has drift
-        mock_unified_service.get_sync_summary.return_value = {
-            "services": {"gateway_only": 0, "konnect_only": 0, "synced": 1, "drift": 2, "total": 3},
-            "routes": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-            "consumers": {
-                "gateway_only": 0,
-                "konnect_only": 0,
-                "synced": 0,
-                "drift": 0,
-                "total": 0,
-            },
-            "plugins": {"gateway_only": 0, "konnect_only": 0, "synced": 0, "drift": 0, "total": 0},
-            "upstreams": {
-                "gateway_only": 0,
-                "konnect_only": 0,
-                "synced": 0,
-                "drift": 0,
-                "total": 0,
-            },
-        }
+        mock_unified_service.list_services.return_value = sample_drifted_services
 
         result = cli_runner.invoke(app, ["sync", "pull"])
 
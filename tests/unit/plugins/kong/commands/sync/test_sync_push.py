@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -123,6 +124,25 @@ class TestSyncPushCommand:
         assert mock_konnect_service_manager.create.call_count == 2
         assert "Created:" in result.stdout
 
+    @pytest.mark.unit
+    def test_push_fetches_snapshot_once_and_refreshes_created_services(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_unified_service: MagicMock,
+        sample_gateway_only_services: UnifiedEntityList[Service],
+    ) -> None:
+        """push should reuse one snapshot, re-fetching services only after creating some."""
+        mock_unified_service.list_services.return_value = sample_gateway_only_services
+
+        result = cli_runner.invoke(app, ["sync", "push", "--force"])
+
+        assert result.exit_code == 0
+        snapshots = [c.args[0] for c in mock_unified_service.get_sync_snapshot.call_args_list]
+        assert len(snapshots) == 2
+        assert {"services", "routes", "upstreams"} <= set(snapshots[0])
+        assert snapshots[1] == ["services"]
+
     @pytest.mark.unit
     def test_push_updates_entities_with_drift(
         self,
@@ -438,3 +458,52 @@ class TestPushEntityTypeHelper:
         assert created == 0
         assert updated == 0
         assert errors == 0
+
+    @pytest.mark.unit
+    def test_push_entity_type_writes_concurrently_in_order(
+        self,
+        mock_unified_service: MagicMock,
+        mock_konnect_service_manager: MagicMock,
+    ) -> None:
+        """Creates should overlap in flight while audit entries keep entity order."""
+        from system_operations_manager.plugins.kong.commands.sync import _push_entity_type
+
+        services = [Service(id=f"svc-{i}", name=f"api-{i}", host="api.local") for i in range(4)]
+        mock_unified_service.list_services.return_value = UnifiedEntityList(
+            entities=[
+                UnifiedEntity(
+                    entity=service,
+                    source=EntitySource.GATEWAY,
+                    gateway_id=service.id,
+                    gateway_entity=service,
+                )
+                for service in services
+            ]
+        )
+        # Every create waits for all four to be in flight at once
+        barrier = threading.Barrier(4, timeout=5)
+
+        def create(service: Service) -> Service:
+            barrier.wait()
+            if service.name == "api-2":
+                raise RuntimeError("conflict")
+            return service
+
+        mock_konnect_service_manager.create.side_effect = create
+        audit_service = MagicMock()
+
+        created, updated, errors = _push_entity_type(
+            "services",
+            mock_unified_service,
+            {"services": mock_konnect_service_manager},
+            dry_run=False,
+            audit_service=audit_service,
+            sync_id="sync-1",
+            max_workers=4,
+        )
+
+        assert (created, updated, errors) == (3, 0, 1)
+        entries = [c.args[0] for c in audit_service.record.call_args_list]
+        assert [e.entity_name for e in entries] == ["api-0", "api-1", "api-2", "api-3"]
+        assert [e.status for e in entries] == ["success", "success", "failed", "success"]
+        assert entries[2].error == "conflict"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -280,7 +281,7 @@ class TestSyncStatusCommand:
     ) -> None:
         result = cli_runner.invoke(app, ["sync", "status", "--type", "services"])
         assert result.exit_code == 0
-        mock_unified_service.get_sync_summary.assert_called_once_with(["services"])
+        mock_unified_service.get_sync_snapshot.assert_called_once_with(["services"])
 
     def test_status_invalid_type(
         self,
@@ -299,7 +300,7 @@ class TestSyncStatusCommand:
     ) -> None:
         result = cli_runner.invoke(app, ["sync", "status"])
         assert result.exit_code == 0
-        call_args = mock_unified_service.get_sync_summary.call_args[0][0]
+        call_args = mock_unified_service.get_sync_snapshot.call_args[0][0]
         assert "services" in call_args
         assert "routes" in call_args
 
@@ -372,6 +373,29 @@ class TestSyncHistoryCommand:
         register_sync_commands(test_app, lambda: mock_unified_service)
         return test_app
 
+    @patch("system_operations_manager.services.kong.sync_audit.SyncAuditService")
+    def test_history_uses_configured_retention(
+        self,
+        mock_audit_cls: MagicMock,
+        cli_runner: CliRunner,
+        mock_unified_service: MagicMock,
+    ) -> None:
+        test_app = typer.Typer()
+        register_sync_commands(
+            test_app,
+            lambda: mock_unified_service,
+            audit_max_age=timedelta(days=30),
+            audit_retention=timedelta(days=180),
+        )
+        mock_audit_cls.return_value.list_syncs.return_value = []
+
+        result = cli_runner.invoke(test_app, ["sync", "history"])
+
+        assert result.exit_code == 0
+        mock_audit_cls.assert_called_once_with(
+            max_age=timedelta(days=30), retention=timedelta(days=180)
+        )
+
     @patch("system_operations_manager.services.kong.sync_audit.SyncAuditService")
     def test_history_no_syncs(
         self,
@@ -51,6 +51,16 @@ def mock_client() -> MagicMock:
     return client
 
 
+@pytest.fixture(autouse=True)
+def _isolated_control_plane_cache(tmp_path: Any) -> Generator[None]:
+    """Keep Konnect control plane resolutions out of the real ~/.cache."""
+    with patch(
+        "system_operations_manager.integrations.konnect.cache.ControlPlaneCache.get_cache_path",
+        return_value=tmp_path / "konnect_control_planes.json",
+    ):
+        yield
+
+
 @pytest.fixture
 def kong_plugin(mock_client: MagicMock) -> KongPlugin:
     """Create a KongPlugin with a mocked client."""
@@ -741,6 +751,67 @@ class TestRegisterEntityCommands:
 
             result = get_konnect_service_manager()
             assert result is None
+            mock_client_cls.return_value.close.assert_called_once()
+
+    def test_konnect_session_shared_across_factories(
+        self,
+        kong_plugin: KongPlugin,
+        factories: dict[str, MagicMock],
+    ) -> None:
+        """All Konnect managers share one client and one control plane lookup."""
+        kwargs = factories["register_sync_commands"].call_args[1]
+
+        with (
+            patch("system_operations_manager.integrations.konnect.KonnectConfig") as mock_config,
+            patch(
+                "system_operations_manager.integrations.konnect.KonnectClient"
+            ) as mock_client_cls,
+        ):
+            config_obj = MagicMock()
+            config_obj.default_control_plane = "my-cp"
+            mock_config.exists.return_value = True
+            mock_config.load.return_value = config_obj
+            mock_client_cls.return_value.find_control_plane.return_value.id = "cp-123"
+
+            service_mgr = kwargs["get_konnect_service_manager"]()
+            route_mgr = kwargs["get_konnect_route_manager"]()
+            plugin_mgr = kwargs["get_konnect_plugin_manager"]()
+
+        assert service_mgr._client is route_mgr._client is plugin_mgr._client
+        mock_client_cls.assert_called_once()
+        mock_client_cls.return_value.find_control_plane.assert_called_once_with("my-cp")
+
+        kong_plugin.cleanup()
+        mock_client_cls.return_value.close.assert_called_once()
+
+    def test_konnect_control_plane_resolved_from_disk_cache(
+        self,
+        factories: dict[str, MagicMock],
+    ) -> None:
+        """A cached control plane ID avoids the find_control_plane lookup."""
+        from system_operations_manager.integrations.konnect.cache import ControlPlaneCache
+
+        kwargs = factories["register_sync_commands"].call_args[1]
+
+        with (
+            patch("system_operations_manager.integrations.konnect.KonnectConfig") as mock_config,
+            patch(
+                "system_operations_manager.integrations.konnect.KonnectClient"
+            ) as mock_client_cls,
+        ):
+            config_obj = MagicMock()
+            config_obj.default_control_plane = "my-cp"
+            mock_config.exists.return_value = True
+            mock_config.load.return_value = config_obj
+            ControlPlaneCache().set(config_obj, "my-cp", "cp-cached")
+
+            manager = kwargs["get_konnect_service_manager"]()
+
+        assert manager is not None
+        assert manager._control_plane_id == "cp-cached"
+        mock_client_cls.return_value.find_control_plane.assert_not_called()
+        mock_client_cls.return_value.get_control_plane.assert_not_called()
+        mock_client_cls.return_value.set_control_plane_resolver.assert_called_once()
 
 
 @pytest.mark.unit
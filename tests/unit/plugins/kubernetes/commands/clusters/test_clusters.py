@@ -110,12 +110,12 @@ class TestEventCommands:
         sample_event: MagicMock,
     ) -> None:
         """events list should display events."""
-        mock_namespace_cluster_manager.list_events.return_value = [sample_event]
+        mock_namespace_cluster_manager.iter_events.return_value = iter([[sample_event]])
 
         result = cli_runner.invoke(app, ["events", "list"])
 
         assert result.exit_code == 0
-        mock_namespace_cluster_manager.list_events.assert_called_once()
+        mock_namespace_cluster_manager.iter_events.assert_called_once()
 
     def test_list_events_all_namespaces(
         self,
@@ -124,7 +124,7 @@ class TestEventCommands:
         mock_namespace_cluster_manager: MagicMock,
     ) -> None:
         """events list -A should list from all namespaces."""
-        mock_namespace_cluster_manager.list_events.return_value = []
+        mock_namespace_cluster_manager.iter_events.return_value = iter([])
 
         result = cli_runner.invoke(app, ["events", "list", "--all-namespaces"])
 
@@ -137,12 +137,12 @@ class TestEventCommands:
         mock_namespace_cluster_manager: MagicMock,
     ) -> None:
         """events list --involved-object should filter by object."""
-        mock_namespace_cluster_manager.list_events.return_value = []
+        mock_namespace_cluster_manager.iter_events.return_value = iter([])
 
         result = cli_runner.invoke(app, ["events", "list", "--involved-object", "my-pod"])
 
         assert result.exit_code == 0
-        call_kwargs = mock_namespace_cluster_manager.list_events.call_args[1]
+        call_kwargs = mock_namespace_cluster_manager.iter_events.call_args[1]
         assert call_kwargs["involved_object"] == "my-pod"
 
     def test_list_events_with_field_selector(
@@ -152,7 +152,7 @@ class TestEventCommands:
         mock_namespace_cluster_manager: MagicMock,
     ) -> None:
         """events list --field-selector should filter by field."""
-        mock_namespace_cluster_manager.list_events.return_value = []
+        mock_namespace_cluster_manager.iter_events.return_value = iter([])
 
         result = cli_runner.invoke(app, ["events", "list", "--field-selector", "type=Warning"])
 
@@ -165,7 +165,7 @@ class TestEventCommands:
         mock_namespace_cluster_manager: MagicMock,
     ) -> None:
         """events list -n should filter by namespace."""
-        mock_namespace_cluster_manager.list_events.return_value = []
+        mock_namespace_cluster_manager.iter_events.return_value = iter([])
 
         result = cli_runner.invoke(app, ["events", "list", "-n", "production"])
 
@@ -293,7 +293,7 @@ class TestEventCommandErrorPaths:
         mock_namespace_cluster_manager: MagicMock,
     ) -> None:
         """events list should handle KubernetesError and exit with code 1."""
-        mock_namespace_cluster_manager.list_events.side_effect = KubernetesError(
+        mock_namespace_cluster_manager.iter_events.side_effect = KubernetesError(
             "Failed to list events"
         )
 
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import typer
@@ -13,6 +13,7 @@ from typer.testing import CliRunner
 from system_operations_manager.integrations.kubernetes.exceptions import (
     KubernetesConnectionError,
 )
+from system_operations_manager.plugins.kubernetes.commands.base import console
 from system_operations_manager.plugins.kubernetes.commands.manifests import (
     register_manifest_commands,
 )
@@ -47,12 +48,12 @@ class TestApplyCommand:
         """apply should succeed when manifests are valid and apply works."""
         mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
         mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
-        mock_manifest_manager.apply_manifests.return_value = [sample_apply_created]
+        mock_manifest_manager.iter_apply_manifests.return_value = [sample_apply_created]
 
         result = cli_runner.invoke(app, ["manifests", "apply", str(tmp_manifest_file)])
 
         assert result.exit_code == 0
-        mock_manifest_manager.apply_manifests.assert_called_once()
+        mock_manifest_manager.iter_apply_manifests.assert_called_once()
 
     def test_apply_validation_failure_blocks(
         self,
@@ -70,7 +71,7 @@ class TestApplyCommand:
         result = cli_runner.invoke(app, ["manifests", "apply", str(tmp_manifest_file)])
 
         assert result.exit_code == 1
-        mock_manifest_manager.apply_manifests.assert_not_called()
+        mock_manifest_manager.iter_apply_manifests.assert_not_called()
 
     def test_apply_with_dry_run(
         self,
@@ -84,7 +85,7 @@ class TestApplyCommand:
         """apply --dry-run should pass dry_run=True to manager."""
         mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
         mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
-        mock_manifest_manager.apply_manifests.return_value = [
+        mock_manifest_manager.iter_apply_manifests.return_value = [
             ApplyResult(
                 resource="Deployment/test-app",
                 action="skipped (client dry-run)",
@@ -97,9 +98,56 @@ class TestApplyCommand:
         result = cli_runner.invoke(app, ["manifests", "apply", str(tmp_manifest_file), "--dry-run"])
 
         assert result.exit_code == 0
-        call_kwargs = mock_manifest_manager.apply_manifests.call_args
+        call_kwargs = mock_manifest_manager.iter_apply_manifests.call_args
         assert call_kwargs.kwargs.get("dry_run") is True or call_kwargs[1].get("dry_run") is True
 
+    def test_apply_server_side_flag(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_manifest_manager: MagicMock,
+        sample_valid_manifest: dict[str, object],
+        sample_validation_ok: ValidationResult,
+        sample_apply_created: ApplyResult,
+        tmp_manifest_file: Path,
+    ) -> None:
+        """apply should use server-side apply unless --no-server-side is given."""
+        mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
+        mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
+        mock_manifest_manager.iter_apply_manifests.return_value = [sample_apply_created]
+
+        cli_runner.invoke(app, ["manifests", "apply", str(tmp_manifest_file)])
+        assert mock_manifest_manager.iter_apply_manifests.call_args.kwargs["server_side"] is True
+
+        result = cli_runner.invoke(
+            app, ["manifests", "apply", str(tmp_manifest_file), "--no-server-side"]
+        )
+
+        assert result.exit_code == 0
+        assert mock_manifest_manager.iter_apply_manifests.call_args.kwargs["server_side"] is False
+
+    def test_apply_concurrency_option(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_manifest_manager: MagicMock,
+        sample_valid_manifest: dict[str, object],
+        sample_validation_ok: ValidationResult,
+        sample_apply_created: ApplyResult,
+        tmp_manifest_file: Path,
+    ) -> None:
+        """apply should pass --concurrency through as max_concurrency."""
+        mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
+        mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
+        mock_manifest_manager.iter_apply_manifests.return_value = [sample_apply_created]
+
+        result = cli_runner.invoke(
+            app, ["manifests", "apply", str(tmp_manifest_file), "--concurrency", "4"]
+        )
+
+        assert result.exit_code == 0
+        assert mock_manifest_manager.iter_apply_manifests.call_args.kwargs["max_concurrency"] == 4
+
     def test_apply_with_namespace(
         self,
         cli_runner: CliRunner,
@@ -113,14 +161,14 @@ class TestApplyCommand:
         """apply -n should pass namespace to manager."""
         mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
         mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
-        mock_manifest_manager.apply_manifests.return_value = [sample_apply_created]
+        mock_manifest_manager.iter_apply_manifests.return_value = [sample_apply_created]
 
         result = cli_runner.invoke(
             app, ["manifests", "apply", str(tmp_manifest_file), "-n", "production"]
         )
 
         assert result.exit_code == 0
-        call_args = mock_manifest_manager.apply_manifests.call_args
+        call_args = mock_manifest_manager.iter_apply_manifests.call_args
         assert call_args[0][1] == "production" or call_args.kwargs.get("namespace") == "production"
 
     def test_apply_k8s_error(
@@ -135,7 +183,7 @@ class TestApplyCommand:
         """apply should handle KubernetesError gracefully."""
         mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
         mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
-        mock_manifest_manager.apply_manifests.side_effect = KubernetesConnectionError(
+        mock_manifest_manager.iter_apply_manifests.side_effect = KubernetesConnectionError(
             "Cannot connect to cluster"
         )
 
@@ -157,7 +205,7 @@ class TestApplyCommand:
 
         assert result.exit_code == 0
         assert "no manifests" in result.stdout.lower()
-        mock_manifest_manager.apply_manifests.assert_not_called()
+        mock_manifest_manager.iter_apply_manifests.assert_not_called()
 
     def test_apply_json_output(
         self,
@@ -169,7 +217,7 @@ class TestApplyCommand:
         sample_apply_created: ApplyResult,
         tmp_manifest_file: Path,
     ) -> None:
-        """apply --output json should use formatter.format_dict (line 154)."""
+        """apply --output json should report the ordered results via format_dict."""
         mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
         mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
         mock_manifest_manager.apply_manifests.return_value = [sample_apply_created]
@@ -179,6 +227,42 @@ class TestApplyCommand:
         )
 
         assert result.exit_code == 0
+        mock_manifest_manager.apply_manifests.assert_called_once()
+        mock_manifest_manager.iter_apply_manifests.assert_not_called()
+
+    def test_apply_table_streams_results(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_manifest_manager: MagicMock,
+        sample_valid_manifest: dict[str, object],
+        sample_validation_ok: ValidationResult,
+        sample_apply_created: ApplyResult,
+        sample_apply_failed: ApplyResult,
+        tmp_manifest_file: Path,
+    ) -> None:
+        """Table output should print each result as the apply iterator yields it."""
+        lines_before_second: list[int] = []
+
+        def iter_results(*args: object, **kwargs: object) -> Iterator[ApplyResult]:
+            yield sample_apply_created
+            lines_before_second.append(print_spy.call_count)
+            yield sample_apply_failed
+
+        mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
+        mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
+        mock_manifest_manager.iter_apply_manifests.side_effect = iter_results
+
+        with patch.object(console, "print", wraps=console.print) as print_spy:
+            result = cli_runner.invoke(app, ["manifests", "apply", str(tmp_manifest_file)])
+
+        assert result.exit_code == 1
+        assert lines_before_second == [1]
+        assert result.stdout.index(sample_apply_created.resource) < result.stdout.index(
+            sample_apply_failed.resource
+        )
+        assert "Total: 2 resource(s), 1 failed" in result.stdout
+        mock_manifest_manager.apply_manifests.assert_not_called()
 
     def test_apply_resource_failure_exits_1(
         self,
@@ -193,7 +277,7 @@ class TestApplyCommand:
         """apply should exit 1 when any apply result fails (line 161)."""
         mock_manifest_manager.load_manifests.return_value = [sample_valid_manifest]
         mock_manifest_manager.validate_manifests.return_value = [sample_validation_ok]
-        mock_manifest_manager.apply_manifests.return_value = [sample_apply_failed]
+        mock_manifest_manager.iter_apply_manifests.return_value = [sample_apply_failed]
 
         result = cli_runner.invoke(app, ["manifests", "apply", str(tmp_manifest_file)])
 
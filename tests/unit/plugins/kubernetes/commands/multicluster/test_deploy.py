@@ -134,6 +134,44 @@ class TestMulticlusterDeployCommand:
         assert call_kwargs["dry_run"] is True
         assert "Dry run mode" in result.stdout
 
+    def test_deploy_wave_options(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_multicluster_manager: MagicMock,
+        sample_deploy_result: MultiClusterDeployResult,
+        tmp_path: Path,
+    ) -> None:
+        """deploy should pass rollout limits to the manager."""
+        manifest_file = tmp_path / "test-manifest.yaml"
+        manifest_file.write_text("apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: test\n")
+        mock_multicluster_manager.load_manifests_from_path.return_value = [{"kind": "ConfigMap"}]
+        mock_multicluster_manager.deploy_manifests_to_clusters.return_value = sample_deploy_result
+
+        result = cli_runner.invoke(
+            app,
+            [
+                "multicluster",
+                "deploy",
+                "--file",
+                str(manifest_file),
+                "--concurrency",
+                "4",
+                "--wave-size",
+                "2",
+                "--halt-on-failure",
+                "--timeout",
+                "30",
+            ],
+        )
+
+        assert result.exit_code == 0
+        call_kwargs = mock_multicluster_manager.deploy_manifests_to_clusters.call_args.kwargs
+        assert call_kwargs["max_concurrency"] == 4
+        assert call_kwargs["wave_size"] == 2
+        assert call_kwargs["halt_on_failure"] is True
+        assert call_kwargs["timeout"] == 30.0
+
     def test_deploy_partial_failure(
         self,
         cli_runner: CliRunner,
@@ -45,7 +45,9 @@ class TestMulticlusterStatusCommand:
         result = cli_runner.invoke(app, ["multicluster", "status"])
 
         assert result.exit_code == 0
-        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(None)
+        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
+            None, max_concurrency=None, timeout=None
+        )
 
     def test_status_filtered_clusters(
         self,
@@ -63,7 +65,26 @@ class TestMulticlusterStatusCommand:
 
         assert result.exit_code == 0
         mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
-            ["staging", "production"]
+            ["staging", "production"], max_concurrency=None, timeout=None
+        )
+
+    def test_status_concurrency_and_timeout(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_multicluster_manager: MagicMock,
+        sample_status_result: MultiClusterStatusResult,
+    ) -> None:
+        """multicluster status should pass fan-out limits to the manager."""
+        mock_multicluster_manager.multi_cluster_status.return_value = sample_status_result
+
+        result = cli_runner.invoke(
+            app, ["multicluster", "status", "--concurrency", "8", "--timeout", "5"]
+        )
+
+        assert result.exit_code == 0
+        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
+            None, max_concurrency=8, timeout=5.0
         )
 
     def test_status_with_disconnected(
@@ -79,7 +100,9 @@ class TestMulticlusterStatusCommand:
         result = cli_runner.invoke(app, ["multicluster", "status"])
 
         assert result.exit_code == 0
-        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(None)
+        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
+            None, max_concurrency=None, timeout=None
+        )
 
     def test_status_json_output(
         self,
@@ -94,7 +117,9 @@ class TestMulticlusterStatusCommand:
         result = cli_runner.invoke(app, ["multicluster", "status", "--output", "json"])
 
         assert result.exit_code == 0
-        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(None)
+        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
+            None, max_concurrency=None, timeout=None
+        )
 
     def test_status_yaml_output(
         self,
@@ -109,7 +134,9 @@ class TestMulticlusterStatusCommand:
         result = cli_runner.invoke(app, ["multicluster", "status", "--output", "yaml"])
 
         assert result.exit_code == 0
-        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(None)
+        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
+            None, max_concurrency=None, timeout=None
+        )
 
     def test_status_no_clusters_configured(
         self,
@@ -125,7 +152,9 @@ class TestMulticlusterStatusCommand:
         result = cli_runner.invoke(app, ["multicluster", "status"])
 
         assert result.exit_code == 1
-        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(None)
+        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
+            None, max_concurrency=None, timeout=None
+        )
 
     def test_status_kubernetes_error(
         self,
@@ -141,4 +170,6 @@ class TestMulticlusterStatusCommand:
         result = cli_runner.invoke(app, ["multicluster", "status"])
 
         assert result.exit_code == 1
-        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(None)
+        mock_multicluster_manager.multi_cluster_status.assert_called_once_with(
+            None, max_concurrency=None, timeout=None
+        )
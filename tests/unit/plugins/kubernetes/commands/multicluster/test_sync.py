@@ -68,6 +68,8 @@ class TestMulticlusterSyncCommand:
             resource_name="app-config",
             namespace="default",
             dry_run=False,
+            max_concurrency=None,
+            timeout=None,
         )
 
     def test_sync_multiple_targets(
@@ -106,6 +108,8 @@ class TestMulticlusterSyncCommand:
             resource_name="app-config",
             namespace="default",
             dry_run=False,
+            max_concurrency=None,
+            timeout=None,
         )
 
     def test_sync_dry_run(
@@ -145,6 +149,8 @@ class TestMulticlusterSyncCommand:
             resource_name="app-config",
             namespace="default",
             dry_run=True,
+            max_concurrency=None,
+            timeout=None,
         )
 
     def test_sync_failure(
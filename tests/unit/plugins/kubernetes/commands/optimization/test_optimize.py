@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from unittest.mock import MagicMock
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 import typer
@@ -24,6 +26,8 @@ from system_operations_manager.plugins.kubernetes.commands.optimize import (
     register_optimization_commands,
 )
 
+_OPTIMIZE = "system_operations_manager.plugins.kubernetes.commands.optimize"
+
 
 @pytest.mark.unit
 @pytest.mark.kubernetes
@@ -220,6 +224,42 @@ class TestRecommendCommand:
         call_kwargs = mock_optimization_manager.recommend.call_args[1]
         assert call_kwargs["workload_type"] == "StatefulSet"
 
+    def test_recommend_with_history(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_optimization_manager: MagicMock,
+        sample_recommendation: RightsizingRecommendation,
+        tmp_path: Path,
+    ) -> None:
+        """optimize recommend --history-dir should pass the history and window."""
+        mock_optimization_manager.recommend.return_value = sample_recommendation
+
+        result = cli_runner.invoke(
+            app,
+            ["optimize", "recommend", "my-app", "--history-dir", str(tmp_path), "--window", "6"],
+        )
+
+        assert result.exit_code == 0
+        call_kwargs = mock_optimization_manager.recommend.call_args[1]
+        assert call_kwargs["history"].directory == tmp_path
+        assert call_kwargs["window"] == timedelta(hours=6)
+
+    def test_recommend_without_history(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_optimization_manager: MagicMock,
+        sample_recommendation: RightsizingRecommendation,
+    ) -> None:
+        """optimize recommend should not use history unless asked to."""
+        mock_optimization_manager.recommend.return_value = sample_recommendation
+
+        result = cli_runner.invoke(app, ["optimize", "recommend", "my-app"])
+
+        assert result.exit_code == 0
+        assert mock_optimization_manager.recommend.call_args[1]["history"] is None
+
     def test_recommend_not_found(
         self,
         cli_runner: CliRunner,
@@ -252,6 +292,77 @@ class TestRecommendCommand:
         assert "test-deployment" in result.output
 
 
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestSampleCommand:
+    """Tests for optimize sample command."""
+
+    @pytest.fixture
+    def app(self, get_optimization_manager: Callable[[], MagicMock]) -> typer.Typer:
+        """Create a test app with optimization commands."""
+        app = typer.Typer()
+        register_optimization_commands(app, get_optimization_manager)
+        return app
+
+    def test_sample_records_count_rounds(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_optimization_manager: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """optimize sample --count should take that many samples."""
+        mock_optimization_manager.sample_usage.return_value = 7
+
+        with patch(f"{_OPTIMIZE}.time.sleep") as mock_sleep:
+            result = cli_runner.invoke(
+                app,
+                ["optimize", "sample", "-A", "--count", "3", "--history-dir", str(tmp_path)],
+            )
+
+        assert result.exit_code == 0
+        assert mock_optimization_manager.sample_usage.call_count == 3
+        assert mock_sleep.call_count == 2
+        history = mock_optimization_manager.sample_usage.call_args[0][0]
+        assert history.directory == tmp_path
+        assert mock_optimization_manager.sample_usage.call_args[1]["all_namespaces"] is True
+        assert "recorded 7 pods" in result.output
+
+    def test_sample_stops_on_interrupt(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_optimization_manager: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """optimize sample should exit cleanly on Ctrl+C."""
+        mock_optimization_manager.sample_usage.return_value = 1
+
+        with patch(f"{_OPTIMIZE}.time.sleep", side_effect=KeyboardInterrupt):
+            result = cli_runner.invoke(app, ["optimize", "sample", "--history-dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Stopped sampling" in result.output
+
+    def test_sample_connection_error(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_optimization_manager: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """optimize sample should handle connection errors."""
+        mock_optimization_manager.sample_usage.side_effect = KubernetesConnectionError(
+            "Connection refused"
+        )
+
+        result = cli_runner.invoke(
+            app, ["optimize", "sample", "--count", "1", "--history-dir", str(tmp_path)]
+        )
+
+        assert result.exit_code == 1
+
+
 @pytest.mark.unit
 @pytest.mark.kubernetes
 class TestUnusedCommand:
@@ -16,6 +16,7 @@ from system_operations_manager.plugins.kubernetes.commands.streaming import (
     _parse_duration,
     register_streaming_commands,
 )
+from system_operations_manager.services.kubernetes.log_multiplexer import LogLine
 
 
 @pytest.mark.unit
@@ -138,6 +139,102 @@ class TestLogsCommand:
         assert call_args[0][1] == "staging"
 
 
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestMultiplexedLogsCommand:
+    """Tests for tailing several pods through the logs command."""
+
+    @pytest.fixture
+    def app(self, get_streaming_manager: Callable[[], MagicMock]) -> typer.Typer:
+        """Create a test app with streaming commands."""
+        app = typer.Typer()
+        register_streaming_commands(app, get_streaming_manager)
+        return app
+
+    def test_logs_selector(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_streaming_manager: MagicMock,
+    ) -> None:
+        """logs -l should tail every matching pod with prefixed lines."""
+        mock_streaming_manager.stream_selector_logs.return_value = iter(
+            [
+                LogLine("web-0", "app", "2024-01-01T00:00:01Z", "started"),
+                LogLine("web-1", "app", "2024-01-01T00:00:02Z", "[ready]"),
+            ]
+        )
+
+        result = cli_runner.invoke(app, ["logs", "-l", "app=web", "-f", "--tail", "10"])
+
+        assert result.exit_code == 0
+        assert "web-0/app started" in result.stdout
+        assert "web-1/app [ready]" in result.stdout
+        mock_streaming_manager.stream_selector_logs.assert_called_once_with(
+            "app=web",
+            None,
+            container=None,
+            follow=True,
+            tail_lines=10,
+            since_seconds=None,
+        )
+        mock_streaming_manager.stream_logs.assert_not_called()
+
+    def test_logs_workload_target(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_streaming_manager: MagicMock,
+    ) -> None:
+        """logs deploy/<name> should resolve the workload's selector."""
+        mock_streaming_manager.resolve_workload_selector.return_value = "app=web"
+        mock_streaming_manager.stream_selector_logs.return_value = iter([])
+
+        result = cli_runner.invoke(app, ["logs", "deploy/web", "-n", "prod", "--timestamps"])
+
+        assert result.exit_code == 0
+        mock_streaming_manager.resolve_workload_selector.assert_called_once_with(
+            "deploy", "web", "prod"
+        )
+        assert mock_streaming_manager.stream_selector_logs.call_args[0] == ("app=web", "prod")
+
+    def test_logs_pod_prefix_uses_single_pod(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_streaming_manager: MagicMock,
+    ) -> None:
+        """logs pod/<name> should keep the single-pod path."""
+        mock_streaming_manager.stream_logs.return_value = "logs"
+
+        result = cli_runner.invoke(app, ["logs", "pod/my-pod"])
+
+        assert result.exit_code == 0
+        assert mock_streaming_manager.stream_logs.call_args[0][0] == "my-pod"
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["logs"],
+            ["logs", "my-pod", "-l", "app=web"],
+            ["logs", "svc/web"],
+            ["logs", "-l", "app=web", "--previous"],
+        ],
+    )
+    def test_logs_invalid_target(
+        self,
+        cli_runner: CliRunner,
+        app: typer.Typer,
+        mock_streaming_manager: MagicMock,
+        args: list[str],
+    ) -> None:
+        """logs should reject missing, conflicting or unsupported targets."""
+        result = cli_runner.invoke(app, args)
+
+        assert result.exit_code != 0
+        mock_streaming_manager.stream_selector_logs.assert_not_called()
+
+
 @pytest.mark.unit
 class TestParseDuration:
     """Tests for the _parse_duration helper."""
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,11 +16,11 @@ from system_operations_manager.integrations.kubernetes.exceptions import (
     KubernetesNotFoundError,
 )
 from system_operations_manager.plugins.kubernetes.commands.streaming import (
-    _accept_connections,
-    _bridge_connection,
+    _BridgedConnection,
     _parse_duration,
     _parse_port_mappings,
     _parse_target,
+    _PortForwardBridge,
     _run_port_forward,
     register_streaming_commands,
 )
@@ -227,23 +230,32 @@ class TestParseTargetNoMatch:
             _parse_target("")
 
 
+_STREAMING = "system_operations_manager.plugins.kubernetes.commands.streaming"
+
+
 @pytest.mark.unit
 @pytest.mark.kubernetes
 class TestRunPortForward:
-    """Tests for the _run_port_forward socket/threading function (lines 140-166)."""
-
-    @patch(
-        "system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep",
-        side_effect=KeyboardInterrupt,
-    )
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.socket.socket")
+    """Tests for the _run_port_forward listener setup and teardown."""
+
+    @pytest.fixture(autouse=True)
+    def interrupt_loop(self) -> Iterator[MagicMock]:
+        """Make the event loop exit as if Ctrl-C was pressed."""
+        with (
+            patch(f"{_STREAMING}.selectors.DefaultSelector"),
+            patch(f"{_STREAMING}.socket.socketpair", return_value=(MagicMock(), MagicMock())),
+            patch.object(
+                _PortForwardBridge, "serve_forever", side_effect=KeyboardInterrupt
+            ) as serve,
+        ):
+            yield serve
+
+    @patch(f"{_STREAMING}.socket.socket")
     def test_run_port_forward_single_mapping(
-        self, mock_socket_class: MagicMock, mock_sleep: MagicMock
+        self, mock_socket_class: MagicMock, interrupt_loop: MagicMock
     ) -> None:
-        """_run_port_forward should bind, listen, start accept thread, then clean up on Ctrl-C."""
+        """_run_port_forward should bind, listen, serve, then clean up on Ctrl-C."""
         mock_server = MagicMock()
-        # Make accept() raise OSError immediately so the daemon thread exits cleanly.
-        mock_server.accept.side_effect = OSError("closed")
         mock_socket_class.return_value = mock_server
         mock_pf = MagicMock()
 
@@ -252,22 +264,16 @@ class TestRunPortForward:
         mock_socket_class.assert_called_once()
         mock_server.setsockopt.assert_called_once()
         mock_server.bind.assert_called_once_with(("127.0.0.1", 8080))
-        mock_server.listen.assert_called_once_with(5)
+        mock_server.listen.assert_called_once()
+        mock_server.setblocking.assert_called_once_with(False)
+        interrupt_loop.assert_called_once()
         mock_server.close.assert_called_once()
 
-    @patch(
-        "system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep",
-        side_effect=KeyboardInterrupt,
-    )
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.socket.socket")
-    def test_run_port_forward_multiple_mappings(
-        self, mock_socket_class: MagicMock, mock_sleep: MagicMock
-    ) -> None:
+    @patch(f"{_STREAMING}.socket.socket")
+    def test_run_port_forward_multiple_mappings(self, mock_socket_class: MagicMock) -> None:
         """_run_port_forward should create one server socket per port mapping."""
         server_a = MagicMock()
         server_b = MagicMock()
-        server_a.accept.side_effect = OSError("closed")
-        server_b.accept.side_effect = OSError("closed")
         mock_socket_class.side_effect = [server_a, server_b]
         mock_pf = MagicMock()
 
@@ -279,17 +285,10 @@ class TestRunPortForward:
         server_a.close.assert_called_once()
         server_b.close.assert_called_once()
 
-    @patch(
-        "system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep",
-        side_effect=KeyboardInterrupt,
-    )
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.socket.socket")
-    def test_run_port_forward_custom_address(
-        self, mock_socket_class: MagicMock, mock_sleep: MagicMock
-    ) -> None:
+    @patch(f"{_STREAMING}.socket.socket")
+    def test_run_port_forward_custom_address(self, mock_socket_class: MagicMock) -> None:
         """_run_port_forward should use the provided bind address."""
         mock_server = MagicMock()
-        mock_server.accept.side_effect = OSError("closed")
         mock_socket_class.return_value = mock_server
         mock_pf = MagicMock()
 
@@ -297,17 +296,12 @@ class TestRunPortForward:
 
         mock_server.bind.assert_called_once_with(("0.0.0.0", 3000))
 
-    @patch(
-        "system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep",
-        side_effect=KeyboardInterrupt,
-    )
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.socket.socket")
+    @patch(f"{_STREAMING}.socket.socket")
     def test_run_port_forward_server_close_oserror_suppressed(
-        self, mock_socket_class: MagicMock, mock_sleep: MagicMock
+        self, mock_socket_class: MagicMock
     ) -> None:
         """_run_port_forward should suppress OSError when closing the server socket."""
         mock_server = MagicMock()
-        mock_server.accept.side_effect = OSError("closed")
         mock_server.close.side_effect = OSError("already closed")
         mock_socket_class.return_value = mock_server
         mock_pf = MagicMock()
@@ -317,130 +311,209 @@ class TestRunPortForward:
 
         mock_server.close.assert_called_once()
 
+    @patch(f"{_STREAMING}.socket.socket")
+    def test_run_port_forward_bind_error_closes_listeners(
+        self, mock_socket_class: MagicMock, interrupt_loop: MagicMock
+    ) -> None:
+        """A bind failure should propagate after closing already-open listeners."""
+        server_a = MagicMock()
+        server_b = MagicMock()
+        server_b.bind.side_effect = OSError("address in use")
+        mock_socket_class.side_effect = [server_a, server_b]
 
-@pytest.mark.unit
-@pytest.mark.kubernetes
-class TestAcceptConnections:
-    """Tests for the _accept_connections loop (lines 181-192)."""
+        with pytest.raises(OSError, match="address in use"):
+            _run_port_forward(MagicMock(), [(8080, 80), (8080, 81)], "127.0.0.1")
 
-    def test_accept_connections_oserror_breaks_loop(self) -> None:
-        """_accept_connections should return cleanly when accept raises OSError."""
-        mock_server = MagicMock()
-        mock_server.accept.side_effect = OSError("socket closed")
-        mock_pf = MagicMock()
+        interrupt_loop.assert_not_called()
+        server_a.close.assert_called_once()
+        server_b.close.assert_called_once()
 
-        # Should return without raising.
-        _accept_connections(mock_server, mock_pf, 80)
 
-        mock_server.accept.assert_called_once()
+class _FakePortForward:
+    """Port-forward stand-in whose pod side is one end of a socketpair."""
 
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.threading.Thread")
-    def test_accept_connections_spawns_bridge_thread(self, mock_thread_class: MagicMock) -> None:
-        """_accept_connections should spawn a daemon bridge thread for each connection."""
-        mock_server = MagicMock()
-        mock_client = MagicMock()
-        # First call returns a client connection, second call raises OSError to exit the loop.
-        mock_server.accept.side_effect = [(mock_client, ("127.0.0.1", 54321)), OSError("done")]
-        mock_thread = MagicMock()
-        mock_thread_class.return_value = mock_thread
-        mock_pf = MagicMock()
+    def __init__(self) -> None:
+        self.pod, self.stream = socket.socketpair()
+        self.ports: list[int] = []
 
-        _accept_connections(mock_server, mock_pf, 80)
+    def socket(self, port: int) -> socket.socket:
+        self.ports.append(port)
+        return self.stream
 
-        mock_thread_class.assert_called_once()
-        call_kwargs = mock_thread_class.call_args[1]
-        assert call_kwargs["daemon"] is True
-        assert call_kwargs["args"] == (mock_client, mock_pf, 80)
-        mock_thread.start.assert_called_once()
+    def close(self) -> None:
+        self.pod.close()
+        self.stream.close()
 
 
 @pytest.mark.unit
 @pytest.mark.kubernetes
-class TestBridgeConnection:
-    """Tests for the _bridge_connection data-relay loop (lines 207-240)."""
-
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep")
-    def test_bridge_connection_relays_data_from_client_to_pod(self, mock_sleep: MagicMock) -> None:
-        """_bridge_connection should forward data from client socket to pod pf socket."""
-        mock_pf = MagicMock()
-        mock_pf_socket = MagicMock()
-        mock_pf.socket.return_value = mock_pf_socket
-
-        mock_client = MagicMock()
-        # First recv returns data; second returns empty bytes to break the inner loop.
-        mock_client.recv.side_effect = [b"GET / HTTP/1.1\r\n", b""]
-        # Pod side has no data (BlockingIOError) then breaks due to empty client data.
-        mock_pf_socket.recv.side_effect = BlockingIOError
-
-        _bridge_connection(mock_client, mock_pf, 80)
-
-        mock_pf.socket.assert_called_once_with(80)
-        mock_pf_socket.sendall.assert_called_once_with(b"GET / HTTP/1.1\r\n")
-        mock_client.close.assert_called_once()
+class TestPortForwardBridge:
+    """Tests for the selector-based _PortForwardBridge using real sockets."""
 
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep")
-    def test_bridge_connection_relays_data_from_pod_to_client(self, mock_sleep: MagicMock) -> None:
-        """_bridge_connection should forward data from pod pf socket to client socket."""
-        mock_pf = MagicMock()
-        mock_pf_socket = MagicMock()
-        mock_pf.socket.return_value = mock_pf_socket
-
-        mock_client = MagicMock()
-        # Client side raises BlockingIOError (no data from client yet).
-        mock_client.recv.side_effect = BlockingIOError
-        # Pod sends one chunk then empty to break the loop.
-        mock_pf_socket.recv.side_effect = [b"HTTP/1.1 200 OK\r\n", b""]
-
-        _bridge_connection(mock_client, mock_pf, 80)
-
-        mock_client.sendall.assert_called_once_with(b"HTTP/1.1 200 OK\r\n")
-        mock_client.close.assert_called_once()
-
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep")
-    def test_bridge_connection_client_blocking_io_is_ignored(self, mock_sleep: MagicMock) -> None:
-        """_bridge_connection should silently retry when client recv raises BlockingIOError."""
-        mock_pf = MagicMock()
-        mock_pf_socket = MagicMock()
-        mock_pf.socket.return_value = mock_pf_socket
-
-        mock_client = MagicMock()
-        # BlockingIOError first, then empty bytes to stop the loop.
-        mock_client.recv.side_effect = [BlockingIOError, b""]
-        mock_pf_socket.recv.side_effect = BlockingIOError
-
-        _bridge_connection(mock_client, mock_pf, 80)
-
-        # No sendall expected since client had no real data.
-        mock_pf_socket.sendall.assert_not_called()
-        mock_client.close.assert_called_once()
-
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep")
-    def test_bridge_connection_exception_logs_and_closes(self, mock_sleep: MagicMock) -> None:
-        """_bridge_connection should log unexpected exceptions and always close client socket."""
-        mock_pf = MagicMock()
-        mock_pf_socket = MagicMock()
-        mock_pf.socket.return_value = mock_pf_socket
-
-        mock_client = MagicMock()
-        # Raise an unexpected error to trigger the except branch.
-        mock_client.recv.side_effect = RuntimeError("unexpected")
-
-        _bridge_connection(mock_client, mock_pf, 80)
+    @pytest.fixture
+    def pf(self) -> Iterator[_FakePortForward]:
+        fake = _FakePortForward()
+        yield fake
+        fake.close()
 
-        # Client socket must still be closed in the finally block.
-        mock_client.close.assert_called_once()
+    @pytest.fixture
+    def bridge(self, pf: _FakePortForward) -> Iterator[tuple[_PortForwardBridge, int]]:
+        """Run a bridge on an ephemeral port in a background thread."""
+        bridge = _PortForwardBridge(pf, chunk_size=4096, high_water=16 * 1024)
+        bridge.listen("127.0.0.1", 0, 80)
+        port = bridge._servers[0].getsockname()[1]
+        thread = threading.Thread(target=bridge.serve_forever, daemon=True)
+        thread.start()
+        yield bridge, port
+        bridge.stop()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        bridge.close()
+
+    @staticmethod
+    def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return bytes(data)
+
+    def test_relays_both_directions(
+        self, pf: _FakePortForward, bridge: tuple[_PortForwardBridge, int]
+    ) -> None:
+        """Bytes should flow client -> pod and pod -> client."""
+        _, port = bridge
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+            pf.pod.settimeout(5)
+            client.sendall(b"GET / HTTP/1.1\r\n")
+            assert self._recv_exactly(pf.pod, 16) == b"GET / HTTP/1.1\r\n"
 
-    @patch("system_operations_manager.plugins.kubernetes.commands.streaming.time.sleep")
-    def test_bridge_connection_client_close_oserror_suppressed(self, mock_sleep: MagicMock) -> None:
-        """_bridge_connection should suppress OSError when closing the client socket."""
-        mock_pf = MagicMock()
-        mock_pf_socket = MagicMock()
-        mock_pf.socket.return_value = mock_pf_socket
+            pf.pod.sendall(b"HTTP/1.1 200 OK\r\n")
+            assert self._recv_exactly(client, 17) == b"HTTP/1.1 200 OK\r\n"
 
-        mock_client = MagicMock()
-        mock_client.recv.return_value = b""
-        mock_pf_socket.recv.side_effect = BlockingIOError
-        mock_client.close.side_effect = OSError("already closed")
+        assert pf.ports == [80]
 
-        # Should not raise.
-        _bridge_connection(mock_client, mock_pf, 80)
+    def test_large_payload_with_backpressure(
+        self, pf: _FakePortForward, bridge: tuple[_PortForwardBridge, int]
+    ) -> None:
+        """A payload far above the high-water mark should arrive intact."""
+        _, port = bridge
+        payload = bytes(range(256)) * 8192  # 2 MiB
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+            pf.pod.settimeout(5)
+            sender = threading.Thread(target=pf.pod.sendall, args=(payload,))
+            sender.start()
+            # Let the pod side fill the bridge before the client starts reading
+            time.sleep(0.1)
+            received = self._recv_exactly(client, len(payload))
+            sender.join(timeout=5)
+
+        assert received == payload
+
+    def test_new_connection_replaces_closed_client(
+        self, pf: _FakePortForward, bridge: tuple[_PortForwardBridge, int]
+    ) -> None:
+        """A client that has closed should give way to the next connection."""
+        _, port = bridge
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+            client.sendall(b"ping")
+            pf.pod.settimeout(5)
+            assert self._recv_exactly(pf.pod, 4) == b"ping"
+
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+            client.sendall(b"again")
+            assert self._recv_exactly(pf.pod, 5) == b"again"
+
+    def test_client_half_close_still_receives_reply(
+        self, pf: _FakePortForward, bridge: tuple[_PortForwardBridge, int]
+    ) -> None:
+        """After the client shuts down writing, the pod's reply should still arrive."""
+        _, port = bridge
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+            client.sendall(b"request")
+            client.shutdown(socket.SHUT_WR)
+            pf.pod.settimeout(5)
+            assert self._recv_exactly(pf.pod, 7) == b"request"
+
+            # Give the bridge time to see the client's EOF before replying
+            time.sleep(0.05)
+            pf.pod.sendall(b"reply")
+            pf.pod.shutdown(socket.SHUT_WR)
+
+            assert self._recv_exactly(client, 6) == b"reply"
+
+    def test_teardown_discards_unread_stream_bytes(self, pf: _FakePortForward) -> None:
+        """Bytes left on the shared stream should not leak into the next connection."""
+        bridge = _PortForwardBridge(pf)
+        client, peer = socket.socketpair()
+        pf.stream.setblocking(False)
+        conn = _BridgedConnection(client, pf.stream, 80)
+        conn.to_client.pending += b"queued"
+        bridge._active[80] = conn
+        pf.pod.sendall(b"stale reply")
+
+        bridge._close(conn)
+
+        assert not bridge._active
+        assert not conn.to_client.pending
+        with pytest.raises(BlockingIOError):
+            pf.stream.recv(1)
+        peer.close()
+        bridge.close()
+
+    def test_pod_eof_closes_client(
+        self, pf: _FakePortForward, bridge: tuple[_PortForwardBridge, int]
+    ) -> None:
+        """When the pod stream ends, queued data is delivered and the client closed."""
+        _, port = bridge
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+            client.sendall(b"x")
+            pf.pod.settimeout(5)
+            self._recv_exactly(pf.pod, 1)
+            pf.pod.sendall(b"bye")
+            pf.pod.shutdown(socket.SHUT_WR)
+
+            assert self._recv_exactly(client, 4) == b"bye"
+
+    def test_refuses_second_connection_to_busy_port(
+        self, pf: _FakePortForward, bridge: tuple[_PortForwardBridge, int]
+    ) -> None:
+        """A second concurrent connection to the same port should be closed."""
+        _, port = bridge
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as first:
+            first.sendall(b"1")
+            pf.pod.settimeout(5)
+            assert self._recv_exactly(pf.pod, 1) == b"1"
+
+            with socket.create_connection(("127.0.0.1", port), timeout=5) as second:
+                assert second.recv(1) == b""
+
+            first.sendall(b"2")
+            assert self._recv_exactly(pf.pod, 1) == b"2"
+
+    def test_stream_error_closes_client(self) -> None:
+        """Failing to open the pod stream should close the local connection."""
+        pf = MagicMock()
+        pf.socket.side_effect = RuntimeError("stream unavailable")
+        bridge = _PortForwardBridge(pf)
+        bridge.listen("127.0.0.1", 0, 80)
+        port = bridge._servers[0].getsockname()[1]
+        thread = threading.Thread(target=bridge.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=5) as client:
+                assert client.recv(1) == b""
+            assert not bridge._active
+        finally:
+            bridge.stop()
+            thread.join(timeout=5)
+            bridge.close()
+
+    def test_stop_before_serve_returns_immediately(self, pf: _FakePortForward) -> None:
+        """stop() should make serve_forever return even if called first."""
+        bridge = _PortForwardBridge(pf)
+        bridge.stop()
+        bridge.serve_forever()
+        bridge.close()
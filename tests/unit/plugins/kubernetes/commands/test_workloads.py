@@ -37,7 +37,7 @@ def mock_workload_manager() -> MagicMock:
     """Create a mock WorkloadManager."""
     manager = MagicMock()
 
-    manager.list_pods.return_value = []
+    manager.iter_pods.return_value = iter([])
     manager.get_pod.return_value = MagicMock(
         model_dump=lambda **kwargs: {"name": "my-pod", "namespace": "default"}
     )
@@ -174,7 +174,7 @@ class TestPodCommandErrors:
         mock_workload_manager: MagicMock,
     ) -> None:
         """list_pods should handle KubernetesError."""
-        mock_workload_manager.list_pods.side_effect = KubernetesConnectionError("Cannot connect")
+        mock_workload_manager.iter_pods.side_effect = KubernetesConnectionError("Cannot connect")
 
         result = cli_runner.invoke(app, ["pods", "list"])
 
@@ -852,11 +852,11 @@ class TestPodHappyPaths:
         app: typer.Typer,
         mock_workload_manager: MagicMock,
     ) -> None:
-        """list_pods should succeed and call formatter (lines 151-152)."""
+        """list_pods should succeed and stream pages to the formatter."""
         result = cli_runner.invoke(app, ["pods", "list"])
 
         assert result.exit_code == 0
-        mock_workload_manager.list_pods.assert_called_once()
+        mock_workload_manager.iter_pods.assert_called_once()
 
     def test_get_pod_success(
         self,
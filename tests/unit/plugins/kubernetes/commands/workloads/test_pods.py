@@ -37,12 +37,12 @@ class TestPodCommands:
         sample_pod: MagicMock,
     ) -> None:
         """pods list should display pods."""
-        mock_workload_manager.list_pods.return_value = [sample_pod]
+        mock_workload_manager.iter_pods.return_value = iter([[sample_pod]])
 
         result = cli_runner.invoke(app, ["pods", "list"])
 
         assert result.exit_code == 0
-        mock_workload_manager.list_pods.assert_called_once_with(
+        mock_workload_manager.iter_pods.assert_called_once_with(
             namespace=None,
             all_namespaces=False,
             label_selector=None,
@@ -56,12 +56,12 @@ class TestPodCommands:
         mock_workload_manager: MagicMock,
     ) -> None:
         """pods list -n should filter by namespace."""
-        mock_workload_manager.list_pods.return_value = []
+        mock_workload_manager.iter_pods.return_value = iter([])
 
         result = cli_runner.invoke(app, ["pods", "list", "-n", "production"])
 
         assert result.exit_code == 0
-        mock_workload_manager.list_pods.assert_called_once_with(
+        mock_workload_manager.iter_pods.assert_called_once_with(
             namespace="production",
             all_namespaces=False,
             label_selector=None,
@@ -75,12 +75,12 @@ class TestPodCommands:
         mock_workload_manager: MagicMock,
     ) -> None:
         """pods list -A should list from all namespaces."""
-        mock_workload_manager.list_pods.return_value = []
+        mock_workload_manager.iter_pods.return_value = iter([])
 
         result = cli_runner.invoke(app, ["pods", "list", "--all-namespaces"])
 
         assert result.exit_code == 0
-        mock_workload_manager.list_pods.assert_called_once_with(
+        mock_workload_manager.iter_pods.assert_called_once_with(
             namespace=None,
             all_namespaces=True,
             label_selector=None,
@@ -94,12 +94,12 @@ class TestPodCommands:
         mock_workload_manager: MagicMock,
     ) -> None:
         """pods list -l should filter by label selector."""
-        mock_workload_manager.list_pods.return_value = []
+        mock_workload_manager.iter_pods.return_value = iter([])
 
         result = cli_runner.invoke(app, ["pods", "list", "-l", "app=nginx"])
 
         assert result.exit_code == 0
-        mock_workload_manager.list_pods.assert_called_once_with(
+        mock_workload_manager.iter_pods.assert_called_once_with(
             namespace=None,
             all_namespaces=False,
             label_selector="app=nginx",
@@ -215,7 +215,7 @@ class TestPodCommands:
         sample_pod: MagicMock,
     ) -> None:
         """pods list --output json should output JSON format."""
-        mock_workload_manager.list_pods.return_value = [sample_pod]
+        mock_workload_manager.iter_pods.return_value = iter([[sample_pod]])
 
         result = cli_runner.invoke(app, ["pods", "list", "--output", "json"])
 
@@ -232,7 +232,7 @@ class TestPodCommands:
             KubernetesError,
         )
 
-        mock_workload_manager.list_pods.side_effect = KubernetesError("API error")
+        mock_workload_manager.iter_pods.side_effect = KubernetesError("API error")
 
         result = cli_runner.invoke(app, ["pods", "list"])
 
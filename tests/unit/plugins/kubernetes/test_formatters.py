@@ -149,6 +149,17 @@ class TestTableFormatter:
 
         assert "Total: 0" in output
 
+    def test_format_pages(self, formatter: TableFormatter, console_output: StringIO) -> None:
+        """format_pages should print every page and a grand total."""
+        pages = iter([[{"name": "pod-1"}, {"name": "pod-2"}], [], [{"name": "pod-3"}]])
+
+        formatter.format_pages(pages, [("name", "Name")], title="Pods")
+        output = console_output.getvalue()
+
+        assert "pod-1" in output
+        assert "pod-3" in output
+        assert "Total: 3" in output
+
     def test_format_dict(self, formatter: TableFormatter, console_output: StringIO) -> None:
         """format_dict should format dictionary as table."""
         data = {"context": "minikube", "namespace": "default", "connected": "yes"}
@@ -329,6 +340,26 @@ class TestJsonFormatter:
         assert data["total"] == 2
         assert len(data["data"]) == 2
 
+    def test_format_pages_matches_format_list(
+        self, formatter: JsonFormatter, console_output: StringIO
+    ) -> None:
+        """format_pages should stream the same document format_list prints."""
+        resources = [{"name": "item1", "labels": {"app": "web"}}, {"name": "item2"}]
+
+        formatter.format_list(resources, [])
+        expected = console_output.getvalue()
+        console_output.truncate(0)
+        console_output.seek(0)
+        formatter.format_pages(iter([resources[:1], [], resources[1:]]), [])
+
+        assert console_output.getvalue() == expected
+
+    def test_format_pages_empty(self, formatter: JsonFormatter, console_output: StringIO) -> None:
+        """format_pages should output valid JSON when there are no items."""
+        formatter.format_pages(iter([[]]), [])
+
+        assert json.loads(console_output.getvalue()) == {"data": [], "total": 0}
+
     def test_format_dict(self, formatter: JsonFormatter, console_output: StringIO) -> None:
         """format_dict should output valid JSON."""
         data_dict = {"key1": "value1", "key2": 123}
@@ -402,6 +433,21 @@ class TestYamlFormatter:
         assert isinstance(data, list)
         assert len(data) == 2
 
+    def test_format_pages(self, formatter: YamlFormatter, console_output: StringIO) -> None:
+        """format_pages should write all pages as one YAML list."""
+        pages = iter([[{"name": "item1"}], [{"name": "item2"}, {"name": "item3"}]])
+
+        formatter.format_pages(pages, [])
+
+        data = yaml.safe_load(console_output.getvalue())
+        assert [item["name"] for item in data] == ["item1", "item2", "item3"]
+
+    def test_format_pages_empty(self, formatter: YamlFormatter, console_output: StringIO) -> None:
+        """format_pages should output an empty YAML list when there are no items."""
+        formatter.format_pages(iter([]), [])
+
+        assert yaml.safe_load(console_output.getvalue()) == []
+
     def test_format_dict(self, formatter: YamlFormatter, console_output: StringIO) -> None:
         """format_dict should output valid YAML."""
         data_dict = {"key1": "value1", "key2": 123}
@@ -0,0 +1,208 @@
+"""Unit tests for ApplyScheduler."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from system_operations_manager.integrations.kong.models.config import (
+    ApplyOperation,
+    ConfigDiff,
+)
+from system_operations_manager.services.kong.apply_scheduler import ApplyScheduler
+
+
+def _resolve(ref: Any, prefer_username: bool = False) -> str | None:
+    """Resolve references like ConfigManager._extract_ref_name."""
+    if isinstance(ref, str):
+        return ref
+    if isinstance(ref, dict):
+        if prefer_username:
+            return ref.get("username") or ref.get("name") or ref.get("id")
+        return ref.get("name") or ref.get("id")
+    return None
+
+
+def _create(entity_type: str, name: str, **fields: Any) -> ConfigDiff:
+    """Build a create diff."""
+    return ConfigDiff(
+        entity_type=entity_type,
+        operation="create",
+        id_or_name=name,
+        desired={"name": name, **fields},
+    )
+
+
+def _delete(entity_type: str, name: str, **fields: Any) -> ConfigDiff:
+    """Build a delete diff with current state."""
+    return ConfigDiff(
+        entity_type=entity_type,
+        operation="delete",
+        id_or_name=name,
+        current={"id": f"{name}-id", "name": name, **fields},
+    )
+
+
+class _Recorder:
+    """Thread-safe fake apply function."""
+
+    def __init__(self, fail: set[str] | None = None) -> None:
+        self.calls: list[str] = []
+        self._fail = fail or set()
+        self._lock = threading.Lock()
+
+    def __call__(self, diff: ConfigDiff) -> ApplyOperation:
+        with self._lock:
+            self.calls.append(diff.id_or_name)
+        failed = diff.id_or_name in self._fail
+        return ApplyOperation(
+            operation=diff.operation,
+            entity_type=diff.entity_type,
+            id_or_name=diff.id_or_name,
+            result="failed" if failed else "success",
+            error="boom" if failed else None,
+        )
+
+
+@pytest.mark.unit
+class TestApplySchedulerPlan:
+    """Tests for wave planning."""
+
+    def test_independent_entities_share_a_wave(self) -> None:
+        """Entities without references to other changes run in the first wave."""
+        scheduler = ApplyScheduler(_Recorder(), resolve_ref=_resolve)
+        diffs = [
+            _create("services", "svc-a"),
+            _create("services", "svc-b"),
+            _create("upstreams", "up-a"),
+            _create("routes", "existing-parent", service="not-in-diff"),
+        ]
+
+        waves = scheduler.plan(diffs)
+
+        assert len(waves) == 1
+        assert len(waves[0]) == 4
+
+    def test_depth_follows_references(self) -> None:
+        """Depth should follow service -> route -> plugin references."""
+        scheduler = ApplyScheduler(_Recorder(), resolve_ref=_resolve)
+        diffs = [
+            _create("services", "svc"),
+            _create("routes", "rt", service={"name": "svc"}),
+            _create("consumers", "alice", username="alice"),
+            _create("plugins", "rl", route="rt"),
+            _create("plugins", "acl", consumer={"username": "alice"}),
+        ]
+
+        waves = scheduler.plan(diffs)
+
+        assert [[d.id_or_name for d in wave] for wave in waves] == [
+            ["svc", "alice"],
+            ["rt", "acl"],
+            ["rl"],
+        ]
+
+    def test_deletes_run_children_first_after_upserts(self) -> None:
+        """Deletes should follow all upserts, with children before parents."""
+        scheduler = ApplyScheduler(_Recorder(), resolve_ref=_resolve)
+        diffs = [
+            _create("services", "new-svc"),
+            _delete("plugins", "old-plugin", service={"id": "old-svc-id"}),
+            _delete("routes", "old-route", service={"id": "old-svc-id"}),
+            _delete("services", "old-svc"),
+            _delete("services", "lonely-svc"),
+        ]
+
+        waves = scheduler.plan(diffs)
+
+        assert [[d.id_or_name for d in wave] for wave in waves] == [
+            ["new-svc"],
+            ["old-plugin", "old-route", "lonely-svc"],
+            ["old-svc"],
+        ]
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Invalid worker counts and policies should raise ValueError."""
+        with pytest.raises(ValueError, match="max_workers"):
+            ApplyScheduler(_Recorder(), resolve_ref=_resolve, max_workers=0)
+        with pytest.raises(ValueError, match="on_error"):
+            ApplyScheduler(
+                _Recorder(),
+                resolve_ref=_resolve,
+                on_error="ignore",  # type: ignore[arg-type]
+            )
+
+
+@pytest.mark.unit
+class TestApplySchedulerRun:
+    """Tests for wave execution."""
+
+    def test_results_preserve_input_order(self) -> None:
+        """Results should be returned in the order diffs were given."""
+        recorder = _Recorder()
+        scheduler = ApplyScheduler(recorder, resolve_ref=_resolve, max_workers=4)
+        diffs = [
+            _create("services", "svc"),
+            _create("routes", "rt", service="svc"),
+            *[_create("consumers", f"c{i}") for i in range(10)],
+        ]
+
+        operations = scheduler.run(diffs)
+
+        assert [op.id_or_name for op in operations] == [d.id_or_name for d in diffs]
+        assert recorder.calls.index("svc") < recorder.calls.index("rt")
+
+    def test_wave_runs_concurrently(self) -> None:
+        """Operations in one wave should overlap up to max_workers."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def apply(diff: ConfigDiff) -> ApplyOperation:
+            barrier.wait()
+            return _Recorder()(diff)
+
+        scheduler = ApplyScheduler(apply, resolve_ref=_resolve, max_workers=3)
+
+        operations = scheduler.run([_create("services", f"svc-{i}") for i in range(3)])
+
+        assert all(op.result == "success" for op in operations)
+
+    def test_continue_skips_only_dependents(self) -> None:
+        """A failure should skip dependents while unrelated operations proceed."""
+        recorder = _Recorder(fail={"svc"})
+        scheduler = ApplyScheduler(recorder, resolve_ref=_resolve)
+        diffs = [
+            _create("services", "svc"),
+            _create("services", "other"),
+            _create("routes", "rt", service="svc"),
+            _create("plugins", "pl", route="rt"),
+            _create("routes", "ok", service="other"),
+        ]
+
+        operations = {op.id_or_name: op for op in scheduler.run(diffs)}
+
+        assert operations["svc"].error == "boom"
+        assert operations["rt"].result == "failed"
+        assert operations["rt"].error == "Not applied: dependency services/svc failed"
+        assert operations["pl"].error == "Not applied: dependency routes/rt failed"
+        assert operations["ok"].result == "success"
+        assert "rt" not in recorder.calls
+        assert "pl" not in recorder.calls
+
+    def test_fail_fast_stops_after_failing_wave(self) -> None:
+        """fail-fast should finish the failing wave and skip later waves."""
+        recorder = _Recorder(fail={"svc-a"})
+        scheduler = ApplyScheduler(recorder, resolve_ref=_resolve, on_error="fail-fast")
+        diffs = [
+            _create("services", "svc-a"),
+            _create("services", "svc-b"),
+            _create("routes", "rt", service="svc-b"),
+        ]
+
+        operations = {op.id_or_name: op for op in scheduler.run(diffs)}
+
+        assert operations["svc-b"].result == "success"
+        assert operations["rt"].result == "failed"
+        assert operations["rt"].error == "Not applied: aborted after an earlier failure"
+        assert recorder.calls == ["svc-a", "svc-b"]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -21,8 +23,20 @@ def mock_client() -> MagicMock:
 
 @pytest.fixture
 def manager(mock_client: MagicMock) -> ConfigManager:
-    """Create a ConfigManager with mocked client."""
-    return ConfigManager(mock_client)
+    """Create a sequential ConfigManager so mocked responses are consumed in order."""
+    return ConfigManager(mock_client, max_workers=1)
+
+
+def _route_responses(pages: dict[str, list[dict[str, Any]]]) -> Any:
+    """Build a thread-safe get side_effect that serves pages per endpoint."""
+
+    def _get(endpoint: str, params: dict[str, Any] | None = None, **_: Any) -> dict[str, Any]:
+        endpoint_pages = pages.get(endpoint, [{"data": []}])
+        offset = (params or {}).get("offset")
+        index = int(offset) if offset else 0
+        return endpoint_pages[index]
+
+    return _get
 
 
 class TestConfigManagerInit:
@@ -35,6 +49,21 @@ class TestConfigManagerInit:
 
         assert manager._client is mock_client
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("page_size", [0, 1001])
+    def test_manager_rejects_invalid_page_size(
+        self, mock_client: MagicMock, page_size: int
+    ) -> None:
+        """Page size outside Kong's 1-1000 range should be rejected."""
+        with pytest.raises(ValueError, match="page_size"):
+            ConfigManager(mock_client, page_size=page_size)
+
+    @pytest.mark.unit
+    def test_manager_rejects_invalid_max_workers(self, mock_client: MagicMock) -> None:
+        """A worker pool smaller than one should be rejected."""
+        with pytest.raises(ValueError, match="max_workers"):
+            ConfigManager(mock_client, max_workers=0)
+
 
 class TestConfigManagerExport:
     """Tests for export_state method."""
@@ -47,10 +76,10 @@ class TestConfigManagerExport:
         mock_client.get.side_effect = [
             {"data": [{"id": "svc-1", "name": "api", "host": "api.local"}]},
             {"data": [{"id": "up-1", "name": "upstream-1"}]},
-            {"data": []},  # targets for upstream
             {"data": [{"id": "rt-1", "name": "route-1", "paths": ["/api"]}]},
             {"data": [{"id": "con-1", "username": "user1"}]},
             {"data": [{"id": "pl-1", "name": "rate-limiting"}]},
+            {"data": []},  # targets, fetched once every collection is in
         ]
 
         config = manager.export_state()
@@ -113,13 +142,13 @@ class TestConfigManagerExport:
     def test_export_upstreams_with_targets(
         self, manager: ConfigManager, mock_client: MagicMock
     ) -> None:
-        """_export_upstreams should embed targets."""
+        """Exported upstreams should embed their targets."""
         mock_client.get.side_effect = [
             {"data": [{"id": "up-1", "name": "upstream-1"}]},
             {"data": [{"target": "192.168.1.1:8080", "weight": 100}]},
         ]
 
-        upstreams = manager._export_upstreams()
+        upstreams = manager.export_state(only=["upstreams"]).upstreams
 
         assert len(upstreams) == 1
         assert "targets" in upstreams[0]
@@ -129,13 +158,13 @@ class TestConfigManagerExport:
     def test_export_upstreams_targets_error_handled(
         self, manager: ConfigManager, mock_client: MagicMock
     ) -> None:
-        """_export_upstreams should handle target fetch errors gracefully."""
+        """A failed target fetch should leave the upstream without targets."""
         mock_client.get.side_effect = [
             {"data": [{"id": "up-1", "name": "upstream-1"}]},
             Exception("Target fetch failed"),
         ]
 
-        upstreams = manager._export_upstreams()
+        upstreams = manager.export_state(only=["upstreams"]).upstreams
 
         assert len(upstreams) == 1
         assert "targets" not in upstreams[0]
@@ -144,10 +173,10 @@ class TestConfigManagerExport:
     def test_export_consumers_without_credentials(
         self, manager: ConfigManager, mock_client: MagicMock
     ) -> None:
-        """_export_consumers should work without credentials."""
+        """Consumers should export without credential fetches by default."""
         mock_client.get.return_value = {"data": [{"id": "con-1", "username": "user1"}]}
 
-        consumers = manager._export_consumers(include_credentials=False)
+        consumers = manager.export_state(only=["consumers"]).consumers
 
         assert len(consumers) == 1
         assert consumers[0]["username"] == "user1"
@@ -156,7 +185,7 @@ class TestConfigManagerExport:
     def test_export_consumers_with_credentials(
         self, manager: ConfigManager, mock_client: MagicMock
     ) -> None:
-        """_export_consumers should include credentials when requested."""
+        """Consumers should embed credentials when requested."""
         mock_client.get.side_effect = [
             {"data": [{"id": "con-1", "username": "user1"}]},
             {"data": [{"key": "api-key-123"}]},  # key-auth
@@ -166,7 +195,7 @@ class TestConfigManagerExport:
             {"data": []},  # acls
         ]
 
-        consumers = manager._export_consumers(include_credentials=True)
+        consumers = manager.export_state(only=["consumers"], include_credentials=True).consumers
 
         assert len(consumers) == 1
         assert "key_auth" in consumers[0]
@@ -184,6 +213,114 @@ class TestConfigManagerExport:
         assert plugins[0]["name"] == "rate-limiting"
 
 
+class TestConfigManagerPaginatedExport:
+    """Tests for paginated, concurrent export."""
+
+    @pytest.mark.unit
+    def test_fetch_all_follows_every_page(
+        self, manager: ConfigManager, mock_client: MagicMock
+    ) -> None:
+        """_fetch_all should follow offsets until the last page."""
+        mock_client.get.side_effect = _route_responses(
+            {
+                "services": [
+                    {"data": [{"name": "a"}], "offset": "1"},
+                    {"data": [{"name": "b"}], "offset": "2"},
+                    {"data": [{"name": "c"}]},
+                ]
+            }
+        )
+
+        entities = manager._fetch_all("services")
+
+        assert [e["name"] for e in entities] == ["a", "b", "c"]
+        assert mock_client.get.call_count == 3
+        assert mock_client.get.call_args_list[0].kwargs["params"] == {"size": 1000}
+        assert mock_client.get.call_args_list[2].kwargs["params"] == {"size": 1000, "offset": "2"}
+
+    @pytest.mark.unit
+    def test_export_state_uses_page_size_override(
+        self, manager: ConfigManager, mock_client: MagicMock
+    ) -> None:
+        """export_state should send the overridden page size."""
+        mock_client.get.return_value = {"data": []}
+
+        manager.export_state(only=["routes"], page_size=50)
+
+        mock_client.get.assert_called_once_with("routes", params={"size": 50})
+
+    @pytest.mark.unit
+    def test_export_state_rejects_invalid_override(self, manager: ConfigManager) -> None:
+        """export_state should validate overrides."""
+        with pytest.raises(ValueError, match="page_size"):
+            manager.export_state(page_size=5000)
+
+    @pytest.mark.unit
+    def test_export_state_concurrent_with_credentials(self, mock_client: MagicMock) -> None:
+        """Concurrent export should assemble paginated entities and children."""
+        mock_client.get.side_effect = _route_responses(
+            {
+                "services": [
+                    {"data": [{"name": "svc-1"}], "offset": "1"},
+                    {"data": [{"name": "svc-2"}]},
+                ],
+                "upstreams": [{"data": [{"name": "up-1"}, {"name": "up-2"}]}],
+                "upstreams/up-1/targets": [{"data": [{"target": "10.0.0.1:80"}]}],
+                "upstreams/up-2/targets": [{"data": [{"target": "10.0.0.2:80"}]}],
+                "consumers": [
+                    {"data": [{"id": "c-1", "username": "alice"}], "offset": "1"},
+                    {"data": [{"id": "c-2", "username": "bob"}]},
+                ],
+                "consumers/c-1/key-auth": [{"data": [{"key": "alice-key"}]}],
+                "consumers/c-2/acls": [{"data": [{"group": "admins"}]}],
+            }
+        )
+        manager = ConfigManager(mock_client, max_workers=4)
+
+        config = manager.export_state(include_credentials=True)
+
+        assert [s["name"] for s in config.services] == ["svc-1", "svc-2"]
+        assert [u["targets"][0]["target"] for u in config.upstreams] == [
+            "10.0.0.1:80",
+            "10.0.0.2:80",
+        ]
+        assert config.consumers[0]["key_auth"] == [{"key": "alice-key"}]
+        assert config.consumers[1]["acls"] == [{"group": "admins"}]
+        assert "key_auth" not in config.consumers[1]
+
+    @pytest.mark.unit
+    def test_export_state_children_share_the_pool(self, mock_client: MagicMock) -> None:
+        """Targets and credentials should never run more requests than max_workers."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        serve = _route_responses(
+            {
+                "upstreams": [{"data": [{"name": f"up-{i}"} for i in range(4)]}],
+                "consumers": [{"data": [{"id": f"c-{i}"} for i in range(4)]}],
+            }
+        )
+
+        def get(endpoint: str, params: dict[str, Any] | None = None, **_: Any) -> dict[str, Any]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.005)
+            with lock:
+                active -= 1
+            return serve(endpoint, params)
+
+        mock_client.get.side_effect = get
+        manager = ConfigManager(mock_client, max_workers=2)
+
+        manager.export_state(include_credentials=True)
+
+        # 5 collections + 4 target lists + 4 consumers x 5 credential types
+        assert mock_client.get.call_count == 5 + 4 + 4 * len(ConfigManager.CREDENTIAL_TYPES)
+        assert peak <= 2
+
+
 class TestConfigManagerCleanEntities:
     """Tests for _clean_entities method."""
 
@@ -458,6 +595,43 @@ class TestConfigManagerDiffEntityList:
         assert len(diffs) == 1
         assert diffs[0].operation == "delete"
 
+    @pytest.mark.unit
+    def test_diff_entity_list_skips_unchanged_by_fingerprint(self, manager: ConfigManager) -> None:
+        """Entities equal up to key order and server fields should not diff."""
+        current = [
+            {
+                "id": "p1",
+                "created_at": 1,
+                "name": "rate-limiting",
+                "service": {"id": "svc"},
+                "config": {"minute": 5, "policy": "local"},
+            }
+        ]
+        desired = [
+            {
+                "config": {"policy": "local", "minute": 5},
+                "service": {"id": "svc"},
+                "name": "rate-limiting",
+            }
+        ]
+
+        with patch.object(manager, "_diff_entity") as diff_entity:
+            diffs = manager._diff_entity_list("plugins", current, desired)
+
+        assert diffs == []
+        diff_entity.assert_not_called()
+
+    @pytest.mark.unit
+    def test_diff_entity_list_diffs_fields_on_mismatch(self, manager: ConfigManager) -> None:
+        """A fingerprint mismatch should produce field-level changes."""
+        current = [{"name": "api", "host": "old.local", "tags": ["a"]}]
+        desired = [{"name": "api", "host": "new.local", "tags": ["a"]}]
+
+        diffs = manager._diff_entity_list("services", current, desired)
+
+        assert len(diffs) == 1
+        assert diffs[0].changes == {"host": ("old.local", "new.local")}
+
 
 class TestConfigManagerEntityKey:
     """Tests for _entity_key method."""
@@ -498,6 +672,17 @@ class TestConfigManagerEntityKey:
 
         assert key is not None
 
+    @pytest.mark.unit
+    def test_entity_key_fallback_is_stable_for_nested_values(self, manager: ConfigManager) -> None:
+        """The fallback key should handle unhashable values and ignore key order."""
+        first = {"target": "10.0.0.1:80", "tags": ["a"], "config": {"x": 1, "y": 2}}
+        second = {"config": {"y": 2, "x": 1}, "tags": ["a"], "target": "10.0.0.1:80"}
+
+        key = manager._entity_key(first)
+
+        assert key.startswith("fingerprint:")
+        assert key == manager._entity_key(second)
+
 
 class TestConfigManagerDiffEntity:
     """Tests for _diff_entity method."""
@@ -644,6 +829,147 @@ class TestConfigManagerApply:
         assert delete_order.index("routes") < delete_order.index("services")
 
 
+_EMPTY_STATE = [{"data": []}] * 5  # services, upstreams, routes, consumers, plugins
+
+
+class TestConfigManagerScheduledApply:
+    """Tests for apply_config through ApplyScheduler."""
+
+    @pytest.mark.unit
+    def test_fail_fast_stops_dependents(
+        self, manager: ConfigManager, mock_client: MagicMock
+    ) -> None:
+        """fail-fast should not attempt routes after their service fails."""
+        mock_client.get.side_effect = [
+            {"configuration": {"database": "postgres"}},  # is_dbless_mode check
+            *_EMPTY_STATE,
+        ]
+        mock_client.post.side_effect = Exception("service rejected")
+        desired = DeclarativeConfig(
+            services=[{"name": "api", "host": "api.local"}],
+            routes=[{"name": "rt", "paths": ["/api"], "service": {"name": "api"}}],
+        )
+
+        operations = manager.apply_config(desired, on_error="fail-fast")
+
+        assert [op.result for op in operations] == ["failed", "failed"]
+        assert mock_client.post.call_count == 1
+
+    @pytest.mark.unit
+    def test_rejects_invalid_max_workers(
+        self, manager: ConfigManager, mock_client: MagicMock
+    ) -> None:
+        """Invalid max_workers overrides should raise ValueError."""
+        mock_client.get.side_effect = [
+            {"configuration": {"database": "postgres"}},  # is_dbless_mode check
+            *_EMPTY_STATE,
+        ]
+        desired = DeclarativeConfig(services=[{"name": "api", "host": "api.local"}])
+
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            manager.apply_config(desired, max_workers=-1)
+
+
+class TestConfigManagerBulkApply:
+    """Tests for apply_config via the /config endpoint."""
+
+    @pytest.mark.unit
+    def test_dbless_mode_posts_once(self, manager: ConfigManager, mock_client: MagicMock) -> None:
+        """DB-less apply should post the whole document in a single request."""
+        mock_client.get.side_effect = [
+            {"configuration": {"database": "off"}},  # is_dbless_mode check
+            *_EMPTY_STATE,
+        ]
+        desired = DeclarativeConfig(
+            services=[{"name": f"svc-{i}", "host": f"svc-{i}.local"} for i in range(50)],
+            routes=[{"name": f"route-{i}", "paths": [f"/r{i}"]} for i in range(50)],
+        )
+
+        operations = manager.apply_config(desired)
+
+        mock_client.post.assert_called_once()
+        assert mock_client.post.call_args[0][0] == "config"
+        mock_client.patch.assert_not_called()
+        mock_client.delete.assert_not_called()
+        assert len(operations) == 100
+        assert all(op.result == "success" for op in operations)
+        entity_types = [op.entity_type for op in operations]
+        assert entity_types.index("routes") > entity_types.index("services")
+
+    @pytest.mark.unit
+    def test_bulk_forced_in_db_mode(self, manager: ConfigManager, mock_client: MagicMock) -> None:
+        """bulk=True should use /config even on a database-backed node."""
+        mock_client.get.side_effect = [
+            {"configuration": {"database": "postgres"}},  # is_dbless_mode check
+            {"data": [{"id": "svc-1", "name": "old", "host": "old.local"}]},
+            *_EMPTY_STATE[1:],
+        ]
+        desired = DeclarativeConfig(services=[{"name": "api", "host": "api.local"}])
+
+        operations = manager.apply_config(desired, bulk=True)
+
+        mock_client.post.assert_called_once()
+        assert mock_client.post.call_args[0][0] == "config"
+        mock_client.delete.assert_not_called()
+        assert [(op.operation, op.id_or_name) for op in operations] == [
+            ("create", "api"),
+            ("delete", "old"),
+        ]
+
+    @pytest.mark.unit
+    def test_bulk_failure_marks_all_failed(
+        self, manager: ConfigManager, mock_client: MagicMock
+    ) -> None:
+        """A rejected /config request should fail every reported operation."""
+        from system_operations_manager.integrations.kong.exceptions import KongAPIError
+
+        mock_client.get.side_effect = [
+            {"configuration": {"database": "off"}},  # is_dbless_mode check
+            *_EMPTY_STATE,
+        ]
+        mock_client.post.side_effect = KongAPIError("declarative config is invalid")
+        desired = DeclarativeConfig(
+            services=[{"name": "a", "host": "a.local"}, {"name": "b", "host": "b.local"}],
+        )
+
+        operations = manager.apply_config(desired)
+
+        assert [op.result for op in operations] == ["failed", "failed"]
+        assert operations[0].error is not None
+        assert "declarative config is invalid" in operations[0].error
+
+    @pytest.mark.unit
+    def test_bulk_without_changes_skips_request(
+        self, manager: ConfigManager, mock_client: MagicMock
+    ) -> None:
+        """No request should be sent when the diff is empty."""
+        mock_client.get.side_effect = [
+            {"configuration": {"database": "off"}},  # is_dbless_mode check
+            *_EMPTY_STATE,
+        ]
+
+        operations = manager.apply_config(DeclarativeConfig())
+
+        assert operations == []
+        mock_client.post.assert_not_called()
+
+    @pytest.mark.unit
+    def test_bulk_disabled_in_dbless_mode(
+        self, manager: ConfigManager, mock_client: MagicMock
+    ) -> None:
+        """bulk=False should keep per-entity calls even in DB-less mode."""
+        mock_client.get.side_effect = [
+            {"configuration": {"database": "off"}},  # is_dbless_mode check
+            *_EMPTY_STATE,
+        ]
+        mock_client.post.return_value = {"id": "new-id"}
+        desired = DeclarativeConfig(services=[{"name": "api", "host": "api.local"}])
+
+        manager.apply_config(desired, bulk=False)
+
+        assert mock_client.post.call_args[0][0] == "services"
+
+
 class TestConfigManagerApplyEntity:
     """Tests for _apply_entity method."""
 
@@ -1050,8 +1376,8 @@ class TestFlattenConfigNestedConsumerPlugins:
         assert "consumer" not in flattened.plugins[0]
 
 
-class TestExportConsumersSkipAndException:
-    """Tests for _export_consumers edge cases (lines 314, 324-326)."""
+class TestEmbedChildrenSkipAndException:
+    """Tests for credential embedding edge cases in _embed_children."""
 
     @pytest.mark.unit
     def test_export_consumers_skips_consumer_without_id_or_username(
@@ -1062,7 +1388,7 @@ class TestExportConsumersSkipAndException:
             "data": [{"custom_id": "ext-1"}]  # no id, no username
         }
 
-        consumers = manager._export_consumers(include_credentials=True)
+        consumers = manager.export_state(only=["consumers"], include_credentials=True).consumers
 
         assert len(consumers) == 1
         # Only the initial consumers GET is made; no credential fetches happen
@@ -1082,7 +1408,7 @@ class TestExportConsumersSkipAndException:
             {"data": []},  # acls
         ]
 
-        consumers = manager._export_consumers(include_credentials=True)
+        consumers = manager.export_state(only=["consumers"], include_credentials=True).consumers
 
         assert len(consumers) == 1
         assert "key_auth" not in consumers[0]
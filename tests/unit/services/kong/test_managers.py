@@ -598,6 +598,66 @@ class TestBaseEntityManagerEdgeCases:
 
         assert result == 0
 
+    @pytest.mark.unit
+    def test_count_with_page_size(
+        self,
+        manager: ServiceManager,
+        mock_client: MagicMock,
+    ) -> None:
+        """count should request the given page size."""
+        mock_client.get.return_value = {"data": [{"id": "1"}], "offset": None}
+
+        manager.count(page_size=1000)
+
+        assert mock_client.get.call_args.kwargs["params"]["size"] == 1000
+
+    @pytest.mark.unit
+    def test_iter_pages_follows_offsets(
+        self,
+        manager: ServiceManager,
+        mock_client: MagicMock,
+    ) -> None:
+        """iter_pages should yield one list per page in order."""
+        mock_client.get.side_effect = [
+            {"data": [{"id": "1"}, {"id": "2"}], "offset": "page2"},
+            {"data": [{"id": "3"}], "offset": None},
+        ]
+
+        pages = list(manager.iter_pages(page_size=2))
+
+        assert [[s.id for s in page] for page in pages] == [["1", "2"], ["3"]]
+        first, second = mock_client.get.call_args_list
+        assert first.kwargs["params"] == {"size": 2}
+        assert second.kwargs["params"] == {"size": 2, "offset": "page2"}
+
+    @pytest.mark.unit
+    def test_iter_all_yields_entities(
+        self,
+        manager: ServiceManager,
+        mock_client: MagicMock,
+    ) -> None:
+        """iter_all should flatten pages into entities."""
+        mock_client.get.side_effect = [
+            {"data": [{"id": "1"}], "offset": "page2"},
+            {"data": [{"id": "2"}], "offset": None},
+        ]
+
+        ids = [service.id for service in manager.iter_all(tags=["prod"])]
+
+        assert ids == ["1", "2"]
+        assert mock_client.get.call_args.kwargs["params"]["tags"] == "prod"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("page_size", [0, 1001])
+    def test_iter_all_rejects_invalid_page_size(
+        self,
+        manager: ServiceManager,
+        page_size: int,
+    ) -> None:
+        """iter_all should reject page sizes outside Kong's accepted range."""
+        with pytest.raises(ValueError, match="page_size must be between 1 and 1000"):
+            manager.iter_all(page_size=page_size)
+
 
 class TestKongPluginManager:
     """Tests for KongPluginManager."""
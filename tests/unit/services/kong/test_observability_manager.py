@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import math
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -132,65 +131,6 @@ kong_nginx_connections_total 50"""
         assert metrics[0].type == "gauge"
 
 
-class TestObservabilityManagerParseMetricLine:
-    """Tests for _parse_metric_line method."""
-
-    @pytest.mark.unit
-    def test_parse_metric_line_with_labels(self, manager: ObservabilityManager) -> None:
-        """Should parse metric line with labels."""
-        line = 'kong_http_requests_total{service="api",code="200"} 100'
-
-        metric = manager._parse_metric_line(line, "help", "counter")
-
-        assert metric is not None
-        assert metric.name == "kong_http_requests_total"
-        assert metric.value == 100
-        assert metric.labels == {"service": "api", "code": "200"}
-
-    @pytest.mark.unit
-    def test_parse_metric_line_without_labels(self, manager: ObservabilityManager) -> None:
-        """Should parse metric line without labels."""
-        line = "kong_http_requests_total 100"
-
-        metric = manager._parse_metric_line(line, "", "counter")
-
-        assert metric is not None
-        assert metric.name == "kong_http_requests_total"
-        assert metric.value == 100
-        assert metric.labels == {}
-
-    @pytest.mark.unit
-    def test_parse_metric_line_nan_value(self, manager: ObservabilityManager) -> None:
-        """Should handle NaN values."""
-        line = "kong_some_metric NaN"
-
-        metric = manager._parse_metric_line(line, "", "gauge")
-
-        # NaN should fail float conversion, returning None or a metric with NaN value
-        assert metric is None or (
-            metric is not None and metric.value is not None and math.isnan(metric.value)
-        )
-
-    @pytest.mark.unit
-    def test_parse_metric_line_inf_value(self, manager: ObservabilityManager) -> None:
-        """Should handle Inf values."""
-        line = "kong_some_metric +Inf"
-
-        metric = manager._parse_metric_line(line, "", "gauge")
-
-        assert metric is not None
-        assert metric.value == float("inf")
-
-    @pytest.mark.unit
-    def test_parse_metric_line_invalid(self, manager: ObservabilityManager) -> None:
-        """Should return None for invalid lines."""
-        line = "this is not a valid metric line"
-
-        metric = manager._parse_metric_line(line, "", "")
-
-        assert metric is None
-
-
 class TestObservabilityManagerMetricsSummary:
     """Tests for get_metrics_summary method."""
 
@@ -547,6 +487,25 @@ kong_request_latency_ms_bucket{service="api",le="+Inf"} 100"""
 
         assert percentiles.service == "api"
 
+    @pytest.mark.unit
+    def test_get_percentile_metrics_sums_series(
+        self, manager: ObservabilityManager, mock_client: MagicMock
+    ) -> None:
+        """Percentiles should use buckets and totals summed across series."""
+        mock_client.get.return_value = {
+            "raw": """kong_request_latency_ms_bucket{service="a",le="10"} 100
+kong_request_latency_ms_bucket{service="a",le="100"} 100
+kong_request_latency_ms_bucket{service="a",le="+Inf"} 100
+kong_request_latency_ms_bucket{service="b",le="10"} 0
+kong_request_latency_ms_bucket{service="b",le="100"} 100
+kong_request_latency_ms_bucket{service="b",le="+Inf"} 100"""
+        }
+
+        percentiles = manager.get_percentile_metrics()
+
+        assert percentiles.p50_ms == 10.0
+        assert percentiles.p95_ms == pytest.approx(91.0)
+
     @pytest.mark.unit
     def test_get_percentile_metrics_unavailable(
         self, manager: ObservabilityManager, mock_client: MagicMock
@@ -561,58 +520,6 @@ kong_request_latency_ms_bucket{service="api",le="+Inf"} 100"""
         assert percentiles.p99_ms is None
 
 
-class TestObservabilityManagerCalculatePercentile:
-    """Tests for _calculate_percentile method."""
-
-    @pytest.mark.unit
-    def test_calculate_percentile_empty_buckets(self, manager: ObservabilityManager) -> None:
-        """Should return None for empty buckets."""
-        result = manager._calculate_percentile({}, 0, 0.50)
-
-        assert result is None
-
-    @pytest.mark.unit
-    def test_calculate_percentile_p50(self, manager: ObservabilityManager) -> None:
-        """Should calculate P50 correctly."""
-        buckets: dict[float, float] = {10.0: 50.0, 50.0: 90.0, 100.0: 100.0}
-
-        result = manager._calculate_percentile(buckets, 100, 0.50)
-
-        assert result is not None
-        assert result <= 10.0  # P50 should be at or below the 10ms bucket
-
-    @pytest.mark.unit
-    def test_calculate_percentile_p95(self, manager: ObservabilityManager) -> None:
-        """Should calculate P95 correctly."""
-        buckets: dict[float, float] = {10.0: 50.0, 50.0: 90.0, 100.0: 100.0}
-
-        result = manager._calculate_percentile(buckets, 100, 0.95)
-
-        assert result is not None
-        assert result >= 50.0  # P95 should be above the P50 bucket
-
-    @pytest.mark.unit
-    def test_calculate_percentile_p99(self, manager: ObservabilityManager) -> None:
-        """Should calculate P99 correctly."""
-        buckets: dict[float, float] = {10.0: 50.0, 50.0: 90.0, 100.0: 99.0}
-
-        result = manager._calculate_percentile(buckets, 100, 0.99)
-
-        assert result is not None
-
-    @pytest.mark.unit
-    def test_calculate_percentile_interpolation(self, manager: ObservabilityManager) -> None:
-        """Should interpolate within bucket boundaries."""
-        # 75% of observations are at le=100
-        buckets: dict[float, float] = {50.0: 50.0, 100.0: 100.0}
-
-        result = manager._calculate_percentile(buckets, 100, 0.75)
-
-        assert result is not None
-        # Should be interpolated between 50 and 100
-        assert 50.0 < result < 100.0
-
-
 class TestObservabilityManagerHealthFailures:
     """Tests for get_health_failures method."""
 
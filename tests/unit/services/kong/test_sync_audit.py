@@ -263,6 +263,106 @@ class TestSyncAuditServiceRecord:
         assert len(lines) == num_threads * entries_per_thread
 
 
+def _entry(name: str, sync_id: str = "sync-batch") -> SyncAuditEntry:
+    return SyncAuditEntry(
+        sync_id=sync_id,
+        timestamp=datetime.now(UTC).isoformat(),
+        operation="push",
+        dry_run=False,
+        entity_type="services",
+        entity_name=name,
+        action="create",
+        source="gateway",
+        target="konnect",
+        status="success",
+    )
+
+
+class TestSyncAuditServiceBatch:
+    """Tests for buffered batch writes."""
+
+    @pytest.mark.unit
+    def test_batch_buffers_until_exit(
+        self, audit_service: SyncAuditService, audit_file: Path
+    ) -> None:
+        """Entries recorded in a batch should reach the file in order on exit."""
+        with audit_service.batch():
+            for i in range(3):
+                audit_service.record(_entry(f"service-{i}"))
+            assert not audit_file.exists()
+
+        names = [e.entity_name for e in audit_service.get_sync_details("sync-batch")]
+        assert names == ["service-0", "service-1", "service-2"]
+
+    @pytest.mark.unit
+    def test_batch_flushes_at_size_with_one_lock_and_fsync(
+        self,
+        audit_service: SyncAuditService,
+        audit_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A full batch should be written under one lock and fsynced."""
+        import system_operations_manager.services.kong.sync_audit as sync_audit
+
+        locks: list[int] = []
+        fsyncs: list[int] = []
+        real_flock = sync_audit.fcntl.flock
+        monkeypatch.setattr(
+            sync_audit.fcntl,
+            "flock",
+            lambda fd, op: (locks.append(op), real_flock(fd, op))[1],
+        )
+        monkeypatch.setattr(sync_audit.os, "fsync", fsyncs.append)
+
+        with audit_service.batch(max_entries=2):
+            for i in range(5):
+                audit_service.record(_entry(f"service-{i}"))
+            assert len(audit_file.read_text().splitlines()) == 4
+
+        assert len(audit_file.read_text().splitlines()) == 5
+        assert locks.count(sync_audit.fcntl.LOCK_EX) == 3
+        assert len(fsyncs) == 3
+
+    @pytest.mark.unit
+    def test_batch_flushes_after_interval(
+        self, audit_service: SyncAuditService, audit_file: Path
+    ) -> None:
+        """A batch older than max_interval should flush on the next record."""
+        with audit_service.batch(max_interval=0):
+            audit_service.record(_entry("service-0"))
+            assert audit_file.read_text().count("service-0") == 1
+
+    @pytest.mark.unit
+    def test_batch_flushes_on_error(
+        self, audit_service: SyncAuditService, audit_file: Path
+    ) -> None:
+        """Buffered entries should be written even if the sync run fails."""
+        with pytest.raises(RuntimeError), audit_service.batch():
+            audit_service.record(_entry("service-0"))
+            raise RuntimeError("push failed")
+
+        assert "service-0" in audit_file.read_text()
+        audit_service.record(_entry("service-1"))
+        assert "service-1" in audit_file.read_text()
+
+    @pytest.mark.unit
+    def test_record_many_and_flush(self, audit_service: SyncAuditService, audit_file: Path) -> None:
+        """record_many and flush should write immediately."""
+        audit_service.record_many([_entry("a"), _entry("b")])
+        assert len(audit_file.read_text().splitlines()) == 2
+
+        with audit_service.batch():
+            audit_service.record(_entry("c"))
+            audit_service.flush()
+            assert len(audit_file.read_text().splitlines()) == 3
+
+    @pytest.mark.unit
+    def test_batch_rejects_non_positive_size(self, audit_service: SyncAuditService) -> None:
+        """max_entries must be positive."""
+        with pytest.raises(ValueError), audit_service.batch(max_entries=0):
+            pass
+
+
 class TestSyncAuditServiceListSyncs:
     """Tests for SyncAuditService.list_syncs."""
 
@@ -685,6 +785,31 @@ class TestSyncAuditServiceGetEntityHistory:
         assert entries[0].sync_id == "sync-0"
         assert entries[2].sync_id == "sync-2"
 
+    @pytest.mark.unit
+    def test_get_entity_history_breaks_ties_newest_first(
+        self, audit_service: SyncAuditService
+    ) -> None:
+        """Entries sharing a timestamp should come back latest-written first."""
+        ts = datetime.now(UTC).isoformat()
+        for i in range(3):
+            audit_service.record(
+                SyncAuditEntry(
+                    sync_id=f"sync-{i}",
+                    timestamp=ts,
+                    operation="push",
+                    dry_run=False,
+                    entity_type="services",
+                    entity_name="target-service",
+                    action="update",
+                    source="gateway",
+                    target="konnect",
+                    status="success",
+                )
+            )
+
+        entries = audit_service.get_entity_history("services", "target-service", limit=2)
+        assert [e.sync_id for e in entries] == ["sync-2", "sync-1"]
+
 
 class TestSyncAuditServiceEdgeCases:
     """Tests for edge cases in SyncAuditService."""
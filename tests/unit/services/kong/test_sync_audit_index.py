@@ -0,0 +1,294 @@
+"""Unit tests for the sync audit log index, rotation and compaction."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from system_operations_manager.services.kong.sync_audit import (
+    SyncAuditEntry,
+    SyncAuditService,
+)
+from system_operations_manager.services.kong.sync_audit_index import (
+    parse_timestamp,
+    segment_name,
+)
+
+
+def _entry(
+    sync_id: str = "sync-1",
+    entity_name: str = "svc",
+    *,
+    timestamp: datetime | None = None,
+    operation: str = "push",
+) -> SyncAuditEntry:
+    """Build an audit entry."""
+    return SyncAuditEntry(
+        sync_id=sync_id,
+        timestamp=(timestamp or datetime.now(UTC)).isoformat(),
+        operation=operation,
+        dry_run=False,
+        entity_type="services",
+        entity_name=entity_name,
+        action="create",
+        source="gateway",
+        target="konnect",
+        status="success",
+    )
+
+
+@pytest.fixture
+def audit_file(tmp_path: Path) -> Path:
+    """Create a temporary audit file path."""
+    return tmp_path / "kong_sync_audit.jsonl"
+
+
+@pytest.mark.unit
+class TestSyncAuditIndex:
+    """Tests for incremental indexing."""
+
+    def test_record_updates_index(self, audit_file: Path) -> None:
+        """record should index the entry so queries need no scan."""
+        service = SyncAuditService(audit_file=audit_file)
+        service.record(_entry())
+
+        assert service.index.index_file.exists()
+        rows = service.index.query("SELECT sync_id, entity_name FROM entries")
+        assert rows == [("sync-1", "svc")]
+
+    def test_queries_only_parse_new_lines(self, audit_file: Path) -> None:
+        """Catch-up should only parse bytes appended since the last query."""
+        service = SyncAuditService(audit_file=audit_file)
+        for i in range(5):
+            service.record(_entry(entity_name=f"svc-{i}"))
+
+        with patch(
+            "system_operations_manager.services.kong.sync_audit._index_record",
+        ) as parse:
+            service.index._parse_line = parse
+            service.get_sync_details("sync-1")
+
+        parse.assert_not_called()
+
+    def test_picks_up_lines_from_other_writers(self, audit_file: Path) -> None:
+        """Lines appended outside record() should be indexed on the next query."""
+        service = SyncAuditService(audit_file=audit_file)
+        service.record(_entry(entity_name="first"))
+
+        with audit_file.open("a") as f:
+            f.write(_entry(entity_name="second").model_dump_json() + "\n")
+
+        names = [e.entity_name for e in service.get_sync_details("sync-1")]
+        assert names == ["first", "second"]
+
+    def test_record_indexes_without_reading_back(self, audit_file: Path) -> None:
+        """Entries written by record() should be indexed from memory, not re-parsed."""
+        service = SyncAuditService(audit_file=audit_file)
+        service.record(_entry(entity_name="first"))
+
+        with patch(
+            "system_operations_manager.services.kong.sync_audit._index_record",
+        ) as parse:
+            service.index._parse_line = parse
+            service.record_many([_entry(entity_name="second"), _entry(entity_name="third")])
+
+        parse.assert_not_called()
+        names = [e.entity_name for e in service.get_sync_details("sync-1")]
+        assert names == ["first", "second", "third"]
+
+    def test_record_after_other_writer_catches_up(self, audit_file: Path) -> None:
+        """A write behind a foreign append should index both in log order."""
+        service = SyncAuditService(audit_file=audit_file)
+        service.record(_entry(entity_name="first"))
+
+        with audit_file.open("a") as f:
+            f.write(_entry(entity_name="foreign").model_dump_json() + "\n")
+        service.record(_entry(entity_name="last"))
+
+        rows = service.index.query("SELECT entity_name FROM entries ORDER BY seq")
+        assert rows == [("first",), ("foreign",), ("last",)]
+
+    def test_ignores_incomplete_trailing_line(self, audit_file: Path) -> None:
+        """A line still being written should be indexed once it is complete."""
+        service = SyncAuditService(audit_file=audit_file)
+        line = _entry().model_dump_json()
+        audit_file.write_text(line[:20])
+
+        assert service.get_sync_details("sync-1") == []
+
+        audit_file.write_text(line + "\n")
+        assert len(service.get_sync_details("sync-1")) == 1
+
+    def test_reindexes_rewritten_file(self, audit_file: Path) -> None:
+        """A truncated or replaced log should be re-indexed from the start."""
+        service = SyncAuditService(audit_file=audit_file)
+        service.record(_entry("old-sync", "a"))
+        service.record(_entry("old-sync", "b"))
+
+        replacement = audit_file.with_name("replacement.jsonl")
+        replacement.write_text(_entry("new-sync").model_dump_json() + "\n")
+        replacement.replace(audit_file)
+
+        assert service.get_sync_details("old-sync") == []
+        assert len(service.get_sync_details("new-sync")) == 1
+
+    def test_recreates_corrupt_index(self, audit_file: Path) -> None:
+        """An unreadable index file should be rebuilt from the log."""
+        audit_file.write_text(_entry().model_dump_json() + "\n")
+        audit_file.with_name(audit_file.name + ".idx").write_bytes(b"not a database" * 100)
+
+        service = SyncAuditService(audit_file=audit_file)
+
+        assert len(service.get_sync_details("sync-1")) == 1
+
+    def test_list_syncs_time_range(self, audit_file: Path) -> None:
+        """list_syncs should filter entries by since and until."""
+        service = SyncAuditService(audit_file=audit_file)
+        now = datetime.now(UTC)
+        for days in (10, 5, 1):
+            service.record(_entry(f"sync-{days}d", timestamp=now - timedelta(days=days)))
+
+        syncs = service.list_syncs(since=now - timedelta(days=7), until=now - timedelta(days=2))
+
+        assert [s.sync_id for s in syncs] == ["sync-5d"]
+
+    def test_rebuild(self, audit_file: Path) -> None:
+        """rebuild should re-index every log file."""
+        service = SyncAuditService(audit_file=audit_file)
+        service.record(_entry())
+
+        service.index.rebuild()
+
+        assert service.index.query("SELECT COUNT(*) FROM entries") == [(1,)]
+
+
+@pytest.mark.unit
+class TestSyncAuditRotation:
+    """Tests for size/age rotation and compaction."""
+
+    def test_rotates_by_size(self, audit_file: Path) -> None:
+        """The active log should roll over once it reaches max_bytes."""
+        service = SyncAuditService(audit_file=audit_file, max_bytes=1)
+
+        service.record(_entry(entity_name="a"))
+        service.record(_entry(entity_name="b"))
+
+        segments = sorted(audit_file.parent.glob("kong_sync_audit.*.jsonl"))
+        assert len(segments) == 2
+        assert not audit_file.exists()
+        names = [e.entity_name for e in service.get_sync_details("sync-1")]
+        assert names == ["a", "b"]
+
+    def test_rotates_by_age(self, audit_file: Path) -> None:
+        """The active log should roll over once its oldest entry exceeds max_age."""
+        service = SyncAuditService(audit_file=audit_file, max_age=timedelta(days=1))
+
+        service.record(_entry(entity_name="recent"))
+        assert audit_file.exists()
+
+        audit_file.unlink()
+        service.record(_entry(timestamp=datetime.now(UTC) - timedelta(days=2)))
+        assert not audit_file.exists()
+
+    def test_history_spans_segments(self, audit_file: Path) -> None:
+        """Entity history should include entries from rotated segments."""
+        service = SyncAuditService(audit_file=audit_file, max_bytes=1)
+        now = datetime.now(UTC)
+        for i in range(3):
+            service.record(_entry(f"sync-{i}", timestamp=now + timedelta(seconds=i)))
+
+        history = service.get_entity_history("services", "svc", limit=2)
+
+        assert [e.sync_id for e in history] == ["sync-2", "sync-1"]
+        assert len(service.list_syncs()) == 3
+
+    def test_history_survives_lost_index(self, audit_file: Path) -> None:
+        """Deleting the index should not lose entries in rotated segments."""
+        service = SyncAuditService(audit_file=audit_file, max_bytes=1)
+        for name in ("a", "b", "c", "d", "e"):
+            service.record(_entry(entity_name=name))
+        index_file = service.index.index_file
+        service.index.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(index_file) + suffix).unlink(missing_ok=True)
+
+        restored = SyncAuditService(audit_file=audit_file, max_bytes=1)
+
+        names = [e.entity_name for e in restored.get_sync_details("sync-1")]
+        assert names == ["a", "b", "c", "d", "e"]
+        assert [s.sync_id for s in restored.list_syncs()] == ["sync-1"]
+
+        restored.index.rebuild()
+        assert restored.index.query("SELECT COUNT(*) FROM entries") == [(5,)]
+
+    def test_segments_registered_in_rotation_order(self, audit_file: Path) -> None:
+        """Segments sharing a timestamp should be ordered by their counter."""
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        for name in ("first", "second", "third"):
+            segment = audit_file.with_name(segment_name(audit_file, now))
+            segment.write_text(_entry(entity_name=name).model_dump_json() + "\n")
+
+        service = SyncAuditService(audit_file=audit_file)
+
+        names = [e.entity_name for e in service.get_sync_details("sync-1")]
+        assert names == ["first", "second", "third"]
+
+    def test_compact_removes_old_segments(self, audit_file: Path) -> None:
+        """compact should drop segments whose newest entry is past the cutoff."""
+        service = SyncAuditService(audit_file=audit_file, max_bytes=1)
+        service.record(_entry("old", timestamp=datetime.now(UTC) - timedelta(days=60)))
+        service.record(_entry("new"))
+
+        removed = service.compact(timedelta(days=30))
+
+        assert len(removed) == 1
+        assert not (audit_file.parent / removed[0]).exists()
+        assert service.get_sync_details("old") == []
+        assert len(service.get_sync_details("new")) == 1
+
+    def test_compact_keeps_active_log(self, audit_file: Path) -> None:
+        """The active log is never compacted."""
+        service = SyncAuditService(audit_file=audit_file)
+        service.record(_entry(timestamp=datetime.now(UTC) - timedelta(days=60)))
+
+        assert service.compact(timedelta(days=1)) == []
+        assert audit_file.exists()
+
+    def test_retention_compacts_on_rotation(self, audit_file: Path) -> None:
+        """Segments past retention should be removed when the log rotates."""
+        service = SyncAuditService(audit_file=audit_file, max_bytes=1, retention=timedelta(days=30))
+        service.record(_entry("old", timestamp=datetime.now(UTC) - timedelta(days=60)))
+        service.record(_entry("new"))
+
+        assert service.list_syncs()[0].sync_id == "new"
+        assert len(service.list_syncs()) == 1
+
+    def test_rejects_invalid_max_bytes(self, audit_file: Path) -> None:
+        """max_bytes must be positive."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            SyncAuditService(audit_file=audit_file, max_bytes=0)
+
+
+@pytest.mark.unit
+class TestHelpers:
+    """Tests for module helpers."""
+
+    def test_parse_timestamp(self) -> None:
+        """ISO timestamps with Z or offsets should convert to epoch seconds."""
+        assert parse_timestamp("1970-01-01T00:00:10Z") == 10
+        assert parse_timestamp("1970-01-01T00:00:10+00:00") == 10
+        assert parse_timestamp("yesterday") is None
+
+    def test_segment_name_is_unique(self, audit_file: Path) -> None:
+        """Segment names should not collide with existing files."""
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        first = segment_name(audit_file, now)
+        (audit_file.parent / first).touch()
+
+        second = segment_name(audit_file, now)
+
+        assert first == "kong_sync_audit.20260101T000000000000Z.jsonl"
+        assert second != first
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
+from system_operations_manager.integrations.kong.exceptions import KongConnectionError
 from system_operations_manager.integrations.kong.models.base import KongEntityReference
 from system_operations_manager.integrations.kong.models.certificate import (
     SNI,
@@ -19,9 +22,17 @@ from system_operations_manager.integrations.kong.models.key import Key, KeySet
 from system_operations_manager.integrations.kong.models.plugin import KongPluginEntity
 from system_operations_manager.integrations.kong.models.route import Route
 from system_operations_manager.integrations.kong.models.service import Service
-from system_operations_manager.integrations.kong.models.unified import EntitySource
+from system_operations_manager.integrations.kong.models.unified import (
+    EntitySource,
+    UnifiedEntity,
+    UnifiedEntityList,
+)
 from system_operations_manager.integrations.kong.models.upstream import Target, Upstream
-from system_operations_manager.services.kong.unified_query import UnifiedQueryService
+from system_operations_manager.integrations.konnect.exceptions import KonnectConnectionError
+from system_operations_manager.services.kong.unified_query import (
+    SyncSession,
+    UnifiedQueryService,
+)
 
 
 @pytest.fixture
@@ -101,6 +112,49 @@ class TestUnifiedQueryServiceInit:
         """Should initialize with gateway managers only."""
         assert gateway_only_service.konnect_configured is False
 
+    @pytest.mark.unit
+    def test_page_size_passed_to_every_chain(
+        self,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """page_size should be sent as the limit of Gateway and Konnect pages."""
+        mock_gateway_managers["service"].list.return_value = ([], None)
+        mock_konnect_managers["service"].list.return_value = ([], None)
+        service = UnifiedQueryService(
+            gateway_service_manager=mock_gateway_managers["service"],
+            gateway_route_manager=mock_gateway_managers["route"],
+            gateway_consumer_manager=mock_gateway_managers["consumer"],
+            gateway_plugin_manager=mock_gateway_managers["plugin"],
+            gateway_upstream_manager=mock_gateway_managers["upstream"],
+            konnect_service_manager=mock_konnect_managers["service"],
+            page_size=1000,
+        )
+
+        service.list_services()
+
+        mock_gateway_managers["service"].list.assert_called_once_with(
+            tags=None, limit=1000, offset=None
+        )
+        mock_konnect_managers["service"].list.assert_called_once_with(
+            tags=None, limit=1000, offset=None
+        )
+
+    @pytest.mark.unit
+    def test_rejects_out_of_range_page_size(
+        self, mock_gateway_managers: dict[str, MagicMock]
+    ) -> None:
+        """page_size above MAX_PAGE_SIZE should be rejected."""
+        with pytest.raises(ValueError, match="page_size"):
+            UnifiedQueryService(
+                gateway_service_manager=mock_gateway_managers["service"],
+                gateway_route_manager=mock_gateway_managers["route"],
+                gateway_consumer_manager=mock_gateway_managers["consumer"],
+                gateway_plugin_manager=mock_gateway_managers["plugin"],
+                gateway_upstream_manager=mock_gateway_managers["upstream"],
+                page_size=5000,
+            )
+
 
 class TestUnifiedQueryServiceListServices:
     """Tests for list_services operations."""
@@ -514,6 +568,307 @@ class TestUnifiedQueryServiceGetSyncSummary:
         assert service_stats["drift"] == 1
         assert service_stats["total"] == 4
 
+    @pytest.mark.unit
+    def test_get_sync_snapshot_returns_merged_lists(
+        self,
+        unified_service: UnifiedQueryService,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """Should return the merged entity lists the summary is computed from."""
+        mock_gateway_managers["service"].list.return_value = (
+            [Service(id="gw-1", name="shared", host="shared.local")],
+            None,
+        )
+        mock_konnect_managers["service"].list.return_value = (
+            [Service(id="kon-1", name="shared", host="shared.local")],
+            None,
+        )
+
+        result = unified_service.get_sync_snapshot(entity_types=["services", "bananas"])
+
+        assert list(result) == ["services"]
+        assert result["services"].synced_count == 1
+        assert result["services"].entities[0].konnect_id == "kon-1"
+
+
+class TestSyncSession:
+    """Tests for SyncSession snapshot reuse."""
+
+    @pytest.fixture
+    def service(self) -> MagicMock:
+        """Mock service serving one gateway-only service per snapshot."""
+        service = MagicMock()
+
+        def snapshot(entity_types: list[str]) -> dict[str, UnifiedEntityList[Any]]:
+            entity = Service(id="svc-1", name="api", host="api.local")
+            return {
+                entity_type: UnifiedEntityList(
+                    entities=[
+                        UnifiedEntity(
+                            entity=entity,
+                            source=EntitySource.GATEWAY,
+                            gateway_id="svc-1",
+                            gateway_entity=entity,
+                        )
+                    ]
+                )
+                for entity_type in entity_types
+                if entity_type != "bananas"
+            }
+
+        service.get_sync_snapshot.side_effect = snapshot
+        return service
+
+    @pytest.mark.unit
+    def test_summary_and_lists_share_one_fetch(self, service: MagicMock) -> None:
+        """Summary and later list reads should come from one snapshot."""
+        session = SyncSession(service)
+
+        summary = session.get_sync_summary(["services", "routes"])
+        services = session.list_services()
+        session.list_routes()
+
+        service.get_sync_snapshot.assert_called_once_with(["services", "routes"])
+        assert summary["services"] == {
+            "gateway_only": 1,
+            "konnect_only": 0,
+            "synced": 0,
+            "drift": 0,
+            "total": 1,
+        }
+        assert services.gateway_only_count == 1
+
+    @pytest.mark.unit
+    def test_loads_only_missing_types(self, service: MagicMock) -> None:
+        """Reading a type outside the snapshot should fetch just that type."""
+        session = SyncSession(service)
+        session.get_sync_summary(["services"])
+
+        session.list_upstreams()
+        session.list_services()
+
+        assert [c.args[0] for c in service.get_sync_snapshot.call_args_list] == [
+            ["services"],
+            ["upstreams"],
+        ]
+
+    @pytest.mark.unit
+    def test_unknown_type_is_empty(self, service: MagicMock) -> None:
+        """Unknown entity types should read as empty and be left out of summaries."""
+        session = SyncSession(service)
+
+        assert len(session.entities("bananas")) == 0
+        assert session.get_sync_summary(["bananas"]) == {}
+
+    @pytest.mark.unit
+    def test_refresh_refetches_types(self, service: MagicMock) -> None:
+        """refresh should drop and re-fetch the given types only."""
+        session = SyncSession(service)
+        session.get_sync_summary(["services", "routes"])
+        before = session.list_routes()
+
+        session.refresh(["services"])
+
+        service.get_sync_snapshot.assert_called_with(["services"])
+        assert session.list_routes() is before
+
+    @pytest.mark.unit
+    def test_targets_fetched_once_per_upstream(self, service: MagicMock) -> None:
+        """Targets should be fetched lazily and cached until upstreams refresh."""
+        session = SyncSession(service)
+
+        session.list_targets_for_upstream("backend")
+        session.list_targets_for_upstream("backend")
+        session.list_targets_for_upstream("api")
+        assert service.list_targets_for_upstream.call_count == 2
+
+        session.refresh(["upstreams"])
+        session.list_targets_for_upstream("backend")
+        assert service.list_targets_for_upstream.call_count == 3
+
+    @pytest.mark.unit
+    def test_konnect_configured_delegates(self, service: MagicMock) -> None:
+        """konnect_configured should reflect the underlying service."""
+        service.konnect_configured = False
+
+        assert SyncSession(service).konnect_configured is False
+
+
+def _build_service(
+    gateway: dict[str, MagicMock],
+    konnect: dict[str, MagicMock],
+    **kwargs: Any,
+) -> UnifiedQueryService:
+    """Create a UnifiedQueryService with custom concurrency settings."""
+    return UnifiedQueryService(
+        gateway_service_manager=gateway["service"],
+        gateway_route_manager=gateway["route"],
+        gateway_consumer_manager=gateway["consumer"],
+        gateway_plugin_manager=gateway["plugin"],
+        gateway_upstream_manager=gateway["upstream"],
+        konnect_service_manager=konnect["service"],
+        konnect_route_manager=konnect["route"],
+        konnect_consumer_manager=konnect["consumer"],
+        konnect_plugin_manager=konnect["plugin"],
+        konnect_upstream_manager=konnect["upstream"],
+        **kwargs,
+    )
+
+
+class TestUnifiedQueryServiceConcurrency:
+    """Tests for concurrent Gateway/Konnect fetching."""
+
+    @pytest.mark.unit
+    def test_sources_fetched_in_parallel(
+        self,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """Gateway and Konnect fetches should overlap rather than run back to back."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def gateway_list(**kwargs: Any) -> tuple[list[Service], str | None]:
+            barrier.wait()
+            return [Service(id="gw-1", name="shared", host="a.local")], None
+
+        def konnect_list(**kwargs: Any) -> tuple[list[Service], str | None]:
+            barrier.wait()
+            return [Service(id="kon-1", name="shared", host="a.local")], None
+
+        mock_gateway_managers["service"].list.side_effect = gateway_list
+        mock_konnect_managers["service"].list.side_effect = konnect_list
+        service = _build_service(mock_gateway_managers, mock_konnect_managers, max_workers=2)
+
+        result = service.list_services()
+
+        assert result.synced_count == 1
+
+    @pytest.mark.unit
+    def test_sequential_mode(
+        self,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """max_workers=1 should fetch the sources one at a time on one worker."""
+        threads: list[int] = []
+        running = threading.Semaphore(1)
+
+        def record(**kwargs: Any) -> tuple[list[Service], str | None]:
+            assert running.acquire(blocking=False), "fetches overlapped"
+            threads.append(threading.get_ident())
+            time.sleep(0.01)
+            running.release()
+            return [], None
+
+        mock_gateway_managers["service"].list.side_effect = record
+        mock_konnect_managers["service"].list.side_effect = record
+        service = _build_service(mock_gateway_managers, mock_konnect_managers, max_workers=1)
+
+        service.list_services()
+
+        assert len(threads) == 2
+        assert len(set(threads)) == 1
+
+    @pytest.mark.unit
+    def test_sequential_mode_enforces_timeout(
+        self,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """max_workers=1 should still raise once a source exceeds its timeout."""
+        release = threading.Event()
+
+        def slow_list(**kwargs: Any) -> tuple[list[Service], str | None]:
+            release.wait(5)
+            return [], None
+
+        mock_gateway_managers["service"].list.return_value = ([], None)
+        mock_konnect_managers["service"].list.side_effect = slow_list
+        service = _build_service(
+            mock_gateway_managers, mock_konnect_managers, max_workers=1, konnect_timeout=0.05
+        )
+
+        try:
+            with pytest.raises(KonnectConnectionError, match="Timed out"):
+                service.list_services()
+        finally:
+            release.set()
+
+    @pytest.mark.unit
+    def test_konnect_timeout_raises_connection_error(
+        self,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """A Konnect fetch exceeding its budget should raise KonnectConnectionError."""
+        release = threading.Event()
+
+        def slow_list(**kwargs: Any) -> tuple[list[Service], str | None]:
+            release.wait(5)
+            return [], None
+
+        mock_gateway_managers["service"].list.return_value = ([], None)
+        mock_konnect_managers["service"].list.side_effect = slow_list
+        service = _build_service(mock_gateway_managers, mock_konnect_managers, konnect_timeout=0.05)
+
+        try:
+            with pytest.raises(KonnectConnectionError, match="Timed out"):
+                service.list_services()
+        finally:
+            release.set()
+
+    @pytest.mark.unit
+    def test_gateway_timeout_raises_connection_error(
+        self,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """A Gateway fetch exceeding its budget should raise KongConnectionError."""
+
+        def slow_list(**kwargs: Any) -> tuple[list[Service], str | None]:
+            time.sleep(0.5)
+            return [], None
+
+        mock_gateway_managers["service"].list.side_effect = slow_list
+        mock_konnect_managers["service"].list.return_value = ([], None)
+        service = _build_service(mock_gateway_managers, mock_konnect_managers, gateway_timeout=0.05)
+
+        with pytest.raises(KongConnectionError, match="Timed out"):
+            service.list_services()
+
+    @pytest.mark.unit
+    def test_sync_summary_concurrent_matches_sequential(
+        self,
+        mock_gateway_managers: dict[str, MagicMock],
+        mock_konnect_managers: dict[str, MagicMock],
+    ) -> None:
+        """Concurrent summary should produce the same counts as sequential mode."""
+        for managers, host in (
+            (mock_gateway_managers, "gateway.local"),
+            (mock_konnect_managers, "konnect.local"),
+        ):
+            for manager in managers.values():
+                manager.list.return_value = ([], None)
+            managers["service"].list.return_value = (
+                [
+                    Service(id="s-1", name="shared", host="shared.local"),
+                    Service(id="s-2", name="drifted", host=host),
+                ],
+                None,
+            )
+
+        sequential = _build_service(
+            mock_gateway_managers, mock_konnect_managers, max_workers=1
+        ).get_sync_summary()
+        concurrent = _build_service(
+            mock_gateway_managers, mock_konnect_managers, max_workers=8
+        ).get_sync_summary()
+
+        assert concurrent == sequential
+        assert concurrent["services"]["synced"] == 1
+        assert concurrent["services"]["drift"] == 1
+
 
 class TestUnifiedQueryServiceSourceFiltering:
     """Tests for source filtering in unified results."""
@@ -645,7 +1000,7 @@ class TestUnifiedQueryServiceListTargets:
         assert result.gateway_only_count == 2
         assert result.konnect_only_count == 0
         mock_gateway_managers["upstream"].list_targets.assert_called_once_with(
-            "my-upstream", offset=None
+            "my-upstream", limit=None, offset=None
         )
 
     @pytest.mark.unit
@@ -194,3 +194,45 @@ class TestKonnectServiceManagerDelete:
         service_manager.delete("test-service")
 
         mock_konnect_client.delete_service.assert_called_once_with("cp-123", "test-service")
+
+
+class TestKonnectServiceManagerIteration:
+    """Tests for streaming iteration."""
+
+    @pytest.mark.unit
+    def test_iter_all_follows_offsets(
+        self,
+        service_manager: KonnectServiceManager,
+        mock_konnect_client: MagicMock,
+    ) -> None:
+        """iter_all should page through every service."""
+        mock_konnect_client.list_services.side_effect = [
+            ([Service(name="svc-1", host="host1.local")], "next"),
+            ([Service(name="svc-2", host="host2.local")], None),
+        ]
+
+        names = [service.name for service in service_manager.iter_all(page_size=500)]
+
+        assert names == ["svc-1", "svc-2"]
+        mock_konnect_client.list_services.assert_called_with(
+            "cp-123", tags=None, limit=500, offset="next"
+        )
+
+    @pytest.mark.unit
+    def test_iter_pages_yields_pages(
+        self,
+        service_manager: KonnectServiceManager,
+        mock_konnect_client: MagicMock,
+    ) -> None:
+        """iter_pages should yield each page as a list."""
+        mock_konnect_client.list_services.return_value = (
+            [Service(name="svc-1", host="host1.local")],
+            None,
+        )
+
+        pages = list(service_manager.iter_pages(tags=["prod"], prefetch=False))
+
+        assert len(pages) == 1
+        mock_konnect_client.list_services.assert_called_once_with(
+            "cp-123", tags=["prod"], limit=None, offset=None
+        )
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call
 
 import pytest
 
+from system_operations_manager.integrations.kubernetes.informer import Informer
 from system_operations_manager.services.kubernetes.base import K8sBaseManager
 
 
@@ -14,6 +16,8 @@ def mock_k8s_client() -> MagicMock:
     """Create a mock Kubernetes client."""
     mock_client = MagicMock()
     mock_client.default_namespace = "default"
+    mock_client.informer.return_value = None
+    mock_client.fast_list_enabled = False
     return mock_client
 
 
@@ -79,3 +83,117 @@ class TestK8sBaseManager:
         manager = K8sBaseManager(mock_k8s_client)
 
         assert manager._entity_name == ""
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_list_from_informer_uses_store(self, mock_k8s_client: MagicMock) -> None:
+        """Should answer label-selector lists from a running informer."""
+        informer = MagicMock(spec=Informer)
+        informer.list_objects.return_value = ["pod"]
+        mock_k8s_client.informer.return_value = informer
+        manager = K8sBaseManager(mock_k8s_client)
+
+        result = manager._list_from_informer("pods", "prod", {"label_selector": "app=web"})
+
+        assert result == ["pod"]
+        mock_k8s_client.informer.assert_called_once_with("pods")
+        informer.list_objects.assert_called_once_with("prod", label_selector="app=web")
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_list_from_informer_falls_back(self, mock_k8s_client: MagicMock) -> None:
+        """Should return None when disabled or when field selectors are used."""
+        manager = K8sBaseManager(mock_k8s_client)
+
+        mock_k8s_client.informer.return_value = None
+        assert manager._list_from_informer("pods", None, {}) is None
+
+        mock_k8s_client.informer.return_value = MagicMock(spec=Informer)
+        assert manager._list_from_informer("pods", None, {"field_selector": "x=y"}) is None
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_iter_list_pages_follows_continue_token(self, mock_k8s_client: MagicMock) -> None:
+        """Should request pages with limit/_continue until the token runs out."""
+        mock_k8s_client.informer.return_value = None
+        list_call = MagicMock(
+            side_effect=[
+                SimpleNamespace(items=[1, 2], metadata=SimpleNamespace(_continue="next")),
+                SimpleNamespace(items=[3], metadata=SimpleNamespace(_continue=None)),
+            ]
+        )
+        manager = K8sBaseManager(mock_k8s_client)
+
+        pages = list(
+            manager._iter_list_pages(
+                str,
+                list_call,
+                {"label_selector": "app=web"},
+                resource_type="Pod",
+                informer="pods",
+                chunk_size=2,
+            )
+        )
+
+        assert pages == [["1", "2"], ["3"]]
+        assert list_call.call_args_list == [
+            call(label_selector="app=web", limit=2),
+            call(label_selector="app=web", limit=2, _continue="next"),
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_iter_list_pages_decodes_raw_json_when_fast(self, mock_k8s_client: MagicMock) -> None:
+        """Should request raw responses and use json_convert in fast list mode."""
+        mock_k8s_client.informer.return_value = None
+        mock_k8s_client.fast_list_enabled = True
+        responses = [
+            MagicMock(data=b'{"metadata": {"continue": "next"}, "items": [{"n": 1}]}'),
+            MagicMock(data=b'{"metadata": {}, "items": [{"n": 2}]}'),
+        ]
+        list_call = MagicMock(side_effect=responses)
+        convert = MagicMock()
+        manager = K8sBaseManager(mock_k8s_client)
+
+        pages = list(
+            manager._iter_list_pages(
+                convert,
+                list_call,
+                {},
+                resource_type="Pod",
+                chunk_size=1,
+                json_convert=lambda obj: obj["n"],
+            )
+        )
+
+        assert pages == [[1], [2]]
+        assert list_call.call_args_list == [
+            call(_preload_content=False, limit=1),
+            call(_preload_content=False, limit=1, _continue="next"),
+        ]
+        convert.assert_not_called()
+        for response in responses:
+            response.release_conn.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_iter_list_pages_translates_errors(self, mock_k8s_client: MagicMock) -> None:
+        """Should translate API errors raised while paging."""
+        mock_k8s_client.translate_api_exception.return_value = RuntimeError("translated")
+        manager = K8sBaseManager(mock_k8s_client)
+
+        pages = manager._iter_list_pages(
+            str, MagicMock(side_effect=Exception("boom")), {}, resource_type="Pod"
+        )
+
+        with pytest.raises(RuntimeError, match="translated"):
+            next(pages)
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_iter_list_pages_rejects_bad_chunk_size(self, mock_k8s_client: MagicMock) -> None:
+        """Should reject chunk sizes below 1."""
+        manager = K8sBaseManager(mock_k8s_client)
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            manager._iter_list_pages(str, MagicMock(), {}, resource_type="Pod", chunk_size=0)
@@ -0,0 +1,216 @@
+"""Unit tests for the multiplexed log tailer."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from unittest.mock import MagicMock
+
+import pytest
+
+from system_operations_manager.services.kubernetes.log_multiplexer import (
+    Discover,
+    LogLine,
+    LogMultiplexer,
+    LogTarget,
+    OpenStream,
+    _sort_key,
+    parse_log_line,
+    pod_log_opener,
+)
+
+WEB_0 = LogTarget("web-0", "app")
+WEB_1 = LogTarget("web-1", "app")
+
+
+def _static(logs: dict[LogTarget, list[bytes]]) -> tuple[OpenStream, Discover]:
+    """Build open/discover callbacks serving fixed logs as a final target set."""
+
+    def open_stream(target: LogTarget, initial: bool) -> Iterable[bytes]:
+        return iter(logs[target])
+
+    def discover() -> tuple[list[LogTarget], bool]:
+        return list(logs), True
+
+    return open_stream, discover
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestParseLogLine:
+    """Tests for kubelet line parsing."""
+
+    def test_splits_timestamp(self) -> None:
+        """Should split the RFC 3339 prefix from the message."""
+        assert parse_log_line(b"2024-01-01T00:00:01.5Z GET /health 200\n") == (
+            "2024-01-01T00:00:01.5Z",
+            "GET /health 200",
+        )
+
+    def test_line_without_timestamp(self) -> None:
+        """Should keep the whole line as message when no timestamp leads it."""
+        assert parse_log_line("plain message\r\n") == ("", "plain message")
+
+    def test_sort_key_pads_fraction(self) -> None:
+        """Trimmed fractions should still order numerically."""
+        assert _sort_key("2024-01-01T00:00:00.1Z") > _sort_key("2024-01-01T00:00:00.09Z")
+        assert _sort_key("2024-01-01T00:00:01Z") > _sort_key("2024-01-01T00:00:00.999Z")
+
+    def test_format_prefix(self) -> None:
+        """LogLine.format should prefix pod/container and optional timestamp."""
+        line = LogLine("web-0", "app", "2024-01-01T00:00:00Z", "ready")
+        assert line.format() == "[web-0/app] ready\n"
+        assert line.format(timestamps=True) == "[web-0/app] 2024-01-01T00:00:00Z ready\n"
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestLogMultiplexer:
+    """Tests for LogMultiplexer merging and lifecycle."""
+
+    def test_interleaves_streams_by_timestamp(self) -> None:
+        """Lines from all streams should come out in timestamp order."""
+        open_stream, discover = _static(
+            {
+                WEB_0: [b"2024-01-01T00:00:01Z a1\n", b"2024-01-01T00:00:03Z a3\n"],
+                WEB_1: [b"2024-01-01T00:00:02Z b2\n", b"2024-01-01T00:00:04Z b4\n"],
+            }
+        )
+
+        lines = list(LogMultiplexer(open_stream, discover))
+
+        assert [line.message for line in lines] == ["a1", "b2", "a3", "b4"]
+        assert [line.pod for line in lines] == ["web-0", "web-1", "web-0", "web-1"]
+
+    def test_small_buffers_deliver_everything_in_order(self) -> None:
+        """Readers blocked on a full buffer should resume as it drains."""
+        logs = {
+            target: [
+                f"2024-01-01T00:00:{i:02d}.{n}Z {target.pod}-{i}\n".encode() for i in range(50)
+            ]
+            for n, target in enumerate((WEB_0, WEB_1))
+        }
+        open_stream, discover = _static(logs)
+
+        lines = list(LogMultiplexer(open_stream, discover, buffer_lines=1))
+
+        assert len(lines) == 100
+        assert [line.timestamp for line in lines] == sorted(
+            (line.timestamp for line in lines), key=_sort_key
+        )
+
+    def test_picks_up_new_targets(self) -> None:
+        """Targets found by later discovery passes should be opened."""
+        passes = iter([([WEB_0], False), ([WEB_0, WEB_1], True)])
+        opened: list[tuple[LogTarget, bool]] = []
+
+        def open_stream(target: LogTarget, initial: bool) -> Iterable[bytes]:
+            opened.append((target, initial))
+            return iter([f"2024-01-01T00:00:00Z hello from {target.pod}\n".encode()])
+
+        mux = LogMultiplexer(open_stream, lambda: next(passes), rediscover_interval=0.01)
+        lines = list(mux)
+
+        assert {line.pod for line in lines} == {"web-0", "web-1"}
+        assert sorted(opened) == [(WEB_0, True), (WEB_1, False)]
+        assert mux.targets == [WEB_0, WEB_1]
+
+    def test_quiet_stream_does_not_block_output(self) -> None:
+        """A live stream with no output should delay others by the window only."""
+        release = threading.Event()
+
+        def open_stream(target: LogTarget, initial: bool) -> Iterable[bytes]:
+            if target == WEB_1:
+                release.wait(5)
+                return iter([])
+            return iter([b"2024-01-01T00:00:01Z early\n"])
+
+        mux = LogMultiplexer(
+            open_stream,
+            lambda: ([WEB_0, WEB_1], True),
+            reorder_window=0.01,
+        )
+        lines = iter(mux)
+
+        assert next(lines).message == "early"
+        release.set()
+        assert list(lines) == []
+
+    def test_failed_stream_is_skipped(self) -> None:
+        """A stream that fails to open should not stop the others."""
+
+        def open_stream(target: LogTarget, initial: bool) -> Iterable[bytes]:
+            if target == WEB_1:
+                raise RuntimeError("container not found")
+            return iter([b"2024-01-01T00:00:01Z ok\n"])
+
+        lines = list(LogMultiplexer(open_stream, lambda: ([WEB_0, WEB_1], True)))
+
+        assert [line.message for line in lines] == ["ok"]
+
+    def test_initial_discovery_error_propagates(self) -> None:
+        """Errors from the first discovery pass should reach the caller."""
+
+        def discover() -> tuple[list[LogTarget], bool]:
+            raise RuntimeError("forbidden")
+
+        with pytest.raises(RuntimeError, match="forbidden"):
+            list(LogMultiplexer(MagicMock(), discover))
+
+    def test_max_streams_limits_opened_targets(self) -> None:
+        """Targets beyond max_streams should not be opened."""
+        open_stream = MagicMock(return_value=iter([]))
+
+        mux = LogMultiplexer(open_stream, lambda: ([WEB_0, WEB_1], True), max_streams=1)
+        list(mux)
+
+        assert mux.targets == [WEB_0]
+        open_stream.assert_called_once_with(WEB_0, True)
+
+    def test_close_on_early_exit(self) -> None:
+        """Leaving the iteration early should close open responses."""
+        response = MagicMock()
+        response.__iter__.return_value = iter([b"2024-01-01T00:00:01Z one\n"] * 10)
+
+        mux = LogMultiplexer(lambda target, initial: response, lambda: ([WEB_0], False))
+        lines = iter(mux)
+        next(lines)
+        lines.close()  # type: ignore[attr-defined]
+
+        response.close.assert_called_once()
+
+    @pytest.mark.parametrize("kwargs", [{"buffer_lines": 0}, {"max_streams": 0}])
+    def test_invalid_limits(self, kwargs: dict[str, int]) -> None:
+        """Non-positive limits should be rejected."""
+        with pytest.raises(ValueError):
+            LogMultiplexer(MagicMock(), MagicMock(), **kwargs)
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestPodLogOpener:
+    """Tests for pod_log_opener."""
+
+    def test_limits_apply_to_initial_targets_only(self) -> None:
+        """tail/since should only be sent for the first discovery pass."""
+        core_v1 = MagicMock()
+        open_stream = pod_log_opener(
+            core_v1, "default", follow=True, tail_lines=10, since_seconds=60
+        )
+
+        open_stream(WEB_0, True)
+        open_stream(WEB_1, False)
+
+        first, later = core_v1.read_namespaced_pod_log.call_args_list
+        assert first.kwargs == {
+            "name": "web-0",
+            "namespace": "default",
+            "container": "app",
+            "follow": True,
+            "timestamps": True,
+            "_preload_content": False,
+            "tail_lines": 10,
+            "since_seconds": 60,
+        }
+        assert "tail_lines" not in later.kwargs
+        assert "since_seconds" not in later.kwargs
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -257,7 +258,7 @@ class TestApplyManifests:
         """Should create a resource when it does not exist."""
         mock_create.return_value = None  # Success
 
-        results = manifest_manager.apply_manifests([valid_manifest])
+        results = manifest_manager.apply_manifests([valid_manifest], server_side=False)
 
         assert len(results) == 1
         assert results[0].success is True
@@ -289,7 +290,7 @@ class TestApplyManifests:
             message="",
         )
 
-        results = manifest_manager.apply_manifests([valid_manifest])
+        results = manifest_manager.apply_manifests([valid_manifest], server_side=False)
 
         assert len(results) == 1
         assert results[0].success is True
@@ -310,7 +311,7 @@ class TestApplyManifests:
         mock_api_exc.reason = "Forbidden"
         mock_create.side_effect = utils.FailToCreateError([mock_api_exc])
 
-        results = manifest_manager.apply_manifests([valid_manifest])
+        results = manifest_manager.apply_manifests([valid_manifest], server_side=False)
 
         assert len(results) == 1
         assert results[0].success is False
@@ -338,7 +339,9 @@ class TestApplyManifests:
         """Server dry run should call API with dry_run parameter."""
         mock_create.return_value = None
 
-        results = manifest_manager.apply_manifests([valid_manifest], server_dry_run=True)
+        results = manifest_manager.apply_manifests(
+            [valid_manifest], server_dry_run=True, server_side=False
+        )
 
         assert len(results) == 1
         assert results[0].success is True
@@ -358,17 +361,17 @@ class TestApplyManifests:
             "metadata": {"name": "cfg"},
         }
 
-        # First call succeeds, second fails
+        # ConfigMap is applied first (earlier tier) and succeeds, Deployment fails
         mock_create.side_effect = [
             None,
             Exception("Connection reset"),
         ]
 
-        results = manifest_manager.apply_manifests([valid_manifest, manifest_2])
+        results = manifest_manager.apply_manifests([valid_manifest, manifest_2], server_side=False)
 
         assert len(results) == 2
-        assert results[0].success is True
-        assert results[1].success is False
+        assert results[0].success is False
+        assert results[1].success is True
 
 
 # ===========================================================================
@@ -718,7 +721,9 @@ class TestApplyManifestsNamespaceOverride:
             "metadata": {"name": "cfg"},
         }
 
-        results = manifest_manager.apply_manifests([manifest], namespace="production")
+        results = manifest_manager.apply_manifests(
+            [manifest], namespace="production", server_side=False
+        )
 
         assert len(results) == 1
         assert results[0].success is True
@@ -750,7 +755,7 @@ class TestApplySingleApiException:
 
         mock_create.side_effect = ApiException(status=500, reason="Internal Server Error")
 
-        results = manifest_manager.apply_manifests([valid_manifest])
+        results = manifest_manager.apply_manifests([valid_manifest], server_side=False)
 
         assert len(results) == 1
         assert results[0].success is False
@@ -872,7 +877,7 @@ class TestServerSideApply:
         manifest_manager: ManifestManager,
         valid_manifest: dict[str, object],
     ) -> None:
-        """Should invoke _server_side_apply end-to-end on 409 Conflict.
+        """Should invoke _server_side_apply end-to-end on 409 Conflict when not SSA-first.
 
         Covers the full integration of apply_manifests -> _apply_single ->
         _server_side_apply for the success path.
@@ -889,7 +894,7 @@ class TestServerSideApply:
         dynamic_client.resources.get.return_value = mock_resource_api
         mock_get_dynamic.return_value = dynamic_client
 
-        results = manifest_manager.apply_manifests([valid_manifest])
+        results = manifest_manager.apply_manifests([valid_manifest], server_side=False)
 
         assert len(results) == 1
         assert results[0].success is True
@@ -897,6 +902,209 @@ class TestServerSideApply:
         mock_resource_api.server_side_apply.assert_called_once()
 
 
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestServerSideApplyFirst:
+    """Tests for the default server-side-apply-first path."""
+
+    @staticmethod
+    def _dynamic(mock_get_dynamic: MagicMock, status: int) -> MagicMock:
+        resource_api = MagicMock()
+        resource_api.server_side_apply.return_value = MagicMock(status=status)
+        mock_get_dynamic.return_value.resources.get.return_value = resource_api
+        return resource_api
+
+    @patch(
+        "system_operations_manager.services.kubernetes.manifest_manager.ManifestManager._get_dynamic_client"
+    )
+    @patch("kubernetes.utils.create_from_dict")
+    def test_new_resource_is_created_in_one_request(
+        self,
+        mock_create: MagicMock,
+        mock_get_dynamic: MagicMock,
+        manifest_manager: ManifestManager,
+        valid_manifest: dict[str, object],
+    ) -> None:
+        """A 201 from server-side apply should report 'created' without create_from_dict."""
+        resource_api = self._dynamic(mock_get_dynamic, 201)
+
+        results = manifest_manager.apply_manifests([valid_manifest])
+
+        assert results[0].success is True
+        assert results[0].action == "created"
+        mock_create.assert_not_called()
+        call_kwargs = resource_api.server_side_apply.call_args.kwargs
+        assert call_kwargs["field_manager"] == "ops-cli"
+        assert call_kwargs["serialize"] is False
+        assert "force_conflicts" not in call_kwargs
+
+    @patch(
+        "system_operations_manager.services.kubernetes.manifest_manager.ManifestManager._get_dynamic_client"
+    )
+    def test_existing_resource_is_configured(
+        self,
+        mock_get_dynamic: MagicMock,
+        manifest_manager: ManifestManager,
+        valid_manifest: dict[str, object],
+    ) -> None:
+        """A 200 from server-side apply should report 'configured'."""
+        self._dynamic(mock_get_dynamic, 200)
+
+        results = manifest_manager.apply_manifests([valid_manifest], server_dry_run=True)
+
+        assert results[0].action == "configured (server dry-run)"
+
+    @patch(
+        "system_operations_manager.services.kubernetes.manifest_manager.ManifestManager._get_dynamic_client"
+    )
+    def test_force_takes_over_conflicting_fields(
+        self,
+        mock_get_dynamic: MagicMock,
+        manifest_manager: ManifestManager,
+        valid_manifest: dict[str, object],
+    ) -> None:
+        """force should be sent as force_conflicts."""
+        resource_api = self._dynamic(mock_get_dynamic, 200)
+
+        manifest_manager.apply_manifests([valid_manifest], force=True)
+
+        assert resource_api.server_side_apply.call_args.kwargs["force_conflicts"] is True
+
+    @patch(
+        "system_operations_manager.services.kubernetes.manifest_manager.ManifestManager._get_dynamic_client"
+    )
+    @patch("kubernetes.utils.create_from_dict")
+    def test_list_manifests_use_create_path(
+        self,
+        mock_create: MagicMock,
+        mock_get_dynamic: MagicMock,
+        manifest_manager: ManifestManager,
+    ) -> None:
+        """List manifests cannot be server-side applied and go through create_from_dict."""
+        manifest: dict[str, Any] = {
+            "apiVersion": "v1",
+            "kind": "List",
+            "metadata": {"name": "bundle"},
+            "items": [{"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "a"}}],
+        }
+
+        results = manifest_manager.apply_manifests([manifest])
+
+        assert results[0].action == "created"
+        mock_create.assert_called_once()
+        mock_get_dynamic.assert_not_called()
+
+
+# ===========================================================================
+# TestApplyTiers
+# ===========================================================================
+
+_PATCH_GET_DYNAMIC = "system_operations_manager.services.kubernetes.manifest_manager.ManifestManager._get_dynamic_client"
+
+
+def _manifest(kind: str, name: str, api_version: str = "v1") -> dict[str, Any]:
+    return {"apiVersion": api_version, "kind": kind, "metadata": {"name": name}}
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestApplyTiers:
+    """Tests for kind-tiered, concurrent apply."""
+
+    @patch(_PATCH_GET_DYNAMIC)
+    def test_applies_tiers_in_dependency_order(
+        self, mock_get_dynamic: MagicMock, manifest_manager: ManifestManager
+    ) -> None:
+        """Namespaces and CRDs go first, webhooks last; results keep input order."""
+        applied: list[str] = []
+        resource_api = mock_get_dynamic.return_value.resources.get.return_value
+        resource_api.server_side_apply.side_effect = lambda body, **_: (
+            applied.append(body["kind"]) or MagicMock(status=201)
+        )
+        manifests = [
+            _manifest("ValidatingWebhookConfiguration", "hook", "admissionregistration.k8s.io/v1"),
+            _manifest("Deployment", "web", "apps/v1"),
+            _manifest("ConfigMap", "cfg"),
+            _manifest("Widget", "w", "example.com/v1"),
+            _manifest("CustomResourceDefinition", "widgets", "apiextensions.k8s.io/v1"),
+            _manifest("Namespace", "team"),
+        ]
+
+        results = manifest_manager.apply_manifests(manifests, max_concurrency=1)
+
+        assert applied == [
+            "CustomResourceDefinition",
+            "Namespace",
+            "ConfigMap",
+            "Deployment",
+            "Widget",
+            "ValidatingWebhookConfiguration",
+        ]
+        assert [r.resource.split("/")[0] for r in results] == [m["kind"] for m in manifests]
+
+    @patch(_PATCH_GET_DYNAMIC)
+    def test_tier_is_applied_concurrently(
+        self, mock_get_dynamic: MagicMock, manifest_manager: ManifestManager
+    ) -> None:
+        """Manifests in one tier should be in flight at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+        resource_api = mock_get_dynamic.return_value.resources.get.return_value
+        resource_api.server_side_apply.side_effect = lambda **_: (
+            barrier.wait() and MagicMock(status=200)
+        )
+        manifests = [_manifest("ConfigMap", f"cfg-{i}") for i in range(4)]
+
+        results = manifest_manager.apply_manifests(manifests, max_concurrency=4)
+
+        assert all(r.success for r in results)
+        assert [r.resource for r in results] == [f"ConfigMap/cfg-{i}" for i in range(4)]
+
+    @patch(_PATCH_GET_DYNAMIC)
+    def test_iter_yields_every_result(
+        self, mock_get_dynamic: MagicMock, manifest_manager: ManifestManager
+    ) -> None:
+        """iter_apply_manifests should stream one result per manifest."""
+        resource_api = mock_get_dynamic.return_value.resources.get.return_value
+        resource_api.server_side_apply.return_value = MagicMock(status=201)
+        manifests = [_manifest("ConfigMap", f"cfg-{i}") for i in range(5)]
+
+        results = list(manifest_manager.iter_apply_manifests(manifests))
+
+        assert sorted(r.resource for r in results) == [f"ConfigMap/cfg-{i}" for i in range(5)]
+
+    @patch("system_operations_manager.services.kubernetes.manifest_manager.CRD_POLL_INTERVAL", 0)
+    @patch(_PATCH_GET_DYNAMIC)
+    def test_waits_for_crd_kind_to_be_served(
+        self, mock_get_dynamic: MagicMock, manifest_manager: ManifestManager
+    ) -> None:
+        """A custom resource should wait until its CRD's kind is discoverable."""
+        resource_api = MagicMock()
+        resource_api.server_side_apply.return_value = MagicMock(status=201)
+        misses = {"count": 0}
+
+        def get(api_version: str, kind: str) -> MagicMock:
+            if kind == "Widget" and misses["count"] < 2:
+                misses["count"] += 1
+                raise LookupError("not served yet")
+            return resource_api
+
+        mock_get_dynamic.return_value.resources.get.side_effect = get
+        crd = _manifest("CustomResourceDefinition", "widgets", "apiextensions.k8s.io/v1")
+        crd["spec"] = {"group": "example.com", "names": {"kind": "Widget"}}
+
+        results = manifest_manager.apply_manifests(
+            [_manifest("Widget", "w", "example.com/v1"), crd]
+        )
+
+        assert misses["count"] == 2
+        assert all(r.success for r in results)
+
+    def test_rejects_invalid_concurrency(self, manifest_manager: ManifestManager) -> None:
+        """max_concurrency below 1 should raise ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            manifest_manager.apply_manifests([], max_concurrency=0)
+
+
 # ===========================================================================
 # TestDiffSingleErrorBranches
 # ===========================================================================
@@ -970,26 +1178,13 @@ class TestDiffSingleErrorBranches:
 
 @pytest.mark.unit
 class TestGetDynamicClient:
-    """Tests for _get_dynamic_client (lines 556-559)."""
+    """Tests for _get_dynamic_client."""
 
-    def test_get_dynamic_client_creates_dynamic_client(
+    def test_get_dynamic_client_uses_client_cache(
         self,
         manifest_manager: ManifestManager,
     ) -> None:
-        """Should construct and return a DynamicClient wrapping a fresh ApiClient.
-
-        Covers lines 556-559 in manifest_manager.py.
-        """
-        with (
-            patch("kubernetes.client.ApiClient") as mock_api_cls,
-            patch("kubernetes.dynamic.DynamicClient") as mock_dyn_cls,
-        ):
-            mock_api_instance: Any = MagicMock()
-            mock_api_cls.return_value = mock_api_instance
-            mock_dynamic_instance: Any = MagicMock()
-            mock_dyn_cls.return_value = mock_dynamic_instance
-
-            result = manifest_manager._get_dynamic_client()
+        """Should return the client's cached DynamicClient."""
+        result = manifest_manager._get_dynamic_client()
 
-        mock_dyn_cls.assert_called_once_with(mock_api_instance)
-        assert result is mock_dynamic_instance
+        assert result is manifest_manager._client.dynamic_client
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from system_operations_manager.integrations.kubernetes.models.multicluster import (
+    ClusterDeployResult,
+)
 from system_operations_manager.services.kubernetes.manifest_manager import ApplyResult
 from system_operations_manager.services.kubernetes.multicluster_manager import (
     MultiClusterManager,
@@ -21,9 +26,22 @@ def mock_k8s_client() -> MagicMock:
         "staging": MagicMock(context="staging-ctx", namespace="default", timeout=300),
         "production": MagicMock(context="prod-ctx", namespace="prod-ns", timeout=300),
     }
+    # Per-cluster clients resolve to the same mock unless a test overrides it
+    client.for_cluster.return_value = client
     return client
 
 
+def _fail_cluster(client: MagicMock, failing: str, error: Exception) -> None:
+    """Make loading one cluster's client raise."""
+
+    def for_cluster(cluster_name: str) -> MagicMock:
+        if cluster_name == failing:
+            raise error
+        return client
+
+    client.for_cluster.side_effect = for_cluster
+
+
 @pytest.fixture
 def manager(mock_k8s_client: MagicMock) -> MultiClusterManager:
     """Create a MultiClusterManager with a mocked client."""
@@ -136,11 +154,7 @@ class TestMultiClusterStatus:
         """Should handle partial failures when one cluster is unreachable."""
 
         # First cluster connects, second cluster fails
-        def switch_context_side_effect(cluster_name: str) -> None:
-            if cluster_name == "production":
-                raise ConnectionError("Connection refused")
-
-        mock_k8s_client.switch_context.side_effect = switch_context_side_effect
+        _fail_cluster(mock_k8s_client, "production", ConnectionError("Connection refused"))
         mock_k8s_client.check_connection.return_value = True
         mock_k8s_client.get_cluster_version.return_value = "v1.28.0"
 
@@ -162,26 +176,80 @@ class TestMultiClusterStatus:
         prod_status = next(s for s in result.clusters if s.cluster == "production")
         assert prod_status.connected is False
         assert prod_status.error is not None
-        assert "Failed to switch context" in prod_status.error
+        assert "Failed to load context" in prod_status.error
 
-    def test_context_restored(
+    def test_uses_per_cluster_clients_without_switching_context(
         self, manager: MultiClusterManager, mock_k8s_client: MagicMock
     ) -> None:
-        """Should restore original context after status check."""
+        """Should query each cluster's own client and leave the global context alone."""
         mock_k8s_client.check_connection.return_value = True
+        mock_k8s_client.core_v1.list_node.return_value = MagicMock(items=[])
+
+        manager.multi_cluster_status()
+
+        requested = {call.args[0] for call in mock_k8s_client.for_cluster.call_args_list}
+        assert requested == {"staging", "production"}
+        mock_k8s_client.switch_context.assert_not_called()
+
+    def test_clusters_checked_concurrently(
+        self, manager: MultiClusterManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Both clusters should be in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def check_connection() -> bool:
+            barrier.wait()
+            return True
+
+        mock_k8s_client.check_connection.side_effect = check_connection
         mock_k8s_client.get_cluster_version.return_value = "v1.28.0"
-        mock_nodes = MagicMock()
-        mock_nodes.items = []
-        mock_k8s_client.core_v1.list_node.return_value = mock_nodes
+        mock_k8s_client.core_v1.list_node.return_value = MagicMock(items=[])
 
-        # Reset switch_context to track calls
-        mock_k8s_client.switch_context.reset_mock()
+        result = manager.multi_cluster_status()
 
-        manager.multi_cluster_status()
+        assert result.connected == 2
+
+    def test_slow_cluster_times_out(
+        self, manager: MultiClusterManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """A cluster exceeding the timeout should be reported without waiting for it."""
+        release = threading.Event()
+        slow = MagicMock()
+        slow.check_connection.side_effect = lambda: release.wait(5)
+        mock_k8s_client.check_connection.return_value = True
+        mock_k8s_client.get_cluster_version.return_value = "v1.28.0"
+        mock_k8s_client.core_v1.list_node.return_value = MagicMock(items=[])
+        mock_k8s_client.for_cluster.side_effect = lambda name: (
+            slow if name == "production" else mock_k8s_client
+        )
+
+        start = time.monotonic()
+        try:
+            result = manager.multi_cluster_status(timeout=0.2)
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 2
+        statuses = {s.cluster: s for s in result.clusters}
+        assert statuses["staging"].connected is True
+        assert statuses["production"].connected is False
+        assert statuses["production"].error == "Timed out after 0.2s"
+
+    def test_results_follow_requested_order(
+        self, manager: MultiClusterManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Results should be ordered like the requested clusters, not by completion."""
+        mock_k8s_client.check_connection.return_value = True
+        mock_k8s_client.core_v1.list_node.return_value = MagicMock(items=[])
+
+        result = manager.multi_cluster_status(["production", "staging"], max_concurrency=1)
 
-        # Verify that switch_context was called to restore original context
-        switch_calls = [call[0][0] for call in mock_k8s_client.switch_context.call_args_list]
-        assert "original-ctx" in switch_calls
+        assert [s.cluster for s in result.clusters] == ["production", "staging"]
+
+    def test_rejects_invalid_concurrency(self, manager: MultiClusterManager) -> None:
+        """max_concurrency below 1 should raise ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            manager.multi_cluster_status(max_concurrency=0)
 
 
 # ===========================================================================
@@ -248,12 +316,8 @@ class TestDeployManifestsToClusters:
     ) -> None:
         """Should handle context switch failures gracefully."""
 
-        # First cluster OK, second cluster fails to switch
-        def switch_context_side_effect(cluster_name: str) -> None:
-            if cluster_name == "production":
-                raise RuntimeError("Context switch failed")
-
-        mock_k8s_client.switch_context.side_effect = switch_context_side_effect
+        # First cluster OK, second cluster fails to load
+        _fail_cluster(mock_k8s_client, "production", RuntimeError("Context load failed"))
 
         mock_manifest_mgr = MagicMock()
         MockManifestManager.return_value = mock_manifest_mgr
@@ -283,7 +347,7 @@ class TestDeployManifestsToClusters:
         prod_result = next(r for r in result.cluster_results if r.cluster == "production")
         assert prod_result.success is False
         assert prod_result.error is not None
-        assert "Failed to switch context" in prod_result.error
+        assert "Failed to load context" in prod_result.error
 
     @patch("system_operations_manager.services.kubernetes.multicluster_manager.ManifestManager")
     def test_deploy_dry_run(
@@ -314,6 +378,163 @@ class TestDeployManifestsToClusters:
             assert call.kwargs["dry_run"] is True
 
 
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestDeployWaves:
+    """Tests for wave-limited rollouts in deploy_manifests_to_clusters."""
+
+    @pytest.fixture
+    def four_clusters(self, mock_k8s_client: MagicMock) -> list[str]:
+        """Configure four clusters."""
+        names = ["a", "b", "c", "d"]
+        mock_k8s_client._config.clusters = {
+            name: MagicMock(context=f"{name}-ctx", namespace="default", timeout=300)
+            for name in names
+        }
+        return names
+
+    @staticmethod
+    def _fake_deploy(calls: list[str], failing: set[str]) -> object:
+        lock = threading.Lock()
+
+        def deploy(cluster_name: str, *args: object, **kwargs: object) -> ClusterDeployResult:
+            with lock:
+                calls.append(cluster_name)
+            return ClusterDeployResult(cluster=cluster_name, success=cluster_name not in failing)
+
+        return deploy
+
+    def test_waves_run_in_order(
+        self, manager: MultiClusterManager, four_clusters: list[str]
+    ) -> None:
+        """Each wave should finish before the next one starts."""
+        calls: list[str] = []
+        with patch.object(
+            manager, "_deploy_to_single_cluster", side_effect=self._fake_deploy(calls, set())
+        ):
+            result = manager.deploy_manifests_to_clusters([], clusters=four_clusters, wave_size=2)
+
+        assert result.successful == 4
+        assert set(calls[:2]) == {"a", "b"}
+        assert set(calls[2:]) == {"c", "d"}
+        assert [r.cluster for r in result.cluster_results] == four_clusters
+
+    def test_halt_on_failure_skips_later_waves(
+        self, manager: MultiClusterManager, four_clusters: list[str]
+    ) -> None:
+        """A failed wave should stop the rollout when halt_on_failure is set."""
+        calls: list[str] = []
+        with patch.object(
+            manager, "_deploy_to_single_cluster", side_effect=self._fake_deploy(calls, {"b"})
+        ):
+            result = manager.deploy_manifests_to_clusters(
+                [], clusters=four_clusters, wave_size=2, halt_on_failure=True
+            )
+
+        assert sorted(calls) == ["a", "b"]
+        assert result.successful == 1
+        assert result.failed == 3
+        skipped = {r.cluster: r.error for r in result.cluster_results[2:]}
+        assert skipped == {
+            "c": "Not deployed: wave 1 had failures",
+            "d": "Not deployed: wave 1 had failures",
+        }
+
+    def test_failures_do_not_halt_by_default(
+        self, manager: MultiClusterManager, four_clusters: list[str]
+    ) -> None:
+        """Without halt_on_failure every wave should run."""
+        calls: list[str] = []
+        with patch.object(
+            manager, "_deploy_to_single_cluster", side_effect=self._fake_deploy(calls, {"a"})
+        ):
+            result = manager.deploy_manifests_to_clusters([], clusters=four_clusters, wave_size=1)
+
+        assert calls == four_clusters
+        assert result.failed == 1
+
+    def test_timed_out_deploy_is_unknown_not_failed(
+        self, manager: MultiClusterManager, four_clusters: list[str]
+    ) -> None:
+        """A deploy that overruns its timeout may still be applying, so it is unknown."""
+        release = threading.Event()
+
+        def deploy(cluster_name: str, *args: object, **kwargs: object) -> ClusterDeployResult:
+            if cluster_name == "a":
+                release.wait(5)
+            return ClusterDeployResult(cluster=cluster_name, success=True)
+
+        try:
+            with patch.object(manager, "_deploy_to_single_cluster", side_effect=deploy):
+                result = manager.deploy_manifests_to_clusters([], clusters=["a", "b"], timeout=0.2)
+        finally:
+            release.set()
+
+        assert result.successful == 1
+        assert result.failed == 0
+        assert result.unknown == 1
+        timed_out = result.cluster_results[0]
+        assert timed_out.timed_out is True
+        assert timed_out.error == "Timed out after 0.2s; still running, outcome unknown"
+
+    def test_timed_out_worker_keeps_its_slot(
+        self, manager: MultiClusterManager, four_clusters: list[str]
+    ) -> None:
+        """The next cluster should not start until the timed-out worker has stopped."""
+        events: list[str] = []
+        lock = threading.Lock()
+
+        def deploy(cluster_name: str, *args: object, **kwargs: object) -> ClusterDeployResult:
+            if cluster_name == "a":
+                time.sleep(0.4)
+            with lock:
+                events.append(cluster_name)
+            return ClusterDeployResult(cluster=cluster_name, success=True)
+
+        with patch.object(manager, "_deploy_to_single_cluster", side_effect=deploy):
+            result = manager.deploy_manifests_to_clusters(
+                [], clusters=["a", "b"], max_concurrency=1, timeout=0.2
+            )
+
+        assert events == ["a", "b"]
+        assert [r.success for r in result.cluster_results] == [False, True]
+        assert result.unknown == 1
+
+    def test_queued_clusters_not_started_while_slots_stay_blocked(
+        self, manager: MultiClusterManager, four_clusters: list[str]
+    ) -> None:
+        """Clusters queued behind a hung worker should give up after their own timeout."""
+        release = threading.Event()
+        calls: list[str] = []
+
+        def deploy(cluster_name: str, *args: object, **kwargs: object) -> ClusterDeployResult:
+            calls.append(cluster_name)
+            release.wait(5)
+            return ClusterDeployResult(cluster=cluster_name, success=True)
+
+        start = time.monotonic()
+        try:
+            with patch.object(manager, "_deploy_to_single_cluster", side_effect=deploy):
+                result = manager.deploy_manifests_to_clusters(
+                    [], clusters=["a", "b"], max_concurrency=1, timeout=0.2
+                )
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 2
+        assert calls == ["a"]
+        assert result.unknown == 1
+        assert result.failed == 1
+        assert result.cluster_results[1].error == (
+            "Not started: 1 timed-out cluster(s) still running"
+        )
+
+    def test_rejects_invalid_wave_size(self, manager: MultiClusterManager) -> None:
+        """wave_size below 1 should raise ValueError."""
+        with pytest.raises(ValueError, match="wave_size"):
+            manager.deploy_manifests_to_clusters([], wave_size=0)
+
+
 # ===========================================================================
 # TestSyncResource
 # ===========================================================================
@@ -386,12 +607,8 @@ class TestSyncResource:
     ) -> None:
         """Should mark all targets as failed when source read fails."""
 
-        # Make source cluster switch fail
-        def switch_context_side_effect(cluster_name: str) -> None:
-            if cluster_name == "staging":
-                raise ConnectionError("Source cluster unreachable")
-
-        mock_k8s_client.switch_context.side_effect = switch_context_side_effect
+        # Make source cluster fail to load
+        _fail_cluster(mock_k8s_client, "staging", ConnectionError("Source cluster unreachable"))
 
         result = manager.sync_resource(
             source_cluster="staging",
@@ -554,74 +771,6 @@ class TestLoadManifestsFromPath:
         assert result == expected
 
 
-# ===========================================================================
-# TestSaveAndRestoreContextFailure
-# ===========================================================================
-
-
-@pytest.mark.unit
-@pytest.mark.kubernetes
-class TestSaveAndRestoreContextFailure:
-    """Tests for _save_and_restore_context when restoring the context fails."""
-
-    def test_restore_failure_is_suppressed(
-        self, manager: MultiClusterManager, mock_k8s_client: MagicMock
-    ) -> None:
-        """Should log a warning and not propagate when context restore fails."""
-        mock_k8s_client.check_connection.return_value = True
-        mock_k8s_client.get_cluster_version.return_value = "v1.28.0"
-        mock_nodes = MagicMock()
-        mock_nodes.items = []
-        mock_k8s_client.core_v1.list_node.return_value = mock_nodes
-
-        # Make switch_context raise only when restoring the original context
-        original_ctx = "original-ctx"
-
-        def switch_side_effect(ctx: str) -> None:
-            if ctx == original_ctx:
-                raise RuntimeError("Cannot restore context")
-
-        mock_k8s_client.switch_context.side_effect = switch_side_effect
-
-        # Should complete without raising even though restore fails
-        result = manager.multi_cluster_status()
-
-        assert result.total == 2
-
-    def test_restore_skipped_when_context_unknown(
-        self, manager: MultiClusterManager, mock_k8s_client: MagicMock
-    ) -> None:
-        """Should not attempt to restore context when original context is 'unknown'."""
-        mock_k8s_client.get_current_context.return_value = "unknown"
-        mock_k8s_client.check_connection.return_value = True
-        mock_k8s_client.get_cluster_version.return_value = "v1.29.0"
-        mock_nodes = MagicMock()
-        mock_nodes.items = []
-        mock_k8s_client.core_v1.list_node.return_value = mock_nodes
-
-        manager.multi_cluster_status()
-
-        # switch_context should only have been called for cluster names, not "unknown"
-        switch_calls = [call[0][0] for call in mock_k8s_client.switch_context.call_args_list]
-        assert "unknown" not in switch_calls
-
-    def test_restore_skipped_when_context_is_none(
-        self, manager: MultiClusterManager, mock_k8s_client: MagicMock
-    ) -> None:
-        """Should not attempt to restore context when original context is None."""
-        mock_k8s_client.get_current_context.return_value = None
-        mock_k8s_client.check_connection.return_value = True
-        mock_k8s_client.get_cluster_version.return_value = "v1.29.0"
-        mock_nodes = MagicMock()
-        mock_nodes.items = []
-        mock_k8s_client.core_v1.list_node.return_value = mock_nodes
-
-        manager.multi_cluster_status()
-
-        switch_calls = [call[0][0] for call in mock_k8s_client.switch_context.call_args_list]
-        assert None not in switch_calls
-
-
 # ===========================================================================
 # TestGetSingleClusterStatusEdgeCases
 # ===========================================================================
@@ -866,8 +1015,8 @@ class TestSyncToSingleClusterEdgeCases:
     def test_context_switch_failure_returns_failed_result(
         self, manager: MultiClusterManager, mock_k8s_client: MagicMock
     ) -> None:
-        """Should return failed ClusterSyncResult when switch_context raises."""
-        mock_k8s_client.switch_context.side_effect = RuntimeError("ctx switch error")
+        """Should return failed ClusterSyncResult when the cluster client cannot load."""
+        mock_k8s_client.for_cluster.side_effect = RuntimeError("ctx load error")
 
         result = manager._sync_to_single_cluster(
             "production",
@@ -877,7 +1026,7 @@ class TestSyncToSingleClusterEdgeCases:
 
         assert result.success is False
         assert result.cluster == "production"
-        assert "Failed to switch context" in (result.error or "")
+        assert "Failed to load context" in (result.error or "")
 
     def test_dry_run_returns_skipped_result(
         self, manager: MultiClusterManager, mock_k8s_client: MagicMock
@@ -1063,18 +1212,9 @@ class TestGetDynamicClient:
     """Tests for MultiClusterManager._get_dynamic_client."""
 
     def test_returns_dynamic_client_instance(self, manager: MultiClusterManager) -> None:
-        """Should construct and return a DynamicClient wrapping an ApiClient."""
-        mock_api_client = MagicMock()
-        mock_dynamic_client = MagicMock()
+        """Should return the cluster client's cached DynamicClient."""
+        cluster_client = MagicMock()
 
-        with (
-            patch(
-                "kubernetes.dynamic.DynamicClient", return_value=mock_dynamic_client
-            ) as MockDynamic,
-            patch("kubernetes.client.ApiClient", return_value=mock_api_client) as MockApiClient,
-        ):
-            result = manager._get_dynamic_client()
+        result = manager._get_dynamic_client(cluster_client)
 
-        MockApiClient.assert_called_once_with()
-        MockDynamic.assert_called_once_with(mock_api_client)
-        assert result is mock_dynamic_client
+        assert result is cluster_client.dynamic_client
@@ -16,6 +16,8 @@ def mock_k8s_client() -> MagicMock:
     """Create a mock Kubernetes client."""
     mock_client = MagicMock()
     mock_client.default_namespace = "default"
+    mock_client.informer.return_value = None
+    mock_client.fast_list_enabled = False
     return mock_client
 
 
@@ -69,7 +71,9 @@ class TestNamespaceOperations:
 
         namespace_manager.list_namespaces(label_selector="env=prod")
 
-        mock_k8s_client.core_v1.list_namespace.assert_called_once_with(label_selector="env=prod")
+        mock_k8s_client.core_v1.list_namespace.assert_called_once_with(
+            label_selector="env=prod", limit=500
+        )
 
     @pytest.mark.unit
     @pytest.mark.kubernetes
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -23,6 +24,11 @@ from system_operations_manager.services.kubernetes.optimization_manager import (
     _parse_cpu,
     _parse_memory,
     _safe_nested_get,
+    _WorkloadPodIndex,
+)
+from system_operations_manager.services.kubernetes.usage_history import (
+    UsageHistory,
+    UsageSample,
 )
 
 # =============================================================================
@@ -1522,3 +1528,292 @@ class TestAnalyzeSingleWorkload:
 
         assert analysis is not None
         assert analysis.creation_timestamp == "12345"
+
+
+# =============================================================================
+# Tests: _WorkloadPodIndex
+# =============================================================================
+
+
+def _owner(kind: str, name: str, controller: bool | None = True) -> MagicMock:
+    """Build an owner reference."""
+    ref = MagicMock()
+    ref.kind = kind
+    ref.name = name
+    ref.controller = controller
+    return ref
+
+
+def _make_owned(
+    name: str,
+    namespace: str = "default",
+    owners: list[MagicMock] | None = None,
+    labels: dict[str, str] | None = None,
+) -> MagicMock:
+    """Build a pod or ReplicaSet with owner references and labels."""
+    obj = MagicMock()
+    obj.metadata.name = name
+    obj.metadata.namespace = namespace
+    obj.metadata.owner_references = owners or []
+    obj.metadata.labels = labels or {}
+    return obj
+
+
+class TestWorkloadPodIndex:
+    """Tests for the _WorkloadPodIndex pod-to-workload join."""
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_resolves_replica_sets_to_deployments(self) -> None:
+        """Pods owned by a ReplicaSet belong to the ReplicaSet's Deployment."""
+        rs = _make_owned("web-abc", owners=[_owner("Deployment", "web")])
+        pods = [
+            _make_owned("web-abc-1", owners=[_owner("ReplicaSet", "web-abc")]),
+            _make_owned("web-abc-2", owners=[_owner("ReplicaSet", "web-abc")]),
+            _make_owned("db-0", owners=[_owner("StatefulSet", "db")]),
+            _make_owned("agent-x", owners=[_owner("DaemonSet", "agent")]),
+        ]
+
+        index = _WorkloadPodIndex(pods, [rs])
+
+        assert list(index.pods_for("Deployment", "default", "web", {"app": "web"})) == [
+            "default/web-abc-1",
+            "default/web-abc-2",
+        ]
+        assert list(index.pods_for("StatefulSet", "default", "db", None)) == ["default/db-0"]
+        assert list(index.pods_for("DaemonSet", "default", "agent", None)) == ["default/agent-x"]
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_prefers_controller_owner_reference(self) -> None:
+        """The controlling owner reference wins over other owners."""
+        pod = _make_owned(
+            "db-0",
+            owners=[_owner("ConfigMap", "cfg", controller=None), _owner("StatefulSet", "db")],
+        )
+
+        index = _WorkloadPodIndex([pod])
+
+        assert list(index.pods_for("StatefulSet", "default", "db", None)) == ["default/db-0"]
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_overlapping_selectors_do_not_double_count(self) -> None:
+        """Owner references keep pods of one workload out of another's usage."""
+        labels = {"app": "web"}
+        pods = [
+            _make_owned("web-0", owners=[_owner("StatefulSet", "web")], labels=labels),
+            _make_owned(
+                "web-canary-0", owners=[_owner("StatefulSet", "web-canary")], labels=labels
+            ),
+        ]
+
+        index = _WorkloadPodIndex(pods)
+
+        assert list(index.pods_for("StatefulSet", "default", "web", labels)) == ["default/web-0"]
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_falls_back_to_match_labels(self) -> None:
+        """Without an owner match, pods are found by all matchLabels in the namespace."""
+        pods = [
+            _make_owned(
+                "web-1",
+                owners=[_owner("ReplicaSet", "unknown")],
+                labels={"app": "web", "tier": "fe"},
+            ),
+            _make_owned("web-2", labels={"app": "web"}),
+            _make_owned("web-3", namespace="other", labels={"app": "web", "tier": "fe"}),
+        ]
+
+        index = _WorkloadPodIndex(pods)
+
+        assert set(
+            index.pods_for("Deployment", "default", "web", {"app": "web", "tier": "fe"})
+        ) == {"default/web-1"}
+        assert list(index.pods_for("Deployment", "default", "web", None)) == []
+
+
+class TestAnalyzeWorkloadsPodJoin:
+    """Tests for the single-listing pod join in analyze_workloads."""
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_lists_pods_once_for_all_workloads(
+        self, manager: OptimizationManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Pods and ReplicaSets are listed once and usage is joined per workload."""
+        deployments = [_make_workload(name=f"web-{i}", replicas=1) for i in range(20)]
+        replica_sets = [
+            _make_owned(f"web-{i}-rs", owners=[_owner("Deployment", f"web-{i}")]) for i in range(20)
+        ]
+        pods = [
+            _make_owned(f"web-{i}-rs-pod", owners=[_owner("ReplicaSet", f"web-{i}-rs")])
+            for i in range(20)
+        ]
+        mock_k8s_client.apps_v1.list_namespaced_deployment.return_value = MagicMock(
+            items=deployments
+        )
+        mock_k8s_client.apps_v1.list_namespaced_stateful_set.return_value = MagicMock(items=[])
+        mock_k8s_client.apps_v1.list_namespaced_daemon_set.return_value = MagicMock(items=[])
+        mock_k8s_client.apps_v1.list_namespaced_replica_set.return_value = MagicMock(
+            items=replica_sets
+        )
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value = MagicMock(items=pods)
+        mock_k8s_client.custom_objects.list_namespaced_custom_object.return_value = {
+            "items": [
+                _make_pod_metrics_dict("default", f"web-{i}-rs-pod", cpu=f"{i}m") for i in range(20)
+            ]
+        }
+
+        result = manager.analyze_workloads(namespace="default")
+
+        mock_k8s_client.core_v1.list_namespaced_pod.assert_called_once_with(namespace="default")
+        mock_k8s_client.apps_v1.list_namespaced_replica_set.assert_called_once()
+        usage = {a.name: a.total_usage.cpu_millicores for a in result}
+        assert usage == {f"web-{i}": i for i in range(20)}
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_all_namespaces_lists_pods_cluster_wide(
+        self, manager: OptimizationManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """all_namespaces mode uses the cluster-wide pod and ReplicaSet listings."""
+        empty = MagicMock(items=[])
+        mock_k8s_client.apps_v1.list_deployment_for_all_namespaces.return_value = empty
+        mock_k8s_client.apps_v1.list_stateful_set_for_all_namespaces.return_value = empty
+        mock_k8s_client.apps_v1.list_daemon_set_for_all_namespaces.return_value = empty
+        mock_k8s_client.custom_objects.list_cluster_custom_object.return_value = {"items": []}
+
+        manager.analyze_workloads(all_namespaces=True)
+
+        mock_k8s_client.core_v1.list_pod_for_all_namespaces.assert_called_once_with()
+        mock_k8s_client.apps_v1.list_replica_set_for_all_namespaces.assert_called_once_with()
+        mock_k8s_client.core_v1.list_namespaced_pod.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_replica_set_listing_failure_falls_back_to_labels(
+        self, manager: OptimizationManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Deployments are still matched by selector when ReplicaSets cannot be listed."""
+        deploy = _make_workload(name="web", replicas=1)
+        pod = _make_owned("web-1", owners=[_owner("ReplicaSet", "web-rs")], labels={"app": "web"})
+        mock_k8s_client.apps_v1.list_namespaced_deployment.return_value = MagicMock(items=[deploy])
+        mock_k8s_client.apps_v1.list_namespaced_stateful_set.return_value = MagicMock(items=[])
+        mock_k8s_client.apps_v1.list_namespaced_daemon_set.return_value = MagicMock(items=[])
+        mock_k8s_client.apps_v1.list_namespaced_replica_set.side_effect = Exception("forbidden")
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value = MagicMock(items=[pod])
+        mock_k8s_client.custom_objects.list_namespaced_custom_object.return_value = {
+            "items": [_make_pod_metrics_dict("default", "web-1", cpu="40m")]
+        }
+
+        result = manager.analyze_workloads(namespace="default")
+
+        assert result[0].total_usage.cpu_millicores == 40
+
+
+# =============================================================================
+# Tests: usage history
+# =============================================================================
+
+
+class TestUsageHistoryIntegration:
+    """Tests for sampling and percentile-based analysis."""
+
+    @staticmethod
+    def _seed(history: UsageHistory, name: str, cpu: list[int], memory_mi: int = 64) -> None:
+        """Record one sample per value for a single Deployment pod."""
+        now = datetime.now(UTC)
+        for i, value in enumerate(cpu):
+            history.record(
+                [UsageSample("default", "Deployment", name, f"{name}-pod", value, memory_mi << 20)],
+                timestamp=now - timedelta(minutes=len(cpu) - i),
+            )
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_sample_usage_files_pods_under_workload(
+        self, manager: OptimizationManager, mock_k8s_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """sample_usage records owned pods under their workload and skips bare pods."""
+        history = UsageHistory(tmp_path)
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value = MagicMock(
+            items=[
+                _make_owned("db-0", owners=[_owner("StatefulSet", "db")]),
+                _make_owned("bare"),
+            ]
+        )
+        mock_k8s_client.apps_v1.list_namespaced_replica_set.return_value = MagicMock(items=[])
+        mock_k8s_client.custom_objects.list_namespaced_custom_object.return_value = {
+            "items": [
+                _make_pod_metrics_dict("default", "db-0", cpu="30m", memory="1Mi"),
+                _make_pod_metrics_dict("default", "bare"),
+            ]
+        }
+
+        recorded = manager.sample_usage(history, namespace="default")
+
+        assert recorded == 1
+        series = history.pod_series("default", "StatefulSet", "db", "db-0")
+        assert list(series.cpu) == [30]
+        assert list(series.memory) == [1 << 20]
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_recommend_uses_percentiles(
+        self, manager: OptimizationManager, mock_k8s_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Requests follow p95 usage and CPU limits cover the observed peak."""
+        history = UsageHistory(tmp_path)
+        self._seed(history, "web", [10] * 95 + [100] * 4 + [1000])
+        workload = _make_workload(name="web", replicas=2)
+        mock_k8s_client.apps_v1.read_namespaced_deployment.return_value = workload
+        mock_k8s_client.custom_objects.list_namespaced_custom_object.return_value = {"items": []}
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value = MagicMock(items=[])
+
+        rec = manager.recommend("web", "default", history=history)
+
+        assert rec.usage_percentiles is not None
+        assert rec.usage_percentiles.cpu_p95_millicores == 10
+        assert rec.recommended_cpu_request_millicores == 26  # 10m x 2 replicas x 1.3
+        assert rec.recommended_cpu_limit_millicores == 2000  # peak 1000m x 2 replicas
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_recommend_without_samples_uses_snapshot(
+        self, manager: OptimizationManager, mock_k8s_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """An empty history falls back to the metrics-server snapshot."""
+        workload = _make_workload(name="web", replicas=1)
+        mock_k8s_client.apps_v1.read_namespaced_deployment.return_value = workload
+        mock_k8s_client.custom_objects.list_namespaced_custom_object.return_value = {"items": []}
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value = MagicMock(items=[])
+
+        rec = manager.recommend("web", "default", history=UsageHistory(tmp_path))
+
+        assert rec.usage_percentiles is None
+        assert rec.recommended_cpu_request_millicores == 1
+
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_analyze_uses_p95_within_window(
+        self, manager: OptimizationManager, mock_k8s_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """analyze_workloads scales p95 per-pod usage by replicas."""
+        history = UsageHistory(tmp_path)
+        self._seed(history, "web", [50] * 20)
+        deploy = _make_workload(name="web", replicas=3, cpu_request="100m")
+        mock_k8s_client.apps_v1.list_namespaced_deployment.return_value = MagicMock(items=[deploy])
+        mock_k8s_client.apps_v1.list_namespaced_stateful_set.return_value = MagicMock(items=[])
+        mock_k8s_client.apps_v1.list_namespaced_daemon_set.return_value = MagicMock(items=[])
+        mock_k8s_client.custom_objects.list_namespaced_custom_object.return_value = {"items": []}
+
+        result = manager.analyze_workloads(namespace="default", history=history)
+        stale = manager.analyze_workloads(
+            namespace="default", history=history, window=timedelta(seconds=1)
+        )
+
+        assert result[0].total_usage.cpu_millicores == 150
+        assert result[0].cpu_utilization_pct == 50.0
+        assert stale[0].total_usage.cpu_millicores == 0
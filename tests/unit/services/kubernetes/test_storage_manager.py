@@ -16,6 +16,8 @@ def mock_k8s_client() -> MagicMock:
     """Create a mock Kubernetes client."""
     mock_client = MagicMock()
     mock_client.default_namespace = "default"
+    mock_client.informer.return_value = None
+    mock_client.fast_list_enabled = False
     return mock_client
 
 
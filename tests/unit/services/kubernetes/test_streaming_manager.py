@@ -435,3 +435,119 @@ class TestResolveServiceToPodErrorHandling:
 
         with pytest.raises(KubernetesNotFoundError):
             streaming_manager.resolve_service_to_pod("my-service")
+
+
+def _pod(name: str, phase: str = "Running", containers: tuple[str, ...] = ("app",)) -> MagicMock:
+    """Build a mock pod with the given phase and containers."""
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.status.phase = phase
+    pod.spec.containers = []
+    for container_name in containers:
+        container = MagicMock()
+        container.name = container_name
+        pod.spec.containers.append(container)
+    return pod
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestStreamSelectorLogs:
+    """Tests for StreamingManager.stream_selector_logs."""
+
+    def test_merges_all_matching_containers(
+        self, streaming_manager: StreamingManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Should stream every container of every non-pending pod."""
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value.items = [
+            _pod("web-0", containers=("app", "proxy")),
+            _pod("web-1"),
+            _pod("web-2", phase="Pending"),
+        ]
+        logs = {
+            ("web-0", "app"): [b"2024-01-01T00:00:03Z third\n"],
+            ("web-0", "proxy"): [b"2024-01-01T00:00:01Z first\n"],
+            ("web-1", "app"): [b"2024-01-01T00:00:02Z second\n"],
+        }
+        mock_k8s_client.core_v1.read_namespaced_pod_log.side_effect = lambda **kw: iter(
+            logs[(kw["name"], kw["container"])]
+        )
+
+        lines = list(streaming_manager.stream_selector_logs("app=web", tail_lines=5))
+
+        assert [(line.pod, line.container, line.message) for line in lines] == [
+            ("web-0", "proxy", "first"),
+            ("web-1", "app", "second"),
+            ("web-0", "app", "third"),
+        ]
+        mock_k8s_client.core_v1.list_namespaced_pod.assert_called_once_with(
+            namespace="default", label_selector="app=web"
+        )
+        for call in mock_k8s_client.core_v1.read_namespaced_pod_log.call_args_list:
+            assert call.kwargs["timestamps"] is True
+            assert call.kwargs["tail_lines"] == 5
+
+    def test_container_filter(
+        self, streaming_manager: StreamingManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Should only stream the requested container."""
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value.items = [
+            _pod("web-0", containers=("app", "proxy")),
+        ]
+        mock_k8s_client.core_v1.read_namespaced_pod_log.return_value = iter([])
+
+        list(streaming_manager.stream_selector_logs("app=web", container="proxy"))
+
+        mock_k8s_client.core_v1.read_namespaced_pod_log.assert_called_once()
+        assert mock_k8s_client.core_v1.read_namespaced_pod_log.call_args.kwargs["container"] == (
+            "proxy"
+        )
+
+    def test_no_matching_pods_raises(
+        self, streaming_manager: StreamingManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Should raise KubernetesNotFoundError when nothing matches."""
+        mock_k8s_client.core_v1.list_namespaced_pod.return_value.items = []
+
+        with pytest.raises(KubernetesNotFoundError):
+            streaming_manager.stream_selector_logs("app=missing")
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestResolveWorkloadSelector:
+    """Tests for StreamingManager.resolve_workload_selector."""
+
+    def test_deployment_match_labels_and_expressions(
+        self, streaming_manager: StreamingManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Should render matchLabels and matchExpressions."""
+        selector = MagicMock()
+        selector.match_labels = {"app": "web"}
+        expression = MagicMock(key="tier", operator="In", values=["frontend", "edge"])
+        selector.match_expressions = [expression]
+        mock_k8s_client.apps_v1.read_namespaced_deployment.return_value.spec.selector = selector
+
+        result = streaming_manager.resolve_workload_selector("deploy", "web", "prod")
+
+        assert result == "app=web,tier in (frontend,edge)"
+        mock_k8s_client.apps_v1.read_namespaced_deployment.assert_called_once_with(
+            name="web", namespace="prod"
+        )
+
+    def test_job_selector(
+        self, streaming_manager: StreamingManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Should read Jobs through the batch API."""
+        selector = MagicMock(match_labels={"batch.kubernetes.io/controller-uid": "abc"})
+        selector.match_expressions = None
+        mock_k8s_client.batch_v1.read_namespaced_job.return_value.spec.selector = selector
+
+        result = streaming_manager.resolve_workload_selector("job", "migrate")
+
+        assert result == "batch.kubernetes.io/controller-uid=abc"
+
+    def test_unsupported_kind(self, streaming_manager: StreamingManager) -> None:
+        """Should reject kinds that are not workloads."""
+        with pytest.raises(ValueError, match="Unsupported workload kind"):
+            streaming_manager.resolve_workload_selector("service", "web")
@@ -0,0 +1,135 @@
+"""Unit tests for the usage history ring buffers."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from system_operations_manager.services.kubernetes.usage_history import (
+    USAGE_FILE_SUFFIX,
+    UsageHistory,
+    UsageSample,
+    UsageSeries,
+    usage_percentiles,
+)
+
+T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _sample(pod: str, cpu: int, memory: int, workload: str = "web") -> UsageSample:
+    return UsageSample("default", "Deployment", workload, pod, cpu, memory)
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestUsageHistory:
+    """Tests for UsageHistory recording and reading."""
+
+    def test_records_and_reads_in_order(self, tmp_path: Path) -> None:
+        """Samples should be read back chronologically."""
+        history = UsageHistory(tmp_path)
+        for i in range(3):
+            history.record(
+                [_sample("web-1", 10 * i, 100 * i)], timestamp=T0 + timedelta(seconds=30 * i)
+            )
+
+        series = history.pod_series("default", "Deployment", "web", "web-1")
+
+        assert list(series.cpu) == [0, 10, 20]
+        assert list(series.memory) == [0, 100, 200]
+        assert list(series.timestamps) == [int(T0.timestamp()) + 30 * i for i in range(3)]
+
+    def test_ring_overwrites_oldest_samples(self, tmp_path: Path) -> None:
+        """Once full, the ring keeps only the newest ``capacity`` samples."""
+        history = UsageHistory(tmp_path, capacity=4)
+        for i in range(10):
+            history.record([_sample("web-1", i, i)], timestamp=T0 + timedelta(seconds=i))
+
+        series = history.pod_series("default", "Deployment", "web", "web-1")
+        path = tmp_path / "default" / "Deployment" / "web" / f"web-1{USAGE_FILE_SUFFIX}"
+
+        assert list(series.cpu) == [6, 7, 8, 9]
+        size = path.stat().st_size
+        history.record([_sample("web-1", 10, 10)], timestamp=T0 + timedelta(seconds=10))
+        assert path.stat().st_size == size
+
+    def test_since_limits_window(self, tmp_path: Path) -> None:
+        """Only samples at or after ``since`` should be returned."""
+        history = UsageHistory(tmp_path, capacity=5)
+        for i in range(8):
+            history.record([_sample("web-1", i, i)], timestamp=T0 + timedelta(minutes=i))
+
+        series = history.pod_series(
+            "default", "Deployment", "web", "web-1", since=T0 + timedelta(minutes=5)
+        )
+
+        assert list(series.cpu) == [5, 6, 7]
+
+    def test_workload_series_pools_pods(self, tmp_path: Path) -> None:
+        """A workload's series should include every pod it has had."""
+        history = UsageHistory(tmp_path)
+        history.record([_sample("web-1", 1, 1), _sample("web-2", 2, 2)], timestamp=T0)
+        history.record([_sample("web-3", 3, 3), _sample("db-0", 9, 9, "db")], timestamp=T0)
+
+        series = history.workload_series("default", "Deployment", "web")
+
+        assert sorted(series.cpu) == [1, 2, 3]
+        assert len(history.workload_series("default", "Deployment", "missing")) == 0
+
+    def test_corrupt_file_is_ignored_and_replaced(self, tmp_path: Path) -> None:
+        """Files that are not ring buffers read as empty and are recreated on write."""
+        history = UsageHistory(tmp_path)
+        path = tmp_path / "default" / "Deployment" / "web" / f"web-1{USAGE_FILE_SUFFIX}"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not a ring buffer")
+
+        assert len(history.pod_series("default", "Deployment", "web", "web-1")) == 0
+
+        history.record([_sample("web-1", 5, 5)], timestamp=T0)
+        assert list(history.pod_series("default", "Deployment", "web", "web-1").cpu) == [5]
+
+    def test_prune_removes_stale_pods(self, tmp_path: Path) -> None:
+        """Pods whose newest sample predates the cutoff should be deleted."""
+        history = UsageHistory(tmp_path)
+        history.record([_sample("old-1", 1, 1, "old")], timestamp=T0)
+        history.record([_sample("web-1", 1, 1)], timestamp=T0 + timedelta(days=2))
+
+        removed = history.prune(T0 + timedelta(days=1))
+
+        assert removed == 1
+        assert not (tmp_path / "default" / "Deployment" / "old").exists()
+        assert len(history.workload_series("default", "Deployment", "web")) == 1
+
+    def test_rejects_invalid_capacity(self, tmp_path: Path) -> None:
+        """A non-positive capacity should raise ValueError."""
+        with pytest.raises(ValueError, match="capacity"):
+            UsageHistory(tmp_path, capacity=0)
+
+
+@pytest.mark.unit
+@pytest.mark.kubernetes
+class TestUsagePercentiles:
+    """Tests for usage_percentiles."""
+
+    def test_nearest_rank_percentiles(self) -> None:
+        """p50/p95/max should use the nearest-rank method."""
+        series = UsageSeries()
+        for i in range(1, 101):
+            series.timestamps.append(i)
+            series.cpu.append(i)
+            series.memory.append(i * 1024)
+
+        result = usage_percentiles(series)
+
+        assert result is not None
+        assert result.samples == 100
+        assert (result.cpu_p50_millicores, result.cpu_p95_millicores) == (50, 95)
+        assert result.cpu_max_millicores == 100
+        assert result.memory_p95_bytes == 95 * 1024
+        assert result.memory_max_bytes == 100 * 1024
+
+    def test_empty_series_returns_none(self) -> None:
+        """No samples should yield no percentiles."""
+        assert usage_percentiles(UsageSeries()) is None
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from system_operations_manager.services.kubernetes.log_multiplexer import LogMultiplexer
 from system_operations_manager.services.kubernetes.workflows_manager import (
     WorkflowsManager,
 )
@@ -531,29 +533,65 @@ class TestWorkflowLogsEdgeCases:
         with pytest.raises(RuntimeError, match="translated"):
             workflows_manager.get_workflow_logs("broken-workflow")
 
-    def test_stream_pod_logs_bytes_lines(
+    def test_get_workflow_logs_follow_multiplexes_all_pods(
         self, workflows_manager: WorkflowsManager, mock_k8s_client: MagicMock
     ) -> None:
-        """Should decode bytes lines in _stream_pod_logs."""
-        mock_k8s_client.core_v1.read_namespaced_pod_log.return_value = iter(
-            [b"hello\n", b"world\n"]
+        """Should follow every step pod and interleave lines by timestamp."""
+        mock_k8s_client.custom_objects.get_namespaced_custom_object.return_value = {
+            "status": {
+                "phase": "Succeeded",
+                "nodes": {
+                    "node1": {"type": "Pod", "id": "wf-step-a"},
+                    "node2": {"type": "Pod", "id": "wf-step-b"},
+                    "node3": {"type": "Steps", "id": "wf"},
+                },
+            }
+        }
+        logs = {
+            "wf-step-a": [b"2024-01-01T00:00:01Z a1\n", b"2024-01-01T00:00:03Z a3\n"],
+            "wf-step-b": [b"2024-01-01T00:00:02Z b2\n"],
+        }
+        mock_k8s_client.core_v1.read_namespaced_pod_log.side_effect = lambda **kw: iter(
+            logs[kw["name"]]
         )
 
-        lines = list(workflows_manager._stream_pod_logs("pod-xyz", "default", "main"))
+        result = workflows_manager.get_workflow_logs("wf", follow=True)
 
-        assert lines == ["hello\n", "world\n"]
+        assert list(result) == [
+            "[wf-step-a/main] a1\n",
+            "[wf-step-b/main] b2\n",
+            "[wf-step-a/main] a3\n",
+        ]
+        for call in mock_k8s_client.core_v1.read_namespaced_pod_log.call_args_list:
+            assert call.kwargs["follow"] is True
+            assert call.kwargs["container"] == "main"
 
-    def test_stream_pod_logs_str_lines(
+    def test_get_workflow_logs_follow_picks_up_new_steps(
         self, workflows_manager: WorkflowsManager, mock_k8s_client: MagicMock
     ) -> None:
-        """Should yield str lines as-is in _stream_pod_logs."""
-        mock_k8s_client.core_v1.read_namespaced_pod_log.return_value = iter(
-            ["line-a\n", "line-b\n"]
+        """Pods of steps that start later should be followed until the workflow ends."""
+        running = {"status": {"phase": "Running", "nodes": {"n1": {"type": "Pod", "id": "s1"}}}}
+        finished = {
+            "status": {
+                "phase": "Succeeded",
+                "nodes": {"n1": {"type": "Pod", "id": "s1"}, "n2": {"type": "Pod", "id": "s2"}},
+            }
+        }
+        mock_k8s_client.custom_objects.get_namespaced_custom_object.side_effect = [
+            running,
+            finished,
+        ]
+        mock_k8s_client.core_v1.read_namespaced_pod_log.side_effect = lambda **kw: iter(
+            [f"2024-01-01T00:00:00Z from {kw['name']}\n".encode()]
         )
 
-        lines = list(workflows_manager._stream_pod_logs("pod-xyz", "default", "main"))
+        with patch(
+            "system_operations_manager.services.kubernetes.workflows_manager.LogMultiplexer",
+            partial(LogMultiplexer, rediscover_interval=0.01),
+        ):
+            lines = list(workflows_manager.get_workflow_logs("wf", follow=True))
 
-        assert lines == ["line-a\n", "line-b\n"]
+        assert sorted(lines) == ["[s1/main] from s1\n", "[s2/main] from s2\n"]
 
 
 @pytest.mark.unit
@@ -16,6 +16,8 @@ def mock_k8s_client() -> MagicMock:
     """Create a mock Kubernetes client."""
     mock_client = MagicMock()
     mock_client.default_namespace = "default"
+    mock_client.informer.return_value = None
+    mock_client.fast_list_enabled = False
     return mock_client
 
 
@@ -52,7 +54,9 @@ class TestWorkloadManagerPods:
 
             assert len(result) == 1
             assert result[0] == mock_summary
-            mock_k8s_client.core_v1.list_namespaced_pod.assert_called_once_with(namespace="default")
+            mock_k8s_client.core_v1.list_namespaced_pod.assert_called_once_with(
+                namespace="default", limit=500
+            )
 
     @pytest.mark.unit
     @pytest.mark.kubernetes
@@ -68,6 +72,25 @@ class TestWorkloadManagerPods:
 
         assert result == []
 
+    @pytest.mark.unit
+    @pytest.mark.kubernetes
+    def test_list_pods_from_informer(
+        self, workload_manager: WorkloadManager, mock_k8s_client: MagicMock
+    ) -> None:
+        """Should serve pods from a running informer without a LIST call."""
+        from system_operations_manager.integrations.kubernetes.informer import Informer
+
+        informer = MagicMock(spec=Informer)
+        informer.list_objects.return_value = []
+        mock_k8s_client.informer.return_value = informer
+
+        result = workload_manager.list_pods(all_namespaces=True, label_selector="app=web")
+
+        assert result == []
+        mock_k8s_client.informer.assert_called_once_with("pods")
+        informer.list_objects.assert_called_once_with(None, label_selector="app=web")
+        mock_k8s_client.core_v1.list_pod_for_all_namespaces.assert_not_called()
+
     @pytest.mark.unit
     @pytest.mark.kubernetes
     def test_list_pods_all_namespaces(
@@ -96,7 +119,10 @@ class TestWorkloadManagerPods:
         workload_manager.list_pods(label_selector="app=test", field_selector="status.phase=Running")
 
         mock_k8s_client.core_v1.list_namespaced_pod.assert_called_once_with(
-            namespace="default", label_selector="app=test", field_selector="status.phase=Running"
+            namespace="default",
+            label_selector="app=test",
+            field_selector="status.phase=Running",
+            limit=500,
         )
 
     @pytest.mark.unit
@@ -440,14 +440,21 @@ class TestLogsManager:
         assert dist == {200: 500, 404: 10, 500: 5}
 
     @pytest.mark.unit
-    def test_get_status_distribution_loki_unsupported(
+    def test_get_status_distribution_loki(
         self, loki_config: LokiConfig, mock_loki_client: MagicMock
     ) -> None:
-        """get_status_distribution on Loki backend should return empty dict."""
+        """get_status_distribution on Loki backend should delegate to a LogQL aggregation."""
+        mock_loki_client.get_kong_status_distribution.return_value = {200: 90, 503: 3}
+
         manager = LogsManager(loki_config=loki_config)
-        dist = manager.get_status_distribution()
+        dist = manager.get_status_distribution(service="my-api")
 
-        assert dist == {}
+        mock_loki_client.get_kong_status_distribution.assert_called_once_with(
+            service="my-api",
+            start_time=None,
+            end_time=None,
+        )
+        assert dist == {200: 90, 503: 3}
 
     @pytest.mark.unit
     def test_get_service_distribution_elasticsearch(
@@ -466,14 +473,20 @@ class TestLogsManager:
         assert dist == {"svc-a": 300, "svc-b": 150}
 
     @pytest.mark.unit
-    def test_get_service_distribution_loki_unsupported(
+    def test_get_service_distribution_loki(
         self, loki_config: LokiConfig, mock_loki_client: MagicMock
     ) -> None:
-        """get_service_distribution on Loki backend should return empty dict."""
+        """get_service_distribution on Loki backend should delegate to a LogQL aggregation."""
+        mock_loki_client.get_kong_service_distribution.return_value = {"svc-a": 7}
+
         manager = LogsManager(loki_config=loki_config)
         dist = manager.get_service_distribution()
 
-        assert dist == {}
+        mock_loki_client.get_kong_service_distribution.assert_called_once_with(
+            start_time=None,
+            end_time=None,
+        )
+        assert dist == {"svc-a": 7}
 
     @pytest.mark.unit
     def test_count_logs_elasticsearch(
@@ -493,14 +506,19 @@ class TestLogsManager:
         assert count == 42
 
     @pytest.mark.unit
-    def test_count_logs_loki_unsupported(
-        self, loki_config: LokiConfig, mock_loki_client: MagicMock
-    ) -> None:
-        """count_logs on Loki backend should return 0."""
+    def test_count_logs_loki(self, loki_config: LokiConfig, mock_loki_client: MagicMock) -> None:
+        """count_logs on Loki backend should delegate to loki_client.count_kong_logs."""
+        mock_loki_client.count_kong_logs.return_value = 42
+
         manager = LogsManager(loki_config=loki_config)
-        count = manager.count_logs()
+        count = manager.count_logs(service="my-api")
 
-        assert count == 0
+        mock_loki_client.count_kong_logs.assert_called_once_with(
+            service="my-api",
+            start_time=None,
+            end_time=None,
+        )
+        assert count == 42
 
     @pytest.mark.unit
     def test_get_summary_elasticsearch(
@@ -542,17 +560,24 @@ class TestLogsManager:
 
     @pytest.mark.unit
     def test_get_summary_loki(self, loki_config: LokiConfig, mock_loki_client: MagicMock) -> None:
-        """get_summary on Loki backend should return zeros and empty distributions."""
+        """get_summary on Loki backend should return the LogQL aggregations."""
+        mock_loki_client.count_kong_logs.return_value = 120
+        mock_loki_client.get_kong_status_distribution.return_value = {200: 100, 404: 15, 502: 5}
+        mock_loki_client.get_kong_service_distribution.return_value = {"svc-a": 120}
+
         manager = LogsManager(loki_config=loki_config)
         start = datetime(2024, 6, 1, 12, 0, 0)
         end = datetime(2024, 6, 1, 13, 0, 0)
         summary = manager.get_summary(start_time=start, end_time=end)
 
         assert summary["backend"] == "loki"
-        assert summary["total_logs"] == 0
-        assert summary["status_distribution"] == {}
-        assert summary["error_count"] == 0
-        assert summary["service_distribution"] == {}
+        assert summary["total_logs"] == 120
+        assert summary["status_distribution"] == {200: 100, 404: 15, 502: 5}
+        assert summary["error_count"] == 20
+        assert summary["service_distribution"] == {"svc-a": 120}
+        mock_loki_client.count_kong_logs.assert_called_once_with(
+            service=None, start_time=start, end_time=end
+        )
 
 
 class TestTracingManager:
@@ -186,6 +186,9 @@ class TestKubernetesAppAsync:
                 )
 
                 assert isinstance(app.screen, ResourceListScreen)
+                mock_client.enable_informers.assert_called_once()
+
+        mock_client.disable_informers.assert_called_once()
 
     @pytest.mark.unit
     @pytest.mark.asyncio
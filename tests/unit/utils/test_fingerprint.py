@@ -0,0 +1,57 @@
+"""Tests for entity fingerprint helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from system_operations_manager.utils.fingerprint import canonical_json, fingerprint
+
+
+@pytest.mark.unit
+class TestCanonicalJson:
+    """Tests for canonical_json."""
+
+    def test_sorts_keys_at_every_level(self) -> None:
+        """Nested dict keys should be sorted."""
+        assert canonical_json({"b": {"y": 1, "x": 2}, "a": 1}) == '{"a":1,"b":{"x":2,"y":1}}'
+
+    def test_serializes_sets_in_sorted_order(self) -> None:
+        """Sets should serialize identically regardless of insertion order."""
+        assert canonical_json({"tags": {"b", "a"}}) == canonical_json({"tags": {"a", "b"}})
+
+
+@pytest.mark.unit
+class TestFingerprint:
+    """Tests for fingerprint."""
+
+    def test_ignores_key_order(self) -> None:
+        """Entities with the same content should fingerprint equally."""
+        first = {"name": "rl", "config": {"minute": 5, "policy": "local"}}
+        second = {"config": {"policy": "local", "minute": 5}, "name": "rl"}
+
+        assert fingerprint(first) == fingerprint(second)
+
+    def test_is_stable_across_runs(self) -> None:
+        """The digest should not depend on per-process hash seeds."""
+        assert fingerprint({"host": "api.local"}) == "74c2a21fbcab1cd2a524d3e388121598"
+
+    def test_handles_unhashable_values(self) -> None:
+        """Nested lists and dicts should be accepted."""
+        entity = {"paths": ["/a", "/b"], "headers": {"x": ["1"]}}
+
+        assert len(fingerprint(entity)) == 32
+
+    def test_detects_content_changes(self) -> None:
+        """Different values and list orders should change the fingerprint."""
+        base = fingerprint({"paths": ["/a", "/b"]})
+
+        assert fingerprint({"paths": ["/b", "/a"]}) != base
+        assert fingerprint({"paths": ["/a"]}) != base
+
+    def test_ignores_listed_fields_and_nulls(self) -> None:
+        """Ignored fields and None values should not affect the fingerprint."""
+        current = {"id": "1", "created_at": 1, "name": "api", "retries": None}
+        desired = {"id": "2", "created_at": 2, "name": "api"}
+
+        ignore = {"id", "created_at"}
+        assert fingerprint(current, ignore=ignore) == fingerprint(desired, ignore=ignore)
@@ -0,0 +1,102 @@
+"""Tests for offset pagination helpers."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from system_operations_manager.utils.pagination import (
+    MAX_PAGE_SIZE,
+    iter_items,
+    iter_pages,
+    validate_page_size,
+)
+
+PAGES: dict[str | None, tuple[list[int], str | None]] = {
+    None: ([1, 2], "b"),
+    "b": ([3, 4], "c"),
+    "c": ([5], None),
+}
+
+
+@pytest.mark.unit
+class TestIterPages:
+    """Tests for iter_pages."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_follows_offsets_in_order(self, prefetch: bool) -> None:
+        """Pages should be yielded in server order with offsets requested in order."""
+        requested: list[str | None] = []
+
+        def fetch(offset: str | None) -> tuple[list[int], str | None]:
+            requested.append(offset)
+            return PAGES[offset]
+
+        pages = list(iter_pages(fetch, prefetch=prefetch))
+
+        assert pages == [[1, 2], [3, 4], [5]]
+        assert requested == [None, "b", "c"]
+
+    def test_prefetch_requests_next_page_before_consumer_resumes(self) -> None:
+        """The next page should be fetched while the caller holds the current one."""
+        fetched = {offset: threading.Event() for offset in PAGES}
+
+        def fetch(offset: str | None) -> tuple[list[int], str | None]:
+            fetched[offset].set()
+            return PAGES[offset]
+
+        pages = iter_pages(fetch, prefetch=True)
+        assert next(pages) == [1, 2]
+
+        assert fetched["b"].wait(timeout=5)
+        pages.close()
+
+    def test_without_prefetch_fetches_lazily(self) -> None:
+        """Without prefetch no request is issued until the next page is needed."""
+        requested: list[str | None] = []
+
+        def fetch(offset: str | None) -> tuple[list[int], str | None]:
+            requested.append(offset)
+            return PAGES[offset]
+
+        pages = iter_pages(fetch, prefetch=False)
+        next(pages)
+
+        assert requested == [None]
+
+    def test_propagates_fetch_errors(self) -> None:
+        """Errors raised while fetching should surface to the caller."""
+
+        def fetch(offset: str | None) -> tuple[list[int], str | None]:
+            if offset:
+                raise RuntimeError("boom")
+            return [1], "b"
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(iter_pages(fetch))
+
+
+@pytest.mark.unit
+class TestIterItems:
+    """Tests for iter_items."""
+
+    def test_flattens_pages(self) -> None:
+        """Items from every page should be yielded in order."""
+        assert list(iter_items(lambda offset: PAGES[offset])) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.unit
+class TestValidatePageSize:
+    """Tests for validate_page_size."""
+
+    @pytest.mark.parametrize("page_size", [None, 1, MAX_PAGE_SIZE])
+    def test_accepts_valid_sizes(self, page_size: int | None) -> None:
+        """None and sizes within 1..MAX_PAGE_SIZE should pass through."""
+        assert validate_page_size(page_size) == page_size
+
+    @pytest.mark.parametrize("page_size", [0, MAX_PAGE_SIZE + 1])
+    def test_rejects_out_of_range(self, page_size: int) -> None:
+        """Sizes outside 1..MAX_PAGE_SIZE should raise ValueError."""
+        with pytest.raises(ValueError, match="page_size must be between"):
+            validate_page_size(page_size)
@@ -0,0 +1,202 @@
+"""Tests for the streaming Prometheus exposition parser."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from system_operations_manager.utils.prometheus import (
+    HistogramBuckets,
+    Sample,
+    histogram_buckets,
+    histogram_quantile,
+    iter_families,
+    iter_samples,
+    parse_labels,
+    parse_sample,
+)
+
+EXPOSITION = """\
+# HELP kong_http_requests_total HTTP status codes per service/route in Kong
+# TYPE kong_http_requests_total counter
+kong_http_requests_total{service="api",route="r1",code="200"} 100
+kong_http_requests_total{service="api",route="r2",code="500"} 5
+kong_http_requests_total{service="web",route="r3",code="200"} 40
+# HELP kong_request_latency_ms Total latency incurred during requests
+# TYPE kong_request_latency_ms histogram
+kong_request_latency_ms_bucket{service="api",le="10"} 50
+kong_request_latency_ms_bucket{service="api",le="100"} 90
+kong_request_latency_ms_bucket{service="api",le="+Inf"} 100
+kong_request_latency_ms_bucket{service="web",le="10"} 0
+kong_request_latency_ms_bucket{service="web",le="100"} 80
+kong_request_latency_ms_bucket{service="web",le="+Inf"} 100
+kong_request_latency_ms_sum{service="api"} 2500
+kong_request_latency_ms_count{service="api"} 100
+# TYPE kong_nginx_connections_total gauge
+kong_nginx_connections_total{state="active"} 7
+"""
+
+
+@pytest.mark.unit
+class TestParseSample:
+    """Tests for parse_sample and parse_labels."""
+
+    def test_parses_labels_and_value(self) -> None:
+        """Labels and value should be extracted."""
+        sample = parse_sample('kong_http_requests_total{service="api",code="200"} 12')
+
+        assert sample == Sample("kong_http_requests_total", {"service": "api", "code": "200"}, 12)
+
+    def test_parses_sample_without_labels(self) -> None:
+        """A sample without a label set should have empty labels."""
+        sample = parse_sample("kong_http_requests_total 100")
+
+        assert sample == Sample("kong_http_requests_total", {}, 100.0)
+
+    def test_ignores_timestamp(self) -> None:
+        """A trailing timestamp should not be part of the value."""
+        sample = parse_sample("kong_up 1 1700000000000")
+
+        assert sample == Sample("kong_up", {}, 1.0)
+
+    def test_label_values_with_braces_commas_and_escapes(self) -> None:
+        """Quoted label values may contain braces, commas and escaped quotes."""
+        labels = parse_labels(r'path="/a,{b}",msg="say \"hi\"\n"')
+
+        assert labels == {"path": "/a,{b}", "msg": 'say "hi"\n'}
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("NaN", math.nan), ("+Inf", math.inf), ("-Inf", -math.inf), ("1e3", 1000.0)],
+    )
+    def test_special_values(self, value: str, expected: float) -> None:
+        """NaN, infinities and exponents should parse as floats."""
+        sample = parse_sample(f"kong_x {value}")
+
+        assert sample is not None
+        assert sample.value == expected or (math.isnan(expected) and math.isnan(sample.value))
+
+    @pytest.mark.parametrize("line", ["not a metric", "kong_x", "1bad 1", 'kong_x{a="b" 1'])
+    def test_rejects_invalid_lines(self, line: str) -> None:
+        """Lines that are not samples should return None."""
+        assert parse_sample(line) is None
+
+
+@pytest.mark.unit
+class TestIterSamples:
+    """Tests for iter_samples."""
+
+    def test_prefix_pushdown(self) -> None:
+        """Only samples whose name matches the prefix should be yielded."""
+        names = {s.name for s in iter_samples(EXPOSITION, prefix="kong_request_latency_ms_")}
+
+        assert names == {
+            "kong_request_latency_ms_bucket",
+            "kong_request_latency_ms_sum",
+            "kong_request_latency_ms_count",
+        }
+
+    def test_label_pushdown(self) -> None:
+        """Label filters should require exact label values."""
+        samples = list(
+            iter_samples(
+                EXPOSITION,
+                prefix="kong_http_requests_total",
+                match_labels={"service": "api", "route": "r2"},
+            )
+        )
+
+        assert [s.value for s in samples] == [5]
+
+    def test_label_filter_does_not_match_substrings(self) -> None:
+        """A label whose name ends with the filtered name should not match."""
+        text = 'kong_x{xservice="api"} 1\nkong_x{service="api"} 2\n'
+
+        assert [s.value for s in iter_samples(text, match_labels={"service": "api"})] == [2]
+
+    def test_accepts_line_iterables(self) -> None:
+        """An iterable of lines should be parsed like text."""
+        assert len(list(iter_samples(iter(EXPOSITION.splitlines())))) == 12
+
+
+@pytest.mark.unit
+class TestIterFamilies:
+    """Tests for iter_families."""
+
+    def test_groups_samples_with_metadata(self) -> None:
+        """Samples should be grouped under their HELP/TYPE family."""
+        families = {f.name: f for f in iter_families(EXPOSITION)}
+
+        assert list(families) == [
+            "kong_http_requests_total",
+            "kong_request_latency_ms",
+            "kong_nginx_connections_total",
+        ]
+        latency = families["kong_request_latency_ms"]
+        assert latency.type == "histogram"
+        assert latency.help == "Total latency incurred during requests"
+        assert len(latency.samples) == 8
+
+    def test_untyped_samples_form_their_own_family(self) -> None:
+        """Samples without a header should become untyped families."""
+        families = list(iter_families("kong_a 1\nkong_b 2\n"))
+
+        assert [(f.name, f.type) for f in families] == [
+            ("kong_a", "untyped"),
+            ("kong_b", "untyped"),
+        ]
+
+    def test_skips_families_emptied_by_filters(self) -> None:
+        """Families without matching samples should not be yielded."""
+        families = list(iter_families(EXPOSITION, match_labels={"service": "web"}))
+
+        assert [f.name for f in families] == [
+            "kong_http_requests_total",
+            "kong_request_latency_ms",
+        ]
+
+
+@pytest.mark.unit
+class TestHistograms:
+    """Tests for histogram bucket folding and quantiles."""
+
+    def test_sums_series_into_bucket_arrays(self) -> None:
+        """Matching series should be summed per bound, +Inf becoming the total."""
+        buckets = histogram_buckets(EXPOSITION, "kong_request_latency_ms")
+
+        assert buckets == HistogramBuckets(bounds=[10, 100], counts=[50, 170], total=200)
+
+    def test_filters_series_by_label(self) -> None:
+        """Only series matching the label filter should be folded."""
+        buckets = histogram_buckets(
+            EXPOSITION, "kong_request_latency_ms", match_labels={"service": "api"}
+        )
+
+        assert buckets.counts == [50, 90]
+        assert buckets.total == 100
+        assert buckets.quantile(0.5) == 10.0
+
+    @pytest.mark.parametrize(
+        ("q", "expected"),
+        [(0.50, 10.0), (0.75, 35.0), (0.95, 75.0), (0.99, 95.0)],
+    )
+    def test_quantile_picks_bucket_by_rank(self, q: float, expected: float) -> None:
+        """The target rank should select its bucket before interpolating."""
+        bounds = [10.0, 50.0, 100.0]
+        counts = [50.0, 90.0, 100.0]
+
+        assert histogram_quantile(bounds, counts, 100, q) == pytest.approx(expected)
+
+    def test_quantile_interpolates(self) -> None:
+        """Quantiles should interpolate linearly within a bucket."""
+        assert histogram_quantile([50.0, 100.0], [50.0, 100.0], 100, 0.75) == 75.0
+
+    def test_quantile_beyond_finite_buckets(self) -> None:
+        """Ranks in the +Inf bucket should return the last finite bound."""
+        assert histogram_quantile([10.0], [50.0], 100, 0.99) == 10.0
+
+    def test_quantile_without_data(self) -> None:
+        """No observations should yield None."""
+        assert HistogramBuckets().quantile(0.5) is None
+        assert histogram_quantile([], [], 0, 0.5) is None